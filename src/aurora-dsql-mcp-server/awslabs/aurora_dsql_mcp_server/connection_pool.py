@@ -0,0 +1,194 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Connection pool and IAM authentication token cache for the Aurora DSQL MCP Server."""
+
+import asyncio
+import time
+from loguru import logger
+from psycopg.pq import TransactionStatus
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+
+class AuthTokenCache:
+    """Caches an IAM authentication token and generates the next one before it expires.
+
+    A token can be used for any number of connections until it expires. Once the
+    cached token is older than `refresh_after` seconds, the next token is generated in
+    the background while the cached one is still handed out, so connecting never waits
+    for token generation unless the cached token is about to expire.
+    """
+
+    def __init__(
+        self,
+        generate_token: Callable[[], Awaitable[str]],
+        refresh_after: float,
+        expires_after: float,
+    ):
+        """Initialize the token cache.
+
+        Args:
+            generate_token: Coroutine function generating a new token
+            refresh_after: Seconds after which the next token is generated in the background
+            expires_after: Seconds after which the cached token is no longer handed out
+        """
+        self.generate_token = generate_token
+        self.refresh_after = refresh_after
+        self.expires_after = expires_after
+        self._token: Optional[str] = None
+        self._generated_at = 0.0
+        self._refresh_task: Optional['asyncio.Task[None]'] = None
+
+    async def get(self) -> str:
+        """Return a token that is valid for at least the remaining connection setup."""
+        age = time.monotonic() - self._generated_at
+        if self._token is None or age >= self.expires_after:
+            await self._refresh()
+        elif age >= self.refresh_after and (
+            self._refresh_task is None or self._refresh_task.done()
+        ):
+            self._refresh_task = asyncio.create_task(self._refresh())
+        assert self._token is not None
+        return self._token
+
+    async def _refresh(self):
+        generated_at = time.monotonic()
+        try:
+            token = await self.generate_token()
+        except Exception as e:
+            if self._token is None or time.monotonic() - self._generated_at >= self.expires_after:
+                raise
+            logger.warning(f'Failed to generate the next authentication token: {e}')
+            return
+        self._token, self._generated_at = token, generated_at
+
+    def clear(self):
+        """Drop the cached token."""
+        self._token = None
+        self._generated_at = 0.0
+
+
+class ConnectionPool:
+    """Bounded pool of database connections shared by concurrent tool calls.
+
+    Connections are handed out one caller at a time and returned with `release`.
+    Connections that are closed, left inside a transaction or older than
+    `max_lifetime` are discarded instead of being reused.
+    """
+
+    def __init__(
+        self,
+        connect: Callable[[], Awaitable[Any]],
+        max_size: int,
+        max_lifetime: float,
+    ):
+        """Initialize the connection pool.
+
+        Args:
+            connect: Coroutine function opening a new connection
+            max_size: Maximum number of open connections
+            max_lifetime: Seconds after which a connection is closed instead of reused
+        """
+        self.connect = connect
+        self.max_size = max_size
+        self.max_lifetime = max_lifetime
+        self._idle: List[Any] = []
+        self._opened_at: Dict[int, float] = {}
+        self._in_use = 0
+        self._requests_waiting = 0
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        # Semaphores are bound to an event loop, and the server validates its
+        # connection on another event loop than the one serving tool calls
+        loop = asyncio.get_running_loop()
+        if self._semaphore is None or self._loop is not loop:
+            self._semaphore = asyncio.Semaphore(self.max_size - self._in_use)
+            self._loop = loop
+        return self._semaphore
+
+    def owns(self, conn: Any) -> bool:
+        """Return whether a connection was opened by this pool."""
+        return id(conn) in self._opened_at
+
+    async def acquire(self) -> Any:
+        """Return an idle connection, opening one if none is idle and the pool is not full."""
+        semaphore = self._get_semaphore()
+        self._requests_waiting += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._requests_waiting -= 1
+
+        try:
+            while self._idle:
+                conn = self._idle.pop()
+                if self._is_reusable(conn):
+                    self._in_use += 1
+                    return conn
+                await self._close(conn)
+
+            conn = await self.connect()
+            self._opened_at[id(conn)] = time.monotonic()
+            self._in_use += 1
+            return conn
+        except BaseException:
+            semaphore.release()
+            raise
+
+    async def release(self, conn: Any, discard: bool = False):
+        """Return a connection to the pool.
+
+        Args:
+            conn: Connection returned by `acquire`
+            discard: Whether to close the connection instead of reusing it
+        """
+        if not self.owns(conn):
+            return
+        self._in_use -= 1
+        if discard or not self._is_reusable(conn):
+            await self._close(conn)
+        else:
+            self._idle.append(conn)
+        if self._semaphore is not None and self._loop is asyncio.get_running_loop():
+            self._semaphore.release()
+
+    def _is_reusable(self, conn: Any) -> bool:
+        if conn.closed or conn.info.transaction_status != TransactionStatus.IDLE:
+            return False
+        return time.monotonic() - self._opened_at[id(conn)] < self.max_lifetime
+
+    async def _close(self, conn: Any):
+        self._opened_at.pop(id(conn), None)
+        try:
+            await conn.close()
+        except Exception:
+            pass  # Ignore errors when closing an already broken connection
+
+    async def close(self):
+        """Close the idle connections."""
+        idle, self._idle = self._idle, []
+        for conn in idle:
+            await self._close(conn)
+
+    def get_stats(self) -> Dict[str, int]:
+        """Return the number of open, idle and in use connections and waiting requests."""
+        return {
+            'size': len(self._opened_at),
+            'max_size': self.max_size,
+            'idle': len(self._idle),
+            'in_use': self._in_use,
+            'requests_waiting': self._requests_waiting,
+        }
@@ -16,6 +16,14 @@ DSQL_MCP_SERVER_APPLICATION_NAME = 'awslabs.aurora-dsql-mcp-server'
 DSQL_DB_NAME = 'postgres'
 DSQL_DB_PORT = '5432'
 
+# Authentication tokens are valid for 15 minutes. The next token is generated in the
+# background after 10 minutes, and a token is not used for new connections after 14.
+DSQL_AUTH_TOKEN_REFRESH_AFTER = 600
+DSQL_AUTH_TOKEN_EXPIRES_AFTER = 840
+# Aurora DSQL closes connections after one hour, so pooled connections are replaced earlier
+DSQL_CONNECTION_MAX_LIFETIME = 3300
+DEFAULT_MAX_CONNECTIONS = 5
+
 ERROR_EMPTY_SQL_PASSED_TO_READONLY_QUERY = (
     'Incorrect invocation: readonly_query invoked without a SQL statement'
 )
@@ -19,10 +19,15 @@ import asyncio
 import boto3
 import psycopg
 import sys
+from awslabs.aurora_dsql_mcp_server.connection_pool import AuthTokenCache, ConnectionPool
 from awslabs.aurora_dsql_mcp_server.consts import (
     BEGIN_READ_ONLY_TRANSACTION_SQL,
     BEGIN_TRANSACTION_SQL,
     COMMIT_TRANSACTION_SQL,
+    DEFAULT_MAX_CONNECTIONS,
+    DSQL_AUTH_TOKEN_EXPIRES_AFTER,
+    DSQL_AUTH_TOKEN_REFRESH_AFTER,
+    DSQL_CONNECTION_MAX_LIFETIME,
     DSQL_DB_NAME,
     DSQL_DB_PORT,
     DSQL_MCP_SERVER_APPLICATION_NAME,
@@ -51,6 +56,7 @@ from awslabs.aurora_dsql_mcp_server.mutable_sql_detector import (
     detect_mutating_keywords,
     detect_transaction_bypass_attempt,
 )
+from contextlib import asynccontextmanager
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
@@ -63,7 +69,9 @@ database_user = None
 region = None
 read_only = False
 dsql_client = None
-persistent_connection = None
+connection_pool = None
+auth_token_cache = None
+max_connections = DEFAULT_MAX_CONNECTIONS
 aws_profile = None
 
 mcp = FastMCP(
@@ -161,29 +169,28 @@ async def readonly_query(
         raise Exception(ERROR_TRANSACTION_BYPASS_ATTEMPT)
 
     try:
-        conn = await get_connection(ctx)
-
         try:
-            await execute_query(ctx, conn, BEGIN_READ_ONLY_TRANSACTION_SQL)
+            conn = await begin_transaction(ctx, BEGIN_READ_ONLY_TRANSACTION_SQL)
         except Exception as e:
             logger.error(f'{ERROR_BEGIN_READ_ONLY_TRANSACTION}: {str(e)}')
             await ctx.error(INTERNAL_ERROR)
             raise Exception(INTERNAL_ERROR)
 
-        try:
-            rows = await execute_query(ctx, conn, sql)
-            await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
-            return rows
-        except psycopg.errors.ReadOnlySqlTransaction:
-            await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
-            raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
-        except Exception as e:
-            raise e
-        finally:
+        async with pooled_connection(ctx, conn):
             try:
-                await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                rows = await execute_query(ctx, conn, sql)
+                await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
+                return rows
+            except psycopg.errors.ReadOnlySqlTransaction:
+                await ctx.error(READ_ONLY_QUERY_WRITE_ERROR)
+                raise Exception(READ_ONLY_QUERY_WRITE_ERROR)
             except Exception as e:
-                logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(e)}')
+                raise e
+            finally:
+                try:
+                    await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                except Exception as e:
+                    logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(e)}')
 
     except Exception as e:
         await ctx.error(f'{ERROR_READONLY_QUERY}: {str(e)}')
@@ -234,27 +241,26 @@ async def transact(
         raise ValueError(ERROR_EMPTY_SQL_LIST_PASSED_TO_TRANSACT)
 
     try:
-        conn = await get_connection(ctx)
-
         try:
-            await execute_query(ctx, conn, BEGIN_TRANSACTION_SQL)
+            conn = await begin_transaction(ctx, BEGIN_TRANSACTION_SQL)
         except Exception as e:
             logger.error(f'{ERROR_BEGIN_TRANSACTION}: {str(e)}')
             await ctx.error(f'{ERROR_BEGIN_TRANSACTION}: {str(e)}')
             raise Exception(f'{ERROR_BEGIN_TRANSACTION}: {str(e)}')
 
-        try:
-            rows = []
-            for query in sql_list:
-                rows = await execute_query(ctx, conn, query)
-            await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
-            return rows
-        except Exception as e:
+        async with pooled_connection(ctx, conn):
             try:
-                await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
-            except Exception as re:
-                logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(re)}')
-            raise e
+                rows = []
+                for query in sql_list:
+                    rows = await execute_query(ctx, conn, query)
+                await execute_query(ctx, conn, COMMIT_TRANSACTION_SQL)
+                return rows
+            except Exception as e:
+                try:
+                    await execute_query(ctx, conn, ROLLBACK_TRANSACTION_SQL)
+                except Exception as re:
+                    logger.error(f'{ERROR_ROLLBACK_TRANSACTION}: {str(re)}')
+                raise e
 
     except Exception as e:
         await ctx.error(f'{ERROR_TRANSACT}: {str(e)}')
@@ -282,8 +288,8 @@ async def get_schema(
         raise ValueError(ERROR_EMPTY_TABLE_NAME_PASSED_TO_SCHEMA)
 
     try:
-        conn = await get_connection(ctx)
-        return await execute_query(ctx, conn, GET_SCHEMA_SQL, [table_name])
+        async with pooled_connection(ctx) as conn:
+            return await execute_query(ctx, conn, GET_SCHEMA_SQL, [table_name])
     except Exception as e:
         await ctx.error(f'{ERROR_GET_SCHEMA}: {str(e)}')
         raise Exception(f'{ERROR_GET_SCHEMA}: {str(e)}')
@@ -301,32 +307,29 @@ class NoOpCtx:
 
 
 async def get_password_token():  # noqa: D103
-    # Generate a fresh password token for each connection, to ensure the token is not expired
-    # when the connection is established
+    # Tokens are signed locally, but signing may first need to refresh the AWS
+    # credentials, so it runs in a worker thread instead of blocking the event loop
     if database_user == 'admin':
-        return dsql_client.generate_db_connect_admin_auth_token(cluster_endpoint, region)  # pyright: ignore[reportOptionalMemberAccess]
+        generate_token = dsql_client.generate_db_connect_admin_auth_token  # pyright: ignore[reportOptionalMemberAccess]
     else:
-        return dsql_client.generate_db_connect_auth_token(cluster_endpoint, region)  # pyright: ignore[reportOptionalMemberAccess]
-
+        generate_token = dsql_client.generate_db_connect_auth_token  # pyright: ignore[reportOptionalMemberAccess]
+    return await asyncio.to_thread(generate_token, cluster_endpoint, region)
 
-async def get_connection(ctx):  # noqa: D103
-    """Get a connection to the database, creating one if needed or reusing the existing one.
 
-    Args:
-        ctx: MCP context for logging and state management
+async def connect():
+    """Open a new connection to the cluster, authenticated with a cached token.
 
     Returns:
         A database connection
     """
-    global persistent_connection
-
-    # Return the existing connection without health check
-    # The caller will handle reconnection if needed
-    if persistent_connection is not None:
-        return persistent_connection
-
-    # Create a new connection
-    password_token = await get_password_token()
+    global auth_token_cache
+    if auth_token_cache is None:
+        auth_token_cache = AuthTokenCache(
+            lambda: get_password_token(),
+            refresh_after=DSQL_AUTH_TOKEN_REFRESH_AFTER,
+            expires_after=DSQL_AUTH_TOKEN_EXPIRES_AFTER,
+        )
+    password_token = await auth_token_cache.get()
 
     conn_params = {
         'dbname': DSQL_DB_NAME,
@@ -339,49 +342,133 @@ async def get_connection(ctx):  # noqa: D103
     }
 
     logger.info(f'Creating new connection to {cluster_endpoint} as user {database_user}')
-    try:
-        persistent_connection = await psycopg.AsyncConnection.connect(
-            **conn_params, autocommit=True
+    return await psycopg.AsyncConnection.connect(**conn_params, autocommit=True)
+
+
+async def get_connection(ctx):  # noqa: D103
+    """Get a connection from the pool, opening one if none is idle.
+
+    The connection must be returned with `release_connection` once it is no longer
+    used, which `pooled_connection` does.
+
+    Args:
+        ctx: MCP context for logging and state management
+
+    Returns:
+        A database connection
+    """
+    global connection_pool
+    if connection_pool is None:
+        connection_pool = ConnectionPool(
+            connect, max_size=max_connections, max_lifetime=DSQL_CONNECTION_MAX_LIFETIME
         )
-        return persistent_connection
+
+    try:
+        return await connection_pool.acquire()
     except Exception as e:
         logger.error(f'{ERROR_CREATE_CONNECTION} : {e}')
         await ctx.error(f'{ERROR_CREATE_CONNECTION} : {e}')
         raise e
 
 
-async def execute_query(ctx, conn_to_use, query: str, params=None) -> List[dict]:  # noqa: D103
-    if conn_to_use is None:
+async def release_connection(conn, discard: bool = False):
+    """Return a connection obtained from `get_connection` to the pool.
+
+    Args:
+        conn: The connection to return
+        discard: Whether to close the connection instead of reusing it
+    """
+    if connection_pool is not None:
+        await connection_pool.release(conn, discard)
+
+
+@asynccontextmanager
+async def pooled_connection(ctx, conn=None):
+    """Hold a pooled connection for the duration of the block.
+
+    Connections that failed with a connection error are closed instead of reused.
+
+    Args:
+        ctx: MCP context for logging and state management
+        conn: Connection already obtained from `get_connection`, a new one if not given
+    """
+    if conn is None:
         conn = await get_connection(ctx)
-    else:
-        conn = conn_to_use
+    discard = False
+    try:
+        yield conn
+    except (psycopg.OperationalError, psycopg.InterfaceError):
+        discard = True
+        raise
+    finally:
+        await release_connection(conn, discard)
+
+
+async def begin_transaction(ctx, begin_sql: str):
+    """Get a connection from the pool and start a transaction on it.
+
+    A connection the server closed while it was idle in the pool fails the `BEGIN`
+    before anything ran, so it is discarded and the transaction is started once more
+    on a fresh connection.
 
+    Args:
+        ctx: MCP context for logging and state management
+        begin_sql: Statement starting the transaction
+
+    Returns:
+        The connection holding the transaction, to be returned with `release_connection`
+    """
+    conn = await get_connection(ctx)
     try:
-        async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
-            await cur.execute(query, params)  # pyright: ignore[reportArgumentType]
-            if cur.rownumber is None:
-                return []
-            else:
-                return await cur.fetchall()
+        await execute_query(ctx, conn, begin_sql)
+        return conn
     except (psycopg.OperationalError, psycopg.InterfaceError) as e:
-        # Connection issue - reconnect and retry
-        logger.warning(f'Connection error, reconnecting: {e}')
-        global persistent_connection
-        try:
-            if persistent_connection:
-                await persistent_connection.close()
-        except Exception:
-            pass  # Ignore errors when closing an already broken connection
-        persistent_connection = None
+        logger.warning(f'Connection error starting a transaction, reconnecting: {e}')
+        await release_connection(conn, discard=True)
+    except BaseException:
+        await release_connection(conn)
+        raise
 
-        # Get a fresh connection and retry
-        conn = await get_connection(ctx)
-        async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
-            await cur.execute(query, params)  # pyright: ignore[reportArgumentType]
-            if cur.rownumber is None:
-                return []
-            else:
-                return await cur.fetchall()
+    conn = await get_connection(ctx)
+    try:
+        await execute_query(ctx, conn, begin_sql)
+        return conn
+    except (psycopg.OperationalError, psycopg.InterfaceError):
+        await release_connection(conn, discard=True)
+        raise
+    except BaseException:
+        await release_connection(conn)
+        raise
+
+
+async def fetch_rows(conn, query: str, params=None) -> List[dict]:
+    """Run a query on a connection and return its rows as dictionaries.
+
+    Parameterized queries are prepared on the server the first time a connection
+    runs them and reused by later calls on the same connection.
+    """
+    async with conn.cursor(row_factory=psycopg.rows.dict_row) as cur:  # pyright: ignore[reportAttributeAccessIssue]
+        await cur.execute(query, params, prepare=True if params else None)  # pyright: ignore[reportArgumentType]
+        if cur.rownumber is None:
+            return []
+        else:
+            return await cur.fetchall()
+
+
+async def execute_query(ctx, conn_to_use, query: str, params=None) -> List[dict]:  # noqa: D103
+    try:
+        if conn_to_use is not None:
+            # Statements of a transaction are not retried on another connection
+            return await fetch_rows(conn_to_use, query, params)
+
+        try:
+            async with pooled_connection(ctx) as conn:
+                return await fetch_rows(conn, query, params)
+        except (psycopg.OperationalError, psycopg.InterfaceError) as e:
+            # Connection issue - retry on a fresh connection
+            logger.warning(f'Connection error, reconnecting: {e}')
+            async with pooled_connection(ctx) as conn:
+                return await fetch_rows(conn, query, params)
     except Exception as e:
         logger.error(f'{ERROR_EXECUTE_QUERY} : {e}')
         await ctx.error(f'{ERROR_EXECUTE_QUERY} : {e}')
@@ -407,6 +494,12 @@ def main():
         '--profile',
         help='AWS profile to use for credentials',
     )
+    parser.add_argument(
+        '--max_connections',
+        type=int,
+        default=DEFAULT_MAX_CONNECTIONS,
+        help='Maximum number of connections used by concurrent tool calls',
+    )
     args = parser.parse_args()
 
     global cluster_endpoint
@@ -424,6 +517,9 @@ def main():
     global aws_profile
     aws_profile = args.profile
 
+    global max_connections
+    max_connections = args.max_connections
+
     logger.info(
         'Aurora DSQL MCP init with CLUSTER_ENDPOINT:{}, REGION: {}, DATABASE_USER:{}, ALLOW-WRITES:{}, AWS_PROFILE:{}',
         cluster_endpoint,
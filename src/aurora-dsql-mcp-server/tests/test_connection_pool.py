@@ -0,0 +1,124 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the connection pool and authentication token cache."""
+
+import asyncio
+import psycopg
+import pytest
+from awslabs.aurora_dsql_mcp_server.connection_pool import AuthTokenCache, ConnectionPool
+from awslabs.aurora_dsql_mcp_server.server import fetch_rows
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+def create_mock_connection():
+    """Create a mock connection that is idle outside of a transaction."""
+    mock_conn = AsyncMock()
+    mock_conn.closed = False
+    mock_conn.info = MagicMock(transaction_status=psycopg.pq.TransactionStatus.IDLE)
+    return mock_conn
+
+
+async def test_concurrent_callers_get_separate_connections():
+    """Test that callers use separate connections and wait once the pool is full."""
+    connect = AsyncMock(side_effect=lambda: create_mock_connection())
+    pool = ConnectionPool(connect, max_size=2, max_lifetime=3300)
+
+    conn1 = await pool.acquire()
+    conn2 = await pool.acquire()
+    assert conn1 is not conn2
+
+    waiting = asyncio.create_task(pool.acquire())
+    await asyncio.sleep(0)
+    assert not waiting.done()
+    assert pool.get_stats()['requests_waiting'] == 1
+
+    await pool.release(conn1)
+    assert await waiting is conn1
+    assert connect.call_count == 2
+    assert pool.get_stats() == {
+        'size': 2,
+        'max_size': 2,
+        'idle': 0,
+        'in_use': 2,
+        'requests_waiting': 0,
+    }
+
+
+async def test_unusable_connections_are_not_reused():
+    """Test that broken, expired or mid-transaction connections are replaced."""
+    connect = AsyncMock(side_effect=lambda: create_mock_connection())
+    pool = ConnectionPool(connect, max_size=1, max_lifetime=3300)
+
+    conn = await pool.acquire()
+    conn.info.transaction_status = psycopg.pq.TransactionStatus.INERROR
+    await pool.release(conn)
+    conn.close.assert_awaited_once()
+
+    conn = await pool.acquire()
+    await pool.release(conn, discard=True)
+    assert connect.call_count == 2
+
+    pool.max_lifetime = 0
+    conn = await pool.acquire()
+    await pool.release(conn)
+    assert await pool.acquire() is not conn
+    assert pool.get_stats()['size'] == 1
+
+
+async def test_failed_connect_frees_the_slot():
+    """Test that a failed connection attempt does not use up the pool."""
+    connect = AsyncMock(side_effect=[Exception('Connection error'), create_mock_connection()])
+    pool = ConnectionPool(connect, max_size=1, max_lifetime=3300)
+
+    with pytest.raises(Exception, match='Connection error'):
+        await pool.acquire()
+    assert await pool.acquire() is not None
+
+
+async def test_token_is_generated_ahead_of_expiry():
+    """Test that the next token is generated in the background before the token expires."""
+    tokens = iter(['token1', 'token2', 'token3'])
+    generate_token = AsyncMock(side_effect=lambda: next(tokens))
+    cache = AuthTokenCache(generate_token, refresh_after=600, expires_after=840)
+
+    with patch('awslabs.aurora_dsql_mcp_server.connection_pool.time') as mock_time:
+        mock_time.monotonic.return_value = 1000
+        assert await cache.get() == 'token1'
+        mock_time.monotonic.return_value = 1500
+        assert await cache.get() == 'token1'
+        assert generate_token.call_count == 1
+
+        # The cached token is handed out while the next one is generated
+        mock_time.monotonic.return_value = 1700
+        assert await cache.get() == 'token1'
+        await asyncio.sleep(0)
+        assert await cache.get() == 'token2'
+
+        # An expired token is never handed out
+        mock_time.monotonic.return_value = 2600
+        assert await cache.get() == 'token3'
+
+
+async def test_parameterized_queries_are_prepared():
+    """Test that only parameterized queries are prepared on the server."""
+    mock_cursor = AsyncMock()
+    mock_cursor.__aenter__ = AsyncMock(return_value=mock_cursor)
+    mock_conn = MagicMock()
+    mock_conn.cursor.return_value = mock_cursor
+
+    await fetch_rows(mock_conn, 'SELECT * FROM t WHERE a = %s', ['x'])
+    await fetch_rows(mock_conn, 'SELECT 1')
+
+    assert mock_cursor.execute.call_args_list[0].kwargs == {'prepare': True}
+    assert mock_cursor.execute.call_args_list[1].kwargs == {'prepare': None}
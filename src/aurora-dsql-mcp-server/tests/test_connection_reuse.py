@@ -3,17 +3,23 @@
 import pytest
 import psycopg
 from unittest.mock import AsyncMock, patch, MagicMock
-from awslabs.aurora_dsql_mcp_server.server import execute_query, get_connection
+from awslabs.aurora_dsql_mcp_server.server import (
+    execute_query,
+    get_connection,
+    release_connection,
+)
 
 ctx = AsyncMock()
 
 @pytest.fixture
 async def reset_persistent_connection():
-    """Reset the persistent connection before and after each test."""
+    """Reset the connection pool before and after each test."""
     import awslabs.aurora_dsql_mcp_server.server as server
-    server.persistent_connection = None
+    server.connection_pool = None
+    server.auth_token_cache = None
     yield
-    server.persistent_connection = None
+    server.connection_pool = None
+    server.auth_token_cache = None
 
 def create_mock_connection():
     """Create a mock connection with cursor context manager."""
@@ -24,6 +30,7 @@ def create_mock_connection():
     mock_cursor.execute = AsyncMock()
     mock_conn.cursor = MagicMock(return_value=mock_cursor)
     mock_conn.closed = False
+    mock_conn.info = MagicMock(transaction_status=psycopg.pq.TransactionStatus.IDLE)
     return mock_conn, mock_cursor
 
 @pytest.mark.asyncio
@@ -43,8 +50,9 @@ async def test_connection_reuse(mocker, reset_persistent_connection):
     result1 = await get_connection(ctx)
     assert mock_connect.call_count == 1
     assert result1 is mock_conn
+    await release_connection(result1)
 
-    # Second connection attempt should reuse the existing connection
+    # Second connection attempt should reuse the released connection
     result2 = await get_connection(ctx)
     assert mock_connect.call_count == 1  # Connection count should not increase
     assert result2 is mock_conn  # Should be the same connection object
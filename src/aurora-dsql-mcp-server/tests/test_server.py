@@ -39,6 +39,7 @@ from awslabs.aurora_dsql_mcp_server.server import (
     transact,
 )
 from unittest.mock import AsyncMock, MagicMock, call, patch
+from psycopg import OperationalError
 from psycopg.errors import ReadOnlySqlTransaction
 
 
@@ -59,11 +60,13 @@ def create_mock_connection():
 
 @pytest.fixture
 async def reset_persistent_connection():
-    """Reset the persistent connection before and after each test."""
+    """Reset the connection pool before and after each test."""
     import awslabs.aurora_dsql_mcp_server.server as server
-    server.persistent_connection = None
+    server.connection_pool = None
+    server.auth_token_cache = None
     yield
-    server.persistent_connection = None
+    server.connection_pool = None
+    server.auth_token_cache = None
 
 
 async def test_readonly_query_throws_exception_on_empty_input():
@@ -266,6 +269,43 @@ async def test_readonly_query_internal_error_on_failed_begin(mocker):
     mock_execute_query.assert_called_once_with(ctx, mock_conn, BEGIN_READ_ONLY_TRANSACTION_SQL)
 
 
+async def test_readonly_query_retries_begin_on_dropped_connection(mocker):
+    mock_execute_query = mocker.patch('awslabs.aurora_dsql_mcp_server.server.execute_query')
+    mock_execute_query.side_effect = (
+        OperationalError('server closed the connection'),
+        '',
+        {'column': 1},
+        '',
+        '',
+    )
+
+    mock_get_connection = mocker.patch(
+        'awslabs.aurora_dsql_mcp_server.server.get_connection'
+    )
+    mock_release_connection = mocker.patch(
+        'awslabs.aurora_dsql_mcp_server.server.release_connection'
+    )
+    dropped_conn, fresh_conn = AsyncMock(), AsyncMock()
+    mock_get_connection.side_effect = (dropped_conn, fresh_conn)
+
+    sql = 'select 1'
+    result = await readonly_query(sql, ctx)
+
+    assert result == {'column': 1}
+    mock_execute_query.assert_has_calls(
+        [
+            call(ctx, dropped_conn, BEGIN_READ_ONLY_TRANSACTION_SQL),
+            call(ctx, fresh_conn, BEGIN_READ_ONLY_TRANSACTION_SQL),
+            call(ctx, fresh_conn, sql),
+            call(ctx, fresh_conn, COMMIT_TRANSACTION_SQL),
+        ]
+    )
+    assert mock_release_connection.call_args_list == [
+        call(dropped_conn, discard=True),
+        call(fresh_conn, False),
+    ]
+
+
 async def test_readonly_query_error_on_write_sql(mocker):
     mock_execute_query = mocker.patch('awslabs.aurora_dsql_mcp_server.server.execute_query')
     mock_execute_query.side_effect = ('', ReadOnlySqlTransaction(''), '')
@@ -360,3 +400,31 @@ async def test_transact_error_on_failed_begin(mocker):
     assert ERROR_BEGIN_TRANSACTION in str(excinfo.value)
 
     mock_execute_query.assert_called_once_with(ctx, mock_conn, BEGIN_TRANSACTION_SQL)
+
+
+@patch('awslabs.aurora_dsql_mcp_server.server.read_only', False)
+async def test_transact_retries_begin_once(mocker):
+    mock_execute_query = mocker.patch('awslabs.aurora_dsql_mcp_server.server.execute_query')
+    mock_execute_query.side_effect = OperationalError('server closed the connection')
+
+    mock_get_connection = mocker.patch(
+        'awslabs.aurora_dsql_mcp_server.server.get_connection'
+    )
+    mock_release_connection = mocker.patch(
+        'awslabs.aurora_dsql_mcp_server.server.release_connection'
+    )
+    dropped_conn, fresh_conn = AsyncMock(), AsyncMock()
+    mock_get_connection.side_effect = (dropped_conn, fresh_conn)
+
+    with pytest.raises(Exception) as excinfo:
+        await transact(['select 1'], ctx)
+    assert ERROR_BEGIN_TRANSACTION in str(excinfo.value)
+
+    assert mock_execute_query.call_args_list == [
+        call(ctx, dropped_conn, BEGIN_TRANSACTION_SQL),
+        call(ctx, fresh_conn, BEGIN_TRANSACTION_SQL),
+    ]
+    assert mock_release_connection.call_args_list == [
+        call(dropped_conn, discard=True),
+        call(fresh_conn, discard=True),
+    ]
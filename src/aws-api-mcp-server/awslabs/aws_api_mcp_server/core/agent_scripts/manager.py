@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import frontmatter
+import functools
 import os
 from ..common.config import CUSTOM_SCRIPTS_DIR
 from .models import Script
@@ -79,7 +80,10 @@ class AgentScriptsManager:
         )
 
 
-custom_scripts_dir = (
-    Path(CUSTOM_SCRIPTS_DIR) if CUSTOM_SCRIPTS_DIR and CUSTOM_SCRIPTS_DIR.strip() else None
-)
-AGENT_SCRIPTS_MANAGER = AgentScriptsManager(custom_scripts_dir=custom_scripts_dir)
+@functools.cache
+def get_agent_scripts_manager() -> AgentScriptsManager:
+    """Return the scripts manager, loading the scripts on first use."""
+    custom_scripts_dir = (
+        Path(CUSTOM_SCRIPTS_DIR) if CUSTOM_SCRIPTS_DIR and CUSTOM_SCRIPTS_DIR.strip() else None
+    )
+    return AgentScriptsManager(custom_scripts_dir=custom_scripts_dir)
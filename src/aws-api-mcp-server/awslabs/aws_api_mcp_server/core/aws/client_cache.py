@@ -0,0 +1,154 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import boto3
+import hashlib
+import threading
+import time
+from ..common.config import CLIENT_CACHE_SIZE, CLIENT_CACHE_TTL_SECONDS
+from botocore.client import BaseClient
+from botocore.config import Config
+from collections import OrderedDict
+from typing import Any, NamedTuple
+
+
+class ClientKey(NamedTuple):
+    """Identifies a boto3 client that can be shared between calls."""
+
+    service_name: str
+    region: str
+    endpoint_url: str | None
+    credentials_fingerprint: str
+
+
+class _CacheEntry(NamedTuple):
+    client: BaseClient
+    expires_at: float
+
+
+def credentials_fingerprint(
+    access_key_id: str, secret_access_key: str, session_token: str | None
+) -> str:
+    """Return a digest identifying a set of credentials without keeping them in the key."""
+    digest = hashlib.sha256()
+    for part in (access_key_id, secret_access_key, session_token or ''):
+        digest.update(part.encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+class ClientCache:
+    """Bounded LRU cache of boto3 clients with TTL eviction.
+
+    Reusing clients avoids reloading endpoint rulesets and service models and keeps
+    the underlying connection pool warm between calls. Entries expire after the
+    configured TTL. Refreshed temporary credentials have a new fingerprint, so clients
+    built with stale credentials are never reused.
+    """
+
+    def __init__(self, max_size: int, ttl_seconds: float):
+        """Initialize the cache with a maximum number of clients and a TTL in seconds."""
+        self._max_size = max_size
+        self._ttl_seconds = ttl_seconds
+        self._entries: OrderedDict[ClientKey, _CacheEntry] = OrderedDict()
+        # The default boto3 session is not thread-safe, and clients are created from
+        # executor threads, so each cache creates its clients from its own session.
+        # Creating a client loads the service model, so it holds a separate lock to
+        # keep cache hits on other threads from waiting behind a miss
+        self._session = boto3.Session()
+        self._session_lock = threading.Lock()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if clients are cached at all."""
+        return self._max_size > 0 and self._ttl_seconds > 0
+
+    def get_client(
+        self,
+        service_name: str,
+        region: str,
+        access_key_id: str,
+        secret_access_key: str,
+        session_token: str | None,
+        config: Config,
+        endpoint_url: str | None = None,
+    ) -> BaseClient:
+        """Return a cached client for the given key, creating one on a miss."""
+        key = ClientKey(
+            service_name=service_name,
+            region=region,
+            endpoint_url=endpoint_url,
+            credentials_fingerprint=credentials_fingerprint(
+                access_key_id, secret_access_key, session_token
+            ),
+        )
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at > now:
+                self._entries.move_to_end(key)
+                self._hits += 1
+                return entry.client
+            if entry is not None:
+                del self._entries[key]
+                self._evictions += 1
+            self._misses += 1
+
+        with self._session_lock:
+            client = self._session.client(
+                service_name,
+                aws_access_key_id=access_key_id,
+                aws_secret_access_key=secret_access_key,
+                aws_session_token=session_token,
+                config=config,
+                endpoint_url=endpoint_url,
+            )
+
+        if not self.enabled:
+            return client
+
+        with self._lock:
+            self._entries[key] = _CacheEntry(client=client, expires_at=now + self._ttl_seconds)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+        return client
+
+    def clear(self):
+        """Drop all cached clients and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def stats(self) -> dict[str, Any]:
+        """Return the hit, miss and eviction counters along with the current size."""
+        with self._lock:
+            return {
+                'client_cache_hits': self._hits,
+                'client_cache_misses': self._misses,
+                'client_cache_evictions': self._evictions,
+                'client_cache_size': len(self._entries),
+            }
+
+
+CLIENT_CACHE = ClientCache(max_size=CLIENT_CACHE_SIZE, ttl_seconds=CLIENT_CACHE_TTL_SECONDS)
@@ -24,6 +24,7 @@ from ..common.models import Credentials, InterpretedProgram, IRTranslation
 from ..parser.interpretation import interpret
 from ..parser.parser import parse
 from .regions import GLOBAL_SERVICE_REGIONS
+from .streaming import ProgressCallback
 from awslabs.aws_api_mcp_server.core.common.config import AWS_API_MCP_PROFILE_NAME
 from botocore.exceptions import NoCredentialsError
 
@@ -81,6 +82,7 @@ def interpret_command(
     cli_command: str,
     max_results: int | None = None,
     credentials: Credentials | None = None,
+    progress: ProgressCallback | None = None,
 ) -> InterpretedProgram:
     """Interpret the CLI command.
 
@@ -90,8 +92,21 @@ def interpret_command(
     The response contains any validation errors found during
     validating the command, as well as any errors that occur during interpretation.
     """
-    translation = translate_cli_to_ir(cli_command)
+    return interpret_translation(
+        translate_cli_to_ir(cli_command),
+        max_results=max_results,
+        credentials=credentials,
+        progress=progress,
+    )
+
 
+def interpret_translation(
+    translation: IRTranslation,
+    max_results: int | None = None,
+    credentials: Credentials | None = None,
+    progress: ProgressCallback | None = None,
+) -> InterpretedProgram:
+    """Interpret a CLI command that was already translated to an intermediate representation."""
     if translation.command is None:
         return InterpretedProgram(translation=translation)
 
@@ -116,6 +131,7 @@ def interpret_command(
             client_side_filter=translation.command.client_side_filter,
             max_results=max_results,
             endpoint_url=translation.command.endpoint_url,
+            progress=progress,
         )
     except botocore.exceptions.ClientError as error:
         service_error = str(error)
@@ -12,6 +12,7 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from ..common.helpers import as_json
 from .services import PaginationConfig
 from botocore.paginate import PageIterator, Paginator
 from botocore.utils import merge_dicts, set_value_from_jmespath
@@ -24,20 +25,30 @@ def _merge_page_into_result(
     result: dict[str, Any],
     page: dict[str, Any],
     page_iterator: PageIterator,
-) -> dict[str, Any]:
+    merged_values: dict[str, Any],
+    measure_size: bool = False,
+) -> int:
+    """Merge the result keys of a page into the result and return their serialized size.
+
+    `merged_values` keeps a reference to the value stored in `result` for each result
+    key, so lists are extended in place instead of being searched for on every page.
+    The size is only measured when `measure_size` is set and is 0 otherwise.
+    """
+    page_size = 0
     for result_expression in page_iterator.result_keys:
         result_value = result_expression.search(page)
         if result_value is None:
             continue
 
-        existing_value = result_expression.search(result)
+        if measure_size:
+            page_size += len(as_json(result_value))
+
+        expression = result_expression.expression
+        existing_value = merged_values.get(expression)
         if existing_value is None:
             # Set the initial result
-            set_value_from_jmespath(
-                result,
-                result_expression.expression,
-                result_value,
-            )
+            set_value_from_jmespath(result, expression, result_value)
+            merged_values[expression] = result_value
             continue
 
         # Merge with existing value
@@ -45,13 +56,21 @@ def _merge_page_into_result(
             existing_value.extend(result_value)
         elif isinstance(result_value, (int | float | str)):
             # Modify the existing result with the sum or concatenation
-            set_value_from_jmespath(
-                result,
-                result_expression.expression,
-                existing_value + result_value,
-            )
+            merged_values[expression] = existing_value + result_value
+            set_value_from_jmespath(result, expression, merged_values[expression])
 
-    return result
+    return page_size
+
+
+def _stop_at_page(page_iterator: PageIterator, page: dict[str, Any]):
+    """Record the token for the page following `page` so the caller can resume from it."""
+    if page_iterator.resume_token is not None:
+        # The page was truncated by MaxItems and the resume token is already set
+        return
+
+    next_token = page_iterator._get_next_token(page)
+    if any(token is not None for token in next_token.values()):
+        page_iterator.resume_token = next_token
 
 
 def _finalize_result(
@@ -82,15 +101,21 @@ def build_result(
     operation_parameters: dict[str, Any],
     pagination_config: PaginationConfig,
     client_side_filter: ParsedResult | None = None,
+    max_response_bytes: int | None = None,
 ):
     """This function is based on build_full_result in botocore with some modifications.
 
     to take into account token limits, max results and timeouts. The first page is always processed.
+    Pages are streamed into the result, and when `max_response_bytes` is set pagination
+    stops at the first page boundary past that budget. The result then carries a
+    `pagination_token` that can be passed back with `--starting-token`.
 
     https://github.com/boto/botocore/blob/master/botocore/paginate.py#L481
     """
     result: dict[str, Any] = {}
+    merged_values: dict[str, Any] = {}
     response_metadata = None
+    response_size = 0
 
     logger.info(
         f'Building pagination result for {service_name} {operation_name} with config: {pagination_config}'
@@ -105,8 +130,18 @@ def build_result(
             page = response[1]
 
         # For each page in the response we need to inject the necessary components from the page into the result.
-        _merge_page_into_result(result, page, page_iterator)
+        response_size += _merge_page_into_result(
+            result, page, page_iterator, merged_values, measure_size=bool(max_response_bytes)
+        )
 
         response_metadata = page.get('ResponseMetadata')
 
+        if max_response_bytes and response_size >= max_response_bytes:
+            logger.info(
+                f'Stopping pagination for {service_name} {operation_name} after '
+                f'{response_size} bytes (budget: {max_response_bytes} bytes)'
+            )
+            _stop_at_page(page_iterator, page)
+            break
+
     return _finalize_result(result, page_iterator, response_metadata, client_side_filter)
@@ -12,6 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from ..common.config import get_user_agent_extra
+from ..common.models import Credentials
+from .client_cache import CLIENT_CACHE
+from botocore.config import Config
+
+
 # These global services don't have regionalized endpoints
 NON_REGIONALIZED_SERVICES = ('iam', 'route53')
 
@@ -26,3 +32,17 @@ GLOBAL_SERVICE_REGIONS = {
     'route53domains': 'us-east-1',
     'sagemaker-geospatial': 'us-west-2',
 }
+
+
+def get_enabled_regions(credentials: Credentials, region: str) -> list[str]:
+    """Return the regions enabled for the account the given credentials belong to."""
+    client = CLIENT_CACHE.get_client(
+        'ec2',
+        region=region,
+        access_key_id=credentials.access_key_id,
+        secret_access_key=credentials.secret_access_key,
+        session_token=credentials.session_token,
+        config=Config(region_name=region, user_agent_extra=get_user_agent_extra()),
+    )
+    response = client.describe_regions(AllRegions=False)
+    return sorted(enabled_region['RegionName'] for enabled_region in response['Regions'])
@@ -12,10 +12,18 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import contextlib
+import copy
+import dataclasses
 from ..aws.services import get_awscli_driver
-from ..common.config import AWS_API_MCP_PROFILE_NAME, DEFAULT_REGION
+from ..common.config import (
+    AWS_API_MCP_PROFILE_NAME,
+    DEFAULT_REGION,
+    FAN_OUT_REGION_TIMEOUT_SECONDS,
+)
 from ..common.errors import AwsApiMcpError, Failure
+from ..common.executor import TOOL_EXECUTOR
 from ..common.models import (
     AwsApiMcpServerErrorResponse,
     AwsCliAliasResponse,
@@ -25,8 +33,10 @@ from ..common.models import (
     InterpretationResponse,
     InterpretedProgram,
     IRTranslation,
+    MultiRegionInterpretationResponse,
     ProgramInterpretationResponse,
     ProgramValidationResponse,
+    RegionInterpretationResult,
 )
 from ..common.models import Context as ContextAPIModel
 from ..common.models import ValidationFailure as FailureAPIModel
@@ -35,9 +45,12 @@ from ..metadata.read_only_operations_list import (
 )
 from ..parser.lexer import split_cli_command
 from ..security.policy import PolicyDecision, SecurityPolicy
+from .driver import get_local_credentials, interpret_translation
 from .driver import interpret_command as _interpret_command
+from .regions import GLOBAL_SERVICE_REGIONS, NON_REGIONALIZED_SERVICES, get_enabled_regions
+from .streaming import ProgressCallback
 from awslabs.aws_api_mcp_server.core.common.command import IRCommand
-from awslabs.aws_api_mcp_server.core.common.helpers import operation_timer
+from awslabs.aws_api_mcp_server.core.common.helpers import operation_timer, validate_aws_region
 from fastmcp import Context
 from fastmcp.server.elicitation import AcceptedElicitation
 from io import StringIO
@@ -47,6 +60,9 @@ from mcp.types import METHOD_NOT_FOUND
 from typing import Any
 
 
+ALL_REGIONS = 'all'
+
+
 async def request_consent(cli_command: str, ctx: Context):
     """Request consent of the user using elicitation."""
     try:
@@ -168,14 +184,39 @@ def interpret_command(
     cli_command: str,
     max_results: int | None = None,
     credentials: Credentials | None = None,
+    progress: ProgressCallback | None = None,
 ) -> ProgramInterpretationResponse:
     """Interpret the given CLI command and return an interpretation response."""
     interpreted_program = _interpret_command(
         cli_command,
         max_results=max_results,
         credentials=credentials,
+        progress=progress,
+    )
+    return _to_interpretation_response(interpreted_program)
+
+
+def interpret_command_in_region(
+    ir_command: IRCommand,
+    region: str,
+    max_results: int | None = None,
+    credentials: Credentials | None = None,
+) -> ProgramInterpretationResponse:
+    """Interpret an already parsed and validated command in the given region."""
+    command = dataclasses.replace(
+        ir_command, region=region, parameters=copy.deepcopy(ir_command.parameters)
+    )
+    interpreted_program = interpret_translation(
+        IRTranslation(command=command, command_metadata=command.command_metadata),
+        max_results=max_results,
+        credentials=credentials,
     )
+    return _to_interpretation_response(interpreted_program)
 
+
+def _to_interpretation_response(
+    interpreted_program: InterpretedProgram,
+) -> ProgramInterpretationResponse:
     validation_failures = (
         []
         if not interpreted_program.translation.validation_or_translation_failures
@@ -212,6 +253,78 @@ def interpret_command(
     )
 
 
+async def interpret_command_in_regions(
+    cli_command: str,
+    ir_command: IRCommand,
+    regions: list[str],
+    max_results: int | None = None,
+    credentials: Credentials | None = None,
+) -> MultiRegionInterpretationResponse:
+    """Interpret the given CLI command concurrently in each of the given regions.
+
+    Passing `all` as the only region runs the command in every region enabled for the
+    account. The command was parsed, validated and policy-checked once, and each region
+    runs a copy of it with the region swapped in. Global services are called only once
+    instead of once per region. Regions share the executor and
+    concurrency limit of `call_aws`, and each is bounded by its own timeout, counted
+    from when it gets a concurrency slot; failures are reported per region instead of
+    failing the whole call.
+    """
+    if any(
+        token == '--region' or token.startswith('--region=')
+        for token in split_cli_command(cli_command)
+    ):
+        raise AwsApiMcpError('--region cannot be combined with a list of regions')
+
+    for region in regions:
+        if region != ALL_REGIONS:
+            # Regions are passed to the clients as-is, so they must be well formed
+            validate_aws_region(region)
+
+    # Resolve credentials once so that every region shares them (and their clients)
+    if credentials is None:
+        credentials = await TOOL_EXECUTOR.run(
+            'call_aws',
+            get_local_credentials,
+            profile=ir_command.profile or AWS_API_MCP_PROFILE_NAME,
+        )
+
+    if regions == [ALL_REGIONS]:
+        regions = await TOOL_EXECUTOR.run(
+            'call_aws', get_enabled_regions, credentials, ir_command.region
+        )
+
+    # Global services answer the same in every region, so they are called only once
+    regions = list(dict.fromkeys(regions))
+    if ir_command.service_name in GLOBAL_SERVICE_REGIONS:
+        regions = [GLOBAL_SERVICE_REGIONS[ir_command.service_name]]
+    elif ir_command.service_name in NON_REGIONALIZED_SERVICES:
+        regions = regions[:1]
+
+    async def interpret_in_region(region: str) -> RegionInterpretationResult:
+        try:
+            response = await TOOL_EXECUTOR.run(
+                'call_aws',
+                interpret_command_in_region,
+                ir_command,
+                region,
+                max_results=max_results,
+                credentials=credentials,
+                timeout=FAN_OUT_REGION_TIMEOUT_SECONDS,
+            )
+        except asyncio.TimeoutError:
+            return RegionInterpretationResult(
+                region=region,
+                error=f'Timed out after {FAN_OUT_REGION_TIMEOUT_SECONDS} seconds',
+            )
+        except Exception as e:
+            return RegionInterpretationResult(region=region, error=str(e))
+        return RegionInterpretationResult(region=region, response=response)
+
+    results = await asyncio.gather(*(interpret_in_region(region) for region in regions))
+    return MultiRegionInterpretationResponse(results=list(results))
+
+
 def _ir_metadata(program: InterpretedProgram | None) -> InterpretationMetadata | None:
     if program and program.translation and program.translation.command:
         command = program.translation.command
@@ -143,8 +143,27 @@ CUSTOM_OPERATION_FILTERS = {
 }
 
 
+# Filters parsed from the operation documentation, keyed by service, API version and
+# operation name. Parsing the HTML documentation is expensive and the result never
+# changes for a given model, so every operation is only parsed once per process.
+_OPERATION_FILTERS_CACHE: dict[tuple[str, str, str], OperationFilters] = {}
+
+
 def get_operation_filters(operation: OperationModel) -> OperationFilters:
     """Given an operation, find all its filters."""
+    key = (
+        str(operation.service_model.service_name),
+        str(operation.service_model.api_version),
+        str(operation.name),
+    )
+    operation_filters = _OPERATION_FILTERS_CACHE.get(key)
+    if operation_filters is None:
+        operation_filters = _parse_operation_filters(operation)
+        _OPERATION_FILTERS_CACHE[key] = operation_filters
+    return operation_filters
+
+
+def _parse_operation_filters(operation: OperationModel) -> OperationFilters:
     filters = operation.input_shape._shape_model.get('members', {}).get('Filters')  # type: ignore[attr-defined]
 
     if not filters or 'documentation' not in filters:
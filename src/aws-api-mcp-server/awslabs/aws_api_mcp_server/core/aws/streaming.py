@@ -0,0 +1,220 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import os
+import threading
+import time
+from botocore.client import BaseClient
+from botocore.exceptions import IncompleteReadError
+from botocore.response import StreamingBody
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from loguru import logger
+from typing import Any
+
+
+CHUNK_SIZE = 4 * 1024 * 1024
+PROGRESS_INTERVAL_SECONDS = 0.5
+
+ProgressCallback = Callable[[int, int | None], None]
+
+
+class ProgressTracker:
+    """Thread-safe byte counter that reports progress at most every `interval` seconds."""
+
+    def __init__(
+        self,
+        total: int | None,
+        callback: ProgressCallback | None,
+        interval: float = PROGRESS_INTERVAL_SECONDS,
+    ):
+        """Initialize the tracker with the expected number of bytes and a callback."""
+        self.total = total
+        self.done = 0
+        self._callback = callback
+        self._interval = interval
+        self._last_report = float('-inf')
+        self._lock = threading.Lock()
+
+    def add(self, num_bytes: int):
+        """Record that `num_bytes` more bytes were written."""
+        with self._lock:
+            self.done += num_bytes
+            now = time.monotonic()
+            if self._callback is None or now - self._last_report < self._interval:
+                return
+            self._last_report = now
+            done = self.done
+        self._report(done)
+
+    def finish(self):
+        """Report the final number of bytes written."""
+        with self._lock:
+            done = self.done
+        self._report(done)
+
+    def _report(self, done: int):
+        if self._callback is None:
+            return
+        try:
+            self._callback(done, self.total)
+        except Exception as e:
+            # Progress is best effort and must never fail the download
+            logger.debug('Failed to report progress: {}', e)
+
+
+def write_streaming_output(
+    client: BaseClient,
+    operation_name: str,
+    parameters: dict[str, Any],
+    response: dict[str, Any],
+    response_key: str,
+    path: str,
+    part_size: int,
+    max_concurrency: int,
+    progress: ProgressCallback | None = None,
+):
+    """Write the streaming member of `response` to `path`.
+
+    Large objects of operations that accept a byte range (such as S3 `GetObject`) are
+    downloaded in parts: the first part is read from the response that is already
+    open, and the remaining parts are fetched with concurrent ranged requests pinned
+    to the same ETag and written at their offset into a preallocated file. Anything
+    else is copied sequentially.
+    """
+    body = response[response_key]
+    total = response.get('ContentLength')
+    tracker = ProgressTracker(total, progress)
+
+    if isinstance(total, int) and _supports_ranged_download(
+        client, operation_name, parameters, response, total, part_size, max_concurrency
+    ):
+        _write_in_parts(
+            client,
+            operation_name,
+            parameters,
+            body,
+            response_key,
+            path,
+            etag=response['ETag'],
+            total=total,
+            part_size=part_size,
+            max_concurrency=max_concurrency,
+            tracker=tracker,
+        )
+    else:
+        with open(path, 'wb') as f:
+            for chunk in body.iter_chunks(chunk_size=CHUNK_SIZE):
+                f.write(chunk)
+                tracker.add(len(chunk))
+
+    tracker.finish()
+
+
+def _supports_ranged_download(
+    client: BaseClient,
+    operation_name: str,
+    parameters: dict[str, Any],
+    response: dict[str, Any],
+    total: int,
+    part_size: int,
+    max_concurrency: int,
+) -> bool:
+    if not hasattr(os, 'pwrite') or max_concurrency < 2 or part_size <= 0:
+        return False
+
+    if total <= part_size:
+        return False
+
+    # Without an ETag the parts could come from different versions of the object, and a
+    # response that is already partial (Range or PartNumber given) must be kept as is.
+    if not response.get('ETag') or response.get('ContentRange'):
+        return False
+    if 'Range' in parameters or 'PartNumber' in parameters:
+        return False
+
+    operation_model = client.meta.service_model.operation_model(
+        client.meta.method_to_api_mapping[operation_name]
+    )
+    input_members = operation_model.input_shape.members if operation_model.input_shape else {}
+    return 'Range' in input_members and 'IfMatch' in input_members
+
+
+def _write_in_parts(
+    client: BaseClient,
+    operation_name: str,
+    parameters: dict[str, Any],
+    body: StreamingBody,
+    response_key: str,
+    path: str,
+    etag: str,
+    total: int,
+    part_size: int,
+    max_concurrency: int,
+    tracker: ProgressTracker,
+):
+    operation = getattr(client, operation_name)
+
+    def fetch_part(start: int, end: int):
+        # An IfMatch given by the caller already matched the ETag of the first response
+        part = operation(**{**parameters, 'Range': f'bytes={start}-{end}', 'IfMatch': etag})
+        _copy_range(part[response_key], fd, start, end - start + 1, tracker)
+
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        # Sizing the file up front lets every part be written at its own offset. On most
+        # file systems this creates a sparse file, so no bytes are written twice.
+        os.ftruncate(fd, total)
+
+        # The calling thread reads the first part, so one less worker is needed
+        with ThreadPoolExecutor(
+            max_workers=max_concurrency - 1, thread_name_prefix='aws-api-mcp-download'
+        ) as pool:
+            futures = [
+                pool.submit(fetch_part, start, min(start + part_size, total) - 1)
+                for start in range(part_size, total, part_size)
+            ]
+            try:
+                _copy_range(body, fd, 0, part_size, tracker)
+                body.close()
+                for future in futures:
+                    future.result()
+            except BaseException:
+                for future in futures:
+                    future.cancel()
+                raise
+    except BaseException:
+        os.close(fd)
+        # A preallocated file has its final size even when parts are missing
+        os.unlink(path)
+        raise
+    os.close(fd)
+
+
+def _copy_range(body: StreamingBody, fd: int, offset: int, length: int, tracker: ProgressTracker):
+    remaining = length
+    while remaining > 0:
+        chunk = body.read(min(CHUNK_SIZE, remaining))
+        if not chunk:
+            break
+        view = memoryview(chunk)
+        while view:
+            written = os.pwrite(fd, view, offset)
+            offset += written
+            view = view[written:]
+        remaining -= len(chunk)
+        tracker.add(len(chunk))
+
+    if remaining > 0:
+        raise IncompleteReadError(actual_bytes=length - remaining, expected_bytes=length)
@@ -18,7 +18,7 @@ import os
 import tempfile
 from loguru import logger
 from pathlib import Path
-from typing import Literal, cast
+from typing import Literal, cast, get_args
 
 
 # Get package version for user agent
@@ -81,6 +81,17 @@ def get_transport_from_env() -> Literal['stdio', 'streamable-http']:
     return cast(Literal['stdio', 'streamable-http'], transport)
 
 
+ExecutorKind = Literal['thread', 'process']
+
+
+def get_executor_kind_from_env() -> ExecutorKind:
+    """Get the type of pool blocking tool work runs on from an environment variable."""
+    executor_kind = os.getenv('AWS_API_MCP_EXECUTOR', 'thread')
+    if executor_kind not in get_args(ExecutorKind):
+        raise ValueError(f'Invalid executor: {executor_kind}')
+    return cast(ExecutorKind, executor_kind)
+
+
 def get_user_agent_extra() -> str:
     """Get the user agent extra string."""
     user_agent_extra = f'awslabs/mcp/AWS-API-MCP-server/{PACKAGE_VERSION}'
@@ -109,6 +120,20 @@ CUSTOM_SCRIPTS_DIR = os.getenv('AWS_API_MCP_AGENT_SCRIPTS_DIR')
 ALLOW_UNRESTRICTED_LOCAL_FILE_ACCESS = get_env_bool(
     ALLOW_UNRESTRICTED_LOCAL_FILE_ACCESS_KEY, False
 )
+CLIENT_CACHE_SIZE = int(os.getenv('AWS_API_MCP_CLIENT_CACHE_SIZE', 64))
+CLIENT_CACHE_TTL_SECONDS = int(os.getenv('AWS_API_MCP_CLIENT_CACHE_TTL_SECONDS', 900))
+PARSE_CACHE_SIZE = int(os.getenv('AWS_API_MCP_PARSE_CACHE_SIZE', 0))
+MAX_RESPONSE_BYTES = int(os.getenv('AWS_API_MCP_MAX_RESPONSE_BYTES', 0))
+EXECUTOR_KIND = get_executor_kind_from_env()
+EXECUTOR_MAX_WORKERS = int(os.getenv('AWS_API_MCP_EXECUTOR_MAX_WORKERS', 16))
+TOOL_MAX_CONCURRENCY = int(os.getenv('AWS_API_MCP_TOOL_MAX_CONCURRENCY', 16))
+FAN_OUT_REGION_TIMEOUT_SECONDS = int(os.getenv('AWS_API_MCP_FAN_OUT_REGION_TIMEOUT_SECONDS', 60))
+STREAMING_PART_SIZE = int(os.getenv('AWS_API_MCP_STREAMING_PART_SIZE', 16 * 1024 * 1024))
+STREAMING_MAX_CONCURRENCY = int(os.getenv('AWS_API_MCP_STREAMING_MAX_CONCURRENCY', 8))
+IMPORT_TIME_REPORT = get_env_bool('AWS_API_MCP_IMPORT_TIME_REPORT', False)
+READ_OPERATIONS_REFRESH_SECONDS = int(
+    os.getenv('AWS_API_MCP_READ_OPERATIONS_REFRESH_SECONDS', 24 * 60 * 60)
+)
 ENDPOINT_SUGGEST_AWS_COMMANDS = os.getenv(
     'ENDPOINT_SUGGEST_AWS_COMMANDS', 'https://api-mcp.global.api.aws/suggest-aws-commands'
 )
@@ -0,0 +1,169 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import functools
+import multiprocessing
+import time
+from .config import (
+    EXECUTOR_KIND,
+    EXECUTOR_MAX_WORKERS,
+    TOOL_MAX_CONCURRENCY,
+    ExecutorKind,
+)
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from loguru import logger
+from typing import Any, TypeVar
+
+
+T = TypeVar('T')
+
+# AWS CLI customizations capture their output by redirecting the process-wide stdout,
+# so within a single process they must not run concurrently.
+AWSCLI_CUSTOMIZATION_TOOL = 'awscli_customization'
+
+
+class ToolExecutor:
+    """Runs blocking tool work on a thread or process pool.
+
+    Each tool gets its own concurrency limit so that one busy tool cannot starve the
+    others, and the number of queued and running calls per tool is tracked so it can
+    be reported.
+    """
+
+    def __init__(
+        self,
+        kind: ExecutorKind,
+        max_workers: int,
+        max_concurrency: int,
+        tool_limits: dict[str, int] | None = None,
+    ):
+        """Initialize the executor with its pool type, pool size and per-tool limits."""
+        self._kind: ExecutorKind = kind
+        self._max_workers = max_workers
+        self._max_concurrency = max_concurrency
+        self._tool_limits = tool_limits or {}
+        self._executor: Executor | None = None
+        self._semaphores: dict[str, asyncio.Semaphore] = {}
+        self._queued: defaultdict[str, int] = defaultdict(int)
+        self._running: defaultdict[str, int] = defaultdict(int)
+
+    @property
+    def kind(self) -> ExecutorKind:
+        """Return the type of pool the work runs on."""
+        return self._kind
+
+    async def run(
+        self,
+        tool: str,
+        func: Callable[..., T],
+        *args: Any,
+        timeout: float | None = None,
+        **kwargs: Any,
+    ) -> T:
+        """Run `func` on the pool once the tool has a free concurrency slot.
+
+        `timeout` is counted from when the call gets its slot, so time spent queued
+        behind other calls of the tool does not count. Work that timed out cannot be
+        interrupted and keeps its slot until it finishes.
+        """
+        semaphore = self._semaphore(tool)
+        queued = semaphore.locked()
+        queued_at = time.perf_counter()
+        self._queued[tool] += 1
+        try:
+            await semaphore.acquire()
+        finally:
+            self._queued[tool] -= 1
+
+        self._running[tool] += 1
+        if queued:
+            logger.info(
+                'Call to {} waited {:.3f} seconds for a free slot ({})',
+                tool,
+                time.perf_counter() - queued_at,
+                self.format_metrics(),
+            )
+        release = True
+        try:
+            future = asyncio.get_running_loop().run_in_executor(
+                self._get_executor(), functools.partial(func, *args, **kwargs)
+            )
+            if timeout is None:
+                return await future
+            try:
+                return await asyncio.wait_for(asyncio.shield(future), timeout)
+            except asyncio.TimeoutError:
+                release = False
+                future.add_done_callback(lambda _: self._release(tool, semaphore))
+                raise
+        finally:
+            if release:
+                self._release(tool, semaphore)
+
+    def metrics(self) -> dict[str, dict[str, int]]:
+        """Return the number of queued and running calls per tool."""
+        return {
+            tool: {'queued': self._queued[tool], 'running': self._running[tool]}
+            for tool in sorted(set(self._queued) | set(self._running))
+        }
+
+    def format_metrics(self) -> str:
+        """Return the queued and running calls per tool as a single log-friendly line."""
+        return '; '.join(
+            f'{tool}: queued={counts["queued"]}, running={counts["running"]}'
+            for tool, counts in self.metrics().items()
+        )
+
+    def shutdown(self):
+        """Shut down the underlying pool, waiting for running work to finish."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    def _release(self, tool: str, semaphore: asyncio.Semaphore):
+        self._running[tool] -= 1
+        semaphore.release()
+
+    def _semaphore(self, tool: str) -> asyncio.Semaphore:
+        if tool not in self._semaphores:
+            self._semaphores[tool] = asyncio.Semaphore(
+                self._tool_limits.get(tool, self._max_concurrency)
+            )
+        return self._semaphores[tool]
+
+    def _get_executor(self) -> Executor:
+        # The pool is created lazily so that importing the server does not spawn workers
+        if self._executor is None:
+            if self._kind == 'process':
+                # The server runs threads, which forked workers could deadlock on
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self._max_workers,
+                    mp_context=multiprocessing.get_context('spawn'),
+                )
+            else:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self._max_workers, thread_name_prefix='aws-api-mcp-tool'
+                )
+        return self._executor
+
+
+TOOL_EXECUTOR = ToolExecutor(
+    kind=EXECUTOR_KIND,
+    max_workers=EXECUTOR_MAX_WORKERS,
+    max_concurrency=TOOL_MAX_CONCURRENCY,
+    tool_limits={AWSCLI_CUSTOMIZATION_TOOL: 1} if EXECUTOR_KIND == 'thread' else None,
+)
@@ -18,6 +18,7 @@ import re
 import requests
 import time
 from botocore.response import StreamingBody
+from collections.abc import Callable, Mapping
 from contextlib import contextmanager
 from datetime import datetime
 from loguru import logger
@@ -27,19 +28,35 @@ from urllib3 import Retry
 
 
 @contextmanager
-def operation_timer(service: str, operation: str, region: str):
+def operation_timer(
+    service: str,
+    operation: str,
+    region: str,
+    stats: Callable[[], Mapping[str, Any]] | None = None,
+):
     """Context manager for timing interpretation calls.
 
     :param service: The service name.
     :param operation: The operation name.
     :param region: The region where the call is being made
+    :param stats: Optional callable returning counters to log alongside the timing
     """
     start = time.perf_counter()
     logger.info('Interpreting operation {}.{} for region {}', service, operation, region)
     yield
     end = time.perf_counter()
     elapsed_time = end - start
-    logger.info('Operation {}.{} interpreted in {} seconds', service, operation, elapsed_time)
+    if stats is None:
+        logger.info('Operation {}.{} interpreted in {} seconds', service, operation, elapsed_time)
+        return
+
+    logger.info(
+        'Operation {}.{} interpreted in {} seconds ({})',
+        service,
+        operation,
+        elapsed_time,
+        ', '.join(f'{name}={value}' for name, value in stats().items()),
+    )
 
 
 class Boto3Encoder(json.JSONEncoder):
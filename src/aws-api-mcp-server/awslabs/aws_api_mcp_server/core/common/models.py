@@ -125,6 +125,20 @@ class ProgramInterpretationResponse(BaseModel):
     failed_constraints: list[str] | None = Field(default=None)
 
 
+class RegionInterpretationResult(BaseModel):
+    """Result of interpreting a command in a single region of a multi-region call."""
+
+    region: str
+    response: ProgramInterpretationResponse | None = Field(default=None)
+    error: str | None = Field(default=None)
+
+
+class MultiRegionInterpretationResponse(BaseModel):
+    """Aggregated results of interpreting a command in several regions."""
+
+    results: list[RegionInterpretationResult]
+
+
 class Consent(BaseModel):
     """Represents the consent of the user for executing a particular command."""
 
@@ -0,0 +1,93 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import subprocess
+import sys
+import threading
+from ..parser.parser import get_aws_cli
+from loguru import logger
+from typing import NamedTuple
+
+
+SERVER_MODULE = 'awslabs.aws_api_mcp_server.server'
+IMPORT_TIME_REPORT_TIMEOUT_SECONDS = 120
+
+
+class ImportTime(NamedTuple):
+    """Time spent importing a single module, as reported by `python -X importtime`."""
+
+    module: str
+    self_us: int
+    cumulative_us: int
+
+
+def parse_import_times(output: str) -> list[ImportTime]:
+    """Parse the output of `python -X importtime` into a list of module timings."""
+    import_times = []
+    for line in output.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:') :].split('|')
+        if len(fields) != 3:
+            continue
+        self_us, cumulative_us, module = (field.strip() for field in fields)
+        if not self_us.isdigit() or not cumulative_us.isdigit():
+            # Header line
+            continue
+        import_times.append(ImportTime(module, int(self_us), int(cumulative_us)))
+    return import_times
+
+
+def log_import_time_report(module: str = SERVER_MODULE, top: int = 20):
+    """Import `module` in a fresh interpreter and log the modules that were slowest to import."""
+    try:
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+            capture_output=True,
+            text=True,
+            timeout=IMPORT_TIME_REPORT_TIMEOUT_SECONDS,
+        )
+    except (OSError, subprocess.TimeoutExpired) as e:
+        logger.warning('Could not produce the import time report: {}', e)
+        return
+
+    import_times = parse_import_times(result.stderr)
+    total = next((t.cumulative_us for t in import_times if t.module == module), None)
+    slowest = sorted(import_times, key=lambda t: t.self_us, reverse=True)[:top]
+
+    lines = [
+        f'{t.self_us / 1000:10.1f} {t.cumulative_us / 1000:10.1f}  {t.module}' for t in slowest
+    ]
+    logger.info(
+        'Import time report for {} (total {} ms), slowest {} modules (self ms, cumulative ms):\n{}',
+        module,
+        f'{total / 1000:.1f}' if total is not None else 'unknown',
+        len(slowest),
+        '\n'.join(lines),
+    )
+
+
+def _warm_up():
+    try:
+        get_aws_cli()
+    except Exception as e:
+        # The driver is created again on first use, where the error is reported to the caller
+        logger.warning('Failed to warm up the AWS CLI driver: {}', e)
+
+
+def warm_up_in_background() -> threading.Thread:
+    """Create the AWS CLI driver on a background thread so the first call does not pay for it."""
+    thread = threading.Thread(target=_warm_up, name='aws-api-mcp-warm-up', daemon=True)
+    thread.start()
+    return thread
@@ -14,6 +14,7 @@
 import importlib.resources
 import json
 import requests
+import threading
 from collections import defaultdict
 from loguru import logger
 from typing import List
@@ -60,31 +61,35 @@ class ServiceReferenceUrlsByService(dict):
 
 
 class ReadOnlyOperations(dict):
-    """Read only operations list by service."""
+    """Read only operations list by service.
+
+    Operations are kept in frozensets so that lookups are constant time. Service
+    reference documents are fetched lazily the first time a service is checked and
+    can be kept up to date by a background refresher thread.
+    """
 
     def __init__(self, service_reference_urls_by_service: dict[str, str]):
         """Initialize the read only operations list."""
         super().__init__()
         self._service_reference_urls_by_service = service_reference_urls_by_service
-        self._known_readonly_operations = self._get_known_readonly_operations_from_metadata()
+        self._fetch_locks: dict[str, threading.Lock] = defaultdict(threading.Lock)
+        self._fetch_locks_lock = threading.Lock()
+        self._stop_refresher = threading.Event()
+        self._refresher: threading.Thread | None = None
+        known_readonly_operations = self._get_known_readonly_operations_from_metadata()
         for service, operations in self._get_custom_readonly_operations().items():
-            if service in self._known_readonly_operations:
-                self._known_readonly_operations[service] = [
-                    *self._known_readonly_operations[service],
-                    *operations,
-                ]
-            else:
-                self._known_readonly_operations[service] = operations
+            known_readonly_operations[service].extend(operations)
+        self._known_readonly_operations = {
+            service: frozenset(operations)
+            for service, operations in known_readonly_operations.items()
+        }
 
     def has(self, service, operation) -> bool:
         """Check if the operation is in the read only operations list."""
         logger.info(f'checking in read only list : {service} - {operation}')
         if service in OVERRIDES and operation in OVERRIDES[service]:
             return OVERRIDES[service][operation]
-        if (
-            service in self._known_readonly_operations
-            and operation in self._known_readonly_operations[service]
-        ):
+        if operation in self._known_readonly_operations.get(service, ()):
             return True
         if service not in self:
             if service not in self._service_reference_urls_by_service:
@@ -92,7 +97,50 @@ class ReadOnlyOperations(dict):
             self._cache_ready_only_operations_for_service(service)
         return operation in self[service]
 
+    def refresh(self):
+        """Re-fetch the service reference documents of all services fetched so far.
+
+        Services that cannot be refreshed keep their previously fetched operations.
+        """
+        for service in list(self):
+            try:
+                self[service] = self._fetch_read_only_operations(service)
+            except RuntimeError:
+                logger.warning('Keeping stale read only operations for {}', service)
+
+    def start_refresher(self, interval_seconds: float):
+        """Refresh the fetched services periodically on a daemon thread."""
+        if self._refresher is not None or interval_seconds <= 0:
+            return
+
+        def run():
+            while not self._stop_refresher.wait(interval_seconds):
+                self.refresh()
+
+        self._stop_refresher.clear()
+        self._refresher = threading.Thread(
+            target=run, name='read-only-operations-refresher', daemon=True
+        )
+        self._refresher.start()
+
+    def stop_refresher(self):
+        """Stop the background refresher if it is running."""
+        if self._refresher is None:
+            return
+        self._stop_refresher.set()
+        self._refresher.join()
+        self._refresher = None
+
     def _cache_ready_only_operations_for_service(self, service: str):
+        # Concurrent checks for the same service should only fetch its document once,
+        # without holding up checks that fetch the document of another service
+        with self._fetch_locks_lock:
+            fetch_lock = self._fetch_locks[service]
+        with fetch_lock:
+            if service not in self:
+                self[service] = self._fetch_read_only_operations(service)
+
+    def _fetch_read_only_operations(self, service: str) -> frozenset[str]:
         try:
             response = requests.get(
                 self._service_reference_urls_by_service[service], timeout=DEFAULT_REQUEST_TIMEOUT
@@ -100,10 +148,11 @@ class ReadOnlyOperations(dict):
         except Exception as e:
             logger.error(f'Error retrieving the service reference document: {e}')
             raise RuntimeError(f'Error retrieving the service reference document: {e}')
-        self[service] = []
-        for action in response['Actions']:
-            if not action['Annotations']['Properties']['IsWrite']:
-                self[service].append(action['Name'])
+        return frozenset(
+            action['Name']
+            for action in response['Actions']
+            if not action['Annotations']['Properties']['IsWrite']
+        )
 
     def _get_known_readonly_operations_from_metadata(self) -> dict[str, List[str]]:
         known_readonly_operations = defaultdict(list)
@@ -12,22 +12,31 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import boto3
+from ..aws.client_cache import CLIENT_CACHE
 from ..aws.pagination import build_result
 from ..aws.services import (
     extract_pagination_config,
 )
+from ..aws.streaming import ProgressCallback, write_streaming_output
 from ..common.command import IRCommand, OutputFile
-from ..common.config import get_user_agent_extra
+from ..common.config import (
+    MAX_RESPONSE_BYTES,
+    STREAMING_MAX_CONCURRENCY,
+    STREAMING_PART_SIZE,
+    get_user_agent_extra,
+)
 from ..common.file_system_controls import validate_file_path
 from ..common.helpers import operation_timer
+from botocore.client import BaseClient
 from botocore.config import Config
 from jmespath.parser import ParsedResult
 from typing import Any
 
 
 TIMEOUT_AFTER_SECONDS = 10
-CHUNK_SIZE = 4 * 1024 * 1024
+# botocore keeps at most 10 connections per client by default, which would otherwise
+# cap the number of parts of a streaming output that are downloaded concurrently
+MAX_POOL_CONNECTIONS = max(10, STREAMING_MAX_CONCURRENCY)
 
 
 def interpret(
@@ -39,11 +48,14 @@ def interpret(
     client_side_filter: ParsedResult | None = None,
     max_results: int | None = None,
     endpoint_url: str | None = None,
+    progress: ProgressCallback | None = None,
 ) -> dict[str, Any]:
     """Interpret the given intermediate representation into boto3 calls.
 
     The function returns the response from the operation indicated by the
-    intermediate representation.
+    intermediate representation. Clients are reused across calls through the
+    shared client cache. `progress` is called with the number of bytes written so far
+    while a streaming output is saved to a file.
     """
     config_result = extract_pagination_config(ir.parameters, max_results)
     parameters = config_result.parameters
@@ -55,14 +67,18 @@ def interpret(
         read_timeout=TIMEOUT_AFTER_SECONDS,
         retries={'max_attempts': 3, 'mode': 'adaptive'},
         user_agent_extra=get_user_agent_extra(),
+        max_pool_connections=MAX_POOL_CONNECTIONS,
     )
 
-    with operation_timer(ir.service_name, ir.operation_python_name, region):
-        client = boto3.client(
+    with operation_timer(
+        ir.service_name, ir.operation_python_name, region, stats=CLIENT_CACHE.stats
+    ):
+        client = CLIENT_CACHE.get_client(
             ir.service_name,
-            aws_access_key_id=access_key_id,
-            aws_secret_access_key=secret_access_key,
-            aws_session_token=session_token,
+            region=region,
+            access_key_id=access_key_id,
+            secret_access_key=secret_access_key,
+            session_token=session_token,
             config=config,
             endpoint_url=endpoint_url,
         )
@@ -75,6 +91,7 @@ def interpret(
                 operation_parameters=ir.parameters,
                 pagination_config=pagination_config,
                 client_side_filter=client_side_filter,
+                max_response_bytes=MAX_RESPONSE_BYTES,
             )
         else:
             operation = getattr(client, ir.operation_python_name)
@@ -84,20 +101,35 @@ def interpret(
                 response = _apply_filter(response, client_side_filter)
 
         if ir.has_streaming_output and ir.output_file and ir.output_file.path != '-':
-            response = _handle_streaming_output(response, ir.output_file)
+            response = _handle_streaming_output(
+                client, ir.operation_python_name, parameters, response, ir.output_file, progress
+            )
 
         return response
 
 
-def _handle_streaming_output(response: dict[str, Any], output_file: OutputFile) -> dict[str, Any]:
-    streaming_output = response[output_file.response_key]
-
+def _handle_streaming_output(
+    client: BaseClient,
+    operation_name: str,
+    parameters: dict[str, Any],
+    response: dict[str, Any],
+    output_file: OutputFile,
+    progress: ProgressCallback | None,
+) -> dict[str, Any]:
     # Validate file path before writing
     validated_path = validate_file_path(output_file.path)
 
-    with open(validated_path, 'wb') as f:
-        for chunk in streaming_output.iter_chunks(chunk_size=CHUNK_SIZE):
-            f.write(chunk)
+    write_streaming_output(
+        client,
+        operation_name,
+        parameters,
+        response,
+        output_file.response_key,
+        validated_path,
+        part_size=STREAMING_PART_SIZE,
+        max_concurrency=STREAMING_MAX_CONCURRENCY,
+        progress=progress,
+    )
 
     del response[output_file.response_key]
     return response
@@ -14,10 +14,13 @@
 
 import argparse
 import botocore.serialize
+import copy
+import dataclasses
 import ipaddress
 import jmespath
 import os
 import re
+import threading
 from ..aws.regions import GLOBAL_SERVICE_REGIONS
 from ..aws.services import (
     get_awscli_driver,
@@ -25,7 +28,7 @@ from ..aws.services import (
 )
 from ..common.command import IRCommand, OutputFile
 from ..common.command_metadata import CommandMetadata
-from ..common.config import AWS_API_MCP_PROFILE_NAME, get_region
+from ..common.config import AWS_API_MCP_PROFILE_NAME, PARSE_CACHE_SIZE, get_region
 from ..common.errors import (
     AwsApiMcpError,
     ClientSideFilterError,
@@ -62,11 +65,13 @@ from argparse import Namespace
 from awscli.argparser import ArgTableArgParser, CommandAction, MainArgParser
 from awscli.argprocess import ParamError
 from awscli.arguments import BaseCLIArgument, CLIArgument
-from awscli.clidriver import ServiceCommand
+from awscli.clidriver import CLIDriver, ServiceCommand
 from botocore.exceptions import ParamValidationError, UndefinedModelAttributeError
 from botocore.model import OperationModel, ServiceModel
+from botocore.validate import ParamValidationDecorator
 from collections.abc import Generator
 from difflib import SequenceMatcher
+from functools import lru_cache
 from jmespath.exceptions import ParseError
 from pathlib import Path
 from typing import Any, NamedTuple, cast
@@ -134,6 +139,10 @@ NARGS_ONE_ARGUMENT = None
 NARGS_OPTIONAL = '?'
 NARGS_ONE_OR_MORE = '+'
 
+# Commands reading local files are never served from the parse cache since the
+# file content is inlined into the parameters when the command is parsed.
+LOCAL_FILE_PREFIXES = ('file://', 'fileb://')
+
 # Map nargs (number of time arguments can appear from argparse point of view)
 # to the corresponding error. These are implicitly defined in argparse.
 _nargs_errors = {
@@ -164,13 +173,28 @@ def _on_error_in_argparse(message: str):
     raise AwsApiMcpError(message)
 
 
+class _UnexpectedNumberOfArgsError(Exception):
+    def __init__(self, parameter: str, msg: str):
+        super().__init__(parameter, msg)
+        self.parameter = parameter
+        self.msg = msg
+
+
 class ArgTableParser(ArgTableArgParser):
-    """Parser for argument tables, supporting AWS CLI command metadata."""
+    """Parser for argument tables, supporting AWS CLI command metadata.
+
+    Parsers are cached and shared between threads, so nothing specific to a single
+    parse is stored on the parser.
+    """
 
     def parse_operation_args(self, command_metadata: CommandMetadata, args: list[str]):
         """Parse known arguments using the provided command metadata and argument list."""
-        self.command_metadata = command_metadata
-        operation_args, unknown_args = super().parse_known_args(args)
+        try:
+            operation_args, unknown_args = super().parse_known_args(args)
+        except _UnexpectedNumberOfArgsError as exc:
+            raise ExpectedArgumentError(
+                exc.parameter, exc.msg, command_metadata
+            ) from exc.__cause__
 
         supported_args = [
             action.option_strings[0] for action in self._actions if action.option_strings
@@ -250,9 +274,7 @@ class ArgTableParser(ArgTableArgParser):
             return super()._match_argument(action, arg_strings_pattern)
         except argparse.ArgumentError as exc:
             msg: str = _fetch_error_from_number_of_args(action.nargs)  # type: ignore
-            raise ExpectedArgumentError(
-                action.option_strings[0], msg, self.command_metadata
-            ) from exc
+            raise _UnexpectedNumberOfArgsError(action.option_strings[0], msg) from exc
 
 
 def _fetch_error_from_number_of_args(nargs: str) -> str:
@@ -283,12 +305,12 @@ class GlobalArgParser(MainArgParser):
         self.add_argument('command', action=CommandAction, command_table=command_table)
 
     @staticmethod
-    def get_parser():
+    def get_parser(driver: CLIDriver, command_table: dict[str, Any]):
         """Return a new instance of GlobalArgParser."""
         return GlobalArgParser(
             command_table,
-            session.user_agent(),
-            cli_data.get('description', None),
+            driver.session.user_agent(),
+            driver._get_cli_data().get('description', None),
             driver._get_argument_table(),
             prog='aws',
         )
@@ -298,9 +320,40 @@ class GlobalArgParser(MainArgParser):
         _on_error_in_argparse(message)
 
 
+class AwsCli(NamedTuple):
+    """The AWS CLI driver along with its command table and global argument parser."""
+
+    driver: CLIDriver
+    command_table: dict[str, Any]
+    parser: GlobalArgParser
+
+
+_aws_cli: AwsCli | None = None
+_aws_cli_lock = threading.Lock()
+
+
+def get_aws_cli() -> AwsCli:
+    """Return the AWS CLI driver, creating it on first use.
+
+    Creating the driver loads the command table of every service, which is one of the
+    most expensive parts of starting the server, so it is deferred until the first
+    command is parsed (or until the server warms it up in the background).
+    """
+    global _aws_cli
+    if _aws_cli is None:
+        with _aws_cli_lock:
+            if _aws_cli is None:
+                driver = get_awscli_driver()
+                command_table = driver._get_command_table()
+                parser = GlobalArgParser.get_parser(driver, command_table)
+                driver._add_aliases(command_table, parser)
+                _aws_cli = AwsCli(driver=driver, command_table=command_table, parser=parser)
+    return _aws_cli
+
+
 def is_custom_operation(service, operation):
     """Returns true if the service operation is cli customization."""
-    service_command = command_table.get(service, None)
+    service_command = get_aws_cli().command_table.get(service, None)
     if not service_command:
         raise InvalidServiceError(service)
 
@@ -335,21 +388,26 @@ def is_denied_custom_operation(service, operation):
     )
 
 
-driver = get_awscli_driver()
-session = driver.session
-command_table = driver._get_command_table()
-cli_data = driver._get_cli_data()
-parser = GlobalArgParser.get_parser()
-driver._add_aliases(command_table, parser)
+def parse(cli_command: str) -> IRCommand:
+    """Parse a CLI command string into an IRCommand object.
 
+    When the parse cache is enabled, identical command strings are validated once
+    and subsequent calls receive a copy of the cached command.
+    """
+    if PARSE_CACHE_SIZE > 0 and not any(prefix in cli_command for prefix in LOCAL_FILE_PREFIXES):
+        command = _cached_parse(cli_command)
+        return dataclasses.replace(command, parameters=copy.deepcopy(command.parameters))
 
-def parse(cli_command: str) -> IRCommand:
-    """Parse a CLI command string into an IRCommand object."""
+    return _parse(cli_command)
+
+
+def _parse(cli_command: str) -> IRCommand:
     tokens = split_cli_command(cli_command)
     # Strip `aws` and expand paths beginning with ~
     tokens = expand_user_home_directory(tokens[1:])
-    global_args, remaining = parser.parse_known_args(tokens)
-    service_command = command_table[global_args.command]
+    aws_cli = get_aws_cli()
+    global_args, remaining = aws_cli.parser.parse_known_args(tokens)
+    service_command = aws_cli.command_table[global_args.command]
 
     # Not all commands have parsers as some of them are "aliases" to existing services
     if isinstance(service_command, ServiceCommand):
@@ -361,6 +419,29 @@ def parse(cli_command: str) -> IRCommand:
     return _handle_awscli_customization(global_args, remaining, tokens[0])
 
 
+@lru_cache(maxsize=max(PARSE_CACHE_SIZE, 0))
+def _cached_parse(cli_command: str) -> IRCommand:
+    return _parse(cli_command)
+
+
+@lru_cache(maxsize=None)
+def _get_service_parser(service_command: ServiceCommand) -> argparse.ArgumentParser:
+    return service_command._create_parser()
+
+
+@lru_cache(maxsize=None)
+def _get_operation_parser(operation_command: Any) -> ArgTableParser:
+    return ArgTableParser(operation_command.arg_table)
+
+
+@lru_cache(maxsize=None)
+def _get_serializer(
+    protocol: str,
+) -> botocore.serialize.Serializer | ParamValidationDecorator:
+    # Parameter validation has been done, just serialize
+    return botocore.serialize.create_serializer(protocol, include_validation=False)
+
+
 def _handle_service_command(
     service_command: ServiceCommand,
     global_args: argparse.Namespace,
@@ -388,9 +469,9 @@ def _handle_service_command(
     _validate_global_args(service, global_args)
     region = getattr(global_args, 'region', None)
 
-    service_parser = service_command._create_parser()
+    service_parser = _get_service_parser(service_command)
     service_args, service_remaining = service_parser.parse_known_args(remaining)
-    operation_parser = ArgTableParser(operation_command.arg_table)
+    operation_parser = _get_operation_parser(operation_command)
     parsed_args = operation_parser.parse_operation_args(command_metadata, service_remaining)
     _handle_invalid_parameters(command_metadata, service, operation, parsed_args)
 
@@ -457,7 +538,7 @@ def _handle_awscli_customization(
 
     operation = remaining[0]
 
-    command_table = driver._get_command_table()
+    command_table = get_aws_cli().command_table
     service_command = command_table.get(service)
 
     if service_command is None:
@@ -509,7 +590,7 @@ def _parse_customization_parameters(
     if not hasattr(operation_command, 'arg_table'):
         raise InvalidServiceOperationError(service, operation)
 
-    operation_parser = ArgTableParser(operation_command.arg_table)
+    operation_parser = _get_operation_parser(operation_command)
     parsed_args = operation_parser.parse_operation_args(command_metadata, operation_args)
 
     _handle_invalid_parameters(command_metadata, service, operation, parsed_args)
@@ -734,10 +815,7 @@ def _validate_request_serialization(
     validated_parameters = parameters.copy()
     validated_parameters.pop('PaginationConfig', None)
 
-    # Parameter validation has been done, just serialize
-    serializer = botocore.serialize.create_serializer(
-        service_model.metadata['protocol'], include_validation=False
-    )
+    serializer = _get_serializer(service_model.metadata['protocol'])
     try:
         serializer.serialize_to_request(validated_parameters, operation_model)
     except ParamValidationError as err:
@@ -12,39 +12,47 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import asyncio
 import os
 import sys
-from .core.agent_scripts.manager import AGENT_SCRIPTS_MANAGER
+from .core.agent_scripts.manager import get_agent_scripts_manager
 from .core.aws.driver import translate_cli_to_ir
 from .core.aws.service import (
     check_security_policy,
     execute_awscli_customization,
     interpret_command,
+    interpret_command_in_regions,
     request_consent,
     validate,
 )
+from .core.aws.streaming import ProgressCallback
 from .core.common.config import (
     DEFAULT_REGION,
     ENABLE_AGENT_SCRIPTS,
     ENDPOINT_SUGGEST_AWS_COMMANDS,
     FASTMCP_LOG_LEVEL,
     HOST,
+    IMPORT_TIME_REPORT,
     PORT,
     READ_ONLY_KEY,
     READ_OPERATIONS_ONLY_MODE,
+    READ_OPERATIONS_REFRESH_SECONDS,
     REQUIRE_MUTATION_CONSENT,
     STATELESS_HTTP,
     TRANSPORT,
     WORKING_DIRECTORY,
 )
 from .core.common.errors import AwsApiMcpError
+from .core.common.executor import AWSCLI_CUSTOMIZATION_TOOL, TOOL_EXECUTOR
 from .core.common.helpers import get_requests_session, validate_aws_region
 from .core.common.models import (
     AwsApiMcpServerErrorResponse,
     AwsCliAliasResponse,
     Credentials,
+    MultiRegionInterpretationResponse,
     ProgramInterpretationResponse,
 )
+from .core.common.startup import log_import_time_report, warm_up_in_background
 from .core.metadata.read_only_operations_list import ReadOnlyOperations, get_read_only_operations
 from .core.security.policy import PolicyDecision
 from botocore.exceptions import NoCredentialsError
@@ -177,6 +185,8 @@ async def suggest_aws_commands(
     - For cross-region or account-wide operations, explicitly include --region parameter
     - All commands are validated before execution to prevent errors
     - Supports pagination control via max_results parameter
+    - When the response includes a pagination_token, pass it back with --starting-token to fetch the remaining results
+    - To run the same command in several regions, omit --region and pass the regions in the regions parameter (or ["all"] for every region enabled in the account); regions are queried concurrently and results are returned per region
     - The current working directory is {WORKING_DIRECTORY}
     - File paths should always have forward slash (/) as a separator regardless of the system. Example: 'c:/folder/file.txt'
 
@@ -218,16 +228,43 @@ async def call_aws(
         int | None,
         Field(description='Optional limit for number of results (useful for pagination)'),
     ] = None,
-) -> ProgramInterpretationResponse | AwsApiMcpServerErrorResponse | AwsCliAliasResponse:
+    regions: Annotated[
+        list[str] | None,
+        Field(
+            description='Optional list of regions to run the command in concurrently. Use ["all"] for all regions enabled in the account. The command must not contain --region when this is set.'
+        ),
+    ] = None,
+) -> (
+    ProgramInterpretationResponse
+    | MultiRegionInterpretationResponse
+    | AwsApiMcpServerErrorResponse
+    | AwsCliAliasResponse
+):
     """Call AWS with the given CLI command and return the result as a dictionary."""
     return await call_aws_helper(
         cli_command=cli_command,
         ctx=ctx,
         max_results=max_results,
         credentials=None,
+        regions=regions,
     )
 
 
+def _progress_reporter(ctx: Context) -> ProgressCallback | None:
+    """Return a callback that forwards progress from a worker thread as MCP notifications."""
+    # Callbacks cannot be sent to another process, so progress is only reported when the
+    # work runs on threads of this process
+    if TOOL_EXECUTOR.kind != 'thread':
+        return None
+
+    loop = asyncio.get_running_loop()
+
+    def report(progress: int, total: int | None):
+        asyncio.run_coroutine_threadsafe(ctx.report_progress(progress, total), loop)
+
+    return report
+
+
 async def call_aws_helper(
     cli_command: Annotated[
         str, Field(description='The complete AWS CLI command to execute. MUST start with "aws"')
@@ -238,10 +275,16 @@ async def call_aws_helper(
         Field(description='Optional limit for number of results (useful for pagination)'),
     ] = None,
     credentials: Credentials | None = None,
-) -> ProgramInterpretationResponse | AwsApiMcpServerErrorResponse | AwsCliAliasResponse:
+    regions: list[str] | None = None,
+) -> (
+    ProgramInterpretationResponse
+    | MultiRegionInterpretationResponse
+    | AwsApiMcpServerErrorResponse
+    | AwsCliAliasResponse
+):
     """Helper function that actually calls aws."""
     try:
-        ir = translate_cli_to_ir(cli_command)
+        ir = await TOOL_EXECUTOR.run('call_aws', translate_cli_to_ir, cli_command)
         ir_validation = validate(ir)
 
         if not ir.command or ir_validation.validation_failed:
@@ -274,7 +317,10 @@ async def call_aws_helper(
     try:
         # Check security policy
         if READ_OPERATIONS_INDEX is not None:
-            policy_decision = check_security_policy(ir, READ_OPERATIONS_INDEX, ctx)
+            # The first check for a service may fetch its service reference document
+            policy_decision = await asyncio.to_thread(
+                check_security_policy, ir, READ_OPERATIONS_INDEX, ctx
+            )
 
             if policy_decision == PolicyDecision.DENY:
                 error_message = 'Execution of this operation is denied by security policy.'
@@ -295,22 +341,41 @@ async def call_aws_helper(
             elif REQUIRE_MUTATION_CONSENT:
                 await request_consent(cli_command, ctx)
 
-        if ir.command and ir.command.is_awscli_customization:
-            response: AwsCliAliasResponse | AwsApiMcpServerErrorResponse = (
-                execute_awscli_customization(
-                    cli_command,
-                    ir.command,
-                    credentials=credentials,
+        if regions:
+            if ir.command.is_awscli_customization:
+                error_message = (
+                    'Running AWS CLI customizations in multiple regions is not supported.'
                 )
+                await ctx.error(error_message)
+                return AwsApiMcpServerErrorResponse(detail=error_message)
+
+            return await interpret_command_in_regions(
+                cli_command=cli_command,
+                ir_command=ir.command,
+                regions=regions,
+                max_results=max_results,
+                credentials=credentials,
+            )
+
+        if ir.command and ir.command.is_awscli_customization:
+            response: AwsCliAliasResponse | AwsApiMcpServerErrorResponse = await TOOL_EXECUTOR.run(
+                AWSCLI_CUSTOMIZATION_TOOL,
+                execute_awscli_customization,
+                cli_command,
+                ir.command,
+                credentials=credentials,
             )
             if isinstance(response, AwsApiMcpServerErrorResponse):
                 await ctx.error(response.detail)
             return response
 
-        return interpret_command(
+        return await TOOL_EXECUTOR.run(
+            'call_aws',
+            interpret_command,
             cli_command=cli_command,
             max_results=max_results,
             credentials=credentials,
+            progress=_progress_reporter(ctx) if ir.command.has_streaming_output else None,
         )
     except NoCredentialsError:
         error_message = (
@@ -338,6 +403,7 @@ async def call_aws_helper(
 
 # EXPERIMENTAL: Agent scripts tool - only registered if ENABLE_AGENT_SCRIPTS is True
 if ENABLE_AGENT_SCRIPTS:
+    AGENT_SCRIPTS_MANAGER = get_agent_scripts_manager()
 
     @server.tool(
         name='get_execution_plan',
@@ -405,9 +471,15 @@ def main():
     validate_aws_region(DEFAULT_REGION)
     logger.info('AWS_REGION: {}', DEFAULT_REGION)
 
+    if IMPORT_TIME_REPORT:
+        log_import_time_report()
+
+    warm_up_in_background()
+
     # Always load read operations index for security policy checking
     try:
         READ_OPERATIONS_INDEX = get_read_only_operations()
+        READ_OPERATIONS_INDEX.start_refresher(READ_OPERATIONS_REFRESH_SECONDS)
     except Exception as e:
         logger.warning('Failed to load read operations index: {}', e)
         READ_OPERATIONS_INDEX = None
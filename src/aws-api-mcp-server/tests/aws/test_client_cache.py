@@ -0,0 +1,149 @@
+import threading
+from awslabs.aws_api_mcp_server.core.aws.client_cache import (
+    ClientCache,
+    credentials_fingerprint,
+)
+from botocore.config import Config
+from unittest.mock import patch
+
+
+BOTO3_CLIENT = 'awslabs.aws_api_mcp_server.core.aws.client_cache.boto3.Session.client'
+
+
+def _get(cache: ClientCache, **overrides):
+    kwargs = {
+        'service_name': 'ec2',
+        'region': 'us-east-1',
+        'access_key_id': 'AKIDEXAMPLE',
+        'secret_access_key': 'secret',  # pragma: allowlist secret
+        'session_token': None,
+        'config': Config(),
+    }
+    kwargs.update(overrides)
+    return cache.get_client(**kwargs)
+
+
+def test_client_is_reused_for_same_key():
+    """Test that a second call with the same key returns the cached client."""
+    cache = ClientCache(max_size=4, ttl_seconds=60)
+    with patch(BOTO3_CLIENT, side_effect=lambda *args, **kwargs: object()) as mock_client:
+        first = _get(cache)
+        second = _get(cache)
+
+    assert first is second
+    assert mock_client.call_count == 1
+    assert cache.stats() == {
+        'client_cache_hits': 1,
+        'client_cache_misses': 1,
+        'client_cache_evictions': 0,
+        'client_cache_size': 1,
+    }
+
+
+def test_different_keys_create_different_clients():
+    """Test that region, endpoint and credentials are all part of the key."""
+    cache = ClientCache(max_size=8, ttl_seconds=60)
+    with patch(BOTO3_CLIENT, side_effect=lambda *args, **kwargs: object()) as mock_client:
+        clients = [
+            _get(cache),
+            _get(cache, region='eu-west-1'),
+            _get(cache, endpoint_url='http://localhost:4566'),
+            _get(cache, session_token='token'),
+            _get(cache, service_name='s3'),
+        ]
+
+    assert len({id(client) for client in clients}) == 5
+    assert mock_client.call_count == 5
+    assert cache.stats()['client_cache_misses'] == 5
+
+
+def test_least_recently_used_client_is_evicted():
+    """Test that the cache never grows beyond its maximum size."""
+    cache = ClientCache(max_size=2, ttl_seconds=60)
+    with patch(BOTO3_CLIENT, side_effect=lambda *args, **kwargs: object()):
+        first = _get(cache, region='us-east-1')
+        _get(cache, region='us-west-2')
+        _get(cache, region='us-east-1')
+        _get(cache, region='eu-west-1')
+        assert _get(cache, region='us-east-1') is first
+
+    stats = cache.stats()
+    assert stats['client_cache_size'] == 2
+    assert stats['client_cache_evictions'] == 1
+
+
+def test_expired_client_is_recreated():
+    """Test that entries older than the TTL are not reused."""
+    cache = ClientCache(max_size=4, ttl_seconds=10)
+    with (
+        patch(BOTO3_CLIENT, side_effect=lambda *args, **kwargs: object()),
+        patch(
+            'awslabs.aws_api_mcp_server.core.aws.client_cache.time.monotonic',
+            side_effect=[100.0, 200.0],
+        ),
+    ):
+        first = _get(cache)
+        second = _get(cache)
+
+    assert first is not second
+    assert cache.stats()['client_cache_evictions'] == 1
+
+
+def test_cache_hits_do_not_wait_for_client_creation():
+    """Test that a client being created does not block hits on other threads."""
+    cache = ClientCache(max_size=4, ttl_seconds=60)
+    creating = threading.Event()
+    release = threading.Event()
+
+    def create_client(service_name, **kwargs):
+        if service_name == 's3':
+            creating.set()
+            release.wait(timeout=5)
+        return object()
+
+    with patch(BOTO3_CLIENT, side_effect=create_client):
+        cached = _get(cache)
+        miss = threading.Thread(target=_get, args=(cache,), kwargs={'service_name': 's3'})
+        miss.start()
+        assert creating.wait(timeout=5)
+
+        assert _get(cache) is cached
+        assert cache.stats()['client_cache_hits'] == 1
+
+        release.set()
+        miss.join(timeout=5)
+
+    assert cache.stats()['client_cache_size'] == 2
+
+
+def test_disabled_cache_always_creates_clients():
+    """Test that a zero-sized cache behaves like no cache at all."""
+    cache = ClientCache(max_size=0, ttl_seconds=900)
+    with patch(BOTO3_CLIENT, side_effect=lambda *args, **kwargs: object()) as mock_client:
+        _get(cache)
+        _get(cache)
+
+    assert not cache.enabled
+    assert mock_client.call_count == 2
+    assert cache.stats()['client_cache_size'] == 0
+
+
+def test_credentials_fingerprint_does_not_contain_secrets():
+    """Test that the cache key does not expose raw credentials."""
+    fingerprint = credentials_fingerprint('AKIDEXAMPLE', 'secret', 'token')
+
+    assert 'AKIDEXAMPLE' not in fingerprint
+    assert fingerprint != credentials_fingerprint('AKIDEXAMPLE', 'secret', None)
+
+
+def test_clients_are_not_created_from_the_default_session():
+    """Test that clients come from the cache's own session, not the shared default one."""
+    cache = ClientCache(max_size=4, ttl_seconds=60)
+    with (
+        patch(BOTO3_CLIENT, side_effect=lambda *args, **kwargs: object()) as mock_client,
+        patch('boto3.client') as mock_default_client,
+    ):
+        _get(cache)
+
+    assert mock_client.call_count == 1
+    mock_default_client.assert_not_called()
@@ -1,6 +1,7 @@
 import jmespath
 from awslabs.aws_api_mcp_server.core.aws.pagination import build_result
-from unittest.mock import MagicMock, Mock
+from botocore.paginate import Paginator, TokenDecoder
+from unittest.mock import MagicMock, Mock, patch
 
 
 def get_pages():
@@ -123,3 +124,91 @@ def test_build_result_with_max_results():
     assert functions[1].get('FunctionName') == 'my-function-2'
     assert (result.get('ResponseMetadata') or {}).get('HTTPStatusCode') == 200
     assert result.get('pagination_token') is None
+
+
+def _lambda_paginator(pages):
+    method = Mock(side_effect=pages)
+    return Paginator(
+        method,
+        {'input_token': 'Marker', 'output_token': 'NextMarker', 'result_key': 'Functions'},
+        model=None,
+    )
+
+
+def _pages_with_markers():
+    first_page, second_page = get_pages()
+    first_page.pop('NextToken')
+    first_page['NextMarker'] = 'marker-1'
+    return [first_page, second_page]
+
+
+def test_build_result_stops_at_response_budget():
+    """Test build_result stops after the page that exceeds the byte budget."""
+    paginator = _lambda_paginator(_pages_with_markers())
+
+    result = build_result(
+        paginator=paginator,
+        service_name='lambda',
+        operation_name='ListFunctions',
+        operation_parameters={},
+        pagination_config={},
+        max_response_bytes=1,
+    )
+
+    assert [f['FunctionName'] for f in result['Functions']] == ['my-function-1']
+    assert result['pagination_token'] is not None
+    assert TokenDecoder().decode(result['pagination_token']) == {'Marker': 'marker-1'}
+
+
+def test_build_result_within_response_budget():
+    """Test build_result reads all pages when the budget is not exceeded."""
+    paginator = _lambda_paginator(_pages_with_markers())
+
+    result = build_result(
+        paginator=paginator,
+        service_name='lambda',
+        operation_name='ListFunctions',
+        operation_parameters={},
+        pagination_config={},
+        max_response_bytes=1024 * 1024,
+    )
+
+    assert len(result['Functions']) == 2
+    assert 'pagination_token' not in result
+
+
+def test_build_result_budget_on_last_page_has_no_token():
+    """Test no pagination token is returned when the budget is hit on the last page."""
+    first_page, _ = get_pages()
+    first_page.pop('NextToken')
+    paginator = _lambda_paginator([first_page])
+
+    result = build_result(
+        paginator=paginator,
+        service_name='lambda',
+        operation_name='ListFunctions',
+        operation_parameters={},
+        pagination_config={},
+        max_response_bytes=1,
+    )
+
+    assert len(result['Functions']) == 1
+    assert 'pagination_token' not in result
+
+
+def test_build_result_without_budget_does_not_serialize_pages():
+    """Test pages are not measured when no byte budget is set."""
+    paginator = _lambda_paginator(_pages_with_markers())
+
+    with patch('awslabs.aws_api_mcp_server.core.aws.pagination.as_json') as mock_as_json:
+        result = build_result(
+            paginator=paginator,
+            service_name='lambda',
+            operation_name='ListFunctions',
+            operation_parameters={},
+            pagination_config={},
+            max_response_bytes=0,
+        )
+
+    assert len(result['Functions']) == 2
+    mock_as_json.assert_not_called()
@@ -1,14 +1,19 @@
 import json
 import pytest
+import time
 from ..history_handler import history
 from awslabs.aws_api_mcp_server.core.aws.driver import translate_cli_to_ir
 from awslabs.aws_api_mcp_server.core.aws.service import (
     execute_awscli_customization,
     interpret_command,
+    interpret_command_in_region,
+    interpret_command_in_regions,
     is_operation_read_only,
     validate,
 )
 from awslabs.aws_api_mcp_server.core.common.command import IRCommand
+from awslabs.aws_api_mcp_server.core.common.errors import AwsApiMcpError
+from awslabs.aws_api_mcp_server.core.common.executor import ToolExecutor
 from awslabs.aws_api_mcp_server.core.common.helpers import as_json
 from awslabs.aws_api_mcp_server.core.common.models import (
     AwsApiMcpServerErrorResponse,
@@ -613,7 +618,10 @@ def test_interpret_command_with_credentials_parameter():
         interpret_command('aws s3api list-buckets', credentials=test_credentials)
 
         mock_interpret.assert_called_once_with(
-            'aws s3api list-buckets', max_results=None, credentials=test_credentials
+            'aws s3api list-buckets',
+            max_results=None,
+            credentials=test_credentials,
+            progress=None,
         )
 
 
@@ -625,7 +633,7 @@ def test_interpret_command_without_credentials_parameter():
         interpret_command('aws s3api list-buckets')
 
         mock_interpret.assert_called_once_with(
-            'aws s3api list-buckets', max_results=None, credentials=None
+            'aws s3api list-buckets', max_results=None, credentials=None, progress=None
         )
 
 
@@ -691,3 +699,183 @@ def test_execute_awscli_customization_without_credentials(mock_get_driver):
                 execute_awscli_customization('aws s3 ls', ir_command, credentials=None)
 
     mock_get_driver.assert_called_once_with(None)
+
+
+async def test_interpret_command_in_regions_runs_each_region():
+    """Test that the parsed command is interpreted once per region with shared credentials."""
+    credentials = Credentials(**TEST_CREDENTIALS)
+    ir_command = MagicMock(profile=None, region='us-east-1', service_name='ec2')
+
+    def fake_interpret(ir_command, region, max_results, credentials):
+        return ProgramInterpretationResponse(response=None, failed_constraints=[region])
+
+    with patch(
+        'awslabs.aws_api_mcp_server.core.aws.service.interpret_command_in_region',
+        side_effect=fake_interpret,
+    ) as mock_interpret:
+        response = await interpret_command_in_regions(
+            'aws ec2 describe-vpcs',
+            ir_command,
+            ['us-east-1', 'eu-west-1', 'us-east-1'],
+            credentials=credentials,
+        )
+
+    assert [result.region for result in response.results] == ['us-east-1', 'eu-west-1']
+    assert [
+        result.response.failed_constraints if result.response else None
+        for result in response.results
+    ] == [['us-east-1'], ['eu-west-1']]
+    assert all(call.args[0] is ir_command for call in mock_interpret.call_args_list)
+    assert all(call.kwargs['credentials'] is credentials for call in mock_interpret.call_args_list)
+
+
+async def test_interpret_command_in_regions_calls_global_services_once():
+    """Test that a global service is called once instead of once per region."""
+    ir = translate_cli_to_ir('aws iam list-users')
+    assert ir.command is not None
+
+    with patch(
+        'awslabs.aws_api_mcp_server.core.aws.service.interpret_command_in_region',
+        return_value=ProgramInterpretationResponse(response=None),
+    ) as mock_interpret:
+        response = await interpret_command_in_regions(
+            'aws iam list-users',
+            ir.command,
+            ['eu-west-1', 'ap-south-1', 'us-west-2'],
+            credentials=Credentials(**TEST_CREDENTIALS),
+        )
+
+    assert [result.region for result in response.results] == ['eu-west-1']
+    mock_interpret.assert_called_once()
+
+
+def test_interpret_command_in_region_swaps_the_region_without_parsing():
+    """Test that each region runs a copy of the parsed command."""
+    ir = translate_cli_to_ir('aws ec2 describe-vpcs --vpc-ids vpc-1')
+    assert ir.command is not None
+
+    with (
+        patch('awslabs.aws_api_mcp_server.core.aws.driver.parse') as mock_parse,
+        patch(
+            'awslabs.aws_api_mcp_server.core.aws.service.interpret_translation',
+            return_value=InterpretedProgram(translation=IRTranslation()),
+        ) as mock_interpret,
+    ):
+        interpret_command_in_region(ir.command, 'eu-west-1')
+
+    mock_parse.assert_not_called()
+    command = mock_interpret.call_args.args[0].command
+    assert command.region == 'eu-west-1'
+    assert command.parameters == ir.command.parameters
+    assert command.parameters is not ir.command.parameters
+    assert ir.command.region != 'eu-west-1'
+
+
+async def test_interpret_command_in_regions_reports_errors_per_region():
+    """Test that a failing or slow region does not fail the other regions."""
+    credentials = Credentials(**TEST_CREDENTIALS)
+    ir_command = MagicMock(profile=None, region='us-east-1', service_name='ec2')
+
+    def fake_interpret(ir_command, region, max_results, credentials):
+        if region == 'eu-west-1':
+            raise RuntimeError('boom')
+        if region == 'ap-south-1':
+            time.sleep(0.5)
+        return ProgramInterpretationResponse(response=None)
+
+    with (
+        patch(
+            'awslabs.aws_api_mcp_server.core.aws.service.interpret_command_in_region',
+            side_effect=fake_interpret,
+        ),
+        patch('awslabs.aws_api_mcp_server.core.aws.service.FAN_OUT_REGION_TIMEOUT_SECONDS', 0.1),
+    ):
+        response = await interpret_command_in_regions(
+            'aws ec2 describe-vpcs',
+            ir_command,
+            ['us-east-1', 'eu-west-1', 'ap-south-1'],
+            credentials=credentials,
+        )
+
+    results = {result.region: result for result in response.results}
+    assert results['us-east-1'].response is not None
+    assert results['eu-west-1'].error == 'boom'
+    assert results['ap-south-1'].error == 'Timed out after 0.1 seconds'
+
+
+async def test_interpret_command_in_regions_respects_call_aws_limit():
+    """Test that regions share the call_aws limit and queued regions do not time out."""
+    credentials = Credentials(**TEST_CREDENTIALS)
+    ir_command = MagicMock(profile=None, region='us-east-1', service_name='ec2')
+    executor = ToolExecutor(kind='thread', max_workers=4, max_concurrency=1)
+    running = []
+
+    def fake_interpret(ir_command, region, max_results, credentials):
+        running.append(region)
+        assert len(running) == 1
+        time.sleep(0.1)
+        running.remove(region)
+        return ProgramInterpretationResponse(response=None)
+
+    try:
+        with (
+            patch('awslabs.aws_api_mcp_server.core.aws.service.TOOL_EXECUTOR', executor),
+            patch(
+                'awslabs.aws_api_mcp_server.core.aws.service.interpret_command_in_region',
+                side_effect=fake_interpret,
+            ),
+            patch(
+                'awslabs.aws_api_mcp_server.core.aws.service.FAN_OUT_REGION_TIMEOUT_SECONDS', 0.25
+            ),
+        ):
+            response = await interpret_command_in_regions(
+                'aws ec2 describe-vpcs',
+                ir_command,
+                ['us-east-1', 'eu-west-1', 'ap-south-1', 'us-west-2'],
+                credentials=credentials,
+            )
+    finally:
+        executor.shutdown()
+
+    assert all(result.error is None for result in response.results)
+
+
+async def test_interpret_command_in_regions_all_enabled_regions():
+    """Test that `all` expands to the regions enabled in the account."""
+    credentials = Credentials(**TEST_CREDENTIALS)
+    ir_command = MagicMock(profile=None, region='us-east-1', service_name='ec2')
+
+    with (
+        patch(
+            'awslabs.aws_api_mcp_server.core.aws.service.get_enabled_regions',
+            return_value=['eu-west-1', 'us-east-1'],
+        ) as mock_get_enabled_regions,
+        patch(
+            'awslabs.aws_api_mcp_server.core.aws.service.interpret_command_in_region',
+            return_value=ProgramInterpretationResponse(response=None),
+        ),
+    ):
+        response = await interpret_command_in_regions(
+            'aws ec2 describe-vpcs', ir_command, ['all'], credentials=credentials
+        )
+
+    mock_get_enabled_regions.assert_called_once_with(credentials, 'us-east-1')
+    assert [result.region for result in response.results] == ['eu-west-1', 'us-east-1']
+
+
+@pytest.mark.parametrize(
+    'cli_command,regions',
+    [
+        ('aws ec2 describe-vpcs --region us-east-1', ['eu-west-1']),
+        ('aws ec2 describe-vpcs --region=us-east-1', ['eu-west-1']),
+        ('aws ec2 describe-vpcs', ['us-east-1 --endpoint-url http://localhost']),
+    ],
+)
+async def test_interpret_command_in_regions_rejects_invalid_input(cli_command, regions):
+    """Test that --region in the command and malformed regions are rejected."""
+    ir_command = MagicMock(profile=None, region='us-east-1')
+
+    with pytest.raises((AwsApiMcpError, ValueError)):
+        await interpret_command_in_regions(
+            cli_command, ir_command, regions, credentials=Credentials(**TEST_CREDENTIALS)
+        )
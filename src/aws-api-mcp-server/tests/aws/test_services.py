@@ -2,8 +2,11 @@ import pytest
 from awslabs.aws_api_mcp_server.core.aws.services import (
     extract_pagination_config,
     get_awscli_driver,
+    get_operation_filters,
 )
 from awslabs.aws_api_mcp_server.core.common.models import Credentials
+from botocore.session import get_session
+from lxml import html
 from tests.fixtures import TEST_CREDENTIALS
 from unittest.mock import MagicMock, patch
 
@@ -110,3 +113,24 @@ def test_get_awscli_driver_user_agent_configuration(mock_create_driver):
     assert result == mock_driver
     assert 'awslabs/mcp/AWS-API-MCP-server' in mock_session.user_agent_extra
     assert 'cli-customizations' in mock_session.user_agent_extra
+
+
+def test_get_operation_filters_parses_documentation_once():
+    """Test that the filter documentation of an operation is only parsed once."""
+    service_model = get_session().get_service_model('ec2')
+    operation = service_model.operation_model('DescribeVolumes')
+
+    with (
+        patch('awslabs.aws_api_mcp_server.core.aws.services._OPERATION_FILTERS_CACHE', {}),
+        patch(
+            'awslabs.aws_api_mcp_server.core.aws.services.html.fromstring',
+            wraps=html.fromstring,
+        ) as mock_fromstring,
+    ):
+        first = get_operation_filters(operation)
+        second = get_operation_filters(operation)
+
+    assert first is second
+    assert first.allows_filter('volume-id')
+    assert not first.allows_filter('not-a-filter')
+    assert mock_fromstring.call_count == 1
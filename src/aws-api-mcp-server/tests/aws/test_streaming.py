@@ -0,0 +1,187 @@
+import boto3
+import io
+import os
+import pytest
+import threading
+from awslabs.aws_api_mcp_server.core.aws.streaming import (
+    ProgressTracker,
+    write_streaming_output,
+)
+from botocore.exceptions import ClientError, IncompleteReadError
+from botocore.response import StreamingBody
+from unittest.mock import MagicMock
+
+
+DATA = bytes(range(256)) * 40  # 10240 bytes
+ETAG = '"abc"'
+
+
+def _body(data: bytes) -> StreamingBody:
+    return StreamingBody(io.BytesIO(data), len(data))
+
+
+def _s3_client_serving(data: bytes, etag: str = ETAG, fail_range: str | None = None):
+    # The service model of a real client decides whether ranged downloads are supported
+    s3_client = boto3.client(
+        's3',
+        region_name='us-east-1',
+        aws_access_key_id='AKIDEXAMPLE',
+        aws_secret_access_key='secret',  # pragma: allowlist secret
+    )
+    client = MagicMock(meta=s3_client.meta)
+    calls = []
+    lock = threading.Lock()
+
+    def get_object(**kwargs):
+        with lock:
+            calls.append(kwargs)
+        if kwargs.get('IfMatch') != etag or kwargs['Range'] == fail_range:
+            raise ClientError({'Error': {'Code': 'PreconditionFailed'}}, 'GetObject')
+        start, end = (int(part) for part in kwargs['Range'][len('bytes=') :].split('-'))
+        return {'Body': _body(data[start : end + 1]), 'ETag': etag}
+
+    client.get_object.side_effect = get_object
+    return client, calls
+
+
+def _response(data: bytes = DATA, **overrides):
+    response = {'Body': _body(data), 'ContentLength': len(data), 'ETag': ETAG}
+    response.update(overrides)
+    return response
+
+
+def test_large_object_is_downloaded_in_ranged_parts(tmp_path):
+    """Test that parts are fetched with ranged requests pinned to the ETag."""
+    client, calls = _s3_client_serving(DATA)
+    path = tmp_path / 'object'
+    progress = []
+
+    write_streaming_output(
+        client,
+        'get_object',
+        {'Bucket': 'bucket', 'Key': 'key'},
+        _response(),
+        'Body',
+        str(path),
+        part_size=4096,
+        max_concurrency=4,
+        progress=lambda done, total: progress.append((done, total)),
+    )
+
+    assert path.read_bytes() == DATA
+    assert sorted(call['Range'] for call in calls) == ['bytes=4096-8191', 'bytes=8192-10239']
+    assert all(call['IfMatch'] == ETAG and call['Bucket'] == 'bucket' for call in calls)
+    assert progress[-1] == (len(DATA), len(DATA))
+
+
+def test_ranged_parts_with_caller_if_match(tmp_path):
+    """Test that an IfMatch given by the caller does not clash with the one of the parts."""
+    client, calls = _s3_client_serving(DATA)
+    path = tmp_path / 'object'
+
+    write_streaming_output(
+        client,
+        'get_object',
+        {'Bucket': 'bucket', 'Key': 'key', 'IfMatch': ETAG},
+        _response(),
+        'Body',
+        str(path),
+        part_size=4096,
+        max_concurrency=4,
+    )
+
+    assert path.read_bytes() == DATA
+    assert len(calls) == 2
+    assert all(call['IfMatch'] == ETAG for call in calls)
+
+
+@pytest.mark.parametrize(
+    'parameters,response_overrides,part_size,max_concurrency',
+    [
+        ({}, {}, len(DATA), 4),
+        ({}, {}, 4096, 1),
+        ({'Range': 'bytes=0-10239'}, {}, 4096, 4),
+        ({}, {'ETag': None}, 4096, 4),
+        ({}, {'ContentRange': 'bytes 0-10239/20000'}, 4096, 4),
+    ],
+)
+def test_sequential_download(tmp_path, parameters, response_overrides, part_size, max_concurrency):
+    """Test that small, partial or unversioned responses are copied as they are."""
+    client, calls = _s3_client_serving(DATA)
+    path = tmp_path / 'object'
+
+    write_streaming_output(
+        client,
+        'get_object',
+        {'Bucket': 'bucket', 'Key': 'key', **parameters},
+        _response(**response_overrides),
+        'Body',
+        str(path),
+        part_size=part_size,
+        max_concurrency=max_concurrency,
+    )
+
+    assert path.read_bytes() == DATA
+    assert calls == []
+
+
+def test_failed_part_removes_file(tmp_path):
+    """Test that a failed ranged request fails the download and leaves no partial file."""
+    client, _ = _s3_client_serving(DATA, fail_range='bytes=8192-10239')
+    path = tmp_path / 'object'
+
+    with pytest.raises(ClientError):
+        write_streaming_output(
+            client,
+            'get_object',
+            {'Bucket': 'bucket', 'Key': 'key'},
+            _response(),
+            'Body',
+            str(path),
+            part_size=4096,
+            max_concurrency=4,
+        )
+
+    assert not os.path.exists(path)
+
+
+def test_truncated_part_is_an_error(tmp_path):
+    """Test that a part shorter than requested is not silently left as a hole."""
+    client, _ = _s3_client_serving(DATA)
+    path = tmp_path / 'object'
+    # The initial response ends before the first part does
+    response = _response(Body=StreamingBody(io.BytesIO(DATA[:100]), None))
+
+    with pytest.raises(IncompleteReadError):
+        write_streaming_output(
+            client,
+            'get_object',
+            {'Bucket': 'bucket', 'Key': 'key'},
+            response,
+            'Body',
+            str(path),
+            part_size=4096,
+            max_concurrency=4,
+        )
+
+    assert not os.path.exists(path)
+
+
+def test_progress_tracker_throttles_and_ignores_callback_errors():
+    """Test that intermediate reports are throttled and callback errors are swallowed."""
+    reports = []
+    tracker = ProgressTracker(100, lambda done, total: reports.append(done), interval=3600)
+
+    tracker.add(10)
+    tracker.add(20)
+    tracker.finish()
+
+    assert reports == [10, 30]
+
+    def fail(done: int, total: int | None):
+        raise ZeroDivisionError()
+
+    failing = ProgressTracker(None, fail)
+    failing.add(5)
+    failing.finish()
+    assert failing.done == 5
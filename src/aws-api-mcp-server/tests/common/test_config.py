@@ -2,6 +2,7 @@ import awslabs.aws_api_mcp_server.core.common.config as config_module
 import importlib
 import pytest
 from awslabs.aws_api_mcp_server.core.common.config import (
+    get_executor_kind_from_env,
     get_region,
     get_server_directory,
     get_transport_from_env,
@@ -203,3 +204,23 @@ def test_package_version_fallback_to_unknown(mock_version):
 
     # Restore original state
     config_module.PACKAGE_VERSION = original_version
+
+
+@pytest.mark.parametrize('executor_kind', ['thread', 'process'])
+def test_get_executor_kind_from_env_valid_values(monkeypatch, executor_kind):
+    """Test that thread and process executors are accepted."""
+    monkeypatch.setenv('AWS_API_MCP_EXECUTOR', executor_kind)
+    assert get_executor_kind_from_env() == executor_kind
+
+
+def test_get_executor_kind_from_env_default_value(monkeypatch):
+    """Test that the thread executor is used by default."""
+    monkeypatch.delenv('AWS_API_MCP_EXECUTOR', raising=False)
+    assert get_executor_kind_from_env() == 'thread'
+
+
+def test_get_executor_kind_from_env_invalid_value(monkeypatch):
+    """Test that an unknown executor is rejected."""
+    monkeypatch.setenv('AWS_API_MCP_EXECUTOR', 'fiber')
+    with pytest.raises(ValueError, match='Invalid executor: fiber'):
+        get_executor_kind_from_env()
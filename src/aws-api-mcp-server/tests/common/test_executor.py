@@ -0,0 +1,99 @@
+import asyncio
+import os
+import pytest
+import threading
+from awslabs.aws_api_mcp_server.core.common.executor import ToolExecutor
+from unittest.mock import patch
+
+
+@pytest.fixture
+def thread_executor():
+    """Thread based executor allowing two concurrent calls per tool."""
+    executor = ToolExecutor(kind='thread', max_workers=4, max_concurrency=2)
+    yield executor
+    executor.shutdown()
+
+
+async def test_run_executes_off_the_event_loop(thread_executor):
+    """Test that work runs on a pool thread and its result is returned."""
+    thread_name = await thread_executor.run('call_aws', lambda: threading.current_thread().name)
+
+    assert thread_name.startswith('aws-api-mcp-tool')
+
+
+async def test_run_propagates_exceptions(thread_executor):
+    """Test that exceptions raised by the work are re-raised to the caller."""
+
+    def fail():
+        raise ValueError('boom')
+
+    with pytest.raises(ValueError, match='boom'):
+        await thread_executor.run('call_aws', fail)
+
+    assert thread_executor.metrics() == {'call_aws': {'queued': 0, 'running': 0}}
+
+
+async def test_run_respects_tool_concurrency_limit(thread_executor):
+    """Test that calls beyond the tool limit are queued and reported."""
+    release = threading.Event()
+    started = threading.Semaphore(0)
+
+    def blocking():
+        started.release()
+        release.wait(timeout=5)
+        return True
+
+    tasks = [asyncio.create_task(thread_executor.run('call_aws', blocking)) for _ in range(3)]
+    for _ in range(2):
+        await asyncio.to_thread(started.acquire)
+    await asyncio.sleep(0.05)
+
+    assert thread_executor.metrics() == {'call_aws': {'queued': 1, 'running': 2}}
+
+    with patch('awslabs.aws_api_mcp_server.core.common.executor.logger') as mock_logger:
+        release.set()
+        assert await asyncio.gather(*tasks) == [True, True, True]
+
+    assert thread_executor.metrics() == {'call_aws': {'queued': 0, 'running': 0}}
+    mock_logger.info.assert_called_once()
+    assert mock_logger.info.call_args.args[1] == 'call_aws'
+    assert mock_logger.info.call_args.args[3].startswith('call_aws: queued=0, running=')
+
+
+async def test_timed_out_work_keeps_its_slot_until_it_finishes(thread_executor):
+    """Test that the timeout excludes queue time and a timed out call holds its slot."""
+    release = threading.Event()
+
+    def blocking():
+        release.wait(timeout=5)
+        return True
+
+    with pytest.raises(asyncio.TimeoutError):
+        await thread_executor.run('call_aws', blocking, timeout=0.05)
+    assert thread_executor.metrics() == {'call_aws': {'queued': 0, 'running': 1}}
+
+    release.set()
+    assert await thread_executor.run('call_aws', blocking, timeout=1)
+    await asyncio.sleep(0.05)
+    assert thread_executor.metrics() == {'call_aws': {'queued': 0, 'running': 0}}
+
+
+async def test_tool_limits_override_default_concurrency():
+    """Test that a per-tool limit overrides the default concurrency."""
+    executor = ToolExecutor(
+        kind='thread', max_workers=4, max_concurrency=4, tool_limits={'customization': 1}
+    )
+    try:
+        assert executor._semaphore('customization')._value == 1
+        assert executor._semaphore('call_aws')._value == 4
+    finally:
+        executor.shutdown()
+
+
+async def test_run_on_process_pool():
+    """Test that the process executor runs work in a separate process."""
+    executor = ToolExecutor(kind='process', max_workers=1, max_concurrency=1)
+    try:
+        assert await executor.run('call_aws', os.getpid) != os.getpid()
+    finally:
+        executor.shutdown()
@@ -0,0 +1,95 @@
+import os
+import subprocess
+import sys
+import time
+from awslabs.aws_api_mcp_server.core.common.startup import (
+    ImportTime,
+    log_import_time_report,
+    parse_import_times,
+    warm_up_in_background,
+)
+from unittest.mock import MagicMock, patch
+
+
+# Generous on purpose: the goal is to catch regressions that put expensive work
+# back on the import path, not to benchmark the machine running the tests.
+COLD_START_BUDGET_SECONDS = 15
+
+IMPORTTIME_OUTPUT = """import time: self [us] | cumulative | imported package
+import time:       120 |        120 | _io
+import time:      3000 |       5000 |   botocore
+import time:       900 |      10000 | awslabs.aws_api_mcp_server.server
+some unrelated line
+"""
+
+
+def test_parse_import_times():
+    """Test that the -X importtime output is parsed and the header is skipped."""
+    assert parse_import_times(IMPORTTIME_OUTPUT) == [
+        ImportTime('_io', 120, 120),
+        ImportTime('botocore', 3000, 5000),
+        ImportTime('awslabs.aws_api_mcp_server.server', 900, 10000),
+    ]
+
+
+@patch('awslabs.aws_api_mcp_server.core.common.startup.logger')
+@patch('awslabs.aws_api_mcp_server.core.common.startup.subprocess.run')
+def test_log_import_time_report(mock_run, mock_logger):
+    """Test that the report lists the slowest modules first."""
+    mock_run.return_value = MagicMock(stderr=IMPORTTIME_OUTPUT)
+
+    log_import_time_report(top=2)
+
+    args = mock_logger.info.call_args.args
+    assert args[1] == 'awslabs.aws_api_mcp_server.server'
+    assert args[2] == '10.0'
+    assert args[3] == 2
+    assert args[4].splitlines()[0].endswith('botocore')
+
+
+@patch('awslabs.aws_api_mcp_server.core.common.startup.logger')
+@patch(
+    'awslabs.aws_api_mcp_server.core.common.startup.subprocess.run',
+    side_effect=subprocess.TimeoutExpired(cmd='python', timeout=1),
+)
+def test_log_import_time_report_timeout(mock_run, mock_logger):
+    """Test that a failure to run the report is logged rather than raised."""
+    log_import_time_report()
+
+    mock_logger.warning.assert_called_once()
+    mock_logger.info.assert_not_called()
+
+
+@patch('awslabs.aws_api_mcp_server.core.common.startup.logger')
+@patch(
+    'awslabs.aws_api_mcp_server.core.common.startup.get_aws_cli',
+    side_effect=RuntimeError('boom'),
+)
+def test_warm_up_failure_is_logged(mock_get_aws_cli, mock_logger):
+    """Test that a failed warm up does not raise on the background thread."""
+    warm_up_in_background().join()
+
+    mock_get_aws_cli.assert_called_once()
+    mock_logger.warning.assert_called_once()
+
+
+def test_cold_start_does_not_create_awscli_driver():
+    """Test that importing the server stays within budget and leaves the driver uncreated."""
+    code = (
+        'import awslabs.aws_api_mcp_server.server\n'
+        'from awslabs.aws_api_mcp_server.core.parser import parser\n'
+        'print(parser._aws_cli is None)\n'
+    )
+    start = time.perf_counter()
+    result = subprocess.run(
+        [sys.executable, '-c', code],
+        capture_output=True,
+        text=True,
+        timeout=COLD_START_BUDGET_SECONDS * 4,
+        env={**os.environ, 'AWS_REGION': 'us-east-1'},
+    )
+    elapsed = time.perf_counter() - start
+
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip() == 'True'
+    assert elapsed < COLD_START_BUDGET_SECONDS
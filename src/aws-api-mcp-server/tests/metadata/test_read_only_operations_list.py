@@ -1,4 +1,5 @@
 import pytest
+import threading
 from awslabs.aws_api_mcp_server.core.metadata.read_only_operations_list import (
     DEFAULT_REQUEST_TIMEOUT,
     SERVICE_REFERENCE_URL,
@@ -223,3 +224,95 @@ def test_read_only_operations_overrides():
     assert not operations.has('cognito-identity', 'GetCredentialsForIdentity')
     assert not operations.has('cognito-identity', 'GetOpenIdToken')
     assert not operations.has('sso', 'GetRoleCredentials')
+
+
+def _service_reference_response(read_operations: list[str]) -> MagicMock:
+    response = MagicMock(spec=Response)
+    response.json.return_value = {
+        'Name': TEST_SERVICE,
+        'Actions': [
+            {'Name': name, 'Annotations': {'Properties': {'IsWrite': False}}}
+            for name in read_operations
+        ],
+    }
+    return response
+
+
+@patch('requests.get')
+def test_read_only_operations_refresh_updates_fetched_services(mocked_requests_get):
+    """Test that refresh re-fetches services that were already fetched."""
+    mocked_requests_get.side_effect = [
+        _service_reference_response([TEST_READ_OPERATION]),
+        _service_reference_response([TEST_READ_OPERATION, TEST_READ_OPERATION_2]),
+    ]
+    operations = ReadOnlyOperations({TEST_SERVICE: TEST_URL})
+
+    assert not operations.has(TEST_SERVICE, TEST_READ_OPERATION_2)
+    operations.refresh()
+
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION_2)
+    assert mocked_requests_get.call_count == 2
+
+
+@patch('requests.get')
+def test_read_only_operations_refresh_keeps_stale_data_on_error(mocked_requests_get):
+    """Test that a failed refresh keeps the previously fetched operations."""
+    mocked_requests_get.side_effect = [
+        _service_reference_response([TEST_READ_OPERATION]),
+        RuntimeError('Error while calling service reference API'),
+    ]
+    operations = ReadOnlyOperations({TEST_SERVICE: TEST_URL})
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+
+    operations.refresh()
+
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+
+
+def test_slow_fetch_does_not_block_other_services():
+    """Test that fetching one service document does not hold up checks of another."""
+    slow_fetch_started = threading.Event()
+    finish_slow_fetch = threading.Event()
+
+    def get(url, timeout):
+        if url == TEST_URL:
+            slow_fetch_started.set()
+            finish_slow_fetch.wait(timeout=5)
+        return _service_reference_response([TEST_READ_OPERATION])
+
+    operations = ReadOnlyOperations({TEST_SERVICE: TEST_URL, 'otherService': 'https://other'})
+    with patch('requests.get', side_effect=get):
+        slow_check = threading.Thread(
+            target=operations.has, args=(TEST_SERVICE, TEST_READ_OPERATION)
+        )
+        slow_check.start()
+        assert slow_fetch_started.wait(timeout=5)
+
+        assert operations.has('otherService', TEST_READ_OPERATION)
+
+        finish_slow_fetch.set()
+        slow_check.join(timeout=5)
+
+    assert operations.has(TEST_SERVICE, TEST_READ_OPERATION)
+
+
+def test_read_only_operations_refresher_lifecycle():
+    """Test that the background refresher can be started once and stopped."""
+    operations = ReadOnlyOperations({})
+    with patch.object(operations, 'refresh'):
+        operations.start_refresher(0.01)
+        refresher = operations._refresher
+        operations.start_refresher(0.01)
+        assert operations._refresher is refresher
+
+        operations.stop_refresher()
+
+    assert operations._refresher is None
+    assert refresher is not None and not refresher.is_alive()
+
+
+def test_read_only_operations_refresher_disabled():
+    """Test that a non-positive interval does not start a refresher."""
+    operations = ReadOnlyOperations({})
+    operations.start_refresher(0)
+    assert operations._refresher is None
@@ -21,10 +21,15 @@ from awslabs.aws_api_mcp_server.core.common.errors import (
     UnknownFiltersError,
 )
 from awslabs.aws_api_mcp_server.core.parser.parser import (
+    _get_operation_parser,
+    _get_service_parser,
+    _parse,
     _validate_endpoint,
     _validate_output_file,
+    get_aws_cli,
     parse,
 )
+from functools import lru_cache
 from unittest.mock import Mock, patch
 
 
@@ -813,3 +818,56 @@ def test_validate_endpoint_non_http_protocols():
     """Test that non-HTTP protocols with localhost are accepted."""
     _validate_endpoint('ftp://localhost:8080')
     _validate_endpoint('ws://127.0.0.1:8080')
+
+
+def test_service_and_operation_parsers_are_reused():
+    """Test that argument parsers are built once per service and operation."""
+    service_command = get_aws_cli().command_table['ec2']
+    operation_command = service_command._get_command_table()['describe-instances']
+
+    assert _get_service_parser(service_command) is _get_service_parser(service_command)
+    assert _get_operation_parser(operation_command) is _get_operation_parser(operation_command)
+
+
+def test_shared_operation_parser_keeps_no_per_call_state():
+    """Test that errors carry the metadata of their own call, not one stored on the parser."""
+    service_command = get_aws_cli().command_table['kinesis']
+    operation_command = service_command._get_command_table()['get-records']
+    operation_parser = _get_operation_parser(operation_command)
+    command_metadata = CommandMetadata('kinesis', None, 'GetRecords')
+
+    with pytest.raises(ExpectedArgumentError) as exc_info:
+        operation_parser.parse_operation_args(command_metadata, ['--shard-iterator'])
+
+    assert exc_info.value.command_metadata is command_metadata
+    assert not hasattr(operation_parser, 'command_metadata')
+
+
+def test_parse_cache_returns_independent_copies():
+    """Test that cached commands can be mutated without affecting the cache."""
+    cached_parse = lru_cache(maxsize=8)(_parse)
+    command = 'aws ec2 describe-instances --instance-ids i-1234567890abcdef0 --region us-east-1'
+    with (
+        patch('awslabs.aws_api_mcp_server.core.parser.parser.PARSE_CACHE_SIZE', 8),
+        patch('awslabs.aws_api_mcp_server.core.parser.parser._cached_parse', cached_parse),
+    ):
+        first = parse(command)
+        first.parameters['InstanceIds'].append('i-0987654321fedcba0')
+        second = parse(command)
+
+    assert second.parameters['InstanceIds'] == ['i-1234567890abcdef0']
+    assert cached_parse.cache_info().hits == 1
+
+
+def test_parse_cache_skips_commands_reading_local_files():
+    """Test that commands inlining local file content are always parsed again."""
+    cached_parse = Mock()
+    with (
+        patch('awslabs.aws_api_mcp_server.core.parser.parser.PARSE_CACHE_SIZE', 8),
+        patch('awslabs.aws_api_mcp_server.core.parser.parser._cached_parse', cached_parse),
+        patch('awslabs.aws_api_mcp_server.core.parser.parser._parse') as mock_parse,
+    ):
+        parse('aws lambda invoke --function-name f --payload fileb:///tmp/payload.json out')
+
+    cached_parse.assert_not_called()
+    mock_parse.assert_called_once()
@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 import requests
 from awslabs.aws_api_mcp_server.core.common.errors import AwsApiMcpError
@@ -7,6 +8,7 @@ from awslabs.aws_api_mcp_server.core.common.models import (
     Consent,
     Credentials,
     InterpretationResponse,
+    MultiRegionInterpretationResponse,
     ProgramInterpretationResponse,
 )
 from awslabs.aws_api_mcp_server.server import call_aws, call_aws_helper, main, suggest_aws_commands
@@ -821,6 +823,7 @@ async def test_call_aws_helper_with_credentials(mock_translate, mock_validate, m
     mock_ir.command_metadata.service_sdk_name = 's3api'
     mock_ir.command_metadata.operation_sdk_name = 'list-buckets'
     mock_ir.command.is_awscli_customization = False  # Ensure interpret_command is called
+    mock_ir.command.has_streaming_output = False
     mock_translate.return_value = mock_ir
 
     mock_validation = MagicMock()
@@ -842,6 +845,7 @@ async def test_call_aws_helper_with_credentials(mock_translate, mock_validate, m
         cli_command='aws s3api list-buckets',
         max_results=None,
         credentials=test_credentials,
+        progress=None,
     )
     assert result == mock_response
 
@@ -857,6 +861,7 @@ async def test_call_aws_helper_without_credentials(mock_translate, mock_validate
     mock_ir.command_metadata.service_sdk_name = 's3api'
     mock_ir.command_metadata.operation_sdk_name = 'list-buckets'
     mock_ir.command.is_awscli_customization = False  # Ensure interpret_command is called
+    mock_ir.command.has_streaming_output = False
     mock_translate.return_value = mock_ir
 
     mock_validation = MagicMock()
@@ -873,11 +878,40 @@ async def test_call_aws_helper_without_credentials(mock_translate, mock_validate
     )
 
     mock_interpret.assert_called_once_with(
-        cli_command='aws s3api list-buckets', max_results=None, credentials=None
+        cli_command='aws s3api list-buckets', max_results=None, credentials=None, progress=None
     )
     assert result == mock_response
 
 
+@patch('awslabs.aws_api_mcp_server.server.interpret_command')
+@patch('awslabs.aws_api_mcp_server.server.validate')
+@patch('awslabs.aws_api_mcp_server.server.translate_cli_to_ir')
+async def test_call_aws_helper_reports_streaming_progress(
+    mock_translate, mock_validate, mock_interpret
+):
+    """Test call_aws_helper forwards download progress as MCP progress notifications."""
+    mock_ir = MagicMock()
+    mock_ir.command_metadata.service_sdk_name = 's3'
+    mock_ir.command_metadata.operation_sdk_name = 'GetObject'
+    mock_ir.command.is_awscli_customization = False
+    mock_ir.command.has_streaming_output = True
+    mock_translate.return_value = mock_ir
+    mock_validate.return_value = MagicMock(validation_failed=False)
+
+    def interpret(cli_command, max_results, credentials, progress):
+        progress(512, 1024)
+        return MagicMock()
+
+    mock_interpret.side_effect = interpret
+    mock_ctx = AsyncMock()
+
+    await call_aws_helper('aws s3api get-object --bucket b --key k /tmp/out', mock_ctx, None)
+    # The notification is scheduled from the worker thread onto the event loop
+    await asyncio.sleep(0)
+
+    mock_ctx.report_progress.assert_awaited_once_with(512, 1024)
+
+
 @patch('awslabs.aws_api_mcp_server.server.call_aws_helper')
 async def test_call_aws_delegates_to_helper(mock_call_aws_helper):
     """Test call_aws delegates to call_aws_helper with None credentials."""
@@ -889,6 +923,63 @@ async def test_call_aws_delegates_to_helper(mock_call_aws_helper):
     result = await call_aws.fn('aws s3api list-buckets', ctx)
 
     mock_call_aws_helper.assert_called_once_with(
-        cli_command='aws s3api list-buckets', ctx=ctx, max_results=None, credentials=None
+        cli_command='aws s3api list-buckets',
+        ctx=ctx,
+        max_results=None,
+        credentials=None,
+        regions=None,
+    )
+    assert result == mock_response
+
+
+@patch('awslabs.aws_api_mcp_server.server.interpret_command_in_regions')
+@patch('awslabs.aws_api_mcp_server.server.validate')
+@patch('awslabs.aws_api_mcp_server.server.translate_cli_to_ir')
+async def test_call_aws_helper_with_regions(mock_translate, mock_validate, mock_in_regions):
+    """Test call_aws_helper fans out to the given regions."""
+    mock_ir = MagicMock()
+    mock_ir.command.is_awscli_customization = False
+    mock_translate.return_value = mock_ir
+
+    mock_validation = MagicMock()
+    mock_validation.validation_failed = False
+    mock_validate.return_value = mock_validation
+
+    mock_response = MultiRegionInterpretationResponse(results=[])
+    mock_in_regions.return_value = mock_response
+
+    result = await call_aws_helper(
+        'aws ec2 describe-vpcs',
+        AsyncMock(),
+        regions=['us-east-1', 'eu-west-1'],
+    )
+
+    mock_in_regions.assert_called_once_with(
+        cli_command='aws ec2 describe-vpcs',
+        ir_command=mock_ir.command,
+        regions=['us-east-1', 'eu-west-1'],
+        max_results=None,
+        credentials=None,
     )
     assert result == mock_response
+
+
+@patch('awslabs.aws_api_mcp_server.server.interpret_command_in_regions')
+@patch('awslabs.aws_api_mcp_server.server.validate')
+@patch('awslabs.aws_api_mcp_server.server.translate_cli_to_ir')
+async def test_call_aws_helper_with_regions_rejects_customizations(
+    mock_translate, mock_validate, mock_in_regions
+):
+    """Test that AWS CLI customizations cannot be fanned out across regions."""
+    mock_ir = MagicMock()
+    mock_ir.command.is_awscli_customization = True
+    mock_translate.return_value = mock_ir
+
+    mock_validation = MagicMock()
+    mock_validation.validation_failed = False
+    mock_validate.return_value = mock_validation
+
+    result = await call_aws_helper('aws s3 ls', AsyncMock(), regions=['us-east-1'])
+
+    assert isinstance(result, AwsApiMcpServerErrorResponse)
+    mock_in_regions.assert_not_called()
@@ -0,0 +1,441 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Offline documentation corpus for AWS Documentation MCP Server.
+
+A corpus is a SQLite database of documentation pages converted to markdown. Pages
+are stored compressed and indexed with a full-text index, so that documentation can
+be searched and read without network access. Build a corpus from pre-fetched pages
+and keep it current with:
+
+    python -m awslabs.aws_documentation_mcp_server.local_corpus build CORPUS PAGES_DIR
+    python -m awslabs.aws_documentation_mcp_server.local_corpus refresh CORPUS
+
+and point the server at it with the `AWS_DOCUMENTATION_CORPUS` environment variable.
+"""
+
+import argparse
+import asyncio
+import html
+import httpx
+import os
+import re
+import sqlite3
+import threading
+import time
+import zlib
+from awslabs.aws_documentation_mcp_server.models import RecommendationResult, SearchResult
+from awslabs.aws_documentation_mcp_server.util import extract_content_from_html, is_html_content
+from functools import lru_cache
+from loguru import logger
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+DEFAULT_BASE_URL = 'https://docs.aws.amazon.com/'
+
+# Length of the excerpt returned as search result context
+CONTEXT_LENGTH = 300
+
+# Relative weight of matches in the page title over matches in the page body
+TITLE_WEIGHT = 5.0
+
+REFRESH_CONCURRENCY = 8
+
+_TERM_PATTERN = re.compile(r'\w+')
+_TITLE_PATTERN = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+_HEADING_PATTERN = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
+
+class LocalCorpus:
+    """SQLite store of converted documentation pages with a full-text index.
+
+    Page content is stored zlib-compressed. The FTS5 index is contentless, so the text
+    is not stored a second time; search result excerpts are cut from the decompressed
+    pages.
+    """
+
+    def __init__(self, path: str):
+        """Open or create a corpus.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        try:
+            with self._conn:
+                self._conn.execute(
+                    'CREATE TABLE IF NOT EXISTS pages ('
+                    'id INTEGER PRIMARY KEY, '
+                    'url TEXT NOT NULL UNIQUE, '
+                    'title TEXT NOT NULL, '
+                    'content BLOB NOT NULL, '
+                    'etag TEXT, '
+                    'last_modified TEXT, '
+                    'updated_at REAL NOT NULL)'
+                )
+                self._conn.execute(
+                    'CREATE VIRTUAL TABLE IF NOT EXISTS pages_fts USING fts5('
+                    "title, body, content='', tokenize='porter unicode61')"
+                )
+        except sqlite3.OperationalError as e:
+            self._conn.close()
+            raise RuntimeError(f'Cannot open documentation corpus {path}: {e}') from e
+
+    def close(self) -> None:
+        """Close the corpus database."""
+        with self._lock:
+            self._conn.close()
+
+    def __len__(self) -> int:
+        """Return the number of pages in the corpus."""
+        with self._lock:
+            return self._conn.execute('SELECT COUNT(*) FROM pages').fetchone()[0]
+
+    def add_page(
+        self,
+        url: str,
+        page_raw: str,
+        content_type: str = 'text/html',
+        etag: Optional[str] = None,
+        last_modified: Optional[str] = None,
+    ) -> bool:
+        """Convert a page and add it to the corpus, replacing an earlier version.
+
+        Args:
+            url: URL of the page
+            page_raw: Raw page content
+            content_type: Content type of the page
+            etag: ETag of the page, used to refresh it (optional)
+            last_modified: Last-Modified date of the page, used to refresh it (optional)
+
+        Returns:
+            True if the page is new or its content changed, False otherwise
+        """
+        if is_html_content(page_raw, content_type):
+            content = extract_content_from_html(page_raw)
+        else:
+            content = page_raw
+        title = _page_title(page_raw, content, url)
+        compressed = zlib.compress(content.encode('utf-8'))
+
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                'SELECT id, title, content FROM pages WHERE url = ?', (url,)
+            ).fetchone()
+            if row is not None and row[2] == compressed and row[1] == title:
+                self._conn.execute(
+                    'UPDATE pages SET etag = ?, last_modified = ?, updated_at = ? WHERE id = ?',
+                    (etag, last_modified, time.time(), row[0]),
+                )
+                return False
+            if row is not None:
+                self._delete_from_index(row[0], row[1], row[2])
+                self._conn.execute(
+                    'UPDATE pages SET title = ?, content = ?, etag = ?, last_modified = ?, '
+                    'updated_at = ? WHERE id = ?',
+                    (title, compressed, etag, last_modified, time.time(), row[0]),
+                )
+                page_id = row[0]
+            else:
+                page_id = self._conn.execute(
+                    'INSERT INTO pages (url, title, content, etag, last_modified, updated_at) '
+                    'VALUES (?, ?, ?, ?, ?, ?)',
+                    (url, title, compressed, etag, last_modified, time.time()),
+                ).lastrowid
+            self._conn.execute(
+                'INSERT INTO pages_fts (rowid, title, body) VALUES (?, ?, ?)',
+                (page_id, title, content),
+            )
+        return True
+
+    def remove_page(self, url: str) -> bool:
+        """Remove a page from the corpus.
+
+        Args:
+            url: URL of the page
+
+        Returns:
+            True if the page was in the corpus, False otherwise
+        """
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                'SELECT id, title, content FROM pages WHERE url = ?', (url,)
+            ).fetchone()
+            if row is None:
+                return False
+            self._delete_from_index(*row)
+            self._conn.execute('DELETE FROM pages WHERE id = ?', (row[0],))
+        return True
+
+    def get_content(self, url: str) -> Optional[str]:
+        """Return the markdown content of a page.
+
+        Args:
+            url: URL of the page
+
+        Returns:
+            Markdown content of the page, or None if the page is not in the corpus
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT content FROM pages WHERE url = ?', (url,)).fetchone()
+        return _decompress(row[0]) if row is not None else None
+
+    def search(self, search_phrase: str, limit: int = 10) -> List[SearchResult]:
+        """Search the corpus.
+
+        Pages matching all terms of the search phrase are returned first, ranked by
+        BM25; if no page matches all terms, pages matching any term are returned.
+
+        Args:
+            search_phrase: Search phrase
+            limit: Maximum number of results to return
+
+        Returns:
+            List of search results, best first
+        """
+        terms = [term.lower() for term in _TERM_PATTERN.findall(search_phrase)]
+        rows = self._match(' AND '.join(_quote(term) for term in terms), limit)
+        if not rows and len(terms) > 1:
+            rows = self._match(' OR '.join(_quote(term) for term in terms), limit)
+        return [
+            SearchResult(
+                rank_order=i + 1,
+                url=url,
+                title=title,
+                query_id='',
+                context=_excerpt(_decompress(content), terms),
+            )
+            for i, (url, title, content) in enumerate(rows)
+        ]
+
+    def related(self, url: str, limit: int = 10) -> List[RecommendationResult]:
+        """Return the pages most similar to a page, by the terms of its title.
+
+        Args:
+            url: URL of the page
+            limit: Maximum number of results to return
+
+        Returns:
+            List of related pages, best first
+        """
+        with self._lock:
+            row = self._conn.execute('SELECT title FROM pages WHERE url = ?', (url,)).fetchone()
+        if row is None:
+            return []
+        terms = [term.lower() for term in _TERM_PATTERN.findall(row[0])]
+        rows = self._match(' OR '.join(_quote(term) for term in terms), limit + 1)
+        return [
+            RecommendationResult(url=page_url, title=title, context='Similar content')
+            for page_url, title, _ in rows
+            if page_url != url
+        ][:limit]
+
+    def pages(self) -> Iterator[Tuple[str, Optional[str], Optional[str]]]:
+        """Iterate over the pages of the corpus.
+
+        Returns:
+            Iterator of the URL, ETag and Last-Modified date of each page
+        """
+        with self._lock:
+            rows = self._conn.execute('SELECT url, etag, last_modified FROM pages').fetchall()
+        return iter(rows)
+
+    def _match(self, expression: str, limit: int) -> List[Tuple[str, str, bytes]]:
+        if not expression:
+            return []
+        with self._lock:
+            return self._conn.execute(
+                'SELECT pages.url, pages.title, pages.content FROM pages_fts '
+                'JOIN pages ON pages.id = pages_fts.rowid '
+                f'WHERE pages_fts MATCH ? ORDER BY bm25(pages_fts, {TITLE_WEIGHT}, 1.0) '
+                'LIMIT ?',
+                (expression, limit),
+            ).fetchall()
+
+    def _delete_from_index(self, page_id: int, title: str, compressed: bytes) -> None:
+        # Contentless FTS5 tables need the indexed values to remove a row
+        self._conn.execute(
+            "INSERT INTO pages_fts (pages_fts, rowid, title, body) VALUES ('delete', ?, ?, ?)",
+            (page_id, title, _decompress(compressed)),
+        )
+
+
+@lru_cache(maxsize=1)
+def _open_corpus(path: str) -> LocalCorpus:
+    return LocalCorpus(path)
+
+
+def get_local_corpus() -> Optional[LocalCorpus]:
+    """Return the corpus configured with `AWS_DOCUMENTATION_CORPUS`, if any.
+
+    Returns:
+        LocalCorpus, or None if the server uses the online documentation APIs
+    """
+    path = os.getenv('AWS_DOCUMENTATION_CORPUS')
+    return _open_corpus(path) if path else None
+
+
+def build_corpus(
+    corpus: LocalCorpus, pages_dir: str, base_url: str = DEFAULT_BASE_URL
+) -> Tuple[int, int]:
+    """Add the HTML pages of a directory to a corpus.
+
+    The URL of each page is its path relative to the directory appended to the base
+    URL, as produced by mirroring the documentation site.
+
+    Args:
+        corpus: Corpus to add the pages to
+        pages_dir: Directory of pre-fetched documentation pages
+        base_url: URL corresponding to the directory
+
+    Returns:
+        Tuple of the number of pages read and the number of new or changed pages
+    """
+    read, changed = 0, 0
+    for root, _, files in os.walk(pages_dir):
+        for name in sorted(files):
+            if not name.endswith('.html'):
+                continue
+            path = os.path.join(root, name)
+            rel_path = os.path.relpath(path, pages_dir).replace(os.sep, '/')
+            try:
+                with open(path, encoding='utf-8') as f:
+                    page_raw = f.read()
+            except (OSError, UnicodeDecodeError) as e:
+                logger.warning(f'Skipping {path}: {e}')
+                continue
+            read += 1
+            if corpus.add_page(base_url.rstrip('/') + '/' + rel_path, page_raw):
+                changed += 1
+    logger.info(f'Read {read} pages from {pages_dir}, {changed} new or changed')
+    return read, changed
+
+
+async def refresh_corpus(
+    corpus: LocalCorpus,
+    client: httpx.AsyncClient,
+    headers: Optional[Dict[str, str]] = None,
+    concurrency: int = REFRESH_CONCURRENCY,
+) -> Tuple[int, int]:
+    """Re-fetch the pages of a corpus that changed online.
+
+    Pages are requested with their ETag and Last-Modified validators, so unchanged
+    pages are not downloaded again. Pages that no longer exist are removed.
+
+    Args:
+        corpus: Corpus to refresh
+        client: HTTP client
+        headers: Headers sent with every request (optional)
+        concurrency: Maximum number of requests in flight
+
+    Returns:
+        Tuple of the number of updated pages and the number of removed pages
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    updated, removed = 0, 0
+
+    async def refresh(url: str, etag: Optional[str], last_modified: Optional[str]):
+        nonlocal updated, removed
+        request_headers = dict(headers or {})
+        if etag:
+            request_headers['If-None-Match'] = etag
+        if last_modified:
+            request_headers['If-Modified-Since'] = last_modified
+        async with semaphore:
+            try:
+                response = await client.get(
+                    url, follow_redirects=True, headers=request_headers, timeout=30
+                )
+            except httpx.HTTPError as e:
+                logger.warning(f'Cannot refresh {url}: {e}')
+                return
+        if response.status_code in (404, 410):
+            removed += corpus.remove_page(url)
+        elif response.status_code == 200:
+            updated += corpus.add_page(
+                url,
+                response.text,
+                response.headers.get('content-type', ''),
+                response.headers.get('etag'),
+                response.headers.get('last-modified'),
+            )
+        elif response.status_code != 304:
+            logger.warning(f'Cannot refresh {url} - status code {response.status_code}')
+
+    await asyncio.gather(*(refresh(*page) for page in corpus.pages()))
+    logger.info(f'Refreshed corpus {corpus.path}: {updated} updated, {removed} removed')
+    return updated, removed
+
+
+def _page_title(page_raw: str, content: str, url: str) -> str:
+    match = _TITLE_PATTERN.search(page_raw)
+    if match and match.group(1).strip():
+        return ' '.join(html.unescape(match.group(1)).split())
+    match = _HEADING_PATTERN.search(content)
+    if match:
+        return match.group(1).strip()
+    return url.rsplit('/', 1)[-1]
+
+
+def _quote(term: str) -> str:
+    return '"' + term.replace('"', '""') + '"'
+
+
+def _decompress(compressed: bytes) -> str:
+    return zlib.decompress(compressed).decode('utf-8')
+
+
+def _excerpt(content: str, terms: List[str]) -> str:
+    lowered = content.lower()
+    positions = [lowered.find(term) for term in terms]
+    start = min((position for position in positions if position >= 0), default=0)
+    start = max(0, content.rfind('\n', 0, start) + 1)
+    excerpt = ' '.join(content[start : start + CONTEXT_LENGTH].split())
+    return excerpt + '...' if start + CONTEXT_LENGTH < len(content) else excerpt
+
+
+def main():
+    """Build or refresh an offline documentation corpus."""
+    from awslabs.aws_documentation_mcp_server.server_utils import DEFAULT_USER_AGENT
+
+    parser = argparse.ArgumentParser(description='Manage an offline AWS documentation corpus')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    build_parser = subparsers.add_parser('build', help='Add pre-fetched HTML pages to a corpus')
+    build_parser.add_argument('corpus', help='Path of the corpus database')
+    build_parser.add_argument('pages_dir', help='Directory of pre-fetched documentation pages')
+    build_parser.add_argument(
+        '--base-url', default=DEFAULT_BASE_URL, help='URL corresponding to the directory'
+    )
+    refresh_parser = subparsers.add_parser('refresh', help='Re-fetch pages that changed online')
+    refresh_parser.add_argument('corpus', help='Path of the corpus database')
+    args = parser.parse_args()
+
+    corpus = LocalCorpus(args.corpus)
+    try:
+        if args.command == 'build':
+            build_corpus(corpus, args.pages_dir, args.base_url)
+        else:
+
+            async def refresh():
+                async with httpx.AsyncClient() as client:
+                    await refresh_corpus(corpus, client, {'User-Agent': DEFAULT_USER_AGENT})
+
+            asyncio.run(refresh())
+    finally:
+        corpus.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -18,6 +18,7 @@ import re
 import uuid
 from awslabs.aws_documentation_mcp_server.server_utils import (
     DEFAULT_USER_AGENT,
+    get_http_client,
     read_documentation_impl,
 )
 
@@ -160,28 +161,28 @@ async def get_available_services(
     """
     url_str = 'https://docs.amazonaws.cn/en_us/aws/latest/userguide/services.html'
     url_with_session = f'{url_str}?session={SESSION_UUID}'
-    async with httpx.AsyncClient() as client:
-        try:
-            response = await client.get(
-                url_with_session,
-                follow_redirects=True,
-                headers={'User-Agent': DEFAULT_USER_AGENT},
-                timeout=30,
-            )
-        except httpx.HTTPError as e:
-            error_msg = f'Failed to fetch {url_str}: {str(e)}'
-            logger.error(error_msg)
-            await ctx.error(error_msg)
-            return error_msg
-
-        if response.status_code >= 400:
-            error_msg = f'Failed to fetch {url_str} - status code {response.status_code}'
-            logger.error(error_msg)
-            await ctx.error(error_msg)
-            return error_msg
-
-        page_raw = response.text
-        content_type = response.headers.get('content-type', '')
+    client = get_http_client()
+    try:
+        response = await client.get(
+            url_with_session,
+            follow_redirects=True,
+            headers={'User-Agent': DEFAULT_USER_AGENT},
+            timeout=30,
+        )
+    except httpx.HTTPError as e:
+        error_msg = f'Failed to fetch {url_str}: {str(e)}'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return error_msg
+
+    if response.status_code >= 400:
+        error_msg = f'Failed to fetch {url_str} - status code {response.status_code}'
+        logger.error(error_msg)
+        await ctx.error(error_msg)
+        return error_msg
+
+    page_raw = response.text
+    content_type = response.headers.get('content-type', '')
 
     if is_html_content(page_raw, content_type):
         content = extract_content_from_html(page_raw)
@@ -11,19 +11,24 @@
 # WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
 # See the License for the specific language governing permissions and
 # limitations under the License.
+import asyncio
 import httpx
+import importlib.util
 import os
+import time
+from awslabs.aws_documentation_mcp_server.local_corpus import get_local_corpus
 from awslabs.aws_documentation_mcp_server.models import SearchResult
 from awslabs.aws_documentation_mcp_server.util import (
     extract_content_from_html,
     format_documentation_result,
     is_html_content,
 )
-from collections import deque
+from collections import OrderedDict, deque
+from dataclasses import dataclass
 from importlib.metadata import version
 from loguru import logger
 from mcp.server.fastmcp import Context
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from urllib.parse import quote
 
 
@@ -42,6 +47,102 @@ DEFAULT_USER_AGENT = (
     f'{BASE_USER_AGENT} ModelContextProtocol/{__version__} (AWS Documentation Server)'
 )
 
+# Converted pages kept in memory, so that paging through a page with start_index does
+# not fetch and convert it again
+PAGE_CACHE_SIZE = int(os.getenv('MCP_PAGE_CACHE_SIZE', '32'))
+PAGE_CACHE_TTL = float(os.getenv('MCP_PAGE_CACHE_TTL', '300'))
+
+# HTTP/2 needs the optional h2 package (httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec('h2') is not None
+
+_http_client: Optional[Tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the HTTP client shared by all requests of the running event loop.
+
+    Reusing one client keeps connections to the documentation hosts alive between
+    tool calls. HTTP/2 is used when the h2 package is installed.
+
+    Returns:
+        Shared httpx.AsyncClient
+    """
+    global _http_client
+    loop = asyncio.get_running_loop()
+    if _http_client is None or _http_client[0] is not loop or _http_client[1].is_closed:
+        client = httpx.AsyncClient(
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+        _http_client = (loop, client)
+    return _http_client[1]
+
+
+@dataclass
+class CachedPage:
+    """A documentation page converted to markdown, with its cache validators."""
+
+    content: str
+    fetched_at: float
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+
+    def validators(self) -> Dict[str, str]:
+        """Return the headers revalidating the page with the server."""
+        headers = {}
+        if self.etag:
+            headers['If-None-Match'] = self.etag
+        if self.last_modified:
+            headers['If-Modified-Since'] = self.last_modified
+        return headers
+
+
+class PageCache:
+    """LRU cache of converted documentation pages keyed by URL.
+
+    Pages younger than `ttl` seconds are served without a request. Older pages are
+    revalidated with their ETag or Last-Modified validators and only downloaded and
+    converted again when they changed.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        """Initialize the page cache.
+
+        Args:
+            max_size: Maximum number of cached pages; 0 disables the cache
+            ttl: Number of seconds a cached page is served without revalidation
+        """
+        self.max_size = max_size
+        self.ttl = ttl
+        self._pages: 'OrderedDict[str, CachedPage]' = OrderedDict()
+
+    def get(self, url: str) -> Optional[CachedPage]:
+        """Return the cached page of a URL, fresh or stale, if any."""
+        page = self._pages.get(url)
+        if page is not None:
+            self._pages.move_to_end(url)
+        return page
+
+    def is_fresh(self, page: CachedPage) -> bool:
+        """Return whether a cached page can be served without revalidation."""
+        return time.monotonic() - page.fetched_at < self.ttl
+
+    def put(self, url: str, page: CachedPage) -> None:
+        """Cache a page, evicting the least recently used pages beyond the size limit."""
+        if self.max_size <= 0:
+            return
+        self._pages[url] = page
+        self._pages.move_to_end(url)
+        while len(self._pages) > self.max_size:
+            self._pages.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached pages."""
+        self._pages.clear()
+
+
+PAGE_CACHE = PageCache(PAGE_CACHE_SIZE, PAGE_CACHE_TTL)
+
 
 async def read_documentation_impl(
     ctx: Context,
@@ -51,24 +152,38 @@ async def read_documentation_impl(
     session_uuid: str,
 ) -> str:
     """The implementation of the read_documentation tool."""
-    logger.debug(f'Fetching documentation from {url_str}')
+    corpus = get_local_corpus()
+    corpus_content = corpus.get_content(url_str) if corpus is not None else None
+    cached_page = PAGE_CACHE.get(url_str)
+    if corpus_content is not None:
+        logger.debug(f'Serving {url_str} from the local corpus')
+        content = corpus_content
+    elif cached_page is not None and PAGE_CACHE.is_fresh(cached_page):
+        logger.debug(f'Serving {url_str} from the page cache')
+        content = cached_page.content
+    else:
+        logger.debug(f'Fetching documentation from {url_str}')
 
-    url_with_session = f'{url_str}?session={session_uuid}'
+        url_with_session = f'{url_str}?session={session_uuid}'
 
-    query_id = get_query_id_from_cache(url_str)
-    if query_id:
-        url_with_session += f'&query_id={query_id}'
-        logger.debug(f'Using query_id {query_id}')
+        query_id = get_query_id_from_cache(url_str)
+        if query_id:
+            url_with_session += f'&query_id={query_id}'
+            logger.debug(f'Using query_id {query_id}')
 
-    async with httpx.AsyncClient() as client:
+        headers = {
+            'User-Agent': DEFAULT_USER_AGENT,
+            'X-MCP-Session-Id': session_uuid,
+        }
+        if cached_page is not None:
+            headers.update(cached_page.validators())
+
+        client = get_http_client()
         try:
             response = await client.get(
                 url_with_session,
                 follow_redirects=True,
-                headers={
-                    'User-Agent': DEFAULT_USER_AGENT,
-                    'X-MCP-Session-Id': session_uuid,
-                },
+                headers=headers,
                 timeout=30,
             )
         except httpx.HTTPError as e:
@@ -77,19 +192,33 @@ async def read_documentation_impl(
             await ctx.error(error_msg)
             return error_msg
 
-        if response.status_code >= 400:
+        if cached_page is not None and response.status_code == 304:
+            logger.debug(f'Cached page of {url_str} is still current')
+            cached_page.fetched_at = time.monotonic()
+            content = cached_page.content
+        elif response.status_code >= 400:
             error_msg = f'Failed to fetch {url_str} - status code {response.status_code}'
             logger.error(error_msg)
             await ctx.error(error_msg)
             return error_msg
+        else:
+            page_raw = response.text
+            content_type = response.headers.get('content-type', '')
 
-        page_raw = response.text
-        content_type = response.headers.get('content-type', '')
+            if is_html_content(page_raw, content_type):
+                content = extract_content_from_html(page_raw)
+            else:
+                content = page_raw
 
-    if is_html_content(page_raw, content_type):
-        content = extract_content_from_html(page_raw)
-    else:
-        content = page_raw
+            PAGE_CACHE.put(
+                url_str,
+                CachedPage(
+                    content=content,
+                    fetched_at=time.monotonic(),
+                    etag=response.headers.get('etag'),
+                    last_modified=response.headers.get('last-modified'),
+                ),
+            )
 
     result = format_documentation_result(url_str, content, start_index, max_length)
 
@@ -14,6 +14,7 @@
 """Configuration for pytest."""
 
 import pytest
+from awslabs.aws_documentation_mcp_server.server_utils import PAGE_CACHE
 
 
 def pytest_addoption(parser):
@@ -38,3 +39,11 @@ def pytest_collection_modifyitems(config, items):
         for item in items:
             if 'live' in item.keywords:
                 item.add_marker(skip_live)
+
+
+@pytest.fixture(autouse=True)
+def clear_page_cache():
+    """Start every test with an empty page cache."""
+    PAGE_CACHE.clear()
+    yield
+    PAGE_CACHE.clear()
@@ -0,0 +1,146 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the offline documentation corpus of the AWS Documentation MCP Server."""
+
+import pytest
+from awslabs.aws_documentation_mcp_server.local_corpus import (
+    LocalCorpus,
+    build_corpus,
+    refresh_corpus,
+)
+from awslabs.aws_documentation_mcp_server.server_aws import recommend, search_documentation
+from awslabs.aws_documentation_mcp_server.server_utils import read_documentation_impl
+from unittest.mock import AsyncMock, MagicMock, patch
+
+
+BASE_URL = 'https://docs.aws.amazon.com/'
+
+
+def _page(title, body):
+    return f'<html><head><title>{title}</title></head><body><main>{body}</main></body></html>'
+
+
+@pytest.fixture
+def corpus(tmp_path):
+    """Create a corpus from a directory of pre-fetched pages."""
+    pages = {
+        'lambda/latest/dg/welcome.html': _page(
+            'What is AWS Lambda?', '<p>Lambda runs code without provisioning servers.</p>'
+        ),
+        'lambda/latest/dg/invocation.html': _page(
+            'Invoking Lambda functions', '<p>You can invoke functions synchronously.</p>'
+        ),
+        'AmazonS3/latest/userguide/versioning.html': _page(
+            'Using versioning in S3 buckets', '<p>Versioning keeps multiple object variants.</p>'
+        ),
+    }
+    pages_dir = tmp_path / 'pages'
+    for rel_path, html in pages.items():
+        path = pages_dir / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(html)
+
+    corpus = LocalCorpus(str(tmp_path / 'corpus.db'))
+    assert build_corpus(corpus, str(pages_dir)) == (3, 3)
+    assert build_corpus(corpus, str(pages_dir)) == (3, 0)
+    yield corpus
+    corpus.close()
+
+
+def test_search_ranks_pages(corpus):
+    """Test that searches match stemmed terms and rank title matches first."""
+    results = corpus.search('invoke lambda', limit=10)
+
+    assert [result.url for result in results] == [f'{BASE_URL}lambda/latest/dg/invocation.html']
+    assert results[0].title == 'Invoking Lambda functions'
+    assert 'synchronously' in results[0].context
+
+    any_term = corpus.search('versioning provisioning', limit=10)
+    assert len(any_term) == 2
+    assert corpus.search('"; DROP TABLE pages', limit=10) == []
+    assert corpus.search('', limit=10) == []
+
+
+def test_pages_are_replaced_and_removed(corpus):
+    """Test that updated pages are re-indexed and removed pages leave the index."""
+    url = f'{BASE_URL}AmazonS3/latest/userguide/versioning.html'
+
+    assert corpus.add_page(url, _page('Object lock', '<p>Retention modes.</p>'))
+    assert corpus.search('versioning', limit=10) == []
+    assert 'Retention modes' in corpus.get_content(url)
+
+    assert corpus.remove_page(url)
+    assert corpus.search('retention', limit=10) == []
+    assert corpus.get_content(url) is None
+    assert len(corpus) == 2
+
+
+def test_related_pages(corpus):
+    """Test that related pages are found by the title of a page."""
+    results = corpus.related(f'{BASE_URL}lambda/latest/dg/welcome.html')
+
+    assert [result.url for result in results] == [f'{BASE_URL}lambda/latest/dg/invocation.html']
+
+
+@pytest.mark.asyncio
+async def test_refresh_updates_changed_pages(corpus):
+    """Test that refreshing sends validators and applies changes and removals."""
+    corpus.add_page(f'{BASE_URL}lambda/latest/dg/welcome.html', _page('Lambda', ''), etag='"v1"')
+
+    def respond(url, headers, **kwargs):
+        response = MagicMock()
+        response.headers = {'content-type': 'text/html'}
+        response.text = _page('Invoking Lambda functions', '<p>Asynchronous invocation.</p>')
+        if url.endswith('welcome.html'):
+            assert headers['If-None-Match'] == '"v1"'
+            response.status_code = 304
+        elif url.endswith('versioning.html'):
+            response.status_code = 404
+        else:
+            response.status_code = 200
+        return response
+
+    client = MagicMock()
+    client.get = AsyncMock(side_effect=respond)
+
+    assert await refresh_corpus(corpus, client) == (1, 1)
+    assert len(corpus.search('asynchronous', limit=10)) == 1
+
+
+@pytest.mark.asyncio
+async def test_tools_use_the_corpus_without_network(corpus):
+    """Test that search, recommend and read are answered from the corpus."""
+    ctx = MagicMock()
+    ctx.error = AsyncMock()
+    url = f'{BASE_URL}lambda/latest/dg/welcome.html'
+
+    with (
+        patch(
+            'awslabs.aws_documentation_mcp_server.server_aws.get_local_corpus',
+            return_value=corpus,
+        ),
+        patch(
+            'awslabs.aws_documentation_mcp_server.server_utils.get_local_corpus',
+            return_value=corpus,
+        ),
+        patch('httpx.AsyncClient') as mock_client_class,
+    ):
+        results = await search_documentation(ctx, search_phrase='provisioning servers', limit=5)
+        recommendations = await recommend(ctx, url=url)
+        content = await read_documentation_impl(ctx, url, 1000, 0, 'test-uuid')
+
+    assert [result.url for result in results] == [url]
+    assert len(recommendations) == 1
+    assert 'without provisioning servers' in content
+    mock_client_class.assert_not_called()
@@ -18,8 +18,10 @@ import pytest
 from awslabs.aws_documentation_mcp_server.models import SearchResult
 from awslabs.aws_documentation_mcp_server.server_utils import (
     DEFAULT_USER_AGENT,
+    PAGE_CACHE,
     SEARCH_RESULT_CACHE,
     add_search_result_cache_item,
+    get_http_client,
     get_query_id_from_cache,
     read_documentation_impl,
 )
@@ -372,6 +374,105 @@ class TestReadDocumentationImpl:
                 )
 
 
+class TestPageCache:
+    """Tests for the converted page cache of read_documentation_impl."""
+
+    @staticmethod
+    def _response(status_code, text='', headers=None):
+        response = MagicMock()
+        response.status_code = status_code
+        response.text = text
+        response.headers = headers or {}
+        return response
+
+    @pytest.mark.asyncio
+    async def test_pages_are_fetched_and_converted_once(self):
+        """Test that paging through a page is served from the cache."""
+        url = 'https://docs.aws.amazon.com/paged.html'
+        ctx = MagicMock(spec=Context)
+        ctx.error = AsyncMock()
+        html = '<html><body><main><p>' + 'word ' * 40 + '</p></main></body></html>'
+
+        with (
+            patch('httpx.AsyncClient') as mock_client_class,
+            patch(
+                'awslabs.aws_documentation_mcp_server.server_utils.extract_content_from_html',
+                return_value='x' * 100,
+            ) as mock_extract,
+        ):
+            mock_client = mock_client_class.return_value
+            mock_client.is_closed = False
+            mock_client.get = AsyncMock(
+                return_value=self._response(200, html, {'content-type': 'text/html'})
+            )
+
+            first = await read_documentation_impl(ctx, url, 60, 0, 'test-uuid')
+            second = await read_documentation_impl(ctx, url, 60, 60, 'test-uuid')
+
+        assert 'start_index=60' in first
+        assert second.endswith('x' * 40)
+        assert mock_client.get.call_count == 1
+        assert mock_extract.call_count == 1
+        assert mock_client_class.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_stale_pages_are_revalidated(self):
+        """Test that expired pages are revalidated with their ETag."""
+        url = 'https://docs.aws.amazon.com/etag.html'
+        ctx = MagicMock(spec=Context)
+        ctx.error = AsyncMock()
+
+        with (
+            patch('httpx.AsyncClient') as mock_client_class,
+            patch.object(PAGE_CACHE, 'ttl', 0),
+        ):
+            mock_client = mock_client_class.return_value
+            mock_client.is_closed = False
+            mock_client.get = AsyncMock(
+                side_effect=[
+                    self._response(
+                        200, 'Plain text', {'content-type': 'text/plain', 'etag': '"v1"'}
+                    ),
+                    self._response(304),
+                ]
+            )
+
+            first = await read_documentation_impl(ctx, url, 1000, 0, 'test-uuid')
+            second = await read_documentation_impl(ctx, url, 1000, 0, 'test-uuid')
+
+        assert first == second
+        assert mock_client.get.call_args.kwargs['headers']['If-None-Match'] == '"v1"'
+
+    @pytest.mark.asyncio
+    async def test_failed_fetches_are_not_cached(self):
+        """Test that error responses are not served from the cache."""
+        url = 'https://docs.aws.amazon.com/missing.html'
+        ctx = MagicMock(spec=Context)
+        ctx.error = AsyncMock()
+
+        with patch('httpx.AsyncClient') as mock_client_class:
+            mock_client = mock_client_class.return_value
+            mock_client.is_closed = False
+            mock_client.get = AsyncMock(return_value=self._response(404))
+
+            await read_documentation_impl(ctx, url, 1000, 0, 'test-uuid')
+            result = await read_documentation_impl(ctx, url, 1000, 0, 'test-uuid')
+
+        assert 'status code 404' in result
+        assert mock_client.get.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_http_client_is_shared(self):
+        """Test that the running event loop reuses one HTTP client."""
+        client = get_http_client()
+
+        assert get_http_client() is client
+        await client.aclose()
+        new_client = get_http_client()
+        assert new_client is not client
+        await new_client.aclose()
+
+
 class TestUserAgentCustomization:
     """Test custom User-Agent functionality."""
 
@@ -26,6 +26,10 @@ MCP_SERVER_NAME = 'awslabs.aws-pricing-mcp-server'
 AWS_REGION = os.environ.get('AWS_REGION', 'us-east-1')
 AWS_PROFILE = os.environ.get('AWS_PROFILE')
 PRICING_ENDPOINT = os.environ.get('PRICING_ENDPOINT')
+PRICE_LIST_STORE = os.environ.get('PRICE_LIST_STORE')
+# Seconds service codes, attribute names and attribute values are cached for (0 disables)
+PRICING_CACHE_TTL = int(os.environ.get('PRICING_CACHE_TTL', '3600'))
+PRICING_CACHE_SIZE = int(os.environ.get('PRICING_CACHE_SIZE', '1024'))
 LOG_LEVEL = os.getenv('FASTMCP_LOG_LEVEL', 'WARNING')
 
 # Supported AWS Pricing API regions
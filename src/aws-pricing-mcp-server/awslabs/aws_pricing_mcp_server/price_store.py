@@ -0,0 +1,562 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Local price list store for the aws-pricing-mcp-server.
+
+This module ingests bulk price list files, as downloaded from the URLs returned by
+get_price_list_urls, into an indexed SQLite database. The store answers the
+get_products, get_attribute_values and describe_services calls of the AWS Pricing
+API, so tools can query ingested services without calling the API.
+"""
+
+import argparse
+import csv
+import json
+import os
+import re
+import sqlite3
+import threading
+from awslabs.aws_pricing_mcp_server import consts
+from functools import lru_cache
+from loguru import logger
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+# Attributes stored as indexed columns of the products table
+PRODUCT_COLUMNS = {
+    'regionCode': 'region_code',
+    'instanceType': 'instance_type',
+    'usagetype': 'usagetype',
+}
+
+# Leading columns of a CSV price list that describe a price dimension
+CSV_TERM_COLUMNS = (
+    'SKU',
+    'OfferTermCode',
+    'RateCode',
+    'TermType',
+    'PriceDescription',
+    'EffectiveDate',
+    'StartingRange',
+    'EndingRange',
+    'Unit',
+    'PricePerUnit',
+    'Currency',
+)
+
+# CSV headers whose attribute name in the API differs from their camel case form
+CSV_ATTRIBUTE_NAMES = {
+    'Product Family': 'productFamily',
+    'serviceCode': 'servicecode',
+    'serviceName': 'servicename',
+    'usageType': 'usagetype',
+}
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS services (
+    service_code TEXT PRIMARY KEY,
+    version TEXT,
+    publication_date TEXT
+);
+CREATE TABLE IF NOT EXISTS products (
+    id INTEGER PRIMARY KEY,
+    service_code TEXT NOT NULL,
+    sku TEXT NOT NULL,
+    region_code TEXT COLLATE NOCASE,
+    instance_type TEXT COLLATE NOCASE,
+    usagetype TEXT COLLATE NOCASE,
+    ingest_id INTEGER NOT NULL,
+    document TEXT NOT NULL,
+    UNIQUE (service_code, sku)
+);
+CREATE INDEX IF NOT EXISTS products_region ON products (service_code, region_code);
+CREATE INDEX IF NOT EXISTS products_instance_type ON products (service_code, instance_type);
+CREATE INDEX IF NOT EXISTS products_usagetype ON products (service_code, usagetype);
+CREATE TABLE IF NOT EXISTS attributes (
+    product_id INTEGER NOT NULL REFERENCES products (id) ON DELETE CASCADE,
+    service_code TEXT NOT NULL,
+    name TEXT NOT NULL,
+    value TEXT NOT NULL COLLATE NOCASE,
+    PRIMARY KEY (product_id, name)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS attributes_value ON attributes (service_code, name, value);
+"""
+
+_ATTRIBUTE_VALUES_PAGE_SIZE = 1000
+
+
+class PriceStore:
+    """SQLite store of AWS price list products.
+
+    Each product is kept as its document in the shape of a `PriceList` entry of the
+    AWS Pricing API, together with its attributes. Region code, instance type and
+    usage type are indexed columns of the products table; every attribute is also
+    indexed by service, name and value so that filters on any attribute are answered
+    from the index. Values are compared case-insensitively, like the API does.
+    """
+
+    def __init__(self, path: str):
+        """Open or create a price list store.
+
+        Args:
+            path: Path to the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._connection.execute('PRAGMA foreign_keys = ON')
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the store."""
+        self._connection.close()
+
+    def services(self) -> List[str]:
+        """Return the codes of the ingested services."""
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT service_code FROM services ORDER BY service_code'
+            ).fetchall()
+        return [row[0] for row in rows]
+
+    def has_service(self, service_code: str) -> bool:
+        """Return whether the price list of a service has been ingested."""
+        with self._lock:
+            row = self._connection.execute(
+                'SELECT 1 FROM services WHERE service_code = ?', (service_code,)
+            ).fetchone()
+        return row is not None
+
+    def get_products(
+        self,
+        ServiceCode: str,
+        Filters: Optional[List[Dict[str, str]]] = None,
+        MaxResults: int = 100,
+        NextToken: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Return the products of a service matching filters, like the Pricing API.
+
+        Args:
+            ServiceCode: Service code
+            Filters: Filters with `Field`, `Type` and `Value`; ANY_OF and NONE_OF take
+                comma-separated values
+            MaxResults: Maximum number of products to return
+            NextToken: Token returned with the previous page
+
+        Returns:
+            Response with a `PriceList` of JSON documents and a `NextToken` if more
+            products match
+
+        Raises:
+            ValueError: If a filter type is not supported or the token is invalid
+        """
+        where = ['p.service_code = ?']
+        params: List[Any] = [ServiceCode]
+        for api_filter in Filters or []:
+            clause, clause_params = self._filter_clause(ServiceCode, api_filter)
+            where.append(clause)
+            params.extend(clause_params)
+        if NextToken:
+            if not NextToken.isdigit():
+                raise ValueError(f'Invalid next token: {NextToken}')
+            where.append('p.id > ?')
+            params.append(int(NextToken))
+
+        query = (
+            f'SELECT p.id, p.document FROM products p WHERE {" AND ".join(where)} '
+            'ORDER BY p.id LIMIT ?'
+        )
+        with self._lock:
+            rows = self._connection.execute(query, [*params, MaxResults + 1]).fetchall()
+
+        response: Dict[str, Any] = {'PriceList': [row[1] for row in rows[:MaxResults]]}
+        if len(rows) > MaxResults:
+            response['NextToken'] = str(rows[MaxResults - 1][0])
+        return response
+
+    def get_attribute_values(
+        self, ServiceCode: str, AttributeName: str, NextToken: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Return the distinct values of an attribute, like the Pricing API.
+
+        Args:
+            ServiceCode: Service code
+            AttributeName: Attribute name
+            NextToken: Token returned with the previous page
+
+        Returns:
+            Response with `AttributeValues` and a `NextToken` if more values exist
+        """
+        offset = int(NextToken) if NextToken else 0
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT DISTINCT value FROM attributes WHERE service_code = ? AND name = ? '
+                'ORDER BY value LIMIT ? OFFSET ?',
+                (ServiceCode, AttributeName, _ATTRIBUTE_VALUES_PAGE_SIZE + 1, offset),
+            ).fetchall()
+
+        response: Dict[str, Any] = {
+            'AttributeValues': [{'Value': row[0]} for row in rows[:_ATTRIBUTE_VALUES_PAGE_SIZE]]
+        }
+        if len(rows) > _ATTRIBUTE_VALUES_PAGE_SIZE:
+            response['NextToken'] = str(offset + _ATTRIBUTE_VALUES_PAGE_SIZE)
+        return response
+
+    def describe_services(self, ServiceCode: str) -> Dict[str, Any]:
+        """Return the attribute names of a service, like the Pricing API.
+
+        Args:
+            ServiceCode: Service code
+
+        Returns:
+            Response with the service and its `AttributeNames`, or no services if the
+            service has not been ingested
+        """
+        if not self.has_service(ServiceCode):
+            return {'Services': []}
+        with self._lock:
+            rows = self._connection.execute(
+                'SELECT DISTINCT name FROM attributes WHERE service_code = ? ORDER BY name',
+                (ServiceCode,),
+            ).fetchall()
+        return {
+            'Services': [{'ServiceCode': ServiceCode, 'AttributeNames': [row[0] for row in rows]}]
+        }
+
+    def ingest_file(self, path: str) -> Tuple[str, int]:
+        """Ingest a bulk price list file in JSON or CSV format.
+
+        The file replaces the products previously ingested for the same service in
+        the regions it covers, so that a service can be ingested one region at a time.
+
+        Args:
+            path: Path to a `.json` or `.csv` price list file
+
+        Returns:
+            Service code and number of products of the file
+
+        Raises:
+            ValueError: If the file is not a price list
+        """
+        if path.endswith('.csv'):
+            with open(path, newline='', encoding='utf-8') as f:
+                return self._ingest(*_read_csv_offer(f))
+        with open(path, encoding='utf-8') as f:
+            offer = json.load(f)
+        return self._ingest(*_read_json_offer(offer))
+
+    def ingest_directory(self, directory: str) -> Dict[str, int]:
+        """Ingest all price list files of a directory.
+
+        Args:
+            directory: Directory holding `.json` and `.csv` price list files
+
+        Returns:
+            Number of products ingested for each service
+        """
+        counts: Dict[str, int] = {}
+        for name in sorted(os.listdir(directory)):
+            if name.endswith(('.json', '.csv')):
+                service_code, count = self.ingest_file(os.path.join(directory, name))
+                counts[service_code] = counts.get(service_code, 0) + count
+        return counts
+
+    def _ingest(
+        self, metadata: Dict[str, str], products: Iterator[Dict[str, Any]]
+    ) -> Tuple[str, int]:
+        service_code = metadata.get('offerCode')
+        if not service_code:
+            raise ValueError('The price list does not name its service (offer code)')
+
+        count = 0
+        regions = set()
+        with self._lock, self._connection:
+            connection = self._connection
+            ingest_id = (
+                connection.execute('SELECT COALESCE(MAX(ingest_id), 0) + 1 FROM products')
+            ).fetchone()[0]
+            for document in products:
+                regions.add(self._upsert(connection, service_code, ingest_id, document))
+                count += 1
+            for region in regions:
+                connection.execute(
+                    'DELETE FROM products WHERE service_code = ? AND region_code IS ? '
+                    'AND ingest_id != ?',
+                    (service_code, region, ingest_id),
+                )
+            connection.execute(
+                'INSERT OR REPLACE INTO services VALUES (?, ?, ?)',
+                (service_code, metadata.get('version'), metadata.get('publicationDate')),
+            )
+        logger.info(f'Ingested {count} products of {service_code}')
+        return service_code, count
+
+    def _upsert(
+        self,
+        connection: sqlite3.Connection,
+        service_code: str,
+        ingest_id: int,
+        document: Dict[str, Any],
+    ) -> Optional[str]:
+        product = document['product']
+        row = connection.execute(
+            'SELECT id, ingest_id, document FROM products WHERE service_code = ? AND sku = ?',
+            (service_code, product['sku']),
+        ).fetchone()
+        if row is not None and row[1] == ingest_id:
+            # Rows of one product that are not adjacent in a CSV file are merged
+            document = _merge_terms(json.loads(row[2]), document)
+
+        attributes = dict(product.get('attributes', {}))
+        if product.get('productFamily'):
+            attributes['productFamily'] = product['productFamily']
+        columns = [attributes.get(name) for name in PRODUCT_COLUMNS]
+        encoded = json.dumps(document, separators=(',', ':'))
+        if row is None:
+            product_id = connection.execute(
+                'INSERT INTO products (service_code, sku, region_code, instance_type, '
+                'usagetype, ingest_id, document) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (service_code, product['sku'], *columns, ingest_id, encoded),
+            ).lastrowid
+        else:
+            product_id = row[0]
+            connection.execute(
+                'UPDATE products SET region_code = ?, instance_type = ?, usagetype = ?, '
+                'ingest_id = ?, document = ? WHERE id = ?',
+                (*columns, ingest_id, encoded, product_id),
+            )
+            connection.execute('DELETE FROM attributes WHERE product_id = ?', (product_id,))
+        connection.executemany(
+            'INSERT INTO attributes VALUES (?, ?, ?, ?)',
+            [
+                (product_id, service_code, name, str(value))
+                for name, value in attributes.items()
+                if value not in (None, '')
+            ],
+        )
+        return columns[0]
+
+    def _filter_clause(
+        self, service_code: str, api_filter: Dict[str, str]
+    ) -> Tuple[str, List[Any]]:
+        field = api_filter['Field']
+        filter_type = api_filter.get('Type', 'EQUALS')
+        value = str(api_filter['Value'])
+        if filter_type in ('ANY_OF', 'NONE_OF'):
+            values = [v.strip() for v in value.split(',')]
+        else:
+            values = [value]
+
+        column = PRODUCT_COLUMNS.get(field)
+        if filter_type in ('EQUALS', 'TERM_MATCH', 'ANY_OF', 'NONE_OF'):
+            placeholders = ', '.join('?' * len(values))
+            if column:
+                condition, params = f'p.{column} IN ({placeholders})', values
+            else:
+                condition = (
+                    'p.id IN (SELECT product_id FROM attributes WHERE service_code = ? '
+                    f'AND name = ? AND value IN ({placeholders}))'
+                )
+                params = [service_code, field, *values]
+            if filter_type == 'NONE_OF':
+                if column:
+                    return f'(p.{column} IS NULL OR NOT {condition})', params
+                return f'NOT {condition}', params
+            return condition, params
+        if filter_type == 'CONTAINS':
+            if column:
+                return f'instr(lower(p.{column}), lower(?)) > 0', values
+            return (
+                'p.id IN (SELECT product_id FROM attributes WHERE service_code = ? '
+                'AND name = ? AND instr(lower(value), lower(?)) > 0)'
+            ), [service_code, field, value]
+        raise ValueError(f'Unsupported filter type: {filter_type}')
+
+
+def _read_json_offer(offer: Dict[str, Any]) -> Tuple[Dict[str, str], Iterator[Dict[str, Any]]]:
+    if 'products' not in offer:
+        raise ValueError('The file is not a price list: it has no products')
+    metadata = {
+        'offerCode': offer.get('offerCode', ''),
+        'version': offer.get('version', ''),
+        'publicationDate': offer.get('publicationDate', ''),
+    }
+    terms = offer.get('terms', {})
+
+    def documents() -> Iterator[Dict[str, Any]]:
+        for sku, product in offer['products'].items():
+            product_terms = {
+                term_type: by_sku[sku] for term_type, by_sku in terms.items() if sku in by_sku
+            }
+            yield {
+                'product': product,
+                'serviceCode': metadata['offerCode'],
+                'terms': product_terms,
+                'version': metadata['version'],
+                'publicationDate': metadata['publicationDate'],
+            }
+
+    return metadata, documents()
+
+
+def _csv_attribute_name(header: str) -> str:
+    if header in CSV_ATTRIBUTE_NAMES:
+        return CSV_ATTRIBUTE_NAMES[header]
+    words = re.findall(r'[A-Za-z0-9]+', header)
+    if not words:
+        return header
+    first = words[0].lower() if words[0].isupper() else words[0][0].lower() + words[0][1:]
+    return first + ''.join(word[0].upper() + word[1:] for word in words[1:])
+
+
+def _read_csv_offer(lines) -> Tuple[Dict[str, str], Iterator[Dict[str, Any]]]:
+    reader = csv.reader(lines)
+    metadata: Dict[str, str] = {}
+    header: Optional[List[str]] = None
+    for row in reader:
+        if row and row[0] == 'SKU':
+            header = row
+            break
+        if len(row) >= 2:
+            key = _csv_attribute_name(row[0])
+            metadata[key] = row[1]
+    if header is None:
+        raise ValueError('The file is not a price list: it has no SKU header')
+
+    try:
+        family_column = header.index('Product Family')
+    except ValueError:
+        family_column = len(CSV_TERM_COLUMNS)
+    term_attribute_names = header[len(CSV_TERM_COLUMNS) : family_column]
+    attribute_names = [_csv_attribute_name(name) for name in header[family_column:]]
+    term_columns = {name: position for position, name in enumerate(header)}
+
+    def document(row: List[str]) -> Dict[str, Any]:
+        def cell(name: str) -> str:
+            return row[term_columns[name]] if name in term_columns else ''
+
+        attributes = {
+            name: value
+            for name, value in zip(attribute_names, row[family_column:], strict=False)
+            if value
+        }
+        family = attributes.pop('productFamily', '')
+        sku = cell('SKU')
+        offer_term_code = cell('OfferTermCode')
+        rate_code = cell('RateCode')
+        term = {
+            'offerTermCode': offer_term_code,
+            'sku': sku,
+            'effectiveDate': cell('EffectiveDate'),
+            'priceDimensions': {
+                rate_code: {
+                    'unit': cell('Unit'),
+                    'endRange': cell('EndingRange'),
+                    'description': cell('PriceDescription'),
+                    'appliesTo': [],
+                    'rateCode': rate_code,
+                    'beginRange': cell('StartingRange'),
+                    'pricePerUnit': {cell('Currency'): cell('PricePerUnit')},
+                }
+            },
+            'termAttributes': {
+                name: value
+                for name, value in zip(
+                    term_attribute_names,
+                    row[len(CSV_TERM_COLUMNS) : family_column],
+                    strict=False,
+                )
+                if value and name != 'RelatedTo'
+            },
+        }
+        product: Dict[str, Any] = {'sku': sku, 'attributes': attributes}
+        if family:
+            product['productFamily'] = family
+        return {
+            'product': product,
+            'serviceCode': metadata.get('offerCode', ''),
+            'terms': {cell('TermType'): {f'{sku}.{offer_term_code}': term}},
+            'version': metadata.get('version', ''),
+            'publicationDate': metadata.get('publicationDate', ''),
+        }
+
+    def documents() -> Iterator[Dict[str, Any]]:
+        # Rows are grouped by SKU and a product is emitted once its rows end
+        current: Optional[Dict[str, Any]] = None
+        for row in reader:
+            if not row:
+                continue
+            row_document = document(row)
+            if current is not None and current['product']['sku'] == row_document['product']['sku']:
+                current = _merge_terms(current, row_document)
+                continue
+            if current is not None:
+                yield current
+            current = row_document
+        if current is not None:
+            yield current
+
+    return metadata, documents()
+
+
+def _merge_terms(document: Dict[str, Any], other: Dict[str, Any]) -> Dict[str, Any]:
+    for term_type, offers in other['terms'].items():
+        merged_offers = document['terms'].setdefault(term_type, {})
+        for offer_code, offer in offers.items():
+            if offer_code in merged_offers:
+                merged_offers[offer_code]['priceDimensions'].update(offer['priceDimensions'])
+            else:
+                merged_offers[offer_code] = offer
+    return document
+
+
+@lru_cache(maxsize=4)
+def _open_price_store(path: str) -> PriceStore:
+    return PriceStore(path)
+
+
+def get_price_store() -> Optional[PriceStore]:
+    """Return the price list store configured with PRICE_LIST_STORE, if any."""
+    if not consts.PRICE_LIST_STORE or not os.path.exists(consts.PRICE_LIST_STORE):
+        return None
+    return _open_price_store(consts.PRICE_LIST_STORE)
+
+
+def main():
+    """Ingest bulk price list files into a price list store."""
+    parser = argparse.ArgumentParser(
+        description='Ingest AWS bulk price list files into a local price list store.'
+    )
+    parser.add_argument('store', help='Path to the SQLite price list store')
+    parser.add_argument(
+        'paths', nargs='+', help='Price list files (.json or .csv) or directories of them'
+    )
+    args = parser.parse_args()
+
+    store = PriceStore(args.store)
+    try:
+        for path in args.paths:
+            if os.path.isdir(path):
+                counts = store.ingest_directory(path)
+            else:
+                service_code, count = store.ingest_file(path)
+                counts = {service_code: count}
+            for service_code, count in counts.items():
+                print(f'{service_code}: {count} products from {path}')
+    finally:
+        store.close()
+
+
+if __name__ == '__main__':
+    main()
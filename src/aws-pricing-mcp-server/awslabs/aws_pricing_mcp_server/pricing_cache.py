@@ -0,0 +1,73 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Cache of pricing discovery results for the aws-pricing-mcp-server.
+
+Service codes, attribute names and attribute values change at most daily, so they
+are cached for a configurable time instead of being paginated from the AWS Pricing
+API on every tool call.
+"""
+
+import threading
+import time
+from awslabs.aws_pricing_mcp_server import consts
+from collections import OrderedDict
+from typing import Hashable, Optional, Tuple
+
+
+class TTLCache:
+    """Least recently used cache whose entries expire after a time to live."""
+
+    def __init__(self, ttl: int, max_size: int):
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry stays valid; 0 disables the cache
+            max_size: Maximum number of entries
+        """
+        self.ttl = ttl
+        self.max_size = max_size
+        self._entries: 'OrderedDict[Hashable, Tuple[float, Tuple[str, ...]]]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Tuple[str, ...]]:
+        """Return the cached values for a key, or None if missing or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, values = entry
+            if time.monotonic() >= expires_at:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return values
+
+    def put(self, key: Hashable, values: Tuple[str, ...]):
+        """Cache values for a key."""
+        if self.ttl <= 0 or self.max_size <= 0:
+            return
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, values)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+
+    def clear(self):
+        """Remove all entries."""
+        with self._lock:
+            self._entries.clear()
+
+
+PRICING_CACHE = TTLCache(consts.PRICING_CACHE_TTL, consts.PRICING_CACHE_SIZE)
@@ -19,16 +19,21 @@ This module provides utilities for creating boto3 pricing clients.
 
 import boto3
 import sys
+import threading
 from awslabs.aws_pricing_mcp_server import __version__, consts
 from botocore.config import Config
 from loguru import logger
-from typing import Any, Optional
+from typing import Any, Dict, Optional, Tuple
 
 
 # Set up logging
 logger.remove()
 logger.add(sys.stderr, level=consts.LOG_LEVEL)
 
+# Pricing clients shared by profile, pricing region and endpoint
+_clients: Dict[Tuple[Optional[str], str, Optional[str]], Any] = {}
+_clients_lock = threading.Lock()
+
 
 def get_pricing_region(requested_region: Optional[str] = None) -> str:
     """Determine the appropriate AWS Pricing API region.
@@ -81,7 +86,10 @@ def get_pricing_region(requested_region: Optional[str] = None) -> str:
 
 
 def create_pricing_client(profile: Optional[str] = None, region: Optional[str] = None) -> Any:
-    """Create an AWS Pricing API client.
+    """Create an AWS Pricing API client, reusing the one created with the same settings.
+
+    boto3 clients are thread-safe, so a single client per profile, pricing region and
+    endpoint is shared by all tool calls instead of creating a session for each call.
 
     Args:
         profile: AWS profile name to use (default: None, uses AWS_PROFILE or default profile)
@@ -91,20 +99,32 @@ def create_pricing_client(profile: Optional[str] = None, region: Optional[str] =
         boto3 pricing client
     """
     profile_name = profile if profile else consts.AWS_PROFILE
-    session = boto3.Session(profile_name=profile_name)
 
     # Determine the appropriate pricing region
     pricing_region = get_pricing_region(region)
 
-    config = Config(
-        region_name=pricing_region,
-        user_agent_extra=f'awslabs/mcp/{consts.MCP_SERVER_NAME}/{__version__}',
-    )
-
-    logger.debug(
-        f'Creating pricing client for region "{pricing_region}" and profile "{profile_name}"'
-    )
-    return session.client('pricing', config=config, endpoint_url=consts.PRICING_ENDPOINT)
+    key = (profile_name, pricing_region, consts.PRICING_ENDPOINT)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            session = boto3.Session(profile_name=profile_name)
+            config = Config(
+                region_name=pricing_region,
+                user_agent_extra=f'awslabs/mcp/{consts.MCP_SERVER_NAME}/{__version__}',
+            )
+
+            logger.debug(
+                f'Creating pricing client for region "{pricing_region}" and profile "{profile_name}"'
+            )
+            client = session.client('pricing', config=config, endpoint_url=consts.PRICING_ENDPOINT)
+            _clients[key] = client
+    return client
+
+
+def clear_pricing_clients():
+    """Drop the shared pricing clients, so that the next call creates new ones."""
+    with _clients_lock:
+        _clients.clear()
 
 
 def get_currency_for_region(region: str) -> str:
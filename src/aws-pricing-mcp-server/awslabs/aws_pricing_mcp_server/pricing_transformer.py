@@ -17,7 +17,7 @@
 import json
 import logging
 from .models import OutputOptions
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 
 logger = logging.getLogger(__name__)
@@ -55,6 +55,80 @@ def _is_free_product(pricing_item: Dict[str, Any]) -> bool:
     return True
 
 
+def _apply_output_options(
+    item: Dict[str, Any], output_options: OutputOptions
+) -> Optional[Dict[str, Any]]:
+    """Filter a parsed pricing record in place.
+
+    Args:
+        item: Parsed pricing record, owned by the caller
+        output_options: Filtering options for pricing terms and product attributes
+
+    Returns:
+        The filtered record, or None if the record is excluded
+    """
+    # Filter out free products first (before removing OnDemand terms)
+    if output_options.exclude_free_products and _is_free_product(item):
+        return None
+
+    # Apply pricing terms filtering
+    if output_options.pricing_terms is not None and 'terms' in item:
+        terms = item['terms']
+        item['terms'] = {
+            term_type: terms[term_type]
+            for term_type in output_options.pricing_terms
+            if term_type in terms
+        }
+
+    # Apply product attributes filtering
+    product = item.get('product')
+    if (
+        output_options.product_attributes is not None
+        and isinstance(product, dict)
+        and 'attributes' in product
+    ):
+        attributes = product['attributes']
+        product['attributes'] = {
+            attr_name: attributes[attr_name]
+            for attr_name in output_options.product_attributes
+            if attr_name in attributes
+        }
+
+    return item
+
+
+def iter_pricing_data(
+    pricing_json_list: Iterable[str], output_options: Optional[OutputOptions]
+) -> Iterator[Dict[str, Any]]:
+    """Parse and filter AWS pricing records one at a time.
+
+    Args:
+        pricing_json_list: JSON strings from AWS Pricing API
+        output_options: Optional filtering options for pricing terms and product attributes
+
+    Yields:
+        Filtered pricing records as dictionaries
+
+    Raises:
+        ValueError: If JSON parsing fails for a record
+    """
+    for i, json_str in enumerate(pricing_json_list):
+        try:
+            item = json.loads(json_str)
+        except json.JSONDecodeError as e:
+            raise ValueError(f'Invalid JSON format in pricing data at index {i}: {e}')
+
+        # Remove redundant serviceCode field (optimization)
+        item.pop('serviceCode', None)
+
+        if output_options is not None:
+            item = _apply_output_options(item, output_options)
+            if item is None:
+                continue
+
+        yield item
+
+
 def transform_pricing_data(
     pricing_json_list: List[str], output_options: Optional[OutputOptions]
 ) -> List[Dict[str, Any]]:
@@ -70,59 +144,38 @@ def transform_pricing_data(
     Raises:
         ValueError: If JSON parsing fails for any record
     """
-    if not pricing_json_list:
-        return []
+    return list(iter_pricing_data(pricing_json_list, output_options))
 
-    # Parse all JSON strings upfront with error handling
-    parsed_data = []
-    for i, json_str in enumerate(pricing_json_list):
-        try:
-            parsed_item = json.loads(json_str)
-            # Remove redundant serviceCode field (optimization)
-            parsed_item.pop('serviceCode', None)
-            parsed_data.append(parsed_item)
-        except json.JSONDecodeError as e:
-            raise ValueError(f'Invalid JSON format in pricing data at index {i}: {e}')
 
-    # Return early if no filtering is needed
-    if output_options is None:
-        return parsed_data
-
-    result = []
-    for item in parsed_data:
-        # Filter out free products first (before removing OnDemand terms)
-        if output_options.exclude_free_products and _is_free_product(item):
-            continue  # Skip this item
-
-        # Start with original item, modify only what's needed
-        filtered_item = item
-
-        # Apply pricing terms filtering
-        if output_options.pricing_terms is not None and 'terms' in item:
-            filtered_terms = {
-                term_type: item['terms'][term_type]
-                for term_type in output_options.pricing_terms
-                if term_type in item['terms']
-            }
-            filtered_item = {**item, 'terms': filtered_terms}
-
-        # Apply product attributes filtering
-        if (
-            output_options.product_attributes is not None
-            and 'product' in filtered_item
-            and 'attributes' in filtered_item['product']
-        ):
-            original_attributes = filtered_item['product']['attributes']
-            filtered_attributes = {
-                attr_name: original_attributes[attr_name]
-                for attr_name in output_options.product_attributes
-                if attr_name in original_attributes
-            }
-            filtered_item = {
-                **filtered_item,
-                'product': {**filtered_item['product'], 'attributes': filtered_attributes},
-            }
-
-        result.append(filtered_item)
-
-    return result
+def transform_pricing_data_within_limit(
+    pricing_json_list: List[str],
+    output_options: Optional[OutputOptions],
+    max_characters: int,
+) -> Tuple[List[Dict[str, Any]], int]:
+    """Filter AWS pricing data, stopping once it exceeds a character limit.
+
+    The size of a record is the length of its string representation. Records are
+    parsed and filtered one at a time, so a result that is too large is detected
+    without parsing the records after the limit is reached.
+
+    Args:
+        pricing_json_list: List of JSON strings from AWS Pricing API
+        output_options: Optional filtering options for pricing terms and product attributes
+        max_characters: Character limit of the filtered records, or -1 for no limit
+
+    Returns:
+        The filtered records and their total size. If the size exceeds the limit, the
+        records are the ones processed until the limit was exceeded.
+
+    Raises:
+        ValueError: If JSON parsing fails for a record before the limit is exceeded
+    """
+    records = []
+    total_characters = 0
+    for item in iter_pricing_data(pricing_json_list, output_options):
+        records.append(item)
+        if max_characters != -1:
+            total_characters += len(str(item))
+            if total_characters > max_characters:
+                break
+    return records, total_characters
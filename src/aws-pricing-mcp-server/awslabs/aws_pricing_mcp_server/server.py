@@ -17,6 +17,7 @@
 This server provides tools for analyzing AWS service costs across different user tiers.
 """
 
+import asyncio
 import re
 import sys
 from awslabs.aws_pricing_mcp_server import consts
@@ -38,11 +39,15 @@ from awslabs.aws_pricing_mcp_server.models import (
     OutputOptions,
     PricingFilter,
 )
+from awslabs.aws_pricing_mcp_server.price_store import PriceStore, get_price_store
+from awslabs.aws_pricing_mcp_server.pricing_cache import PRICING_CACHE
 from awslabs.aws_pricing_mcp_server.pricing_client import (
     create_pricing_client,
     get_currency_for_region,
 )
-from awslabs.aws_pricing_mcp_server.pricing_transformer import transform_pricing_data
+from awslabs.aws_pricing_mcp_server.pricing_transformer import (
+    transform_pricing_data_within_limit,
+)
 from awslabs.aws_pricing_mcp_server.static.patterns import BEDROCK
 from awslabs.aws_pricing_mcp_server.terraform_analyzer import analyze_terraform_project
 from datetime import datetime, timezone
@@ -77,6 +82,25 @@ async def create_error_response(
     return error_response.model_dump()
 
 
+def create_pricing_source(service_code: str) -> Any:
+    """Return the source of pricing data for a service.
+
+    Services ingested into the local price list store are answered from it, so that
+    queries do not call the AWS Pricing API; other services use a pricing client.
+
+    Args:
+        service_code: The service code to query
+
+    Returns:
+        PriceStore or boto3 pricing client exposing the Pricing API query methods
+    """
+    store = get_price_store()
+    if store is not None and store.has_service(service_code):
+        logger.debug(f'Using the local price list store for {service_code}')
+        return store
+    return create_pricing_client()
+
+
 mcp = FastMCP(
     name='awslabs.aws-pricing-mcp-server',
     instructions="""This server provides two primary functionalities:
@@ -415,7 +439,7 @@ async def get_pricing(
 
     # Create pricing client with error handling
     try:
-        pricing_client = create_pricing_client()
+        pricing_client = create_pricing_source(service_code)
     except Exception as e:
         return await create_error_response(
             ctx=ctx,
@@ -485,9 +509,11 @@ async def get_pricing(
             },
         )
 
-    # Apply filtering with error handling
+    # Apply filtering with error handling, stopping early once the result is too large
     try:
-        price_list = transform_pricing_data(response['PriceList'], output_options)
+        price_list, total_characters = transform_pricing_data_within_limit(
+            response['PriceList'], output_options, max_allowed_characters
+        )
         total_count = len(price_list)
     except ValueError as e:
         return await create_error_response(
@@ -499,25 +525,24 @@ async def get_pricing(
         )
 
     # Check if results exceed the character threshold (unless max_characters is -1 for unlimited)
-    if max_allowed_characters != -1:
-        # Calculate total character count of the FILTERED response data
-        total_characters = sum(len(str(item)) for item in price_list)
-
-        if total_characters > max_allowed_characters:
-            return await create_error_response(
-                ctx=ctx,
-                error_type='result_too_large',
-                message=f'Query returned {total_characters:,} characters, exceeding the limit of {max_allowed_characters:,}. Use more specific filters or try output_options={{"pricing_terms": ["OnDemand"]}} to reduce response size.',
-                service_code=service_code,
-                region=region,
-                total_count=total_count,
-                total_characters=total_characters,
-                max_allowed_characters=max_allowed_characters,
-                sample_records=price_list[:3],
-                suggestion='Add more specific filters like instanceType, storageClass, deploymentOption, or engineCode to reduce the number of results. For large services like EC2, consider using output_options={"pricing_terms": ["OnDemand"]} to significantly reduce response size by excluding Reserved Instance pricing.',
-            )
+    if max_allowed_characters != -1 and total_characters > max_allowed_characters:
+        return await create_error_response(
+            ctx=ctx,
+            error_type='result_too_large',
+            message=f'Query returned at least {total_characters:,} characters, exceeding the limit of {max_allowed_characters:,}. Use more specific filters or try output_options={{"pricing_terms": ["OnDemand"]}} to reduce response size.',
+            service_code=service_code,
+            region=region,
+            total_count=len(response['PriceList']),
+            total_characters=total_characters,
+            max_allowed_characters=max_allowed_characters,
+            sample_records=price_list[:3],
+            suggestion='Add more specific filters like instanceType, storageClass, deploymentOption, or engineCode to reduce the number of results. For large services like EC2, consider using output_options={"pricing_terms": ["OnDemand"]} to significantly reduce response size by excluding Reserved Instance pricing.',
+        )
 
     # Success response
+    source = (
+        'local price list store' if isinstance(pricing_client, PriceStore) else 'AWS Pricing API'
+    )
     logger.info(f'Successfully retrieved {total_count} pricing items for {service_code}')
     await ctx.info(f'Successfully retrieved pricing for {service_code} in {region}')
 
@@ -525,7 +550,7 @@ async def get_pricing(
         'status': 'success',
         'service_name': service_code,
         'data': price_list,
-        'message': f'Retrieved pricing for {service_code} in {region} from AWS Pricing API',
+        'message': f'Retrieved pricing for {service_code} in {region} from {source}',
     }
 
     # Include next_token if present for pagination
@@ -843,47 +868,52 @@ async def get_pricing_service_codes(
     """
     logger.info('Retrieving AWS service codes from Price List API')
 
-    # Create pricing client with error handling
-    try:
-        pricing_client = create_pricing_client()
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='client_creation_failed',
-            message=f'Failed to create AWS Pricing client: {str(e)}',
-        )
+    cached_codes = PRICING_CACHE.get(('service_codes',))
+    if cached_codes is not None:
+        service_codes = list(cached_codes)
+    else:
+        # Create pricing client with error handling
+        try:
+            pricing_client = create_pricing_client()
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='client_creation_failed',
+                message=f'Failed to create AWS Pricing client: {str(e)}',
+            )
 
-    # Retrieve service codes with error handling
-    try:
-        service_codes = []
-        next_token = None
+        # Retrieve service codes with error handling
+        try:
+            service_codes = []
+            next_token = None
 
-        # Retrieve all service codes with pagination handling
-        while True:
-            response = pricing_client.describe_services(
-                **({'NextToken': next_token} if next_token else {})
-            )
-            service_codes.extend([service['ServiceCode'] for service in response['Services']])
+            # Retrieve all service codes with pagination handling
+            while True:
+                response = pricing_client.describe_services(
+                    **({'NextToken': next_token} if next_token else {})
+                )
+                service_codes.extend([service['ServiceCode'] for service in response['Services']])
 
-            if 'NextToken' not in response:
-                break
-            next_token = response['NextToken']
+                if 'NextToken' not in response:
+                    break
+                next_token = response['NextToken']
 
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='api_error',
-            message=f'Failed to retrieve service codes from AWS API: {str(e)}',
-            suggestion='Verify AWS credentials and permissions for pricing:DescribeServices action.',
-        )
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='api_error',
+                message=f'Failed to retrieve service codes from AWS API: {str(e)}',
+                suggestion='Verify AWS credentials and permissions for pricing:DescribeServices action.',
+            )
 
-    # Check for empty results
-    if not service_codes:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='empty_results',
-            message='No service codes returned from AWS Price List API',
-        )
+        # Check for empty results
+        if not service_codes:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='empty_results',
+                message='No service codes returned from AWS Price List API',
+            )
+        PRICING_CACHE.put(('service_codes',), tuple(service_codes))
 
     # Apply regex filtering if filter is provided
     if filter:
@@ -966,60 +996,65 @@ async def get_pricing_service_attributes(
 
     logger.info(f'Retrieving attributes for AWS service: {service_code}')
 
-    # Create pricing client with error handling
-    try:
-        pricing_client = create_pricing_client()
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='client_creation_failed',
-            message=f'Failed to create AWS Pricing client: {str(e)}',
-            service_code=service_code,
-        )
+    cached_attributes = PRICING_CACHE.get(('service_attributes', service_code))
+    if cached_attributes is not None:
+        attributes = list(cached_attributes)
+    else:
+        # Create pricing client with error handling
+        try:
+            pricing_client = create_pricing_source(service_code)
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='client_creation_failed',
+                message=f'Failed to create AWS Pricing client: {str(e)}',
+                service_code=service_code,
+            )
 
-    # Get service attributes with error handling
-    try:
-        response = pricing_client.describe_services(ServiceCode=service_code)
-    except Exception as e:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='api_error',
-            message=f'Failed to retrieve attributes for service "{service_code}": {str(e)}',
-            service_code=service_code,
-            suggestion='Verify that the service code is valid and AWS credentials have the required pricing:DescribeServices permissions. Use get_service_codes() to get valid service codes.',
-        )
+        # Get service attributes with error handling
+        try:
+            response = pricing_client.describe_services(ServiceCode=service_code)
+        except Exception as e:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='api_error',
+                message=f'Failed to retrieve attributes for service "{service_code}": {str(e)}',
+                service_code=service_code,
+                suggestion='Verify that the service code is valid and AWS credentials have the required pricing:DescribeServices permissions. Use get_service_codes() to get valid service codes.',
+            )
 
-    # Check if service was found
-    if not response.get('Services'):
-        return await create_error_response(
-            ctx=ctx,
-            error_type='service_not_found',
-            message=f'Service "{service_code}" was not found. Please verify the service code is correct.',
-            service_code=service_code,
-            suggestion='Use get_service_codes() to retrieve a list of all available AWS service codes.',
-            examples={
-                'OpenSearch': 'AmazonES',
-                'Lambda': 'AWSLambda',
-                'DynamoDB': 'AmazonDynamoDB',
-                'EC2': 'AmazonEC2',
-                'S3': 'AmazonS3',
-            },
-        )
+        # Check if service was found
+        if not response.get('Services'):
+            return await create_error_response(
+                ctx=ctx,
+                error_type='service_not_found',
+                message=f'Service "{service_code}" was not found. Please verify the service code is correct.',
+                service_code=service_code,
+                suggestion='Use get_service_codes() to retrieve a list of all available AWS service codes.',
+                examples={
+                    'OpenSearch': 'AmazonES',
+                    'Lambda': 'AWSLambda',
+                    'DynamoDB': 'AmazonDynamoDB',
+                    'EC2': 'AmazonEC2',
+                    'S3': 'AmazonS3',
+                },
+            )
 
-    # Extract attribute names
-    attributes = []
-    for attr in response['Services'][0].get('AttributeNames', []):
-        attributes.append(attr)
+        # Extract attribute names
+        attributes = []
+        for attr in response['Services'][0].get('AttributeNames', []):
+            attributes.append(attr)
 
-    # Check for empty results
-    if not attributes:
-        return await create_error_response(
-            ctx=ctx,
-            error_type='empty_results',
-            message=f'Service "{service_code}" exists but has no filterable attributes available.',
-            service_code=service_code,
-            suggestion='This service may not support attribute-based filtering, or there may be a temporary issue. Try using get_pricing() without filters.',
-        )
+        # Check for empty results
+        if not attributes:
+            return await create_error_response(
+                ctx=ctx,
+                error_type='empty_results',
+                message=f'Service "{service_code}" exists but has no filterable attributes available.',
+                service_code=service_code,
+                suggestion='This service may not support attribute-based filtering, or there may be a temporary issue. Try using get_pricing() without filters.',
+            )
+        PRICING_CACHE.put(('service_attributes', service_code), tuple(attributes))
 
     # Apply regex filtering if filter is provided
     if filter:
@@ -1099,7 +1134,12 @@ async def _get_single_attribute_values(
     Raises:
         AttributeValuesError: When API calls fail or no values are found
     """
-    try:
+    cache_key = ('attribute_values', service_code, attribute_name)
+    cached_values = PRICING_CACHE.get(cache_key)
+    if cached_values is not None:
+        return list(cached_values)
+
+    def fetch_values() -> List[str]:
         # Get attribute values with pagination handling
         values = []
         next_token = None
@@ -1121,8 +1161,11 @@ async def _get_single_attribute_values(
             if 'NextToken' in response:
                 next_token = response['NextToken']
             else:
-                break
+                return values
 
+    try:
+        # Paginate on a worker thread so that attributes are fetched concurrently
+        values = await asyncio.to_thread(fetch_values)
     except Exception as e:
         raise AttributeValuesError(
             error_type='api_error',
@@ -1151,7 +1194,9 @@ async def _get_single_attribute_values(
             },
         )
 
-    return sorted(values)
+    values = sorted(values)
+    PRICING_CACHE.put(cache_key, tuple(values))
+    return values
 
 
 @mcp.tool(
@@ -1223,7 +1268,7 @@ async def get_pricing_attribute_values(
 
     # Create pricing client with error handling
     try:
-        pricing_client = create_pricing_client()
+        pricing_client = create_pricing_source(service_code)
     except Exception as e:
         return await create_error_response(
             ctx=ctx,
@@ -1233,15 +1278,25 @@ async def get_pricing_attribute_values(
             attribute_names=attribute_names,
         )
 
-    # Process each attribute - all-or-nothing approach
+    # Fetch all attributes concurrently, then process them in order - all-or-nothing approach
+    unique_names = list(dict.fromkeys(attribute_names))
+    fetched = await asyncio.gather(
+        *(
+            _get_single_attribute_values(pricing_client, service_code, attribute_name)
+            for attribute_name in unique_names
+        ),
+        return_exceptions=True,
+    )
+    values_by_name = dict(zip(unique_names, fetched))
+
     result = {}
     for attribute_name in attribute_names:
         logger.debug(f'Processing attribute: {attribute_name}')
 
         try:
-            values_result = await _get_single_attribute_values(
-                pricing_client, service_code, attribute_name
-            )
+            values_result = values_by_name[attribute_name]
+            if isinstance(values_result, BaseException):
+                raise values_result
 
             # Apply filtering if a filter is provided for this attribute
             if filters and attribute_name in filters:
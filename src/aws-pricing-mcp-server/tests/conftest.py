@@ -17,11 +17,23 @@
 import json
 import pytest
 import tempfile
+from awslabs.aws_pricing_mcp_server.pricing_cache import PRICING_CACHE
+from awslabs.aws_pricing_mcp_server.pricing_client import clear_pricing_clients
 from pathlib import Path
 from typing import Any, Dict, Generator
 from unittest.mock import AsyncMock, MagicMock
 
 
+@pytest.fixture(autouse=True)
+def clear_pricing_state():
+    """Drop shared pricing clients and cached results between tests."""
+    clear_pricing_clients()
+    PRICING_CACHE.clear()
+    yield
+    clear_pricing_clients()
+    PRICING_CACHE.clear()
+
+
 @pytest.fixture
 def mock_context():
     """Create a mock MCP context."""
@@ -0,0 +1,217 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Tests for the local price list store of the aws-pricing-mcp-server."""
+
+import json
+import pytest
+from awslabs.aws_pricing_mcp_server.models import PricingFilter
+from awslabs.aws_pricing_mcp_server.price_store import PriceStore
+from awslabs.aws_pricing_mcp_server.server import (
+    get_pricing,
+    get_pricing_attribute_values,
+    get_pricing_service_attributes,
+)
+from unittest.mock import patch
+
+
+def _ec2_product(sku, instance_type, region, price):
+    product = {
+        'sku': sku,
+        'productFamily': 'Compute Instance',
+        'attributes': {
+            'instanceType': instance_type,
+            'regionCode': region,
+            'location': 'US East (N. Virginia)',
+            'usagetype': f'BoxUsage:{instance_type}',
+            'operatingSystem': 'Linux',
+        },
+    }
+    terms = {
+        f'{sku}.JRTCKXETXF': {
+            'offerTermCode': 'JRTCKXETXF',
+            'sku': sku,
+            'priceDimensions': {
+                f'{sku}.JRTCKXETXF.6YS6EN2CT7': {
+                    'unit': 'Hrs',
+                    'pricePerUnit': {'USD': price},
+                }
+            },
+        }
+    }
+    return product, terms
+
+
+@pytest.fixture
+def price_lists(tmp_path):
+    """Write a JSON price list of EC2 and a CSV price list of S3."""
+    products = {}
+    on_demand = {}
+    for sku, instance_type, region, price in [
+        ('SKU1', 't3.micro', 'us-east-1', '0.0104'),
+        ('SKU2', 't3.medium', 'us-east-1', '0.0416'),
+        ('SKU3', 'm5.large', 'us-east-1', '0.0960'),
+    ]:
+        products[sku], on_demand[sku] = _ec2_product(sku, instance_type, region, price)
+    offer = {
+        'offerCode': 'AmazonEC2',
+        'version': '20250101000000',
+        'publicationDate': '2025-01-01T00:00:00Z',
+        'products': products,
+        'terms': {'OnDemand': on_demand},
+    }
+    (tmp_path / 'ec2.json').write_text(json.dumps(offer))
+
+    (tmp_path / 's3.csv').write_text(
+        '"FormatVersion","v1.0"\n'
+        '"Disclaimer","This pricing list is for informational purposes only."\n'
+        '"Publication Date","2025-01-01T00:00:00Z"\n'
+        '"Version","20250101000000"\n'
+        '"OfferCode","AmazonS3"\n'
+        '"SKU","OfferTermCode","RateCode","TermType","PriceDescription","EffectiveDate",'
+        '"StartingRange","EndingRange","Unit","PricePerUnit","Currency","Product Family",'
+        '"serviceCode","Region Code","Storage Class","usageType"\n'
+        '"S3SKU","JRTCKXETXF","S3SKU.JRTCKXETXF.A","OnDemand","First 50 TB","2025-01-01",'
+        '"0","51200","GB-Mo","0.023","USD","Storage","AmazonS3","us-east-1","General Purpose",'
+        '"TimedStorage-ByteHrs"\n'
+        '"S3SKU","JRTCKXETXF","S3SKU.JRTCKXETXF.B","OnDemand","Over 50 TB","2025-01-01",'
+        '"51200","Inf","GB-Mo","0.022","USD","Storage","AmazonS3","us-east-1","General Purpose",'
+        '"TimedStorage-ByteHrs"\n'
+        '"S3IA","JRTCKXETXF","S3IA.JRTCKXETXF.A","OnDemand","Infrequent access","2025-01-01",'
+        '"0","Inf","GB-Mo","0.0125","USD","Storage","AmazonS3","us-east-1",'
+        '"Infrequent Access","TimedStorage-SIA-ByteHrs"\n'
+    )
+    return tmp_path
+
+
+@pytest.fixture
+def store(tmp_path, price_lists):
+    """Create a price list store holding the ingested price lists."""
+    store = PriceStore(str(tmp_path / 'prices.db'))
+    assert store.ingest_directory(str(price_lists)) == {'AmazonEC2': 3, 'AmazonS3': 2}
+    yield store
+    store.close()
+
+
+def _skus(response):
+    return [json.loads(item)['product']['sku'] for item in response['PriceList']]
+
+
+def test_products_are_filtered_like_the_api(store):
+    """Test that filters of every type select products case-insensitively."""
+    assert _skus(
+        store.get_products(
+            ServiceCode='AmazonEC2',
+            Filters=[
+                {'Field': 'regionCode', 'Type': 'EQUALS', 'Value': 'US-EAST-1'},
+                {'Field': 'instanceType', 'Type': 'ANY_OF', 'Value': 't3.micro,m5.large'},
+            ],
+        )
+    ) == ['SKU1', 'SKU3']
+    assert _skus(
+        store.get_products(
+            ServiceCode='AmazonEC2',
+            Filters=[{'Field': 'usagetype', 'Type': 'CONTAINS', 'Value': 't3.'}],
+        )
+    ) == ['SKU1', 'SKU2']
+    assert (
+        _skus(
+            store.get_products(
+                ServiceCode='AmazonEC2',
+                Filters=[{'Field': 'operatingSystem', 'Type': 'NONE_OF', 'Value': 'linux'}],
+            )
+        )
+        == []
+    )
+    with pytest.raises(ValueError):
+        store.get_products(
+            ServiceCode='AmazonEC2', Filters=[{'Field': 'location', 'Type': 'LIKE', 'Value': 'x'}]
+        )
+
+
+def test_products_are_paginated(store):
+    """Test that pages are continued with the returned token."""
+    first = store.get_products(ServiceCode='AmazonEC2', MaxResults=2)
+    second = store.get_products(
+        ServiceCode='AmazonEC2', MaxResults=2, NextToken=first['NextToken']
+    )
+
+    assert _skus(first) == ['SKU1', 'SKU2']
+    assert _skus(second) == ['SKU3']
+    assert 'NextToken' not in second
+
+
+def test_csv_rows_are_grouped_into_products(store):
+    """Test that the rows of a CSV price list form API-shaped documents."""
+    response = store.get_products(
+        ServiceCode='AmazonS3',
+        Filters=[{'Field': 'storageClass', 'Type': 'EQUALS', 'Value': 'General Purpose'}],
+    )
+
+    (document,) = [json.loads(item) for item in response['PriceList']]
+    assert document['product']['productFamily'] == 'Storage'
+    assert document['product']['attributes']['usagetype'] == 'TimedStorage-ByteHrs'
+    dimensions = document['terms']['OnDemand']['S3SKU.JRTCKXETXF']['priceDimensions']
+    assert {d['pricePerUnit']['USD'] for d in dimensions.values()} == {'0.023', '0.022'}
+    assert store.get_attribute_values(ServiceCode='AmazonS3', AttributeName='storageClass') == {
+        'AttributeValues': [{'Value': 'General Purpose'}, {'Value': 'Infrequent Access'}]
+    }
+
+
+def test_reingesting_replaces_products(store, price_lists):
+    """Test that products missing from a newer price list of the region are removed."""
+    offer = json.loads((price_lists / 'ec2.json').read_text())
+    del offer['products']['SKU3']
+    (price_lists / 'ec2.json').write_text(json.dumps(offer))
+
+    assert store.ingest_file(str(price_lists / 'ec2.json')) == ('AmazonEC2', 2)
+    assert _skus(store.get_products(ServiceCode='AmazonEC2')) == ['SKU1', 'SKU2']
+    assert store.get_attribute_values(ServiceCode='AmazonEC2', AttributeName='instanceType') == {
+        'AttributeValues': [{'Value': 't3.medium'}, {'Value': 't3.micro'}]
+    }
+
+
+@pytest.mark.asyncio
+async def test_tools_query_the_store_without_the_api(store, mock_context):
+    """Test that ingested services are answered locally and others use the API."""
+    with (
+        patch('awslabs.aws_pricing_mcp_server.server.get_price_store', return_value=store),
+        patch('awslabs.aws_pricing_mcp_server.server.create_pricing_client') as mock_client,
+    ):
+        pricing = await get_pricing(
+            mock_context,
+            service_code='AmazonEC2',
+            region='us-east-1',
+            filters=[PricingFilter(Field='instanceType', Value='t3.micro')],
+        )
+        attributes = await get_pricing_service_attributes(mock_context, service_code='AmazonS3')
+        values = await get_pricing_attribute_values(
+            mock_context, service_code='AmazonEC2', attribute_names=['instanceType']
+        )
+        mock_client.assert_not_called()
+
+        await get_pricing_service_attributes(mock_context, service_code='AWSLambda')
+        mock_client.assert_called_once()
+
+    assert pricing['status'] == 'success'
+    assert [item['product']['sku'] for item in pricing['data']] == ['SKU1']
+    assert 'local price list store' in pricing['message']
+    assert attributes == [
+        'productFamily',
+        'regionCode',
+        'servicecode',
+        'storageClass',
+        'usagetype',
+    ]
+    assert values == {'instanceType': ['m5.large', 't3.medium', 't3.micro']}
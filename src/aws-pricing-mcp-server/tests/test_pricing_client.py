@@ -16,6 +16,7 @@
 
 import pytest
 from awslabs.aws_pricing_mcp_server.pricing_client import (
+    clear_pricing_clients,
     create_pricing_client,
     get_currency_for_region,
     get_pricing_region,
@@ -166,6 +167,22 @@ class TestCreatePricingClient:
 
         assert result == mock_client
 
+    @patch('awslabs.aws_pricing_mcp_server.pricing_client.boto3.Session')
+    def test_clients_are_shared(self, mock_session):
+        """Test that calls with the same settings share one client."""
+        mock_session.return_value.client.side_effect = lambda *args, **kwargs: Mock()
+
+        first = create_pricing_client(region='us-west-2')
+        second = create_pricing_client(region='us-east-2')
+        other = create_pricing_client(profile='other-profile')
+
+        assert first is second
+        assert other is not first
+        assert mock_session.call_count == 2
+
+        clear_pricing_clients()
+        assert create_pricing_client(region='us-west-2') is not first
+
 
 class TestGetCurrencyForRegion:
     """Tests for the get_currency_for_region function."""
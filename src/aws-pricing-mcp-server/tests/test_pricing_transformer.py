@@ -19,7 +19,9 @@ import pytest
 from awslabs.aws_pricing_mcp_server.models import OutputOptions
 from awslabs.aws_pricing_mcp_server.pricing_transformer import (
     _is_free_product,
+    iter_pricing_data,
     transform_pricing_data,
+    transform_pricing_data_within_limit,
 )
 
 
@@ -792,3 +794,54 @@ class TestExcludeFreeProductsFiltering:
     def test_is_free_product_helper_function(self, item, expected):
         """Test the _is_free_product helper function with various inputs."""
         assert _is_free_product(item) is expected
+
+
+class TestStreamingTransform:
+    """Tests for the record-by-record transformation with a size limit."""
+
+    @staticmethod
+    def _records(count):
+        return [
+            json.dumps(
+                {
+                    'serviceCode': 'AmazonEC2',
+                    'product': {'sku': f'SKU{i}', 'attributes': {'instanceType': 't3.micro'}},
+                    'terms': {'OnDemand': {'a': {}}, 'Reserved': {'b': {}}},
+                }
+            )
+            for i in range(count)
+        ]
+
+    def test_transform_stops_once_the_limit_is_exceeded(self):
+        """Test that records after the limit are neither parsed nor kept."""
+        records = self._records(10) + ['invalid json']
+        record_size = len(str(transform_pricing_data(records[:1], None)[0]))
+
+        result, total_characters = transform_pricing_data_within_limit(
+            records, None, record_size * 3 - 1
+        )
+
+        assert [item['product']['sku'] for item in result] == ['SKU0', 'SKU1', 'SKU2']
+        assert total_characters == record_size * 3
+
+    def test_transform_without_limit_processes_all_records(self):
+        """Test that a limit of -1 returns every filtered record."""
+        result, total_characters = transform_pricing_data_within_limit(
+            self._records(5),
+            OutputOptions(
+                pricing_terms=['OnDemand'], product_attributes=None, exclude_free_products=False
+            ),
+            -1,
+        )
+
+        assert len(result) == 5
+        assert total_characters == 0
+        assert all(list(item['terms']) == ['OnDemand'] for item in result)
+
+    def test_iter_pricing_data_is_lazy(self):
+        """Test that records are parsed only as they are consumed."""
+        records = iter_pricing_data(self._records(1) + ['invalid json'], None)
+
+        assert next(records)['product']['sku'] == 'SKU0'
+        with pytest.raises(ValueError, match='at index 1'):
+            next(records)
@@ -15,6 +15,7 @@
 """Tests for the server module of the aws-pricing-mcp-server."""
 
 import pytest
+import threading
 from awslabs.aws_pricing_mcp_server.models import PricingFilter
 from awslabs.aws_pricing_mcp_server.pricing_transformer import (
     _is_free_product,
@@ -2123,3 +2124,57 @@ class TestGetPriceListUrls:
         assert result['region'] == 'us-east-1'
         assert result['price_list_arn'] == 'arn:aws:pricing::123456789012:price-list/AmazonEC2'
         mock_context.error.assert_called()
+
+
+class TestDiscoveryCache:
+    """Tests for the caching and concurrency of the discovery tools."""
+
+    @pytest.mark.asyncio
+    async def test_discovery_results_are_cached(self, mock_context, mock_boto3):
+        """Test that repeated discovery calls are answered without the API."""
+        pricing_client = mock_boto3.Session().client('pricing')
+        pricing_client.describe_services.return_value = {
+            'Services': [{'ServiceCode': 'AmazonEC2', 'AttributeNames': ['instanceType']}]
+        }
+        pricing_client.get_attribute_values.return_value = {
+            'AttributeValues': [{'Value': 't3.micro'}, {'Value': 'm5.large'}]
+        }
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            for _ in range(3):
+                assert await get_pricing_service_codes(mock_context, None) == ['AmazonEC2']
+                assert await get_pricing_service_attributes(mock_context, 'AmazonEC2') == [
+                    'instanceType'
+                ]
+                assert await get_pricing_attribute_values(
+                    mock_context, 'AmazonEC2', ['instanceType'], {'instanceType': 't3'}
+                ) == {'instanceType': ['t3.micro']}
+
+        assert pricing_client.describe_services.call_count == 2
+        assert pricing_client.get_attribute_values.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_attribute_values_are_fetched_concurrently(self, mock_context, mock_boto3):
+        """Test that attributes are paginated in parallel and errors keep their order."""
+        pricing_client = mock_boto3.Session().client('pricing')
+        barrier = threading.Barrier(2, timeout=5)
+
+        def get_attribute_values(ServiceCode, AttributeName, **kwargs):
+            barrier.wait()
+            if AttributeName == 'invalid':
+                return {'AttributeValues': []}
+            return {'AttributeValues': [{'Value': AttributeName.upper()}]}
+
+        pricing_client.get_attribute_values.side_effect = get_attribute_values
+
+        with patch('boto3.Session', return_value=mock_boto3.Session()):
+            result = await get_pricing_attribute_values(
+                mock_context, 'AmazonEC2', ['location', 'instanceType', 'location']
+            )
+            error = await get_pricing_attribute_values(
+                mock_context, 'AmazonEC2', ['invalid', 'memory']
+            )
+
+        assert result == {'location': ['LOCATION'], 'instanceType': ['INSTANCETYPE']}
+        assert error['error_type'] == 'no_attribute_values_found'
+        assert error['failed_attribute'] == 'invalid'
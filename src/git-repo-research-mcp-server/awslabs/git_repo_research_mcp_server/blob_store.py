@@ -0,0 +1,111 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Content-addressed file store for Git Repository Research MCP Server.
+
+This module deduplicates the repository files copied next to the indices: each
+distinct file content is stored once and hard-linked into every repository copy
+that contains it.
+"""
+
+import hashlib
+import os
+import shutil
+from loguru import logger
+
+
+# Name of the blob directory inside the index directory
+BLOB_DIR = '.blobs'
+
+_READ_SIZE = 1024 * 1024
+
+
+def file_hash(path: str) -> str:
+    """Return the hash identifying the content of a file.
+
+    Args:
+        path: Path to the file
+
+    Returns:
+        Hex-encoded SHA-256 digest of the file content
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        while block := f.read(_READ_SIZE):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class BlobStore:
+    """Store of file contents addressed by their SHA-256 hash.
+
+    Files are placed into repository copies as hard links to their blob. Where hard
+    links are not supported, for example across file systems, files are copied
+    instead. A blob is unused once its only remaining link is the blob itself.
+    """
+
+    def __init__(self, blob_dir: str):
+        """Initialize the blob store.
+
+        Args:
+            blob_dir: Directory holding the blobs
+        """
+        self.blob_dir = blob_dir
+
+    def link(self, source_file: str, target_file: str) -> None:
+        """Place a file at a target path, sharing its content with identical files.
+
+        Args:
+            source_file: File to place
+            target_file: Path to place the file at; an existing file is replaced
+        """
+        if os.path.lexists(target_file):
+            os.remove(target_file)
+        try:
+            blob_path = self._store(source_file)
+            os.link(blob_path, target_file)
+        except OSError as e:
+            logger.debug(f'Cannot link {source_file} from the blob store, copying it: {e}')
+            shutil.copy2(source_file, target_file)
+
+    def prune(self) -> int:
+        """Remove the blobs that are no longer linked from any repository copy.
+
+        Returns:
+            Number of removed blobs
+        """
+        removed = 0
+        if not os.path.isdir(self.blob_dir):
+            return removed
+        for root, _, files in os.walk(self.blob_dir):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if os.stat(path).st_nlink <= 1:
+                        os.remove(path)
+                        removed += 1
+                except OSError as e:
+                    logger.warning(f'Cannot remove unused blob {path}: {e}')
+        if removed:
+            logger.info(f'Removed {removed} unused blobs from {self.blob_dir}')
+        return removed
+
+    def _store(self, source_file: str) -> str:
+        key = file_hash(source_file)
+        blob_path = os.path.join(self.blob_dir, key[:2], key)
+        if not os.path.exists(blob_path):
+            os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+            temp_path = f'{blob_path}.{os.getpid()}.tmp'
+            shutil.copy2(source_file, temp_path)
+            os.replace(temp_path, blob_path)
+        return blob_path
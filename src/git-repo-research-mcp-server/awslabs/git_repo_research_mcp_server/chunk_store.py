@@ -0,0 +1,457 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Chunk store for Git Repository Research MCP Server.
+
+This module stores the text and metadata of the indexed chunks in a single columnar
+file addressed by chunk id, with the text held in compressed blocks that are only
+decompressed when a chunk is read.
+"""
+
+import numpy as np
+import os
+import threading
+import zlib
+from collections import OrderedDict
+from langchain_core.documents import Document
+from typing import Dict, Iterable, Iterator, List, MutableMapping, Optional, Set, Tuple
+
+
+CHUNK_STORE_FILE = 'chunks.npz'
+
+# Uncompressed size of the text blocks, and number of decompressed blocks kept in memory
+CHUNK_BLOCK_SIZE = 64 * 1024
+CHUNK_BLOCK_CACHE_SIZE = 32
+
+_COMPRESSION_LEVEL = 6
+
+# Share of the stored text that may belong to removed chunks before an update rebuilds the store
+_MAX_GARBAGE_FRACTION = 0.5
+
+
+def _append_blocks(
+    blocks: np.ndarray, block_offsets: np.ndarray, text: bytes
+) -> Tuple[np.ndarray, np.ndarray]:
+    compressed = [
+        zlib.compress(text[start : start + CHUNK_BLOCK_SIZE], _COMPRESSION_LEVEL)
+        for start in range(0, len(text), CHUNK_BLOCK_SIZE)
+    ]
+    sizes = np.array([len(block) for block in compressed], dtype=np.int64)
+    return (
+        np.concatenate([blocks, np.frombuffer(b''.join(compressed), dtype=np.uint8)]),
+        np.concatenate([block_offsets, block_offsets[-1] + np.cumsum(sizes)]),
+    )
+
+
+class ChunkStore:
+    """Columnar store of chunk texts and metadata addressed by chunk id.
+
+    Chunks are kept sorted by chunk id. The UTF-8 text of the chunks is concatenated
+    and split into blocks of `CHUNK_BLOCK_SIZE` bytes that are compressed separately;
+    the text of the chunk at position `i` spans bytes `text_starts[i]` to
+    `text_ends[i]` of the concatenation. Updates append the text of new chunks, so the
+    concatenation may also hold the text of removed chunks. File paths are stored once
+    and referenced by position.
+    """
+
+    def __init__(
+        self,
+        chunk_ids: np.ndarray,
+        sources: List[str],
+        source_ids: np.ndarray,
+        start_lines: np.ndarray,
+        text_starts: np.ndarray,
+        text_ends: np.ndarray,
+        blocks: np.ndarray,
+        block_offsets: np.ndarray,
+    ):
+        """Initialize the chunk store from its arrays.
+
+        Args:
+            chunk_ids: Sorted chunk ids
+            sources: File paths referenced by the chunks
+            source_ids: Position in `sources` of the file of each chunk
+            start_lines: Line each chunk starts on in its file (0 if unknown)
+            text_starts: Start of the text of each chunk
+            text_ends: End of the text of each chunk
+            blocks: Concatenated compressed text blocks
+            block_offsets: Start of each compressed block, followed by the total size
+        """
+        self.chunk_ids = chunk_ids
+        self.sources = sources
+        self.source_ids = source_ids
+        self.start_lines = start_lines
+        self.text_starts = text_starts
+        self.text_ends = text_ends
+        self.blocks = blocks
+        self.block_offsets = block_offsets
+        self._block_cache: 'OrderedDict[int, bytes]' = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        """Return the number of chunks in the store."""
+        return len(self.chunk_ids)
+
+    @classmethod
+    def build(cls, documents: Iterable[Tuple[int, Document]]) -> 'ChunkStore':
+        """Build a chunk store.
+
+        Args:
+            documents: Pairs of a chunk id and its LangChain document
+
+        Returns:
+            ChunkStore holding the documents
+        """
+        chunk_ids = []
+        source_ids = []
+        start_lines = []
+        text_starts = []
+        text_ends = []
+        source_positions: Dict[str, int] = {}
+        text = bytearray()
+        for chunk_id, doc in sorted(documents, key=lambda item: item[0]):
+            source = doc.metadata.get('source', 'unknown')
+            chunk_ids.append(chunk_id)
+            source_ids.append(source_positions.setdefault(source, len(source_positions)))
+            start_lines.append(doc.metadata.get('start_line') or 0)
+            text_starts.append(len(text))
+            text += doc.page_content.encode('utf-8', errors='surrogatepass')
+            text_ends.append(len(text))
+
+        blocks, block_offsets = _append_blocks(
+            np.zeros(0, dtype=np.uint8), np.zeros(1, dtype=np.int64), bytes(text)
+        )
+        return cls(
+            np.array(chunk_ids, dtype=np.int64),
+            list(source_positions),
+            np.array(source_ids, dtype=np.int32),
+            np.array(start_lines, dtype=np.int32),
+            np.array(text_starts, dtype=np.int64),
+            np.array(text_ends, dtype=np.int64),
+            blocks,
+            block_offsets,
+        )
+
+    def update(
+        self, removed_ids: Iterable[int], documents: Iterable[Tuple[int, Document]]
+    ) -> 'ChunkStore':
+        """Build a chunk store with chunks removed and added.
+
+        Only the text of the added chunks is compressed: it is appended after the
+        existing blocks, and the text of removed chunks is left in place until it makes
+        up more than `_MAX_GARBAGE_FRACTION` of the store, which is then rebuilt.
+
+        Args:
+            removed_ids: Ids of the chunks to remove
+            documents: Pairs of a chunk id and the LangChain document to add
+
+        Returns:
+            ChunkStore holding the remaining and added chunks
+        """
+        documents = list(documents)
+        keep = ~np.isin(self.chunk_ids, np.fromiter(removed_ids, dtype=np.int64))
+        added_text = [
+            doc.page_content.encode('utf-8', errors='surrogatepass') for _, doc in documents
+        ]
+        num_blocks = len(self.block_offsets) - 1
+        tail = self._block(num_blocks - 1) if num_blocks else b''
+        text_size = max(num_blocks - 1, 0) * CHUNK_BLOCK_SIZE + len(tail)
+        live_size = int((self.text_ends[keep] - self.text_starts[keep]).sum()) + sum(
+            len(data) for data in added_text
+        )
+        if text_size - live_size > _MAX_GARBAGE_FRACTION * text_size:
+            return ChunkStore.build(
+                [
+                    (int(self.chunk_ids[position]), self.document(position))
+                    for position in np.flatnonzero(keep)
+                ]
+                + documents
+            )
+
+        # A last block that is not full is compressed again together with the new text
+        kept_blocks = num_blocks
+        text = bytearray()
+        if documents and len(tail) < CHUNK_BLOCK_SIZE:
+            kept_blocks = num_blocks - 1
+            text += tail
+        base = kept_blocks * CHUNK_BLOCK_SIZE
+        sources = list(self.sources)
+        source_positions = {source: i for i, source in enumerate(sources)}
+        source_ids = []
+        text_starts = []
+        text_ends = []
+        for (_, doc), data in zip(documents, added_text):
+            source = doc.metadata.get('source', 'unknown')
+            if source not in source_positions:
+                source_positions[source] = len(sources)
+                sources.append(source)
+            source_ids.append(source_positions[source])
+            text_starts.append(base + len(text))
+            text += data
+            text_ends.append(base + len(text))
+        blocks, block_offsets = _append_blocks(
+            self.blocks[: self.block_offsets[kept_blocks]],
+            self.block_offsets[: kept_blocks + 1],
+            bytes(text),
+        )
+
+        chunk_ids = np.concatenate(
+            [self.chunk_ids[keep], np.array([chunk_id for chunk_id, _ in documents], np.int64)]
+        )
+        order = np.argsort(chunk_ids, kind='stable')
+        return ChunkStore(
+            chunk_ids[order],
+            sources,
+            np.concatenate([self.source_ids[keep], np.array(source_ids, np.int32)])[order],
+            np.concatenate(
+                [
+                    self.start_lines[keep],
+                    np.array(
+                        [doc.metadata.get('start_line') or 0 for _, doc in documents], np.int32
+                    ),
+                ]
+            )[order],
+            np.concatenate([self.text_starts[keep], np.array(text_starts, np.int64)])[order],
+            np.concatenate([self.text_ends[keep], np.array(text_ends, np.int64)])[order],
+            blocks,
+            block_offsets,
+        )
+
+    def source_positions(self, sources: Set[str]) -> np.ndarray:
+        """Return the positions of the chunks of the given files.
+
+        Args:
+            sources: File paths
+
+        Returns:
+            Positions of the chunks whose file is one of `sources`
+        """
+        source_ids = [i for i, source in enumerate(self.sources) if source in sources]
+        return np.flatnonzero(np.isin(self.source_ids, source_ids))
+
+    def position(self, chunk_id: int) -> Optional[int]:
+        """Return the position of a chunk in the store.
+
+        Args:
+            chunk_id: Chunk id
+
+        Returns:
+            Position of the chunk, or None if the store does not hold it
+        """
+        position = int(np.searchsorted(self.chunk_ids, chunk_id))
+        if position < len(self.chunk_ids) and self.chunk_ids[position] == chunk_id:
+            return position
+        return None
+
+    def text(self, position: int) -> str:
+        """Return the text of the chunk at a position.
+
+        Args:
+            position: Position of the chunk
+
+        Returns:
+            Text of the chunk
+        """
+        start = int(self.text_starts[position])
+        end = int(self.text_ends[position])
+        if start == end:
+            return ''
+        first_block = start // CHUNK_BLOCK_SIZE
+        last_block = (end - 1) // CHUNK_BLOCK_SIZE
+        data = b''.join(self._block(block) for block in range(first_block, last_block + 1))
+        offset = first_block * CHUNK_BLOCK_SIZE
+        return data[start - offset : end - offset].decode('utf-8', errors='surrogatepass')
+
+    def document(self, position: int) -> Document:
+        """Return the LangChain document of the chunk at a position.
+
+        Args:
+            position: Position of the chunk
+
+        Returns:
+            Document with the text, source, chunk id and start line of the chunk
+        """
+        metadata = {
+            'source': self.sources[self.source_ids[position]],
+            'chunk_id': int(self.chunk_ids[position]),
+        }
+        if self.start_lines[position]:
+            metadata['start_line'] = int(self.start_lines[position])
+        return Document(page_content=self.text(position), metadata=metadata)
+
+    def save(self, index_path: str):
+        """Save the chunk store to an index directory without using pickle.
+
+        Args:
+            index_path: Path to the index directory
+        """
+        sources = '\n'.join(self.sources).encode('utf-8', errors='surrogatepass')
+        with open(os.path.join(index_path, CHUNK_STORE_FILE), 'wb') as f:
+            np.savez(
+                f,
+                chunk_ids=self.chunk_ids,
+                sources=np.frombuffer(sources, dtype=np.uint8),
+                source_ids=self.source_ids,
+                start_lines=self.start_lines,
+                text_starts=self.text_starts,
+                text_ends=self.text_ends,
+                blocks=self.blocks,
+                block_offsets=self.block_offsets,
+            )
+
+    @classmethod
+    def load(cls, index_path: str) -> 'ChunkStore':
+        """Load a chunk store from an index directory.
+
+        Args:
+            index_path: Path to the index directory
+
+        Returns:
+            The loaded ChunkStore
+        """
+        with np.load(os.path.join(index_path, CHUNK_STORE_FILE), allow_pickle=False) as data:
+            sources = data['sources'].tobytes().decode('utf-8', errors='surrogatepass')
+            return cls(
+                data['chunk_ids'],
+                sources.split('\n') if len(data['chunk_ids']) else [],
+                data['source_ids'],
+                data['start_lines'],
+                data['text_starts'],
+                data['text_ends'],
+                data['blocks'],
+                data['block_offsets'],
+            )
+
+    def _block(self, block: int) -> bytes:
+        with self._lock:
+            data = self._block_cache.get(block)
+            if data is not None:
+                self._block_cache.move_to_end(block)
+                return data
+        start, end = self.block_offsets[block], self.block_offsets[block + 1]
+        data = zlib.decompress(self.blocks[start:end].tobytes())
+        with self._lock:
+            self._block_cache[block] = data
+            while len(self._block_cache) > CHUNK_BLOCK_CACHE_SIZE:
+                self._block_cache.popitem(last=False)
+        return data
+
+
+class ChunkDocuments(MutableMapping[str, Document]):
+    """Document dictionary of a docstore backed by a chunk store.
+
+    Documents are keyed by their chunk id as a string and are only materialized when
+    accessed. Documents added or removed after loading are tracked on top of the
+    store, so the mapping can back a vector store that is updated incrementally.
+    """
+
+    def __init__(self, store: ChunkStore):
+        """Initialize the document dictionary.
+
+        Args:
+            store: Chunk store holding the documents
+        """
+        self.store = store
+        self._added: Dict[str, Document] = {}
+        self._removed: Set[str] = set()
+
+    def __getitem__(self, doc_id: str) -> Document:
+        """Return the document with the given id."""
+        if doc_id in self._added:
+            return self._added[doc_id]
+        position = self._position(doc_id)
+        if position is None:
+            raise KeyError(doc_id)
+        return self.store.document(position)
+
+    def __setitem__(self, doc_id: str, doc: Document):
+        """Add or replace a document."""
+        self._added[doc_id] = doc
+
+    def __delitem__(self, doc_id: str):
+        """Remove a document."""
+        found = self._added.pop(doc_id, None) is not None
+        if self._position(doc_id) is not None:
+            self._removed.add(doc_id)
+            found = True
+        if not found:
+            raise KeyError(doc_id)
+
+    def __contains__(self, doc_id: object) -> bool:
+        """Return whether a document with the given id exists."""
+        return doc_id in self._added or self._position(doc_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the document ids."""
+        for chunk_id in self.store.chunk_ids.tolist():
+            doc_id = str(chunk_id)
+            if doc_id not in self._removed and doc_id not in self._added:
+                yield doc_id
+        yield from list(self._added)
+
+    def __len__(self) -> int:
+        """Return the number of documents."""
+        stored = len(self.store) - len(self._removed)
+        return stored + sum(1 for doc_id in self._added if self._position(doc_id) is None)
+
+    def ids_by_source(self, sources: Set[str]) -> List[str]:
+        """Return the ids of the documents of the given files without reading their text.
+
+        Args:
+            sources: File paths
+
+        Returns:
+            Ids of the documents whose source is one of `sources`
+        """
+        stored = self.store.chunk_ids[self.store.source_positions(sources)].tolist()
+        return [
+            doc_id
+            for doc_id in map(str, stored)
+            if doc_id not in self._removed and doc_id not in self._added
+        ] + [
+            doc_id for doc_id, doc in self._added.items() if doc.metadata.get('source') in sources
+        ]
+
+    def sources(self) -> List[str]:
+        """Return the source of each document, in iteration order, without reading the text.
+
+        Returns:
+            File path of each document
+        """
+        stored = [
+            self.store.sources[int(source_id)]
+            for chunk_id, source_id in zip(self.store.chunk_ids, self.store.source_ids)
+            if str(chunk_id) not in self._removed and str(chunk_id) not in self._added
+        ]
+        return stored + [doc.metadata.get('source', 'unknown') for doc in self._added.values()]
+
+    def changes(self) -> Tuple[List[int], List[Tuple[int, Document]]]:
+        """Return the changes made on top of the store since loading.
+
+        Returns:
+            Tuple of the ids of the stored chunks that were removed or replaced, and
+            pairs of a chunk id and document for the added chunks
+        """
+        removed = {int(doc_id) for doc_id in self._removed}
+        removed.update(int(doc_id) for doc_id in self._added if self._position(doc_id) is not None)
+        added = [(int(doc_id), doc) for doc_id, doc in self._added.items()]
+        return sorted(removed), added
+
+    def _position(self, doc_id: object) -> Optional[int]:
+        if not isinstance(doc_id, str) or doc_id in self._removed:
+            return None
+        try:
+            chunk_id = int(doc_id)
+        except ValueError:
+            return None
+        return self.store.position(chunk_id)
@@ -13,6 +13,8 @@
 # limitations under the License.
 """Default constants for Git Repository Research MCP Server."""
 
+import os
+
 
 class Constants:
     """Constants used throughout the Git Repository Research MCP Server."""
@@ -348,3 +350,34 @@ class Constants:
         '**/.gradle/**',
         '**/target/**',
     ]
+
+    # Maximum total size in bytes of the index files of indices kept loaded in memory
+    INDEX_CACHE_MAX_BYTES = int(
+        os.environ.get('GIT_REPO_RESEARCH_INDEX_CACHE_MAX_BYTES', 1024 * 1024 * 1024)
+    )
+
+    # Memory-map FAISS index files instead of reading them into memory
+    INDEX_MMAP = os.environ.get('GIT_REPO_RESEARCH_INDEX_MMAP', 'false').lower() == 'true'
+
+    # Number of chunks sent to the embedding model per request batch
+    EMBEDDING_BATCH_SIZE = int(os.environ.get('GIT_REPO_RESEARCH_EMBEDDING_BATCH_SIZE', 16))
+
+    # Maximum number of embedding batches in flight; halved whenever Bedrock throttles
+    EMBEDDING_MAX_CONCURRENCY = int(
+        os.environ.get('GIT_REPO_RESEARCH_EMBEDDING_MAX_CONCURRENCY', 8)
+    )
+
+    # Maximum number of attempts for a throttled embedding batch
+    EMBEDDING_MAX_TRIES = int(os.environ.get('GIT_REPO_RESEARCH_EMBEDDING_MAX_TRIES', 6))
+
+    # Keep embeddings of already seen chunks in a SQLite cache in the index directory
+    EMBEDDING_CACHE = os.environ.get('GIT_REPO_RESEARCH_EMBEDDING_CACHE', 'true').lower() == 'true'
+
+    # File name of the embedding cache in the index directory
+    EMBEDDING_CACHE_FILE = 'embedding_cache.sqlite'
+
+    # Number of worker processes used to read and chunk repository files
+    CHUNK_WORKERS = int(os.environ.get('GIT_REPO_RESEARCH_CHUNK_WORKERS', os.cpu_count() or 1))
+
+    # Weight of the BM25 keyword score in hybrid search scores, the rest being vector similarity
+    SEARCH_KEYWORD_WEIGHT = float(os.environ.get('GIT_REPO_RESEARCH_SEARCH_KEYWORD_WEIGHT', 0.3))
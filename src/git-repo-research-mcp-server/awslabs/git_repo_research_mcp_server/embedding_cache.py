@@ -0,0 +1,131 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Persistent embedding cache for Git Repository Research MCP Server.
+
+This module stores the embeddings of text chunks on disk, keyed by embedding model
+and content hash, so that chunks shared between repositories, forks and re-indexing
+runs are only embedded once.
+"""
+
+import hashlib
+import numpy as np
+import os
+import sqlite3
+import threading
+from contextlib import closing
+from loguru import logger
+from typing import Dict, Iterable, List, Mapping
+
+
+# Number of keys looked up per query, below SQLite's default bound on query parameters
+_LOOKUP_BATCH_SIZE = 500
+
+
+def content_hash(text: str) -> str:
+    """Return the hash identifying the content of a text chunk.
+
+    Args:
+        text: Text chunk
+
+    Returns:
+        Hex-encoded SHA-256 digest of the text
+    """
+    return hashlib.sha256(text.encode('utf-8', errors='surrogatepass')).hexdigest()
+
+
+class EmbeddingCache:
+    """SQLite-backed store of embeddings keyed by model id and content hash.
+
+    Vectors are stored as float32 blobs. The database uses write-ahead logging, so
+    several server processes can share one cache file. Errors while reading or writing
+    the cache are logged and treated as misses, so a broken cache never fails indexing.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the embedding cache.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._initialized = False
+
+    def get_many(self, model_id: str, hashes: Iterable[str]) -> Dict[str, List[float]]:
+        """Return the cached embeddings of the given content hashes.
+
+        Args:
+            model_id: ID of the embedding model
+            hashes: Content hashes to look up
+
+        Returns:
+            Dictionary mapping each cached content hash to its embedding
+        """
+        keys = list(hashes)
+        found: Dict[str, List[float]] = {}
+        try:
+            with closing(self._connect()) as conn, conn:
+                for start in range(0, len(keys), _LOOKUP_BATCH_SIZE):
+                    batch = keys[start : start + _LOOKUP_BATCH_SIZE]
+                    rows = conn.execute(
+                        'SELECT content_hash, vector FROM embeddings '
+                        f'WHERE model_id = ? AND content_hash IN ({",".join("?" * len(batch))})',
+                        [model_id, *batch],
+                    )
+                    for key, blob in rows:
+                        found[key] = np.frombuffer(blob, dtype=np.float32).tolist()
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f'Cannot read embedding cache {self.path}: {e}')
+        return found
+
+    def put_many(self, model_id: str, embeddings: Mapping[str, List[float]]) -> None:
+        """Store embeddings by content hash.
+
+        Args:
+            model_id: ID of the embedding model
+            embeddings: Dictionary mapping content hashes to embeddings
+        """
+        if not embeddings:
+            return
+        rows = [
+            (model_id, key, np.asarray(vector, dtype=np.float32).tobytes())
+            for key, vector in embeddings.items()
+        ]
+        try:
+            with closing(self._connect()) as conn, conn:
+                conn.executemany(
+                    'INSERT OR REPLACE INTO embeddings (model_id, content_hash, vector) '
+                    'VALUES (?, ?, ?)',
+                    rows,
+                )
+        except (sqlite3.Error, OSError) as e:
+            logger.warning(f'Cannot write embedding cache {self.path}: {e}')
+
+    def _connect(self) -> sqlite3.Connection:
+        with self._lock:
+            if not self._initialized:
+                os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            if not self._initialized:
+                conn.execute('PRAGMA journal_mode=WAL')
+                conn.execute(
+                    'CREATE TABLE IF NOT EXISTS embeddings ('
+                    'model_id TEXT NOT NULL, '
+                    'content_hash TEXT NOT NULL, '
+                    'vector BLOB NOT NULL, '
+                    'PRIMARY KEY (model_id, content_hash)'
+                    ') WITHOUT ROWID'
+                )
+                self._initialized = True
+        return conn
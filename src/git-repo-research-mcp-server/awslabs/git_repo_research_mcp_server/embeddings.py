@@ -17,12 +17,27 @@ This module provides functionality for generating embeddings from text
 using Amazon Bedrock models via LangChain.
 """
 
+import asyncio
+import backoff
 import os
+from awslabs.git_repo_research_mcp_server.defaults import Constants
+from awslabs.git_repo_research_mcp_server.embedding_cache import EmbeddingCache, content_hash
 from awslabs.git_repo_research_mcp_server.models import EmbeddingModel
+from botocore.exceptions import ClientError
 from langchain_aws import BedrockEmbeddings
 from langchain_core.embeddings.embeddings import Embeddings
 from loguru import logger
-from typing import Optional
+from typing import Awaitable, Callable, Dict, List, Optional
+
+
+# Error codes with which Bedrock signals that requests should be slowed down
+THROTTLING_ERROR_CODES = {
+    'ThrottlingException',
+    'TooManyRequestsException',
+    'ServiceUnavailableException',
+}
+
+EmbeddingProgressCallback = Callable[[int, int], Awaitable[None]]
 
 
 def create_bedrock_embeddings(
@@ -67,3 +82,172 @@ def get_embedding_model(
         Embeddings instance
     """
     return create_bedrock_embeddings(model_id, aws_region, aws_profile)
+
+
+def is_throttling_error(error: Exception) -> bool:
+    """Check whether an error means that the embedding model is throttling requests.
+
+    Args:
+        error: Exception raised by the embedding model
+
+    Returns:
+        True if the request should be retried more slowly, False otherwise
+    """
+    if not isinstance(error, ClientError):
+        return False
+    return error.response.get('Error', {}).get('Code') in THROTTLING_ERROR_CODES
+
+
+class AdaptiveConcurrencyLimiter:
+    """Async limiter on the number of concurrent requests that adapts to throttling.
+
+    The limit is halved whenever a request is throttled and grows by one after a full
+    round of successful requests, up to `max_concurrency`.
+    """
+
+    def __init__(self, max_concurrency: int):
+        """Initialize the limiter.
+
+        Args:
+            max_concurrency: Maximum number of concurrent requests
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.limit = self.max_concurrency
+        self._active = 0
+        self._successes = 0
+        self._condition = asyncio.Condition()
+
+    async def __aenter__(self):
+        """Wait until a request may be started."""
+        async with self._condition:
+            await self._condition.wait_for(lambda: self._active < self.limit)
+            self._active += 1
+
+    async def __aexit__(self, *exc_info):
+        """Mark a request as finished."""
+        async with self._condition:
+            self._active -= 1
+            self._condition.notify_all()
+
+    def succeeded(self):
+        """Record a successful request."""
+        self._successes += 1
+        if self._successes >= self.limit and self.limit < self.max_concurrency:
+            self.limit += 1
+            self._successes = 0
+
+    def throttled(self):
+        """Record a throttled request."""
+        self.limit = max(1, self.limit // 2)
+        self._successes = 0
+        logger.warning(f'Embedding requests throttled, reducing concurrency to {self.limit}')
+
+
+class EmbeddingPipeline:
+    """Embeds text chunks in concurrent batches, reusing cached and duplicate embeddings.
+
+    Chunks are deduplicated by content hash. Chunks found in the embedding cache are
+    not sent to the model, and the remaining ones are embedded in batches that run
+    concurrently on worker threads, so the event loop stays responsive.
+    """
+
+    def __init__(
+        self,
+        embedding_generator: Embeddings,
+        model_id: str,
+        cache: Optional[EmbeddingCache] = None,
+        batch_size: int = Constants.EMBEDDING_BATCH_SIZE,
+        max_concurrency: int = Constants.EMBEDDING_MAX_CONCURRENCY,
+        max_tries: int = Constants.EMBEDDING_MAX_TRIES,
+    ):
+        """Initialize the embedding pipeline.
+
+        Args:
+            embedding_generator: LangChain embedding model
+            model_id: ID of the embedding model, used as part of the cache key
+            cache: Persistent embedding cache (optional)
+            batch_size: Number of chunks per embedding request batch
+            max_concurrency: Maximum number of batches embedded at once
+            max_tries: Maximum number of attempts for a throttled batch
+        """
+        self.embedding_generator = embedding_generator
+        self.model_id = model_id
+        self.cache = cache
+        self.batch_size = max(1, batch_size)
+        self.max_concurrency = max_concurrency
+        self.max_tries = max_tries
+
+    async def embed(
+        self, texts: List[str], progress: Optional[EmbeddingProgressCallback] = None
+    ) -> List[List[float]]:
+        """Embed text chunks.
+
+        Args:
+            texts: Text chunks to embed
+            progress: Coroutine called with the number of embedded and missing chunks
+                after each batch (optional)
+
+        Returns:
+            Embedding of each text chunk, in the order of `texts`
+        """
+        hashes = [content_hash(text) for text in texts]
+        unique = dict(zip(hashes, texts))
+        found: Dict[str, List[float]] = {}
+        if self.cache is not None and unique:
+            found = await asyncio.to_thread(self.cache.get_many, self.model_id, unique)
+
+        missing = [(key, text) for key, text in unique.items() if key not in found]
+        logger.info(
+            f'Embedding {len(missing)} of {len(texts)} chunks '
+            f'({len(texts) - len(unique)} duplicates, {len(found)} cached)'
+        )
+
+        if missing:
+            limiter = AdaptiveConcurrencyLimiter(self.max_concurrency)
+            embedded = 0
+
+            async def run_batch(batch):
+                nonlocal embedded
+                vectors = await self._embed_batch([text for _, text in batch], limiter)
+                result = {key: vector for (key, _), vector in zip(batch, vectors)}
+                # Storing every batch keeps the work of an interrupted run
+                if self.cache is not None:
+                    await asyncio.to_thread(self.cache.put_many, self.model_id, result)
+                found.update(result)
+                embedded += len(batch)
+                if progress:
+                    await progress(embedded, len(missing))
+
+            tasks = [
+                asyncio.ensure_future(run_batch(missing[start : start + self.batch_size]))
+                for start in range(0, len(missing), self.batch_size)
+            ]
+            try:
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+        return [found[key] for key in hashes]
+
+    async def _embed_batch(
+        self, texts: List[str], limiter: AdaptiveConcurrencyLimiter
+    ) -> List[List[float]]:
+        @backoff.on_exception(
+            backoff.expo,
+            ClientError,
+            max_tries=self.max_tries,
+            giveup=lambda e: not is_throttling_error(e),
+            on_backoff=lambda details: limiter.throttled(),
+        )
+        async def embed_with_retries():
+            async with limiter:
+                vectors = await asyncio.to_thread(self.embedding_generator.embed_documents, texts)
+            limiter.succeeded()
+            return vectors
+
+        vectors = await embed_with_retries()
+        if len(vectors) != len(texts):
+            raise ValueError(f'Expected {len(texts)} embeddings, got {len(vectors)}')
+        return vectors
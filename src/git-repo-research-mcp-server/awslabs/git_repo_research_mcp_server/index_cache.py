@@ -0,0 +1,149 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""In-process cache of loaded repository indices for Git Repository Research MCP Server.
+
+This module keeps recently used indices in memory so that repeated searches against
+the same repository do not re-read and rebuild the index from disk.
+"""
+
+import os
+import threading
+from awslabs.git_repo_research_mcp_server.chunk_store import CHUNK_STORE_FILE
+from awslabs.git_repo_research_mcp_server.defaults import Constants
+from collections import OrderedDict
+from loguru import logger
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+# Files whose modification invalidates a cached index
+INDEX_FILES = ['index.faiss', CHUNK_STORE_FILE, 'docstore.json', 'index_mapping.json']
+
+FileSignature = Tuple[Tuple[str, int, int], ...]
+CacheKey = Tuple[str, str]
+
+
+class IndexCache:
+    """LRU cache of loaded indices keyed by index path, name and index file signatures.
+
+    An entry is only reused while none of its index files changed on disk. The total
+    size of the cached index files is bounded by `max_bytes`; the least recently used
+    indices are evicted first. A single index larger than the bound is never cached.
+    """
+
+    def __init__(self, max_bytes: int):
+        """Initialize the index cache.
+
+        Args:
+            max_bytes: Maximum total size in bytes of the index files of cached indices
+        """
+        self.max_bytes = max_bytes
+        self._entries: 'OrderedDict[CacheKey, Tuple[FileSignature, int, Any]]' = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def get_or_load(
+        self,
+        index_path: str,
+        loader: Callable[[str], Any],
+        files: Optional[List[str]] = None,
+        name: str = 'vectors',
+    ) -> Any:
+        """Return the cached index for a path, loading it on a miss.
+
+        Args:
+            index_path: Path to the index directory
+            loader: Function that loads the index from the index directory
+            files: Names of the index files to check for changes (defaults to INDEX_FILES)
+            name: Name distinguishing several structures loaded from one index directory
+
+        Returns:
+            The loaded index, as returned by the loader
+        """
+        key = (os.path.realpath(index_path), name)
+        signature = self._signature(key[0], files or INDEX_FILES)
+
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[2]
+            self.misses += 1
+
+        loaded = loader(index_path)
+        size = sum(file_size for _, _, file_size in signature)
+
+        with self._lock:
+            self._remove(key)
+            if 0 < size <= self.max_bytes:
+                self._entries[key] = (signature, size, loaded)
+                self._size += size
+                while self._size > self.max_bytes:
+                    evicted_key, _ = next(iter(self._entries.items()))
+                    logger.debug(f'Evicting index {evicted_key} from the index cache')
+                    self._remove(evicted_key)
+
+        return loaded
+
+    def invalidate(self, index_path: str) -> None:
+        """Drop everything cached for a path, if any.
+
+        Args:
+            index_path: Path to the index directory
+        """
+        path = os.path.realpath(index_path)
+        with self._lock:
+            for key in [key for key in self._entries if key[0] == path]:
+                self._remove(key)
+
+    def clear(self) -> None:
+        """Drop all cached indices."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        """Return the cache hit and miss counters along with its current size.
+
+        Returns:
+            Dictionary with hits, misses, number of cached indices and their total size
+        """
+        with self._lock:
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'entries': len(self._entries),
+                'size_bytes': self._size,
+            }
+
+    def _remove(self, key: CacheKey) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._size -= entry[1]
+
+    @staticmethod
+    def _signature(index_path: str, files: List[str]) -> FileSignature:
+        signature = []
+        for name in files:
+            try:
+                stat = os.stat(os.path.join(index_path, name))
+            except FileNotFoundError:
+                continue
+            signature.append((name, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+
+INDEX_CACHE = IndexCache(max_bytes=Constants.INDEX_CACHE_MAX_BYTES)
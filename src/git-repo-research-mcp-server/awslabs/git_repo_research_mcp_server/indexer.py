@@ -17,26 +17,46 @@ This module provides functionality for creating and managing FAISS indices
 for Git repositories using LangChain's FAISS implementation.
 """
 
+import asyncio
 import faiss
 import json
+import numpy as np
 import os
 import shutil
 import time
+from awslabs.git_repo_research_mcp_server.blob_store import BLOB_DIR, BlobStore
+from awslabs.git_repo_research_mcp_server.chunk_store import (
+    CHUNK_STORE_FILE,
+    ChunkDocuments,
+    ChunkStore,
+)
 from awslabs.git_repo_research_mcp_server.defaults import Constants
-from awslabs.git_repo_research_mcp_server.embeddings import get_embedding_model
+from awslabs.git_repo_research_mcp_server.embedding_cache import EmbeddingCache
+from awslabs.git_repo_research_mcp_server.embeddings import (
+    EmbeddingPipeline,
+    get_embedding_model,
+)
+from awslabs.git_repo_research_mcp_server.index_cache import INDEX_CACHE
+from awslabs.git_repo_research_mcp_server.keyword_index import KEYWORD_INDEX_FILE, KeywordIndex
 from awslabs.git_repo_research_mcp_server.models import (
     EmbeddingModel,
     IndexMetadata,
     IndexRepositoryResponse,
 )
 from awslabs.git_repo_research_mcp_server.repository import (
+    chunk_files,
     cleanup_repository,
     clone_repository,
+    get_changed_files,
+    get_file_extension_stats,
+    get_path_matcher,
     get_repository_name,
+    get_uncommitted_files,
     is_git_repo,
     is_git_url,
     process_repository,
 )
+from awslabs.git_repo_research_mcp_server.utils import load_metadata
 from datetime import datetime
 from git import Repo
 from langchain_community.docstore.in_memory import InMemoryDocstore
@@ -45,7 +65,11 @@ from langchain_core.documents import Document
 from loguru import logger
 from pydantic import BaseModel, field_validator
 from pydantic_core.core_schema import ValidationInfo
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Set, Tuple, cast
+
+
+# Files of the JSON index format replaced by the chunk store
+LEGACY_INDEX_FILES = ['docstore.json', 'index_mapping.json', 'chunk_map.json']
 
 
 class RepositoryConfig(BaseModel):
@@ -53,6 +77,8 @@ class RepositoryConfig(BaseModel):
 
     This class defines the configuration parameters for indexing a Git repository,
     including paths, patterns for file inclusion/exclusion, and chunking parameters.
+    When `incremental` is set and the repository was indexed before with the same
+    settings, only the files changed since the indexed commit are re-embedded.
     """
 
     repository_path: str
@@ -61,6 +87,7 @@ class RepositoryConfig(BaseModel):
     exclude_patterns: Optional[List[str]] = None
     chunk_size: int = 1000
     chunk_overlap: int = 200
+    incremental: bool = True
 
     @field_validator('repository_path')
     @classmethod
@@ -178,6 +205,22 @@ def ensure_docstore_dict(docstore):
     return docstore._dict
 
 
+def get_docstore_sources(docstore) -> List[str]:
+    """Get the source file of each document of a docstore.
+
+    Args:
+        docstore: LangChain docstore object
+
+    Returns:
+        Source of each document, read from the chunk store without decompressing
+        the text when the docstore is backed by one
+    """
+    docstore_dict = get_docstore_dict(docstore)
+    if isinstance(docstore_dict, ChunkDocuments):
+        return docstore_dict.sources()
+    return [doc.metadata.get('source', 'unknown') for doc in docstore_dict.values()]
+
+
 def get_docstore_dict_size(docstore):
     """Safely get the size of the document dictionary from a docstore.
 
@@ -197,8 +240,10 @@ def save_index_without_pickle(vector_store, index_path):
         vector_store: FAISS vector store
         index_path: Path to save the index
 
-    This function saves a FAISS index using FAISS's native methods and JSON
-    instead of pickle for serialization.
+    This function saves a FAISS index using FAISS's native methods and stores the
+    documents in a chunk store addressed by the FAISS ids, instead of using pickle
+    for serialization. When the documents were loaded from a chunk store, only the
+    chunks added and removed since are applied to it.
     """
     os.makedirs(index_path, exist_ok=True)
 
@@ -206,78 +251,201 @@ def save_index_without_pickle(vector_store, index_path):
     faiss_path = os.path.join(index_path, 'index.faiss')
     faiss.write_index(vector_store.index, faiss_path)
 
-    # 2. Save docstore as JSON
-    docstore_path = os.path.join(index_path, 'docstore.json')
-    docstore_data = {}
-    for doc_id, doc in get_docstore_dict(vector_store.docstore).items():
-        docstore_data[doc_id] = {'page_content': doc.page_content, 'metadata': doc.metadata}
+    # 2. Save the documents in a chunk store addressed by FAISS id
+    docstore_dict = get_docstore_dict(vector_store.docstore)
+    if isinstance(docstore_dict, ChunkDocuments):
+        store = docstore_dict.store.update(*docstore_dict.changes())
+    else:
+        store = ChunkStore.build(
+            (faiss_id, docstore_dict[doc_id])
+            for faiss_id, doc_id in vector_store.index_to_docstore_id.items()
+            if doc_id in docstore_dict
+        )
+    store.save(index_path)
+
+    # 3. Remove the files of the previous JSON format
+    for name in LEGACY_INDEX_FILES:
+        legacy_path = os.path.join(index_path, name)
+        if os.path.exists(legacy_path):
+            os.remove(legacy_path)
+
+
+def read_index_without_pickle(
+    index_path: str,
+) -> Tuple[faiss.Index, InMemoryDocstore, Dict[int, str]]:
+    """Read a FAISS index, its docstore and its id mapping without using pickle.
+
+    Args:
+        index_path: Path to the index
+
+    Returns:
+        Tuple of the FAISS index, the document store and the index to docstore id mapping
+
+    This function loads a FAISS index using FAISS's native methods. Documents are
+    read lazily from the chunk store, or from the JSON files of indices created
+    before the chunk store.
+    """
+    # 1. Load FAISS index using faiss's native methods
+    faiss_path = os.path.join(index_path, 'index.faiss')
+    if Constants.INDEX_MMAP:
+        index = faiss.read_index(faiss_path, faiss.IO_FLAG_MMAP)
+    else:
+        index = faiss.read_index(faiss_path)
 
-    with open(docstore_path, 'w') as f:
-        json.dump(docstore_data, f)
+    # 2. Load documents from the chunk store, addressed by FAISS id
+    if os.path.exists(os.path.join(index_path, CHUNK_STORE_FILE)):
+        store = ChunkStore.load(index_path)
+        # The lazy mapping stands in for the dictionary the docstore expects
+        docstore = InMemoryDocstore(cast(Dict[str, Document], ChunkDocuments(store)))
+        index_to_docstore_id = {int(chunk_id): str(chunk_id) for chunk_id in store.chunk_ids}
+        return index, docstore, index_to_docstore_id
+
+    # 3. Otherwise load docstore and index_to_docstore_id mapping from JSON
+    docstore_path = os.path.join(index_path, 'docstore.json')
+    with open(docstore_path, 'r') as f:
+        docstore_data = json.load(f)
+
+    # Reconstruct the document store
+    docstore = InMemoryDocstore({})
+    dict_obj = ensure_docstore_dict(docstore)
+    for doc_id, doc_data in docstore_data.items():
+        dict_obj[doc_id] = Document(
+            page_content=doc_data['page_content'], metadata=doc_data['metadata']
+        )
 
-    # 3. Save index_to_docstore_id mapping as JSON
     mapping_path = os.path.join(index_path, 'index_mapping.json')
-    # Convert numeric keys to strings for JSON serialization
-    mapping = {str(k): v for k, v in vector_store.index_to_docstore_id.items()}
-    with open(mapping_path, 'w') as f:
-        json.dump(mapping, f)
+    with open(mapping_path, 'r') as f:
+        mapping_data = json.load(f)
 
+    # Convert string keys back to integers for the mapping
+    index_to_docstore_id = {int(k): v for k, v in mapping_data.items()}
 
-def save_chunk_map_without_pickle(chunk_map, index_path):
-    """Save chunk map without using pickle.
+    return index, docstore, index_to_docstore_id
+
+
+def build_vector_store(
+    documents: List[Document], embeddings: List[List[float]], embedding_function
+) -> FAISS:
+    """Build a FAISS vector store whose vectors are addressed by chunk id.
 
     Args:
-        chunk_map: Chunk map to save
-        index_path: Path to save the chunk map
+        documents: LangChain documents with a `chunk_id` in their metadata
+        embeddings: Embedding of each document
+        embedding_function: Embedding function used for queries
+
+    Returns:
+        FAISS vector store backed by an `IndexIDMap`
 
-    This function saves a chunk map using JSON instead of pickle for serialization.
+    Addressing vectors by chunk id rather than by position allows the chunks of a
+    file to be removed and replaced without rebuilding the index.
     """
-    # Convert the chunk map to a JSON-serializable format
-    serializable_chunk_map = {'chunks': chunk_map['chunks'], 'chunk_to_file': {}}
+    vectors = np.array(embeddings, dtype=np.float32)
+    faiss.normalize_L2(vectors)
+    index = faiss.IndexIDMap(faiss.IndexFlatL2(vectors.shape[1]))
+    vector_store = FAISS(
+        embedding_function=embedding_function,
+        index=index,
+        docstore=InMemoryDocstore({}),
+        index_to_docstore_id={},
+        normalize_L2=True,
+    )
+    add_documents_with_ids(vector_store, documents, vectors)
+    return vector_store
+
+
+def add_documents_with_ids(vector_store: FAISS, documents: List[Document], vectors: np.ndarray):
+    """Add normalized vectors to an ID-mapped vector store under their chunk ids.
 
-    # Convert the chunk_to_file dictionary to a serializable format
-    # Since chunks are not hashable in JSON, we use indices
-    for i, chunk in enumerate(chunk_map['chunks']):
-        if chunk in chunk_map['chunk_to_file']:
-            serializable_chunk_map['chunk_to_file'][str(i)] = chunk_map['chunk_to_file'][chunk]
+    Args:
+        vector_store: FAISS vector store backed by an `IndexIDMap`
+        documents: LangChain documents with a `chunk_id` in their metadata
+        vectors: L2-normalized embedding of each document
+    """
+    if not documents:
+        return
+    chunk_ids = np.array([doc.metadata['chunk_id'] for doc in documents], dtype=np.int64)
+    vector_store.index.add_with_ids(vectors, chunk_ids)
 
-    # Save as JSON
-    chunk_map_path = os.path.join(index_path, 'chunk_map.json')
-    with open(chunk_map_path, 'w') as f:
-        json.dump(serializable_chunk_map, f)
+    docstore_dict = ensure_docstore_dict(vector_store.docstore)
+    for chunk_id, doc in zip(map(int, chunk_ids), documents):
+        doc_id = str(chunk_id)
+        docstore_dict[doc_id] = doc
+        vector_store.index_to_docstore_id[chunk_id] = doc_id
 
 
-def load_chunk_map_without_pickle(index_path):
-    """Load chunk map without using pickle.
+def remove_documents_by_source(vector_store: FAISS, sources: Set[str]) -> int:
+    """Remove the chunks of the given files from an ID-mapped vector store.
 
     Args:
-        index_path: Path to the chunk map
+        vector_store: FAISS vector store backed by an `IndexIDMap`
+        sources: Paths of the files (relative to the repository) whose chunks to remove
 
     Returns:
-        Chunk map dictionary if found, None otherwise
+        Number of removed chunks
+    """
+    docstore_dict = get_docstore_dict(vector_store.docstore)
+    if isinstance(docstore_dict, ChunkDocuments):
+        # The chunk store knows the file of each chunk, so no document is read
+        chunk_ids = [int(doc_id) for doc_id in docstore_dict.ids_by_source(sources)]
+    else:
+        chunk_ids = [
+            chunk_id
+            for chunk_id, doc_id in vector_store.index_to_docstore_id.items()
+            if doc_id in docstore_dict and docstore_dict[doc_id].metadata.get('source') in sources
+        ]
+    if not chunk_ids:
+        return 0
+
+    vector_store.index.remove_ids(np.array(chunk_ids, dtype=np.int64))
+    for chunk_id in chunk_ids:
+        del docstore_dict[vector_store.index_to_docstore_id.pop(chunk_id)]
+    return len(chunk_ids)
+
+
+def build_keyword_index(vector_store: FAISS) -> KeywordIndex:
+    """Build the keyword index of a vector store.
+
+    Args:
+        vector_store: FAISS vector store
 
-    This function loads a chunk map using JSON instead of pickle for serialization.
+    Returns:
+        KeywordIndex over the path and content of every chunk, addressed by FAISS id
     """
-    chunk_map_path = os.path.join(index_path, 'chunk_map.json')
+    docstore_dict = get_docstore_dict(vector_store.docstore)
+    return KeywordIndex.build(
+        (faiss_id, _keyword_text(doc))
+        for faiss_id, doc_id in sorted(vector_store.index_to_docstore_id.items())
+        if (doc := docstore_dict.get(doc_id)) is not None
+    )
+
+
+def update_keyword_index(vector_store: FAISS, index_path: str) -> KeywordIndex:
+    """Bring the saved keyword index of a vector store up to date.
+
+    Args:
+        vector_store: FAISS vector store
+        index_path: Path to the index
 
-    if not os.path.exists(chunk_map_path):
-        return None
+    Returns:
+        KeywordIndex over the path and content of every chunk, addressed by FAISS id
 
-    try:
-        with open(chunk_map_path, 'r') as f:
-            serialized_map = json.load(f)
+    When the documents were loaded from a chunk store and the index has a keyword
+    index, only the chunks added and removed since loading are applied to it.
+    Otherwise the keyword index is built from scratch.
+    """
+    docstore_dict = get_docstore_dict(vector_store.docstore)
+    if not isinstance(docstore_dict, ChunkDocuments) or not os.path.exists(
+        os.path.join(index_path, KEYWORD_INDEX_FILE)
+    ):
+        return build_keyword_index(vector_store)
+    removed_ids, added = docstore_dict.changes()
+    return KeywordIndex.load(index_path).update(
+        removed_ids, ((chunk_id, _keyword_text(doc)) for chunk_id, doc in added)
+    )
 
-        # Reconstruct the chunk-to-file mapping
-        chunks = serialized_map['chunks']
-        chunk_to_file = {}
-        for i, chunk in enumerate(chunks):
-            if str(i) in serialized_map['chunk_to_file']:
-                chunk_to_file[chunk] = serialized_map['chunk_to_file'][str(i)]
 
-        return {'chunks': chunks, 'chunk_to_file': chunk_to_file}
-    except Exception as e:
-        logger.error(f'Error loading chunk map: {e}')
-        return None
+def _keyword_text(doc: Document) -> str:
+    return f'{doc.metadata.get("source", "")}\n{doc.page_content}'
 
 
 class RepositoryIndexer:
@@ -307,6 +475,14 @@ class RepositoryIndexer:
             aws_region=self.aws_region,
             aws_profile=self.aws_profile,
         )
+        embedding_cache = (
+            EmbeddingCache(os.path.join(self.index_dir, Constants.EMBEDDING_CACHE_FILE))
+            if Constants.EMBEDDING_CACHE
+            else None
+        )
+        self.embedding_pipeline = EmbeddingPipeline(
+            self.embedding_generator, self.embedding_model, embedding_cache
+        )
 
     def _get_index_path(self, repository_name: str) -> str:
         """Get the path to the index directory for a repository.
@@ -334,19 +510,6 @@ class RepositoryIndexer:
         index_path = self._get_index_path(repository_name)
         return os.path.join(index_path, 'metadata.json')
 
-    def _get_chunk_map_path(self, repository_name: str) -> str:
-        """Get the path to the chunk map file for a repository.
-
-        Args:
-            repository_name: Name of the repository
-
-        Returns:
-            Path to the chunk map file
-        """
-        # Store chunk map file in the repository's index directory
-        index_path = self._get_index_path(repository_name)
-        return os.path.join(index_path, 'chunk_map.json')
-
     async def index_repository(
         self,
         config: RepositoryConfig,
@@ -371,7 +534,7 @@ class RepositoryIndexer:
             # Initialize helper classes
             repo_processor = RepositoryProcessor()
             index_builder = IndexBuilder()
-            file_manager = FileManager()
+            file_manager = FileManager(os.path.join(self.index_dir, BLOB_DIR))
             metadata_manager = MetadataManager()
 
             # Step 1: Repository preparation and processing
@@ -382,9 +545,19 @@ class RepositoryIndexer:
             if ctx:
                 await ctx.report_progress(0, 100)
 
-            chunks, chunk_to_file, extension_stats = await repo_processor.process_content(
-                repo_path, config, ctx
-            )
+            if config.incremental:
+                response = await self._update_index(
+                    config, repo_path, repository_name, start_time, ctx
+                )
+                if response is not None:
+                    return response
+
+            (
+                chunks,
+                chunk_sources,
+                extension_stats,
+                start_lines,
+            ) = await repo_processor.process_content(repo_path, config, ctx)
 
             if not chunks:
                 logger.warning('No text chunks found in repository')
@@ -405,7 +578,9 @@ class RepositoryIndexer:
                 )
 
             # Step 2: Index creation
-            documents = await index_builder.create_documents(chunks, chunk_to_file, ctx)
+            documents = await index_builder.create_documents(
+                chunks, chunk_sources, ctx, start_lines=start_lines
+            )
             index_path = self._get_index_path(config.output_path or repository_name)
             repo_files_path = os.path.join(index_path, 'repository')
             os.makedirs(repo_files_path, exist_ok=True)
@@ -413,14 +588,10 @@ class RepositoryIndexer:
             # Step 3: File management
             await file_manager.copy_repository_files(repo_path, repo_files_path, ctx)
             vector_store = await index_builder.create_vector_store(
-                documents, self.embedding_generator, ctx
+                documents, self.embedding_pipeline, ctx
             )
             index_builder.save_index(vector_store, index_path)
 
-            # Save chunk map
-            chunk_map_data = {'chunks': chunks, 'chunk_to_file': chunk_to_file}
-            file_manager.save_chunk_map(chunk_map_data, index_path)
-
             # Step 4: Metadata management
             last_commit_id = await repo_processor.get_commit_id(
                 repo_path, repository_name, config.repository_path
@@ -432,10 +603,10 @@ class RepositoryIndexer:
                     'config': config,
                     'index_path': index_path,
                     'repo_files_path': repo_files_path,
-                    'chunks': chunks,
-                    'chunk_to_file': chunk_to_file,
+                    'chunk_sources': chunk_sources,
                     'extension_stats': extension_stats,
                     'last_commit_id': last_commit_id,
+                    'uncommitted_files': get_uncommitted_files(repo_path),
                     'embedding_model': self.embedding_model,
                 },
                 ctx,
@@ -487,50 +658,218 @@ class RepositoryIndexer:
             if temp_dir:
                 cleanup_repository(temp_dir)
 
-    def load_index_without_pickle(self, index_path):
-        """Load FAISS index without using pickle.
+    async def _update_index(
+        self,
+        config: RepositoryConfig,
+        repo_path: str,
+        repository_name: str,
+        start_time: float,
+        ctx: Optional[Any] = None,
+    ) -> Optional[IndexRepositoryResponse]:
+        """Re-embed only the files changed since the commit an existing index was built from.
 
         Args:
-            index_path: Path to the index
-            embedding_function: Embedding function to use
+            config: RepositoryConfig object with indexing configuration
+            repo_path: Path to the repository
+            repository_name: Name of the repository
+            start_time: Time at which indexing started
+            ctx: Context object for progress tracking (optional)
 
         Returns:
-            FAISS vector store
-
-        This function loads a FAISS index using FAISS's native methods and JSON
-        instead of pickle for serialization.
+            IndexRepositoryResponse object if the index was updated, or None if the
+            repository has to be indexed from scratch
         """
-        # 1. Load FAISS index using faiss's native methods
-        faiss_path = os.path.join(index_path, 'index.faiss')
-        index = faiss.read_index(faiss_path)
+        index_path = self._get_index_path(config.output_path or repository_name)
+        metadata = load_metadata(os.path.join(index_path, 'metadata.json'))
+        if metadata is None or not self._is_compatible(metadata, config):
+            return None
+
+        changes = get_changed_files(repo_path, metadata.last_commit_id or '')
+        if changes is None:
+            return None
+        changed_files, deleted_files = changes
+        # Files that were indexed with uncommitted content are indexed again, even when
+        # their changes have been reverted since
+        changed_files = sorted(
+            set(changed_files) | (set(metadata.uncommitted_files) - set(deleted_files))
+        )
 
-        # 2. Load docstore from JSON
-        docstore_path = os.path.join(index_path, 'docstore.json')
-        with open(docstore_path, 'r') as f:
-            docstore_data = json.load(f)
-
-        # Reconstruct the document store
-        docstore = InMemoryDocstore({})
-        for doc_id, doc_data in docstore_data.items():
-            dict_obj = ensure_docstore_dict(docstore)
-            dict_obj[doc_id] = Document(
-                page_content=doc_data['page_content'], metadata=doc_data['metadata']
+        try:
+            index, docstore, index_to_docstore_id = read_index_without_pickle(index_path)
+        except Exception as e:
+            logger.warning(f'Cannot load existing index at {index_path}: {e}')
+            return None
+        if not isinstance(index, faiss.IndexIDMap):
+            logger.info(f'Index at {index_path} does not support updates, rebuilding it')
+            return None
+
+        repo_files_path = os.path.join(index_path, 'repository')
+        if not changed_files and not deleted_files:
+            logger.info(f'Index for {repository_name} is up to date')
+            if ctx:
+                await ctx.report_progress(100, 100)
+            return IndexRepositoryResponse(
+                status='success',
+                repository_name=metadata.repository_name,
+                repository_path=config.repository_path,
+                index_path=index_path,
+                repository_directory=repo_files_path,
+                file_count=metadata.file_count,
+                chunk_count=metadata.chunk_count,
+                embedding_model=self.embedding_model,
+                execution_time_ms=int((time.time() - start_time) * 1000),
+                message='Index is already up to date',
             )
 
-        # 3. Load index_to_docstore_id mapping from JSON
-        mapping_path = os.path.join(index_path, 'index_mapping.json')
-        with open(mapping_path, 'r') as f:
-            mapping_data = json.load(f)
+        logger.info(
+            f'Updating index for {repository_name}: {len(changed_files)} changed and '
+            f'{len(deleted_files)} deleted files since {metadata.last_commit_id}'
+        )
+        if ctx:
+            await ctx.info(
+                f'Updating index with {len(changed_files)} changed and '
+                f'{len(deleted_files)} deleted files...'
+            )
 
-        # Convert string keys back to integers for the mapping
-        index_to_docstore_id = {int(k): v for k, v in mapping_data.items()}
+        matcher = get_path_matcher(config.include_patterns, config.exclude_patterns)
+        matching_files = [
+            os.path.join(repo_path, rel_path)
+            for rel_path in changed_files
+            if matcher.matches(rel_path) and os.path.isfile(os.path.join(repo_path, rel_path))
+        ]
+        chunks, chunk_sources, start_lines = await asyncio.to_thread(
+            chunk_files, repo_path, matching_files, config.chunk_size, config.chunk_overlap
+        )
 
-        # 4. Create and return the FAISS vector store
+        index_builder = IndexBuilder()
+        file_manager = FileManager(os.path.join(self.index_dir, BLOB_DIR))
+        vector_store = FAISS(
+            embedding_function=self.embedding_generator,
+            index=index,
+            docstore=docstore,
+            index_to_docstore_id=index_to_docstore_id,
+            normalize_L2=True,
+        )
+        documents = await index_builder.create_documents(
+            chunks,
+            chunk_sources,
+            ctx,
+            first_chunk_id=max(index_to_docstore_id, default=-1) + 1,
+            start_lines=start_lines,
+        )
+        removed_count = await index_builder.update_vector_store(
+            vector_store,
+            set(changed_files) | set(deleted_files),
+            documents,
+            self.embedding_pipeline,
+            ctx,
+        )
+        index_builder.save_index(vector_store, index_path)
+
+        await file_manager.update_repository_files(
+            repo_path, repo_files_path, changed_files, deleted_files, ctx
+        )
+
+        index_sources = get_docstore_sources(vector_store.docstore)
+        last_commit_id = await RepositoryProcessor().get_commit_id(
+            repo_path, repository_name, config.repository_path
+        )
+        metadata = await MetadataManager().create_and_save(
+            {
+                'repository_name': repository_name,
+                'config': config,
+                'index_path': index_path,
+                'repo_files_path': repo_files_path,
+                'chunk_sources': index_sources,
+                'extension_stats': get_file_extension_stats(sorted(set(index_sources))),
+                'last_commit_id': last_commit_id,
+                'uncommitted_files': get_uncommitted_files(repo_path),
+                'embedding_model': self.embedding_model,
+            },
+            ctx,
+        )
+
+        execution_time_ms = int((time.time() - start_time) * 1000)
+        message = (
+            f'Updated index with {len(changed_files)} changed and {len(deleted_files)} '
+            f'deleted files: removed {removed_count} and embedded {len(documents)} chunks'
+        )
+        logger.info(f'{message} in {execution_time_ms}ms')
+        if ctx:
+            await ctx.info(message)
+            await ctx.report_progress(100, 100)
+
+        return IndexRepositoryResponse(
+            status='success',
+            repository_name=metadata.repository_name,
+            repository_path=config.repository_path,
+            index_path=index_path,
+            repository_directory=repo_files_path,
+            file_count=metadata.file_count,
+            chunk_count=metadata.chunk_count,
+            embedding_model=self.embedding_model,
+            execution_time_ms=execution_time_ms,
+            message=message,
+        )
+
+    def _is_compatible(self, metadata: IndexMetadata, config: RepositoryConfig) -> bool:
+        """Check if an existing index was built from the same source with the same settings.
+
+        Args:
+            metadata: Metadata of the existing index
+            config: RepositoryConfig object with indexing configuration
+
+        Returns:
+            True if the existing index can be updated incrementally, False otherwise
+        """
+        return (
+            metadata.last_commit_id not in (None, 'unknown')
+            and metadata.repository_path == config.repository_path
+            and metadata.embedding_model == self.embedding_model
+            and metadata.include_patterns == config.include_patterns
+            and metadata.exclude_patterns == config.exclude_patterns
+            and metadata.chunk_size == config.chunk_size
+            and metadata.chunk_overlap == config.chunk_overlap
+        )
+
+    def load_index_without_pickle(self, index_path):
+        """Load FAISS index without using pickle.
+
+        Args:
+            index_path: Path to the index
+
+        Returns:
+            FAISS vector store
+
+        Loaded indices are kept in the process-wide index cache, so repeated loads of
+        an unchanged index only wrap the cached index with this indexer's embedding
+        function.
+        """
+        index, docstore, index_to_docstore_id = INDEX_CACHE.get_or_load(
+            index_path, read_index_without_pickle
+        )
         return FAISS(
             embedding_function=self.embedding_generator,
             index=index,
             docstore=docstore,
             index_to_docstore_id=index_to_docstore_id,
+            # Indices addressed by chunk id store normalized vectors
+            normalize_L2=isinstance(index, faiss.IndexIDMap),
+        )
+
+    def load_keyword_index(self, index_path: str) -> Optional[KeywordIndex]:
+        """Load the keyword index of an index.
+
+        Args:
+            index_path: Path to the index
+
+        Returns:
+            KeywordIndex, or None if the index was created without one
+        """
+        if not os.path.exists(os.path.join(index_path, KEYWORD_INDEX_FILE)):
+            return None
+        return INDEX_CACHE.get_or_load(
+            index_path, KeywordIndex.load, files=[KEYWORD_INDEX_FILE], name='keywords'
         )
 
 
@@ -573,7 +912,7 @@ class RepositoryProcessor:
 
     async def process_content(
         self, repo_path: str, config: RepositoryConfig, ctx: Optional[Any] = None
-    ) -> Tuple[List[str], Dict[str, str], Dict[str, int]]:
+    ) -> Tuple[List[str], List[str], Dict[str, int], List[int]]:
         """Process repository files to get text chunks.
 
         Args:
@@ -584,14 +923,17 @@ class RepositoryProcessor:
         Returns:
             Tuple containing:
             - List of text chunks
-            - Mapping of chunks to file paths
+            - List of the file path of each chunk, parallel to the chunks
             - Statistics about file extensions
+            - Line each chunk starts on in its file
         """
         if ctx:
             await ctx.info('Processing repository files...')
             await ctx.report_progress(10, 100)
 
-        chunks, chunk_to_file, extension_stats = process_repository(
+        # Chunking blocks on file reads and worker processes, so it runs off the event loop
+        chunks, chunk_sources, extension_stats, start_lines = await asyncio.to_thread(
+            process_repository,
             repo_path,
             include_patterns=config.include_patterns,
             exclude_patterns=config.exclude_patterns,
@@ -602,7 +944,7 @@ class RepositoryProcessor:
         if ctx:
             await ctx.report_progress(30, 100)
 
-        return chunks, chunk_to_file, extension_stats
+        return chunks, chunk_sources, extension_stats, start_lines
 
     async def get_commit_id(
         self, repo_path: str, repository_name: str, repository_path: str
@@ -645,14 +987,21 @@ class IndexBuilder:
     """Handles FAISS index creation and management."""
 
     async def create_documents(
-        self, chunks: List[str], chunk_to_file: Dict[str, str], ctx: Optional[Any] = None
+        self,
+        chunks: List[str],
+        chunk_sources: List[str],
+        ctx: Optional[Any] = None,
+        first_chunk_id: int = 0,
+        start_lines: Optional[List[int]] = None,
     ) -> List[Document]:
         """Convert chunks to LangChain Document objects.
 
         Args:
             chunks: List of text chunks
-            chunk_to_file: Mapping of chunks to file paths
+            chunk_sources: File path of each chunk
             ctx: Context object for progress tracking (optional)
+            first_chunk_id: Chunk id of the first chunk
+            start_lines: Line each chunk starts on in its file (optional)
 
         Returns:
             List of LangChain Document objects
@@ -662,59 +1011,42 @@ class IndexBuilder:
             await ctx.report_progress(40, 100)
 
         documents = []
-        for i, chunk in enumerate(chunks):
-            file_path = chunk_to_file.get(chunk, 'unknown')
-            documents.append(
-                Document(
-                    page_content=chunk,
-                    metadata={'source': file_path, 'chunk_id': i},
-                )
-            )
+        for i, (chunk, file_path) in enumerate(zip(chunks, chunk_sources), start=first_chunk_id):
+            metadata = {'source': file_path, 'chunk_id': i}
+            if start_lines is not None:
+                metadata['start_line'] = start_lines[i - first_chunk_id]
+            documents.append(Document(page_content=chunk, metadata=metadata))
 
         logger.debug(f'Number of documents to embed: {len(documents)}')
         return documents
 
     async def create_vector_store(
-        self, documents: List[Document], embedding_generator, ctx: Optional[Any] = None
+        self,
+        documents: List[Document],
+        embedding_pipeline: EmbeddingPipeline,
+        ctx: Optional[Any] = None,
     ) -> FAISS:
         """Create a FAISS vector store from documents.
 
         Args:
             documents: List of LangChain Document objects
-            embedding_generator: Embedding function to use
+            embedding_pipeline: Embedding pipeline to embed the documents with
             ctx: Context object for progress tracking (optional)
 
         Returns:
             FAISS vector store
         """
         logger.info('Creating FAISS index with LangChain')
-        if ctx:
-            await ctx.info('Creating FAISS index...')
-            await ctx.report_progress(70, 100)
-
-        logger.debug(f'Using embedding function: {embedding_generator}')
-
-        # Test the embedding function
-        try:
-            logger.info('Testing embedding function on sample document...')
-            test_content = documents[0].page_content if documents else 'Test content'
-            test_result = embedding_generator.embed_documents([test_content])
-            logger.info(
-                f'Test embedding successful - shape: {len(test_result)}x{len(test_result[0])}'
-            )
-        except Exception as e:
-            logger.error(f'Embedding function test failed: {e}')
-            raise
-
         if ctx:
             await ctx.info('Generating embeddings and creating vector store...')
-            await ctx.report_progress(75, 100)
+            await ctx.report_progress(70, 100)
 
         logger.debug(f'Number of documents: {len(documents)}')
 
         try:
-            vector_store = FAISS.from_documents(
-                documents=documents, embedding=embedding_generator, normalize_L2=True
+            embeddings = await self._embed_documents(documents, embedding_pipeline, ctx)
+            vector_store = build_vector_store(
+                documents, embeddings, embedding_pipeline.embedding_generator
             )
             logger.debug(
                 f'Created vector store with {get_docstore_dict_size(vector_store.docstore)} documents'
@@ -728,18 +1060,86 @@ class IndexBuilder:
             )
             raise
 
+    async def update_vector_store(
+        self,
+        vector_store: FAISS,
+        removed_sources: Set[str],
+        documents: List[Document],
+        embedding_pipeline: EmbeddingPipeline,
+        ctx: Optional[Any] = None,
+    ) -> int:
+        """Replace the chunks of changed files in an ID-mapped vector store.
+
+        Args:
+            vector_store: FAISS vector store backed by an `IndexIDMap`
+            removed_sources: Paths of the files whose existing chunks to remove
+            documents: LangChain Document objects to embed and add
+            embedding_pipeline: Embedding pipeline to embed the documents with
+            ctx: Context object for progress tracking (optional)
+
+        Returns:
+            Number of removed chunks
+        """
+        removed_count = remove_documents_by_source(vector_store, removed_sources)
+        logger.info(f'Removed {removed_count} chunks of changed and deleted files')
+
+        if documents:
+            if ctx:
+                await ctx.info(f'Generating embeddings for {len(documents)} chunks...')
+                await ctx.report_progress(70, 100)
+            embeddings = await self._embed_documents(documents, embedding_pipeline, ctx)
+            vectors = np.array(embeddings, dtype=np.float32)
+            faiss.normalize_L2(vectors)
+            add_documents_with_ids(vector_store, documents, vectors)
+
+        return removed_count
+
+    async def _embed_documents(
+        self,
+        documents: List[Document],
+        embedding_pipeline: EmbeddingPipeline,
+        ctx: Optional[Any] = None,
+    ) -> List[List[float]]:
+        async def report_progress(embedded: int, total: int):
+            if ctx:
+                await ctx.report_progress(70 + int(20 * embedded / total), 100)
+
+        return await embedding_pipeline.embed(
+            [doc.page_content for doc in documents], report_progress
+        )
+
     def save_index(self, vector_store: FAISS, index_path: str):
-        """Save FAISS index without using pickle.
+        """Save FAISS index and its keyword index without using pickle.
 
         Args:
             vector_store: FAISS vector store
             index_path: Path to save the index
         """
         save_index_without_pickle(vector_store, index_path)
+        update_keyword_index(vector_store, index_path).save(index_path)
+        INDEX_CACHE.invalidate(index_path)
 
 
 class FileManager:
-    """Handles file operations for indexing."""
+    """Handles file operations for indexing.
+
+    Repository files are copied into a content-addressed blob store and hard-linked
+    into the repository copies, so identical files are stored once across indices.
+    """
+
+    def __init__(self, blob_dir: Optional[str] = None):
+        """Initialize the file manager.
+
+        Args:
+            blob_dir: Directory of the blob store (optional, files are copied if not given)
+        """
+        self.blob_store = BlobStore(blob_dir) if blob_dir else None
+
+    def _place_file(self, source_file: str, target_file: str):
+        if self.blob_store is not None:
+            self.blob_store.link(source_file, target_file)
+        else:
+            shutil.copy2(source_file, target_file)
 
     async def copy_repository_files(
         self, repo_path: str, repo_files_path: str, ctx: Optional[Any] = None
@@ -780,22 +1180,62 @@ class FileManager:
                 source_file = os.path.join(root, file)
                 target_file = os.path.join(target_dir, file)
                 try:
-                    shutil.copy2(source_file, target_file)
+                    self._place_file(source_file, target_file)
                     copied_files += 1
                 except Exception as e:
                     logger.warning(f'Error copying file {source_file}: {e}')
 
         logger.info(f'Copied {copied_files} files to {repo_files_path}')
+        if self.blob_store is not None:
+            self.blob_store.prune()
         return copied_files
 
-    def save_chunk_map(self, chunk_map_data: Dict, index_path: str):
-        """Save chunk map without using pickle.
+    async def update_repository_files(
+        self,
+        repo_path: str,
+        repo_files_path: str,
+        changed_files: List[str],
+        deleted_files: List[str],
+        ctx: Optional[Any] = None,
+    ) -> int:
+        """Bring the copied repository files in line with a set of changes.
 
         Args:
-            chunk_map_data: Chunk map to save
-            index_path: Path to save the chunk map
+            repo_path: Source repository path
+            repo_files_path: Target path of the copied files
+            changed_files: Paths of added or modified files (relative to the repository)
+            deleted_files: Paths of deleted files (relative to the repository)
+            ctx: Context object for progress tracking (optional)
+
+        Returns:
+            Number of copied files
         """
-        save_chunk_map_without_pickle(chunk_map_data, index_path)
+        if not os.path.isdir(repo_files_path):
+            return await self.copy_repository_files(repo_path, repo_files_path, ctx)
+
+        for rel_path in deleted_files:
+            target_file = os.path.join(repo_files_path, rel_path)
+            if os.path.isfile(target_file):
+                os.remove(target_file)
+
+        copied_files = 0
+        for rel_path in changed_files:
+            source_file = os.path.join(repo_path, rel_path)
+            target_file = os.path.join(repo_files_path, rel_path)
+            try:
+                if os.path.isfile(source_file):
+                    os.makedirs(os.path.dirname(target_file), exist_ok=True)
+                    self._place_file(source_file, target_file)
+                    copied_files += 1
+                elif os.path.isfile(target_file):
+                    os.remove(target_file)
+            except Exception as e:
+                logger.warning(f'Error copying file {source_file}: {e}')
+
+        logger.info(f'Updated {copied_files} files in {repo_files_path}')
+        if self.blob_store is not None:
+            self.blob_store.prune()
+        return copied_files
 
 
 class MetadataManager:
@@ -832,14 +1272,19 @@ class MetadataManager:
             index_path=params['index_path'],
             created_at=datetime.now(),
             last_accessed=None,
-            file_count=len(set(params['chunk_to_file'].values())),
-            chunk_count=len(params['chunks']),
+            file_count=len(set(params['chunk_sources'])),
+            chunk_count=len(params['chunk_sources']),
             embedding_model=params['embedding_model'],
             file_types=params['extension_stats'],
             total_tokens=None,
             index_size_bytes=index_size,
             last_commit_id=params['last_commit_id'],
+            uncommitted_files=params.get('uncommitted_files', []),
             repository_directory=params['repo_files_path'],
+            include_patterns=params['config'].include_patterns,
+            exclude_patterns=params['config'].exclude_patterns,
+            chunk_size=params['config'].chunk_size,
+            chunk_overlap=params['config'].chunk_overlap,
         )
 
         # Save metadata
@@ -0,0 +1,255 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Keyword index for Git Repository Research MCP Server.
+
+This module provides an inverted index over the indexed chunks that ranks them
+with BM25, complementing the vector index for exact identifier and error string
+searches.
+"""
+
+import math
+import numpy as np
+import os
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Tuple
+
+
+KEYWORD_INDEX_FILE = 'keyword_index.npz'
+
+# BM25 parameters
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+_WORD_PATTERN = re.compile(r'[A-Za-z_][A-Za-z0-9_]*|[0-9]+')
+_SUBWORD_PATTERN = re.compile(r'[A-Z]+(?![a-z])|[A-Z]?[a-z]+|[0-9]+')
+
+
+def tokenize(text: str) -> List[str]:
+    """Split text into lowercase search terms.
+
+    Identifiers are kept whole and are also split into their snake_case and
+    camelCase parts, so that `getUserName` matches both `getusername` and `user`.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of terms, with repetitions
+    """
+    terms = []
+    for word in _WORD_PATTERN.findall(text):
+        terms.append(word.lower())
+        parts = _SUBWORD_PATTERN.findall(word)
+        if len(parts) > 1:
+            terms.extend(part.lower() for part in parts)
+    return terms
+
+
+class KeywordIndex:
+    """BM25 inverted index over the chunks of a repository.
+
+    Postings are stored as flat arrays in CSR layout: the postings of the term at
+    position `t` of the sorted vocabulary are `positions[offsets[t]:offsets[t + 1]]`
+    with their term frequencies in `frequencies`. Documents are addressed by the
+    same ids as the vectors of the FAISS index.
+    """
+
+    def __init__(
+        self,
+        terms: List[str],
+        offsets: np.ndarray,
+        positions: np.ndarray,
+        frequencies: np.ndarray,
+        doc_ids: np.ndarray,
+        doc_lengths: np.ndarray,
+    ):
+        """Initialize the keyword index from its arrays.
+
+        Args:
+            terms: Sorted vocabulary
+            offsets: Start of the postings of each term, followed by the total count
+            positions: Document position of each posting
+            frequencies: Term frequency of each posting
+            doc_ids: FAISS id of the document at each position
+            doc_lengths: Number of terms of the document at each position
+        """
+        self.terms = terms
+        self.offsets = offsets
+        self.positions = positions
+        self.frequencies = frequencies
+        self.doc_ids = doc_ids
+        self.doc_lengths = doc_lengths
+        self._term_ids = {term: i for i, term in enumerate(terms)}
+        self._avg_length = float(doc_lengths.mean()) if len(doc_lengths) else 0.0
+
+    @classmethod
+    def build(cls, documents: Iterable[Tuple[int, str]]) -> 'KeywordIndex':
+        """Build a keyword index.
+
+        Args:
+            documents: Pairs of a FAISS id and the text to index for it
+
+        Returns:
+            KeywordIndex over the documents
+        """
+        doc_ids = []
+        doc_lengths = []
+        postings: Dict[str, List[Tuple[int, int]]] = {}
+        for position, (doc_id, text) in enumerate(documents):
+            counts = Counter(tokenize(text))
+            doc_ids.append(doc_id)
+            doc_lengths.append(sum(counts.values()))
+            for term, count in counts.items():
+                postings.setdefault(term, []).append((position, count))
+
+        terms = sorted(postings)
+        offsets = np.zeros(len(terms) + 1, dtype=np.int64)
+        for i, term in enumerate(terms):
+            offsets[i + 1] = offsets[i] + len(postings[term])
+        flat = [posting for term in terms for posting in postings[term]]
+        return cls(
+            terms,
+            offsets,
+            np.array([position for position, _ in flat], dtype=np.int32),
+            np.minimum([count for _, count in flat], np.iinfo(np.uint16).max).astype(np.uint16),
+            np.array(doc_ids, dtype=np.int64),
+            np.array(doc_lengths, dtype=np.uint32),
+        )
+
+    def update(
+        self, removed_ids: Iterable[int], documents: Iterable[Tuple[int, str]]
+    ) -> 'KeywordIndex':
+        """Build a keyword index with documents removed and added.
+
+        Only the added documents are tokenized; the postings of the remaining
+        documents are carried over.
+
+        Args:
+            removed_ids: FAISS ids of the documents to remove
+            documents: Pairs of a FAISS id and the text to index for it
+
+        Returns:
+            KeywordIndex over the remaining and added documents
+        """
+        keep = ~np.isin(self.doc_ids, np.fromiter(removed_ids, dtype=np.int64))
+        new_positions = np.cumsum(keep) - 1
+        kept = keep[self.positions]
+        added = KeywordIndex.build(documents)
+
+        vocabulary = sorted(set(self.terms).union(added.terms))
+        term_ids = {term: i for i, term in enumerate(vocabulary)}
+        old_terms = np.array([term_ids[term] for term in self.terms], dtype=np.int64)
+        new_terms = np.array([term_ids[term] for term in added.terms], dtype=np.int64)
+        posting_terms = np.concatenate(
+            [
+                np.repeat(old_terms, np.diff(self.offsets))[kept],
+                np.repeat(new_terms, np.diff(added.offsets)),
+            ]
+        )
+        order = np.argsort(posting_terms, kind='stable')
+        counts = np.bincount(posting_terms, minlength=len(vocabulary))
+
+        # Terms that only occurred in removed documents are dropped
+        used = counts > 0
+        offsets = np.zeros(int(used.sum()) + 1, dtype=np.int64)
+        np.cumsum(counts[used], out=offsets[1:])
+        positions = np.concatenate(
+            [new_positions[self.positions[kept]], added.positions + int(keep.sum())]
+        )
+        frequencies = np.concatenate([self.frequencies[kept], added.frequencies])
+        return KeywordIndex(
+            [vocabulary[i] for i in np.flatnonzero(used)],
+            offsets,
+            positions[order].astype(np.int32),
+            frequencies[order].astype(np.uint16),
+            np.concatenate([self.doc_ids[keep], added.doc_ids]),
+            np.concatenate([self.doc_lengths[keep], added.doc_lengths]),
+        )
+
+    def search(self, query: str, k: int) -> List[Tuple[int, float]]:
+        """Rank documents against a query with BM25.
+
+        Args:
+            query: Query text
+            k: Maximum number of documents to return
+
+        Returns:
+            Pairs of a FAISS id and its BM25 score, best first
+        """
+        num_docs = len(self.doc_ids)
+        if num_docs == 0 or k <= 0:
+            return []
+
+        scores = np.zeros(num_docs, dtype=np.float32)
+        length_norm = BM25_K1 * (
+            1 - BM25_B + BM25_B * self.doc_lengths / max(self._avg_length, 1e-9)
+        )
+        for term in set(tokenize(query)):
+            term_id = self._term_ids.get(term)
+            if term_id is None:
+                continue
+            start, end = self.offsets[term_id], self.offsets[term_id + 1]
+            positions = self.positions[start:end]
+            frequencies = self.frequencies[start:end].astype(np.float32)
+            doc_freq = end - start
+            idf = math.log(1 + (num_docs - doc_freq + 0.5) / (doc_freq + 0.5))
+            scores[positions] += (
+                idf * frequencies * (BM25_K1 + 1) / (frequencies + length_norm[positions])
+            )
+
+        matched = np.flatnonzero(scores)
+        if len(matched) > k:
+            matched = matched[np.argpartition(-scores[matched], k - 1)[:k]]
+        matched = matched[np.argsort(-scores[matched], kind='stable')]
+        return [(int(self.doc_ids[i]), float(scores[i])) for i in matched]
+
+    def save(self, index_path: str):
+        """Save the keyword index to an index directory without using pickle.
+
+        Args:
+            index_path: Path to the index directory
+        """
+        vocabulary = '\n'.join(self.terms).encode('utf-8')
+        with open(os.path.join(index_path, KEYWORD_INDEX_FILE), 'wb') as f:
+            np.savez(
+                f,
+                vocabulary=np.frombuffer(vocabulary, dtype=np.uint8),
+                offsets=self.offsets,
+                positions=self.positions,
+                frequencies=self.frequencies,
+                doc_ids=self.doc_ids,
+                doc_lengths=self.doc_lengths,
+            )
+
+    @classmethod
+    def load(cls, index_path: str) -> 'KeywordIndex':
+        """Load a keyword index from an index directory.
+
+        Args:
+            index_path: Path to the index directory
+
+        Returns:
+            The loaded KeywordIndex
+        """
+        with np.load(os.path.join(index_path, KEYWORD_INDEX_FILE), allow_pickle=False) as data:
+            vocabulary = data['vocabulary'].tobytes().decode('utf-8')
+            return cls(
+                vocabulary.split('\n') if vocabulary else [],
+                data['offsets'],
+                data['positions'],
+                data['frequencies'],
+                data['doc_ids'],
+                data['doc_lengths'],
+            )
@@ -57,9 +57,25 @@ class IndexMetadata(BaseModel):
     last_commit_id: Optional[str] = Field(
         None, description='ID of the last commit in the repository'
     )
+    uncommitted_files: List[str] = Field(
+        default_factory=list,
+        description='Files that differed from the last commit when the index was built',
+    )
     repository_directory: Optional[str] = Field(
         None, description='Path to the cloned repository directory'
     )
+    include_patterns: Optional[List[str]] = Field(
+        default=None, description='Glob patterns of the files included in the index'
+    )
+    exclude_patterns: Optional[List[str]] = Field(
+        default=None, description='Glob patterns of the files excluded from the index'
+    )
+    chunk_size: Optional[int] = Field(
+        default=None, description='Maximum size of each chunk in characters'
+    )
+    chunk_overlap: Optional[int] = Field(
+        default=None, description='Overlap between chunks in characters'
+    )
 
 
 class SearchResult(BaseModel):
@@ -71,8 +87,12 @@ class SearchResult(BaseModel):
 
     file_path: str = Field(..., description='Path to the file within the repository')
     content: str = Field(..., description='Relevant content snippet')
-    score: float = Field(..., description='Similarity score (0-1)')
-    line_numbers: Optional[List[int]] = Field(None, description='Line numbers for the content')
+    score: float = Field(
+        ..., description='Relevance score (0-1) combining vector similarity and keyword match'
+    )
+    line_numbers: Optional[List[int]] = Field(
+        None, description='First and last line number of the content in the file'
+    )
     metadata: Optional[Dict[str, str]] = Field(
         None, description='Additional metadata about the result'
     )
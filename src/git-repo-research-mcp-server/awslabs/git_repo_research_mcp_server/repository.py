@@ -18,16 +18,27 @@ Git repositories for indexing and searching.
 """
 
 import fnmatch
+import functools
+import itertools
+import multiprocessing
 import os
+import re
 import shutil
 import tempfile
 from awslabs.git_repo_research_mcp_server.defaults import Constants
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from git import Repo
 from loguru import logger
-from typing import Dict, List, Optional, Tuple
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 
+# Files are chunked in batches of up to this many bytes or files per worker task
+FILE_BATCH_BYTES = 4 * 1024 * 1024
+FILE_BATCH_FILES = 256
+
+
 def is_git_url(repo_path: str) -> bool:
     """Check if a string is a Git URL.
 
@@ -133,6 +144,126 @@ def get_repository_name(repo_path: str) -> str:
         return os.path.basename(os.path.abspath(repo_path))
 
 
+@functools.lru_cache(maxsize=32)
+def compile_patterns(patterns: Tuple[str, ...]) -> Optional[re.Pattern]:
+    """Compile glob patterns into a single regular expression.
+
+    Args:
+        patterns: Glob patterns, matched with the same semantics as `fnmatch.fnmatch`
+
+    Returns:
+        Compiled regular expression matching any of the patterns, or None if there are
+        no patterns
+    """
+    if not patterns:
+        return None
+    return re.compile(
+        '|'.join(f'(?:{fnmatch.translate(os.path.normcase(pattern))})' for pattern in patterns)
+    )
+
+
+class PathMatcher:
+    """Precompiled include and exclude patterns for repository paths.
+
+    Besides matching files, the matcher recognizes directories whose files are all
+    excluded, so that walking the repository can skip them entirely. An exclude
+    pattern of the form `<dir>/*` or `<dir>/**` excludes every file below a directory
+    matching `<dir>`, because `*` also matches path separators.
+    """
+
+    def __init__(self, include_patterns: List[str], exclude_patterns: List[str]):
+        """Initialize the matcher.
+
+        Args:
+            include_patterns: Glob patterns for files to include
+            exclude_patterns: Glob patterns for files to exclude
+        """
+        self._include = compile_patterns(tuple(include_patterns))
+        self._exclude = compile_patterns(tuple(exclude_patterns))
+        self._excluded_dirs = compile_patterns(
+            tuple(
+                match.group(1)
+                for match in (re.fullmatch(r'(.+)/\*+', pattern) for pattern in exclude_patterns)
+                if match
+            )
+        )
+
+    def matches(self, rel_path: str) -> bool:
+        """Check if a file matches any include pattern and no exclude pattern.
+
+        Args:
+            rel_path: Path relative to the repository root
+
+        Returns:
+            True if the file should be indexed, False otherwise
+        """
+        rel_path = os.path.normcase(rel_path)
+        if self._include is None or not self._include.match(rel_path):
+            return False
+        return self._exclude is None or not self._exclude.match(rel_path)
+
+    def is_excluded_dir(self, rel_dir: str) -> bool:
+        """Check if every file below a directory is excluded.
+
+        Args:
+            rel_dir: Directory path relative to the repository root
+
+        Returns:
+            True if the directory does not need to be walked, False otherwise
+        """
+        return self._excluded_dirs is not None and bool(
+            self._excluded_dirs.match(os.path.normcase(rel_dir))
+        )
+
+
+def get_path_matcher(
+    include_patterns: Optional[List[str]] = None,
+    exclude_patterns: Optional[List[str]] = None,
+) -> PathMatcher:
+    """Create a path matcher, defaulting to the text file patterns.
+
+    Args:
+        include_patterns: Glob patterns for files to include (optional)
+        exclude_patterns: Glob patterns for files to exclude (optional)
+
+    Returns:
+        PathMatcher for the patterns
+    """
+    if include_patterns is None:
+        include_patterns = Constants.TEXT_FILE_INCLUDE_PATTERNS
+    if exclude_patterns is None:
+        exclude_patterns = Constants.TEXT_FILE_EXCLUDE_PATTERNS
+    return PathMatcher(include_patterns, exclude_patterns)
+
+
+def iter_matching_files(
+    repo_path: str,
+    include_patterns: Optional[List[str]] = None,
+    exclude_patterns: Optional[List[str]] = None,
+) -> Iterator[str]:
+    """Walk a repository and yield the files matching the patterns.
+
+    Directories whose files are all excluded are not descended into. Files are
+    yielded in a stable order, without checking whether they are text files.
+
+    Args:
+        repo_path: Path to the repository
+        include_patterns: Glob patterns for files to include (optional)
+        exclude_patterns: Glob patterns for files to exclude (optional)
+
+    Returns:
+        Iterator over the paths of the matching files
+    """
+    matcher = get_path_matcher(include_patterns, exclude_patterns)
+    for root, dirs, files in os.walk(repo_path):
+        rel_root = os.path.relpath(root, repo_path)
+        rel_root = '' if rel_root == os.curdir else rel_root
+        dirs[:] = sorted(d for d in dirs if not matcher.is_excluded_dir(os.path.join(rel_root, d)))
+        for file in sorted(files):
+            if matcher.matches(os.path.join(rel_root, file)):
+                yield os.path.join(root, file)
+
+
 def get_text_files(
     repo_path: str,
     include_patterns: Optional[List[str]] = None,
@@ -148,42 +279,128 @@ def get_text_files(
     Returns:
         List of paths to text files
     """
-    if include_patterns is None:
-        include_patterns = Constants.TEXT_FILE_INCLUDE_PATTERNS
-    if exclude_patterns is None:
-        exclude_patterns = Constants.TEXT_FILE_EXCLUDE_PATTERNS
+    return [
+        file_path
+        for file_path in iter_matching_files(repo_path, include_patterns, exclude_patterns)
+        if is_text_file(file_path)
+    ]
 
-    text_files = []
-    for root, _, files in os.walk(repo_path):
-        for file in files:
-            file_path = os.path.join(root, file)
-            rel_path = os.path.relpath(file_path, repo_path)
-
-            # Check if the file matches any include pattern
-            included = any(fnmatch.fnmatch(rel_path, pattern) for pattern in include_patterns)
-            if not included:
-                continue
-
-            # Check if the file matches any exclude pattern
-            excluded = any(fnmatch.fnmatch(rel_path, pattern) for pattern in exclude_patterns)
-            if excluded:
-                continue
-
-            # Try to read the file as text
-            try:
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    # Read a small sample to check if it's text
-                    sample = f.read(1024)
-                    # If we can decode it as UTF-8, it's probably text
-                    if sample:
-                        text_files.append(file_path)
-            except UnicodeDecodeError:
-                # Not a text file
-                pass
-            except Exception as e:
-                logger.warning(f'Error reading file {file_path}: {e}')
-
-    return text_files
+
+def matches_patterns(
+    rel_path: str, include_patterns: List[str], exclude_patterns: List[str]
+) -> bool:
+    """Check if a path matches any include pattern and no exclude pattern.
+
+    Args:
+        rel_path: Path relative to the repository root
+        include_patterns: Glob patterns for files to include
+        exclude_patterns: Glob patterns for files to exclude
+
+    Returns:
+        True if the file should be indexed, False otherwise
+    """
+    return PathMatcher(include_patterns, exclude_patterns).matches(rel_path)
+
+
+def is_text_file(file_path: str) -> bool:
+    """Check if a file is a non-empty UTF-8 text file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        True if the file can be read as text, False otherwise
+    """
+    # Try to read the file as text
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            # Read a small sample to check if it's text
+            sample = f.read(1024)
+            # If we can decode it as UTF-8, it's probably text
+            return bool(sample)
+    except UnicodeDecodeError:
+        # Not a text file
+        return False
+    except Exception as e:
+        logger.warning(f'Error reading file {file_path}: {e}')
+        return False
+
+
+def read_text_file(file_path: str) -> Optional[str]:
+    """Read a file if it is a non-empty UTF-8 text file.
+
+    Args:
+        file_path: Path to the file
+
+    Returns:
+        Content of the file, or None if it is empty, not UTF-8 text or unreadable
+    """
+    try:
+        with open(file_path, 'r', encoding='utf-8') as f:
+            return f.read() or None
+    except UnicodeDecodeError:
+        return None
+    except Exception as e:
+        logger.warning(f'Error reading file {file_path}: {e}')
+        return None
+
+
+def get_changed_files(repo_path: str, since_commit: str) -> Optional[Tuple[List[str], List[str]]]:
+    """Get the files that changed between a commit and the working tree.
+
+    Changes that are not committed yet and untracked files are included, so a local
+    repository is compared as it is on disk rather than as of its HEAD commit.
+
+    Args:
+        repo_path: Path to the repository
+        since_commit: ID of the commit to compare the working tree against
+
+    Returns:
+        Tuple containing:
+        - Paths of files added or modified since the commit (relative to the repository)
+        - Paths of files deleted since the commit (relative to the repository)
+        or None if the commit cannot be found in the repository
+    """
+    try:
+        repo = Repo(repo_path)
+        # Diffing against None compares the commit with the working tree
+        diffs = repo.commit(since_commit).diff(None)
+        untracked_files = repo.untracked_files
+    except Exception as e:
+        logger.warning(f'Cannot compare commit {since_commit} with the working tree: {e}')
+        return None
+
+    changed_files = set(untracked_files)
+    deleted_files = set()
+    for diff in diffs:
+        if diff.change_type == 'D':
+            deleted_files.add(diff.a_path)
+        elif diff.change_type == 'R':
+            deleted_files.add(diff.a_path)
+            changed_files.add(diff.b_path)
+        else:
+            changed_files.add(diff.b_path)
+
+    return sorted(changed_files), sorted(deleted_files - changed_files)
+
+
+def get_uncommitted_files(repo_path: str) -> List[str]:
+    """Get the files whose content in the working tree differs from the HEAD commit.
+
+    Args:
+        repo_path: Path to the repository
+
+    Returns:
+        Paths of modified, deleted and untracked files (relative to the repository), or
+        an empty list if the path is not a Git repository with commits
+    """
+    if not is_git_repo(repo_path):
+        return []
+    changes = get_changed_files(repo_path, 'HEAD')
+    if changes is None:
+        return []
+    changed_files, deleted_files = changes
+    return sorted(set(changed_files) | set(deleted_files))
 
 
 def get_file_extension_stats(file_paths: List[str]) -> Dict[str, int]:
@@ -262,13 +479,36 @@ def chunk_text(text: str, chunk_size: int = 1000, chunk_overlap: int = 200) -> L
     return chunks
 
 
+def chunk_start_lines(text: str, chunks: List[str]) -> List[int]:
+    """Find the line on which each chunk of a text starts.
+
+    Args:
+        text: Text that was split
+        chunks: Chunks of the text, in order, as returned by `chunk_text`
+
+    Returns:
+        1-based line number of the first line of each chunk
+    """
+    start_lines = []
+    offset = 0
+    line = 1
+    for chunk in chunks:
+        found = text.find(chunk, offset)
+        if found == -1:
+            found = offset
+        line += text.count('\n', offset, found)
+        start_lines.append(line)
+        offset = found
+    return start_lines
+
+
 def process_repository(
     repo_path: str,
     include_patterns: Optional[List[str]] = None,
     exclude_patterns: Optional[List[str]] = None,
     chunk_size: int = 1000,
     chunk_overlap: int = 200,
-) -> Tuple[List[str], Dict[str, str], Dict[str, int]]:
+) -> Tuple[List[str], List[str], Dict[str, int], List[int]]:
     """Process a repository for indexing.
 
     Args:
@@ -281,33 +521,158 @@ def process_repository(
     Returns:
         Tuple containing:
         - List of text chunks
-        - Dictionary mapping chunks to file paths
+        - List of the file path of each chunk
         - Dictionary of file extension statistics
+        - List of the line each chunk starts on in its file
     """
     logger.info(f'Processing repository at {repo_path}')
-    text_files = get_text_files(repo_path, include_patterns, exclude_patterns)
+    text_files = []
+    chunks = []
+    chunk_sources = []
+    start_lines = []
+
+    file_paths = iter_matching_files(repo_path, include_patterns, exclude_patterns)
+    for rel_path, file_chunks, file_start_lines in iter_file_chunks(
+        repo_path, file_paths, chunk_size, chunk_overlap
+    ):
+        text_files.append(rel_path)
+        chunks.extend(file_chunks)
+        chunk_sources.extend([rel_path] * len(file_chunks))
+        start_lines.extend(file_start_lines)
     logger.info(f'Found {len(text_files)} text files')
 
     extension_stats = get_file_extension_stats(text_files)
     logger.info(f'File extension statistics: {extension_stats}')
 
+    logger.info(f'Created {len(chunks)} text chunks')
+    return chunks, chunk_sources, extension_stats, start_lines
+
+
+def chunk_files(
+    repo_path: str,
+    file_paths: List[str],
+    chunk_size: int = 1000,
+    chunk_overlap: int = 200,
+) -> Tuple[List[str], List[str], List[int]]:
+    """Read and chunk a list of files.
+
+    Args:
+        repo_path: Path to the repository
+        file_paths: Paths of the files to chunk
+        chunk_size: Maximum size of each chunk in characters
+        chunk_overlap: Overlap between chunks in characters
+
+    Returns:
+        Tuple containing:
+        - List of text chunks
+        - List of the file path of each chunk, relative to the repository
+        - List of the line each chunk starts on in its file
+    """
     chunks = []
-    chunk_to_file = {}
+    chunk_sources = []
+    start_lines = []
 
-    for file_path in text_files:
-        try:
-            content = read_file_content(file_path)
-            file_chunks = chunk_text(content, chunk_size, chunk_overlap)
+    for rel_path, file_chunks, file_start_lines in iter_file_chunks(
+        repo_path, file_paths, chunk_size, chunk_overlap
+    ):
+        chunks.extend(file_chunks)
+        chunk_sources.extend([rel_path] * len(file_chunks))
+        start_lines.extend(file_start_lines)
 
-            rel_path = os.path.relpath(file_path, repo_path)
-            for chunk in file_chunks:
-                chunks.append(chunk)
-                chunk_to_file[chunk] = rel_path
-        except Exception as e:
-            logger.warning(f'Error processing file {file_path}: {e}')
+    return chunks, chunk_sources, start_lines
 
-    logger.info(f'Created {len(chunks)} text chunks')
-    return chunks, chunk_to_file, extension_stats
+
+def iter_file_chunks(
+    repo_path: str,
+    file_paths: Iterable[str],
+    chunk_size: int = 1000,
+    chunk_overlap: int = 200,
+    max_workers: Optional[int] = None,
+) -> Iterator[Tuple[str, List[str], List[int]]]:
+    """Read and chunk files, yielding the chunks of each text file in order.
+
+    Each file is read once. Files are grouped into batches that are chunked on a pool
+    of worker processes; only a bounded number of batches is in flight at a time, so
+    memory use does not grow with the size of the repository. Small sets of files
+    that fit in a single batch are chunked in the calling process.
+
+    Args:
+        repo_path: Path to the repository
+        file_paths: Paths of the files to chunk
+        chunk_size: Maximum size of each chunk in characters
+        chunk_overlap: Overlap between chunks in characters
+        max_workers: Number of worker processes (defaults to Constants.CHUNK_WORKERS)
+
+    Returns:
+        Iterator over a file path relative to the repository, its chunks and the line
+        each chunk starts on; files that are empty or not UTF-8 text are skipped
+    """
+    workers = Constants.CHUNK_WORKERS if max_workers is None else max_workers
+    batches = _batch_files(file_paths)
+    head = list(itertools.islice(batches, 2))
+
+    executor = None
+    if workers > 1 and len(head) > 1:
+        try:
+            # Worker processes are spawned rather than forked, as forking a process
+            # running an event loop and other threads is unsafe.
+            executor = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context('spawn')
+            )
+        except (OSError, NotImplementedError) as e:
+            logger.warning(f'Cannot start chunking workers, chunking in process: {e}')
+
+    if executor is None:
+        for batch in itertools.chain(head, batches):
+            yield from _chunk_file_batch(repo_path, batch, chunk_size, chunk_overlap)
+        return
+
+    with executor:
+        pending: Deque[Future] = deque()
+        try:
+            for batch in itertools.chain(head, batches):
+                pending.append(
+                    executor.submit(_chunk_file_batch, repo_path, batch, chunk_size, chunk_overlap)
+                )
+                if len(pending) >= 2 * workers:
+                    yield from pending.popleft().result()
+            while pending:
+                yield from pending.popleft().result()
+        finally:
+            for future in pending:
+                future.cancel()
+
+
+def _batch_files(file_paths: Iterable[str]) -> Iterator[List[str]]:
+    batch = []
+    batch_bytes = 0
+    for file_path in file_paths:
+        try:
+            size = os.path.getsize(file_path)
+        except OSError:
+            size = 0
+        if batch and (batch_bytes + size > FILE_BATCH_BYTES or len(batch) >= FILE_BATCH_FILES):
+            yield batch
+            batch = []
+            batch_bytes = 0
+        batch.append(file_path)
+        batch_bytes += size
+    if batch:
+        yield batch
+
+
+def _chunk_file_batch(
+    repo_path: str, file_paths: List[str], chunk_size: int, chunk_overlap: int
+) -> List[Tuple[str, List[str], List[int]]]:
+    results = []
+    for file_path in file_paths:
+        content = read_text_file(file_path)
+        if content is None:
+            continue
+        rel_path = os.path.relpath(file_path, repo_path)
+        chunks = chunk_text(content, chunk_size, chunk_overlap)
+        results.append((rel_path, chunks, chunk_start_lines(content, chunks)))
+    return results
 
 
 def cleanup_repository(repo_path: str) -> None:
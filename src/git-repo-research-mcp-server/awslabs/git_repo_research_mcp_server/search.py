@@ -17,28 +17,62 @@ This module provides functionality for searching within indexed Git repositories
 using LangChain's FAISS implementation.
 """
 
+import faiss
+import numpy as np
 import os
 import time
 from awslabs.git_repo_research_mcp_server.defaults import Constants
 from awslabs.git_repo_research_mcp_server.embeddings import get_embedding_model
 from awslabs.git_repo_research_mcp_server.indexer import (
     IndexConfig,
+    get_docstore_dict,
     get_docstore_dict_size,
     get_repository_indexer,
 )
+from awslabs.git_repo_research_mcp_server.keyword_index import KeywordIndex
 from awslabs.git_repo_research_mcp_server.models import (
     EmbeddingModel,
     SearchResponse,
     SearchResult,
 )
+from langchain_community.vectorstores import FAISS
 from loguru import logger
-from typing import Optional
+from typing import List, Optional
+
+
+# Number of candidates taken from each of the vector and keyword rankings per result
+CANDIDATE_MULTIPLIER = 5
+MIN_CANDIDATES = 50
+
+
+def _cosine_similarity(
+    index: faiss.Index, query: np.ndarray, faiss_id: int, distance: float
+) -> float:
+    """Compute the cosine similarity of a unit query vector and a stored vector.
+
+    Args:
+        index: FAISS index holding the vector
+        query: Unit-length query vector
+        faiss_id: ID of the stored vector
+        distance: Squared L2 distance of the two vectors, used if the index cannot
+            reconstruct its vectors
+
+    Returns:
+        Cosine similarity of the two vectors
+    """
+    try:
+        vector = index.reconstruct(faiss_id)
+    except RuntimeError:
+        return 1.0 - distance / 2.0
+    norm = float(np.linalg.norm(vector))
+    return float(np.dot(query, vector)) / norm if norm else 0.0
 
 
 class RepositorySearcher:
     """Searcher for indexed Git repositories using LangChain.
 
-    This class provides methods for searching within indexed Git repositories.
+    This class provides methods for searching within indexed Git repositories,
+    combining vector similarity with BM25 keyword matching.
     """
 
     def __init__(
@@ -177,6 +211,106 @@ class RepositorySearcher:
 
         return tree
 
+    def _hybrid_search(
+        self,
+        vector_store: FAISS,
+        keyword_index: Optional[KeywordIndex],
+        query: str,
+        limit: int,
+        threshold: float,
+    ) -> List[SearchResult]:
+        """Rank chunks by a fusion of vector similarity and BM25 keyword scores.
+
+        The best chunks by cosine similarity and by BM25 are merged into one candidate
+        set. Each candidate is scored with a weighted sum of its cosine similarity and
+        its BM25 score relative to the best keyword match, both in the range 0-1.
+
+        Args:
+            vector_store: FAISS vector store of the repository
+            keyword_index: Keyword index of the repository (optional, vector search only
+                if not provided)
+            query: Search query text
+            limit: Maximum number of results to return
+            threshold: Minimum score of returned results (0.0-1.0)
+
+        Returns:
+            List of search results, best first
+        """
+        index = vector_store.index
+        num_candidates = min(max(limit * CANDIDATE_MULTIPLIER, MIN_CANDIDATES), index.ntotal)
+        if limit <= 0 or num_candidates <= 0:
+            return []
+
+        embedding = np.array(
+            [vector_store.embedding_function.embed_query(query)], dtype=np.float32
+        )
+        faiss.normalize_L2(embedding)
+
+        distances, ids = index.search(embedding, num_candidates)
+        vector_scores = {int(i): float(d) for d, i in zip(distances[0], ids[0]) if i != -1}
+
+        keyword_scores = dict(keyword_index.search(query, num_candidates)) if keyword_index else {}
+        missing = [i for i in keyword_scores if i not in vector_scores]
+        if missing:
+            # Score keyword matches that were not among the nearest vectors
+            selector = faiss.IDSelectorBatch(np.array(missing, dtype=np.int64))
+            distances, ids = index.search(
+                embedding, len(missing), params=faiss.SearchParameters(sel=selector)
+            )
+            vector_scores.update(
+                (int(i), float(d)) for d, i in zip(distances[0], ids[0]) if i != -1
+            )
+
+        # Indices built by this server hold unit vectors in an IndexIDMap. Legacy indices
+        # may hold vectors that are not unit-length, so their cosine similarities are
+        # computed from the stored vectors instead of being derived from the distance.
+        unit_vectors = isinstance(index, faiss.IndexIDMap)
+
+        best_keyword_score = max(keyword_scores.values(), default=0.0)
+        keyword_weight = Constants.SEARCH_KEYWORD_WEIGHT if best_keyword_score > 0 else 0.0
+        docstore_dict = get_docstore_dict(vector_store.docstore)
+
+        ranked = []
+        for faiss_id, distance in vector_scores.items():
+            doc = docstore_dict.get(vector_store.index_to_docstore_id.get(faiss_id))
+            if doc is None:
+                continue
+            if unit_vectors:
+                # Squared L2 distance between unit vectors is 2 - 2 * cosine similarity
+                vector_score = 1.0 - distance / 2.0
+            else:
+                vector_score = _cosine_similarity(index, embedding[0], faiss_id, distance)
+            vector_score = min(1.0, max(0.0, vector_score))
+            keyword_score = keyword_scores.get(faiss_id, 0.0)
+            score = (1 - keyword_weight) * vector_score + keyword_weight * (
+                keyword_score / best_keyword_score if best_keyword_score else 0.0
+            )
+            if score >= threshold:
+                ranked.append((score, vector_score, keyword_score, doc))
+
+        ranked.sort(key=lambda item: item[0], reverse=True)
+        results = []
+        for score, vector_score, keyword_score, doc in ranked[:limit]:
+            start_line = doc.metadata.get('start_line')
+            line_numbers = None
+            if start_line is not None:
+                line_numbers = [start_line, start_line + doc.page_content.rstrip('\n').count('\n')]
+            results.append(
+                SearchResult(
+                    file_path=doc.metadata.get('source', 'unknown'),
+                    content=doc.page_content,
+                    score=score,
+                    line_numbers=line_numbers,
+                    metadata={
+                        'chunk_id': str(doc.metadata.get('chunk_id', -1)),
+                        'vector_score': f'{vector_score:.4f}',
+                        'keyword_score': f'{keyword_score:.4f}',
+                    },
+                )
+            )
+        logger.info(f'Found {len(results)} results above threshold {threshold}')
+        return results
+
     def search(
         self,
         index_path: str,
@@ -184,13 +318,13 @@ class RepositorySearcher:
         limit: int = 10,
         threshold: float = 0.0,
     ) -> SearchResponse:
-        """Search within an indexed repository using LangChain's FAISS implementation.
+        """Search within an indexed repository with hybrid vector and keyword ranking.
 
         Args:
             index_path: Path to the index file or repository name
             query: Search query text
             limit: Maximum number of results to return
-            threshold: Similarity threshold for results (0.0-1.0)
+            threshold: Minimum score of returned results (0.0-1.0)
 
         Returns:
             SearchResponse object with search results
@@ -228,70 +362,17 @@ class RepositorySearcher:
                     execution_time_ms=int((time.time() - start_time) * 1000),
                 )
 
-            # Use LangChain's similarity search
             logger.info(f"Searching for '{query}' in repository {repository_name}")
-
-            # Debug: Print vector store info
-            logger.info(f'Vector store type: {type(vector_store)}')
             logger.info(
                 f'Vector store docstore size: {get_docstore_dict_size(vector_store.docstore)}'
             )
 
-            # Use the same approach as in the test script
             try:
-                # Use similarity_search directly
-                langchain_results = vector_store.similarity_search(query, k=limit)
-
-                # Process the results
-                results = []
-                if langchain_results:
-                    logger.info(f'Found {len(langchain_results)} results')
-                    for doc in langchain_results:
-                        # Get file path from document metadata
-                        file_path = doc.metadata.get('source', 'unknown')
-
-                        # Create a search result
-                        result = SearchResult(
-                            file_path=file_path,
-                            content=doc.page_content,
-                            score=1.0,  # Default score since we're not using similarity_search_with_score
-                            line_numbers=None,  # We don't track line numbers currently
-                            metadata={'chunk_id': str(doc.metadata.get('chunk_id', -1))},
-                        )
-                        results.append(result)
-                else:
-                    logger.info('No results found')
+                keyword_index = self.repository_indexer.load_keyword_index(index_path)
+                results = self._hybrid_search(vector_store, keyword_index, query, limit, threshold)
             except Exception as e:
-                logger.error(f'Error with similarity_search: {e}')
-                # Try with similarity_search_with_score as a fallback
-                try:
-                    logger.info('Trying with similarity_search_with_score as fallback')
-                    langchain_results = vector_store.similarity_search_with_score(query, k=limit)
-
-                    # Process the results
-                    results = []
-                    for doc, score in langchain_results:
-                        # Get file path from document metadata
-                        file_path = doc.metadata.get('source', 'unknown')
-
-                        # Convert score to similarity (0-1 range)
-                        similarity = 1.0 - min(1.0, score / 2.0)
-
-                        # Create a search result
-                        result = SearchResult(
-                            file_path=file_path,
-                            content=doc.page_content,
-                            score=float(similarity),
-                            line_numbers=None,  # We don't track line numbers currently
-                            metadata={
-                                'distance': str(float(score)),
-                                'chunk_id': str(doc.metadata.get('chunk_id', -1)),
-                            },
-                        )
-                        results.append(result)
-                except Exception as e:
-                    logger.error(f'Error with similarity_search_with_score fallback: {e}')
-                    results = []
+                logger.error(f'Error with hybrid search: {e}')
+                results = []
 
             execution_time_ms = int((time.time() - start_time) * 1000)
             logger.info(f'Search completed in {execution_time_ms}ms, found {len(results)} results')
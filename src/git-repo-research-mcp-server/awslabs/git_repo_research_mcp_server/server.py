@@ -601,21 +601,25 @@ async def access_file_or_directory(filepath: str) -> Union[str, List[str], Image
 async def mcp_search_repository(
     ctx: Context,
     index_path: str = Field(description='Name of the repository or path to the index to search'),
-    query: str = Field(description='The search query to use for semantic search'),
+    query: str = Field(
+        description='The search query; natural language, identifiers or error strings'
+    ),
     limit: int = Field(default=10, description='Maximum number of results to return'),
     threshold: float = Field(
         default=0.0, description='Minimum similarity score threshold (0.0 to 1.0)'
     ),
 ) -> Dict:
-    """Perform semantic search within an indexed repository.
+    """Perform hybrid semantic and keyword search within an indexed repository.
 
-    This tool searches an indexed repository using semantic search with Amazon Bedrock embeddings.
-    It returns results ranked by relevance to the query.
+    This tool searches an indexed repository using semantic search with Amazon Bedrock embeddings
+    combined with BM25 keyword matching, so exact identifiers and error strings are found too.
+    It returns results ranked by a relevance score between 0 and 1, with the line numbers of
+    each result in its file.
 
     Args:
         ctx: MCP context object used for error reporting
         index_path: Name of the repository or path to the index to search
-        query: The search query to use for semantic search
+        query: The search query; natural language, identifiers or error strings
         limit: Maximum number of results to return
         threshold: Minimum similarity score threshold (0.0 to 1.0)
 
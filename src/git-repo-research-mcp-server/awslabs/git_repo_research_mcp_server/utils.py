@@ -19,7 +19,9 @@ This module provides utility functions for the Git Repository Research MCP Serve
 import json
 import os
 import shutil
+from awslabs.git_repo_research_mcp_server.blob_store import BLOB_DIR, BlobStore
 from awslabs.git_repo_research_mcp_server.defaults import Constants
+from awslabs.git_repo_research_mcp_server.index_cache import INDEX_CACHE
 from awslabs.git_repo_research_mcp_server.models import (
     DetailedIndexedRepositoriesResponse,
     DetailedIndexedRepositoryInfo,
@@ -300,6 +302,9 @@ async def delete_indexed_repository(
             'permission_issues': permission_issues,
         }
 
+    # Release the loaded index before its files go away
+    INDEX_CACHE.invalidate(index_path)
+
     # Delete the files
     deleted_files = []
     errors = []
@@ -368,6 +373,9 @@ async def delete_indexed_repository(
                 errors.append(f'Failed to delete index directory {index_path}: {str(e)}')
                 logger.error(f'Error deleting index directory {index_path}: {e}')
 
+    # Drop the file contents no other repository copy shares
+    BlobStore(os.path.join(index_dir, BLOB_DIR)).prune()
+
     # Return appropriate response based on results
     if not errors:
         return {
@@ -0,0 +1,219 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the chunk store and blob store of Git Repository Research MCP Server."""
+
+import json
+import os
+import pytest
+from awslabs.git_repo_research_mcp_server.blob_store import BlobStore
+from awslabs.git_repo_research_mcp_server.chunk_store import (
+    CHUNK_STORE_FILE,
+    ChunkDocuments,
+    ChunkStore,
+)
+from awslabs.git_repo_research_mcp_server.indexer import (
+    build_vector_store,
+    get_docstore_dict,
+    read_index_without_pickle,
+    save_index_without_pickle,
+)
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from unittest.mock import patch
+
+
+def _document(store, chunk_id):
+    position = store.position(chunk_id)
+    assert position is not None
+    return store.document(position)
+
+
+def _documents():
+    return [
+        (7, Document(page_content='déf handler():\n    pass\n' * 5, metadata={'source': 'a.py'})),
+        (3, Document(page_content='# Title\n', metadata={'source': 'README.md', 'start_line': 1})),
+        (5, Document(page_content='', metadata={'source': 'a.py', 'start_line': 12})),
+        (9, Document(page_content='# Title\n', metadata={'source': 'docs/b.md'})),
+    ]
+
+
+@pytest.fixture
+def small_blocks():
+    """Split the chunk text into blocks of a few bytes so chunks span blocks."""
+    with patch('awslabs.git_repo_research_mcp_server.chunk_store.CHUNK_BLOCK_SIZE', 16):
+        yield
+
+
+def test_chunks_are_addressed_by_id(tmp_path, small_blocks):
+    """Test that chunks round-trip through a saved store and are looked up by id."""
+    ChunkStore.build(_documents()).save(str(tmp_path))
+    store = ChunkStore.load(str(tmp_path))
+
+    assert store.chunk_ids.tolist() == [3, 5, 7, 9]
+    assert store.sources == ['README.md', 'a.py', 'docs/b.md']
+    assert store.position(4) is None
+    for chunk_id, doc in _documents():
+        loaded = _document(store, chunk_id)
+        assert loaded.page_content == doc.page_content
+        assert loaded.metadata == {**doc.metadata, 'chunk_id': chunk_id}
+
+
+def test_identical_chunks_keep_their_sources():
+    """Test that identical chunks of different files are stored separately."""
+    store = ChunkStore.build(_documents())
+
+    assert _document(store, 3).metadata['source'] == 'README.md'
+    assert _document(store, 9).metadata['source'] == 'docs/b.md'
+
+
+def test_chunk_documents_track_changes():
+    """Test that documents added and removed after loading shadow the store."""
+    documents = ChunkDocuments(ChunkStore.build(_documents()))
+    replacement = Document(page_content='new', metadata={'source': 'c.py', 'chunk_id': 3})
+
+    del documents['5']
+    documents['3'] = replacement
+    documents['11'] = replacement
+
+    assert '5' not in documents
+    assert documents['3'] is replacement
+    assert sorted(documents, key=int) == ['3', '7', '9', '11']
+    assert len(documents) == 4
+    with pytest.raises(KeyError):
+        del documents['5']
+    with pytest.raises(KeyError):
+        documents['uuid']
+
+
+def test_update_only_compresses_added_chunks(tmp_path, small_blocks):
+    """Test that an update keeps the full blocks and appends the text of added chunks."""
+    store = ChunkStore.build(_documents())
+    added = Document(page_content='def main():\n    run()\n', metadata={'source': 'c.py'})
+    replacement = Document(page_content='# Other title\n', metadata={'source': 'README.md'})
+
+    with patch.object(ChunkStore, 'text', side_effect=AssertionError('text was read')):
+        updated = store.update([3, 5], [(3, replacement), (11, added)])
+    updated.save(str(tmp_path))
+    loaded = ChunkStore.load(str(tmp_path))
+
+    full_blocks = len(store.block_offsets) - 2
+    assert loaded.blocks[: store.block_offsets[full_blocks]].tobytes() == (
+        store.blocks[: store.block_offsets[full_blocks]].tobytes()
+    )
+    assert loaded.chunk_ids.tolist() == [3, 7, 9, 11]
+    assert loaded.source_positions({'a.py', 'c.py'}).tolist() == [1, 3]
+    for chunk_id, doc in [(3, replacement), (11, added), *_documents()[:1], *_documents()[3:]]:
+        assert _document(loaded, chunk_id).page_content == doc.page_content
+
+
+def test_update_rebuilds_store_of_mostly_removed_chunks(small_blocks):
+    """Test that the text of removed chunks is dropped once it dominates the store."""
+    store = ChunkStore.build(_documents())
+
+    updated = store.update([7], [])
+
+    assert updated.chunk_ids.tolist() == [3, 5, 9]
+    assert updated.sources == ['README.md', 'a.py', 'docs/b.md']
+    assert int(updated.text_ends.max()) == len('# Title\n' * 2)
+    assert _document(updated, 9).page_content == '# Title\n'
+
+
+def test_chunk_documents_report_changes():
+    """Test that changes and sources are reported without reading the store text."""
+    documents = ChunkDocuments(ChunkStore.build(_documents()))
+    replacement = Document(page_content='new', metadata={'source': 'c.py', 'chunk_id': 3})
+
+    del documents['5']
+    documents['3'] = replacement
+    documents['11'] = replacement
+
+    with patch.object(ChunkStore, 'text', side_effect=AssertionError('text was read')):
+        assert documents.changes() == ([3, 5], [(3, replacement), (11, replacement)])
+        assert documents.ids_by_source({'a.py', 'c.py'}) == ['7', '3', '11']
+        assert documents.sources() == ['a.py', 'docs/b.md', 'c.py', 'c.py']
+
+
+def test_index_round_trip_uses_chunk_store(tmp_path):
+    """Test that indices are saved to a chunk store and older JSON files are removed."""
+    index_path = str(tmp_path)
+    (tmp_path / 'chunk_map.json').write_text('{}')
+    documents = [
+        Document(page_content=f'chunk {i}', metadata={'source': 'a.py', 'chunk_id': i})
+        for i in range(3)
+    ]
+    embedding = DeterministicFakeEmbedding(size=4)
+    vector_store = build_vector_store(
+        documents, embedding.embed_documents([d.page_content for d in documents]), embedding
+    )
+
+    save_index_without_pickle(vector_store, index_path)
+    _, docstore, index_to_docstore_id = read_index_without_pickle(index_path)
+
+    assert sorted(os.listdir(index_path)) == [CHUNK_STORE_FILE, 'index.faiss']
+    assert index_to_docstore_id == {0: '0', 1: '1', 2: '2'}
+    assert get_docstore_dict(docstore)['2'].page_content == 'chunk 2'
+
+
+def test_legacy_json_index_is_read(tmp_path):
+    """Test that indices saved before the chunk store can still be read."""
+    index_path = str(tmp_path)
+    documents = [Document(page_content='chunk', metadata={'source': 'a.py', 'chunk_id': 0})]
+    embedding = DeterministicFakeEmbedding(size=4)
+    vector_store = build_vector_store(documents, embedding.embed_documents(['chunk']), embedding)
+    save_index_without_pickle(vector_store, index_path)
+    os.remove(tmp_path / CHUNK_STORE_FILE)
+    (tmp_path / 'docstore.json').write_text(
+        json.dumps({'doc-a': {'page_content': 'chunk', 'metadata': {'source': 'a.py'}}})
+    )
+    (tmp_path / 'index_mapping.json').write_text(json.dumps({'0': 'doc-a'}))
+
+    _, docstore, index_to_docstore_id = read_index_without_pickle(index_path)
+
+    assert index_to_docstore_id == {0: 'doc-a'}
+    assert get_docstore_dict(docstore)['doc-a'].page_content == 'chunk'
+
+
+def test_blob_store_deduplicates_files(tmp_path):
+    """Test that identical files share one blob that is pruned once unused."""
+    source = tmp_path / 'source'
+    source.mkdir()
+    (source / 'a.txt').write_text('same')
+    (source / 'b.txt').write_text('same')
+    (source / 'c.txt').write_text('other')
+    blobs = BlobStore(str(tmp_path / 'blobs'))
+    copies = tmp_path / 'copies'
+    copies.mkdir()
+
+    for name in ('a.txt', 'b.txt', 'c.txt'):
+        blobs.link(str(source / name), str(copies / name))
+
+    assert (copies / 'b.txt').read_text() == 'same'
+    assert os.path.samefile(copies / 'a.txt', copies / 'b.txt')
+    assert blobs.prune() == 0
+
+    os.remove(copies / 'c.txt')
+    assert blobs.prune() == 1
+    assert (copies / 'a.txt').read_text() == 'same'
+
+
+def test_blob_store_falls_back_to_copies(tmp_path):
+    """Test that files are copied when they cannot be hard-linked."""
+    (tmp_path / 'a.txt').write_text('content')
+    blobs = BlobStore(str(tmp_path / 'blobs'))
+
+    with patch('os.link', side_effect=OSError('cross-device link')):
+        blobs.link(str(tmp_path / 'a.txt'), str(tmp_path / 'copy.txt'))
+
+    assert (tmp_path / 'copy.txt').read_text() == 'content'
+    assert not os.path.samefile(tmp_path / 'a.txt', tmp_path / 'copy.txt')
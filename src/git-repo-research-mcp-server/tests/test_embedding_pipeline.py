@@ -0,0 +1,158 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the batched embedding pipeline and embedding cache."""
+
+import pytest
+import threading
+import time
+from awslabs.git_repo_research_mcp_server.embedding_cache import EmbeddingCache, content_hash
+from awslabs.git_repo_research_mcp_server.embeddings import (
+    AdaptiveConcurrencyLimiter,
+    EmbeddingPipeline,
+)
+from botocore.exceptions import ClientError
+from langchain_core.embeddings import Embeddings
+from unittest.mock import MagicMock, patch
+
+
+def _vector(text):
+    return [float(len(text)), 1.0, 0.5]
+
+
+class RecordingEmbeddings(Embeddings):
+    """Fake embedding model recording its batches and peak concurrency."""
+
+    def __init__(self, throttle_first=0, delay=0.0):
+        """Initialize the fake embedding model."""
+        self.batches = []
+        self.throttle_first = throttle_first
+        self.delay = delay
+        self.active = 0
+        self.peak = 0
+        self._lock = threading.Lock()
+
+    def embed_documents(self, texts):
+        """Embed texts, throttling the first `throttle_first` calls."""
+        with self._lock:
+            if self.throttle_first > 0:
+                self.throttle_first -= 1
+                raise ClientError({'Error': {'Code': 'ThrottlingException'}}, 'InvokeModel')
+            self.batches.append(list(texts))
+            self.active += 1
+            self.peak = max(self.peak, self.active)
+        time.sleep(self.delay)
+        with self._lock:
+            self.active -= 1
+        return [_vector(text) for text in texts]
+
+    def embed_query(self, text):
+        """Embed a single query text."""
+        return _vector(text)
+
+
+def test_embedding_cache_round_trip(tmp_path):
+    """Test that embeddings are stored per model and content hash."""
+    cache = EmbeddingCache(str(tmp_path / 'cache' / 'embeddings.sqlite'))
+    key = content_hash('def handler(): pass')
+
+    cache.put_many('model-a', {key: [0.25, 0.5]})
+
+    assert cache.get_many('model-a', [key, content_hash('other')]) == {key: [0.25, 0.5]}
+    assert cache.get_many('model-b', [key]) == {}
+
+
+def test_embedding_cache_errors_are_misses(tmp_path):
+    """Test that an unusable cache file does not fail embedding."""
+    path = tmp_path / 'embeddings.sqlite'
+    path.write_text('not a database')
+    cache = EmbeddingCache(str(path))
+
+    cache.put_many('model', {'key': [1.0]})
+
+    assert cache.get_many('model', ['key']) == {}
+
+
+@pytest.mark.asyncio
+async def test_duplicates_and_cached_chunks_are_not_embedded(tmp_path):
+    """Test that only unique chunks missing from the cache are sent to the model."""
+    cache = EmbeddingCache(str(tmp_path / 'embeddings.sqlite'))
+    cache.put_many('model', {content_hash('cached'): _vector('cached')})
+    model = RecordingEmbeddings()
+    pipeline = EmbeddingPipeline(model, 'model', cache, batch_size=2)
+
+    texts = ['a', 'cached', 'bb', 'a', 'ccc', 'bb']
+    vectors = await pipeline.embed(texts)
+
+    assert vectors == [_vector(text) for text in texts]
+    assert sorted(text for batch in model.batches for text in batch) == ['a', 'bb', 'ccc']
+    assert all(len(batch) <= 2 for batch in model.batches)
+
+    model.batches.clear()
+    assert await pipeline.embed(['ccc', 'a']) == [_vector('ccc'), _vector('a')]
+    assert model.batches == []
+
+
+@pytest.mark.asyncio
+async def test_batches_run_concurrently_within_the_limit():
+    """Test that batches are embedded concurrently and progress is reported."""
+    model = RecordingEmbeddings(delay=0.05)
+    pipeline = EmbeddingPipeline(model, 'model', batch_size=1, max_concurrency=3)
+    progress = []
+
+    async def report(embedded, total):
+        progress.append((embedded, total))
+
+    await pipeline.embed([str(i) for i in range(9)], report)
+
+    assert 1 < model.peak <= 3
+    assert len(progress) == 9
+    assert progress[-1] == (9, 9)
+
+
+@pytest.mark.asyncio
+async def test_throttled_batches_are_retried():
+    """Test that throttled batches are retried and other errors are raised."""
+    model = RecordingEmbeddings(throttle_first=2)
+    pipeline = EmbeddingPipeline(model, 'model', batch_size=2, max_concurrency=4)
+
+    with patch('asyncio.sleep') as sleep:
+        vectors = await pipeline.embed(['a', 'bb', 'ccc'])
+
+    assert vectors == [_vector('a'), _vector('bb'), _vector('ccc')]
+    assert sleep.call_count == 2
+
+    failing = MagicMock()
+    failing.embed_documents.side_effect = ClientError(
+        {'Error': {'Code': 'AccessDeniedException'}}, 'InvokeModel'
+    )
+    with pytest.raises(ClientError):
+        await EmbeddingPipeline(failing, 'model').embed(['a'])
+    assert failing.embed_documents.call_count == 1
+
+
+def test_adaptive_concurrency_limiter():
+    """Test that throttling halves the limit and successes grow it back."""
+    limiter = AdaptiveConcurrencyLimiter(8)
+
+    limiter.throttled()
+    limiter.throttled()
+    assert limiter.limit == 2
+
+    for _ in range(2):
+        limiter.succeeded()
+    assert limiter.limit == 3
+
+    for _ in range(100):
+        limiter.succeeded()
+    assert limiter.limit == 8
@@ -0,0 +1,295 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for incremental re-indexing in Git Repository Research MCP Server."""
+
+import faiss
+import os
+import pytest
+import subprocess
+from awslabs.git_repo_research_mcp_server.chunk_store import ChunkStore
+from awslabs.git_repo_research_mcp_server.indexer import (
+    IndexConfig,
+    RepositoryConfig,
+    RepositoryIndexer,
+    get_docstore_dict,
+)
+from awslabs.git_repo_research_mcp_server.keyword_index import tokenize
+from awslabs.git_repo_research_mcp_server.repository import (
+    get_changed_files,
+    get_uncommitted_files,
+)
+from awslabs.git_repo_research_mcp_server.utils import load_metadata
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from unittest.mock import MagicMock, patch
+
+
+def _git(repo_dir, *args):
+    subprocess.run(['git', *args], cwd=repo_dir, check=True, capture_output=True)
+
+
+def _write(repo_dir, rel_path, content):
+    path = os.path.join(repo_dir, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+def _commit(repo_dir, message):
+    _git(repo_dir, 'add', '-A')
+    _git(repo_dir, 'commit', '-m', message)
+
+
+@pytest.fixture
+def git_repo(tmp_path):
+    """Create a Git repository with a few committed files."""
+    repo_dir = str(tmp_path / 'repo')
+    os.makedirs(repo_dir)
+    _git(repo_dir, 'init')
+    _git(repo_dir, 'config', 'user.name', 'Test User')
+    _git(repo_dir, 'config', 'user.email', 'test@example.com')
+    _write(repo_dir, 'README.md', '# Project\n\nThis project does things.\n')
+    _write(repo_dir, 'src/app.py', 'def handler(event, context):\n    return event\n')
+    _write(repo_dir, 'src/old.py', 'def legacy():\n    pass\n')
+    _commit(repo_dir, 'Initial commit')
+    return repo_dir
+
+
+@pytest.fixture
+def embeddings():
+    """Create deterministic embeddings that record the embedded texts."""
+    fake = DeterministicFakeEmbedding(size=16)
+    return MagicMock(spec=DeterministicFakeEmbedding, wraps=fake)
+
+
+@pytest.fixture
+def indexer(tmp_path, embeddings):
+    """Create a repository indexer writing to a temporary index directory."""
+    with patch(
+        'awslabs.git_repo_research_mcp_server.indexer.get_embedding_model',
+        return_value=embeddings,
+    ):
+        return RepositoryIndexer(
+            IndexConfig(embedding_model='test-model', index_dir=str(tmp_path / 'indices'))
+        )
+
+
+def _embedded_texts(embeddings):
+    return [text for call in embeddings.embed_documents.call_args_list for text in call.args[0]]
+
+
+def test_get_changed_files(git_repo):
+    """Test that additions, modifications, deletions and renames are reported."""
+    base = subprocess.run(
+        ['git', 'rev-parse', 'HEAD'], cwd=git_repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+    _write(git_repo, 'src/app.py', 'def handler(event, context):\n    return None\n')
+    _write(git_repo, 'docs/new.md', '# New\n')
+    _git(git_repo, 'mv', 'README.md', 'INTRO.md')
+    os.remove(os.path.join(git_repo, 'src/old.py'))
+    _commit(git_repo, 'Change files')
+
+    result = get_changed_files(git_repo, base)
+
+    assert result is not None
+    changed, deleted = result
+
+    assert changed == ['INTRO.md', 'docs/new.md', 'src/app.py']
+    assert deleted == ['README.md', 'src/old.py']
+    assert get_changed_files(git_repo, '0' * 40) is None
+
+
+@pytest.mark.asyncio
+async def test_only_changed_files_are_reembedded(git_repo, indexer, embeddings):
+    """Test that a second indexing run only embeds chunks of changed files."""
+    config = RepositoryConfig(repository_path=git_repo, include_patterns=['*.md', '**/*.py'])
+    first = await indexer.index_repository(config)
+    assert first.status == 'success'
+    assert first.chunk_count == 3
+    embeddings.embed_documents.reset_mock()
+
+    _write(git_repo, 'src/app.py', 'def handler(event, context):\n    return "changed"\n')
+    os.remove(os.path.join(git_repo, 'src/old.py'))
+    _commit(git_repo, 'Change app and remove old')
+
+    second = await indexer.index_repository(config)
+
+    assert second.status == 'success'
+    assert second.message.startswith('Updated index with 1 changed and 1 deleted files')
+    assert _embedded_texts(embeddings) == ['def handler(event, context):\n    return "changed"\n']
+    assert second.chunk_count == 2
+    assert second.file_count == 2
+
+    vector_store = indexer.load_index_without_pickle(first.index_path)
+    assert isinstance(vector_store.index, faiss.IndexIDMap)
+    assert vector_store.index.ntotal == 2
+    docs = get_docstore_dict(vector_store.docstore).values()
+    assert sorted(doc.metadata['source'] for doc in docs) == ['README.md', 'src/app.py']
+    result = vector_store.similarity_search(
+        'def handler(event, context):\n    return "changed"\n', k=1
+    )
+    assert result[0].metadata['source'] == 'src/app.py'
+    keyword_index = indexer.load_keyword_index(first.index_path)
+    assert keyword_index.search('legacy', k=10) == []
+    assert [doc_id for doc_id, _ in keyword_index.search('handler', k=10)] == [
+        result[0].metadata['chunk_id']
+    ]
+
+    metadata = load_metadata(os.path.join(first.index_path, 'metadata.json'))
+    assert metadata is not None
+    head = subprocess.run(
+        ['git', 'rev-parse', 'HEAD'], cwd=git_repo, check=True, capture_output=True, text=True
+    ).stdout.strip()
+    assert metadata.last_commit_id == head
+    repo_files_path = os.path.join(first.index_path, 'repository')
+    assert not os.path.exists(os.path.join(repo_files_path, 'src', 'old.py'))
+    with open(os.path.join(repo_files_path, 'src', 'app.py')) as f:
+        assert 'changed' in f.read()
+
+
+@pytest.mark.asyncio
+async def test_update_does_not_read_unchanged_chunks(git_repo, indexer):
+    """Test that an update reads neither the text of the stored chunks nor rebuilds them."""
+    _write(git_repo, 'src/models.py', 'class User:\n    name: str\n' * 20)
+    _commit(git_repo, 'Add models')
+    config = RepositoryConfig(repository_path=git_repo, include_patterns=['*.md', '**/*.py'])
+    first = await indexer.index_repository(config)
+
+    _write(git_repo, 'src/app.py', 'def handler(event, context):\n    return "changed"\n')
+    _commit(git_repo, 'Change app')
+    with (
+        patch.object(ChunkStore, 'text', side_effect=AssertionError('text was read')),
+        patch.object(ChunkStore, 'build', side_effect=AssertionError('store was rebuilt')),
+        patch(
+            'awslabs.git_repo_research_mcp_server.keyword_index.tokenize', wraps=tokenize
+        ) as tokenize_mock,
+    ):
+        second = await indexer.index_repository(config)
+
+    assert second.message.startswith('Updated index with 1 changed and 0 deleted files')
+    assert tokenize_mock.call_args.args == (
+        'src/app.py\ndef handler(event, context):\n    return "changed"\n',
+    )
+    assert tokenize_mock.call_count == 1
+    keyword_index = indexer.load_keyword_index(first.index_path)
+    assert keyword_index is not None
+    assert keyword_index.search('changed', k=10)[0][0] == keyword_index.doc_ids.max()
+    vector_store = indexer.load_index_without_pickle(first.index_path)
+    docs = get_docstore_dict(vector_store.docstore).values()
+    assert sorted(doc.page_content for doc in docs if doc.metadata['source'] == 'src/app.py') == [
+        'def handler(event, context):\n    return "changed"\n'
+    ]
+
+
+def test_get_changed_files_includes_working_tree(git_repo):
+    """Test that uncommitted and untracked changes are reported."""
+    _write(git_repo, 'src/app.py', 'def handler(event, context):\n    return None\n')
+    _write(git_repo, 'notes.md', '# Notes\n')
+    os.remove(os.path.join(git_repo, 'src/old.py'))
+
+    result = get_changed_files(git_repo, 'HEAD')
+
+    assert result is not None
+    changed, deleted = result
+
+    assert changed == ['notes.md', 'src/app.py']
+    assert deleted == ['src/old.py']
+    assert get_uncommitted_files(git_repo) == ['notes.md', 'src/app.py', 'src/old.py']
+
+
+@pytest.mark.asyncio
+async def test_uncommitted_changes_are_reembedded(git_repo, indexer, embeddings):
+    """Test that uncommitted edits are indexed, and indexed again once they are reverted."""
+    config = RepositoryConfig(repository_path=git_repo, include_patterns=['*.md', '**/*.py'])
+    await indexer.index_repository(config)
+    embeddings.embed_documents.reset_mock()
+
+    original = 'def handler(event, context):\n    return event\n'
+    _write(git_repo, 'src/app.py', 'def handler(event, context):\n    return "draft"\n')
+    _write(git_repo, 'notes.md', '# Notes\n')
+
+    response = await indexer.index_repository(config)
+
+    assert response.message.startswith('Updated index with 2 changed and 0 deleted files')
+    assert sorted(_embedded_texts(embeddings)) == [
+        '# Notes\n',
+        'def handler(event, context):\n    return "draft"\n',
+    ]
+    assert response.chunk_count == 4
+    embeddings.embed_documents.reset_mock()
+
+    _write(git_repo, 'src/app.py', original)
+    os.remove(os.path.join(git_repo, 'notes.md'))
+
+    response = await indexer.index_repository(config)
+
+    assert response.message.startswith('Updated index with 2 changed and 0 deleted files')
+    assert response.chunk_count == 3
+    vector_store = indexer.load_index_without_pickle(response.index_path)
+    docs = get_docstore_dict(vector_store.docstore).values()
+    assert sorted(doc.page_content for doc in docs if doc.metadata['source'] == 'src/app.py') == [
+        original
+    ]
+    metadata = load_metadata(os.path.join(response.index_path, 'metadata.json'))
+    assert metadata is not None
+    assert metadata.uncommitted_files == []
+
+
+@pytest.mark.asyncio
+async def test_unchanged_repository_is_not_reembedded(git_repo, indexer, embeddings):
+    """Test that indexing an unchanged repository again embeds nothing."""
+    config = RepositoryConfig(repository_path=git_repo, include_patterns=['*.md', '**/*.py'])
+    await indexer.index_repository(config)
+    embeddings.embed_documents.reset_mock()
+
+    response = await indexer.index_repository(config)
+
+    assert response.status == 'success'
+    assert response.message == 'Index is already up to date'
+    assert response.chunk_count == 3
+    embeddings.embed_documents.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_changed_settings_rebuild_the_index(git_repo, indexer, embeddings):
+    """Test that an index built with other settings is rebuilt from scratch."""
+    await indexer.index_repository(
+        RepositoryConfig(repository_path=git_repo, include_patterns=['*.md', '**/*.py'])
+    )
+    embeddings.embed_documents.reset_mock()
+
+    response = await indexer.index_repository(
+        RepositoryConfig(repository_path=git_repo, include_patterns=['**/*.py'])
+    )
+
+    assert response.status == 'success'
+    assert response.message.startswith('Successfully indexed repository')
+    assert response.chunk_count == 2
+    # The rebuilt index reuses the embeddings of the first run from the embedding cache
+    embeddings.embed_documents.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_incremental_can_be_disabled(git_repo, indexer, embeddings):
+    """Test that incremental=False always rebuilds the whole index."""
+    config = RepositoryConfig(
+        repository_path=git_repo, include_patterns=['*.md', '**/*.py'], incremental=False
+    )
+    await indexer.index_repository(config)
+    embeddings.embed_documents.reset_mock()
+
+    response = await indexer.index_repository(config)
+
+    assert response.message.startswith('Successfully indexed repository')
+    assert response.chunk_count == 3
+    embeddings.embed_documents.assert_not_called()
@@ -0,0 +1,149 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the in-process index cache of Git Repository Research MCP Server."""
+
+import faiss
+import os
+import pytest
+from awslabs.git_repo_research_mcp_server.index_cache import INDEX_CACHE, IndexCache
+from awslabs.git_repo_research_mcp_server.indexer import (
+    IndexConfig,
+    RepositoryIndexer,
+    save_index_without_pickle,
+)
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import DeterministicFakeEmbedding
+from unittest.mock import MagicMock, patch
+
+
+def _write_index_files(index_path, size=10):
+    os.makedirs(index_path, exist_ok=True)
+    for name in ('index.faiss', 'docstore.json', 'index_mapping.json'):
+        with open(os.path.join(index_path, name), 'wb') as f:
+            f.write(b'x' * size)
+
+
+@pytest.fixture
+def loader():
+    """Create a loader that returns a new object on every call."""
+    return MagicMock(side_effect=lambda index_path: object())
+
+
+def test_index_is_loaded_once(tmp_path, loader):
+    """Test that an unchanged index is served from the cache."""
+    index_path = str(tmp_path / 'repo')
+    _write_index_files(index_path)
+    cache = IndexCache(max_bytes=1000)
+
+    first = cache.get_or_load(index_path, loader)
+    second = cache.get_or_load(index_path, loader)
+
+    assert first is second
+    assert loader.call_count == 1
+    assert cache.stats() == {'hits': 1, 'misses': 1, 'entries': 1, 'size_bytes': 30}
+
+
+def test_modified_index_is_reloaded(tmp_path, loader):
+    """Test that rewriting an index file invalidates the cached index."""
+    index_path = str(tmp_path / 'repo')
+    _write_index_files(index_path)
+    cache = IndexCache(max_bytes=1000)
+
+    first = cache.get_or_load(index_path, loader)
+    _write_index_files(index_path, size=20)
+    second = cache.get_or_load(index_path, loader)
+
+    assert first is not second
+    assert cache.stats()['entries'] == 1
+    assert cache.stats()['size_bytes'] == 60
+
+
+def test_least_recently_used_index_is_evicted(tmp_path, loader):
+    """Test that the total size of cached indices stays within the bound."""
+    paths = [str(tmp_path / name) for name in ('a', 'b', 'c')]
+    for path in paths:
+        _write_index_files(path)
+    cache = IndexCache(max_bytes=70)
+
+    first = cache.get_or_load(paths[0], loader)
+    cache.get_or_load(paths[1], loader)
+    cache.get_or_load(paths[0], loader)
+    cache.get_or_load(paths[2], loader)
+
+    assert cache.stats()['entries'] == 2
+    assert cache.get_or_load(paths[0], loader) is first
+    assert loader.call_count == 3
+
+
+def test_oversized_index_is_not_cached(tmp_path, loader):
+    """Test that an index larger than the bound is loaded but not kept."""
+    index_path = str(tmp_path / 'repo')
+    _write_index_files(index_path, size=100)
+    cache = IndexCache(max_bytes=50)
+
+    cache.get_or_load(index_path, loader)
+    cache.get_or_load(index_path, loader)
+
+    assert loader.call_count == 2
+    assert cache.stats()['entries'] == 0
+
+
+def test_invalidate(tmp_path, loader):
+    """Test that an invalidated index is loaded again."""
+    index_path = str(tmp_path / 'repo')
+    _write_index_files(index_path)
+    cache = IndexCache(max_bytes=1000)
+
+    cache.get_or_load(index_path, loader)
+    cache.invalidate(index_path)
+    cache.get_or_load(index_path, loader)
+
+    assert loader.call_count == 2
+
+
+def test_load_index_without_pickle_reuses_loaded_index(tmp_path):
+    """Test that repeated loads share the index but use the indexer's embedding function."""
+    embeddings = DeterministicFakeEmbedding(size=8)
+    vector_store = FAISS.from_documents(
+        [
+            Document(page_content='def handler(event, context):', metadata={'source': 'a.py'}),
+            Document(page_content='# Project README', metadata={'source': 'README.md'}),
+        ],
+        embeddings,
+    )
+    index_path = str(tmp_path / 'repo')
+    save_index_without_pickle(vector_store, index_path)
+    INDEX_CACHE.invalidate(index_path)
+
+    with patch(
+        'awslabs.git_repo_research_mcp_server.indexer.get_embedding_model',
+        return_value=embeddings,
+    ):
+        indexer = RepositoryIndexer(
+            IndexConfig(embedding_model='test-model', index_dir=str(tmp_path))
+        )
+
+    with patch(
+        'awslabs.git_repo_research_mcp_server.indexer.faiss.read_index',
+        wraps=faiss.read_index,
+    ) as read_index:
+        first = indexer.load_index_without_pickle(index_path)
+        second = indexer.load_index_without_pickle(index_path)
+
+    assert read_index.call_count == 1
+    assert first.index is second.index
+    assert second.embedding_function is embeddings
+    assert second.similarity_search('# Project README', k=1)[0].metadata['source'] == 'README.md'
+    INDEX_CACHE.invalidate(index_path)
@@ -0,0 +1,89 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the BM25 keyword index of Git Repository Research MCP Server."""
+
+import os
+from awslabs.git_repo_research_mcp_server.keyword_index import (
+    KEYWORD_INDEX_FILE,
+    KeywordIndex,
+    tokenize,
+)
+
+
+DOCUMENTS = [
+    (10, 'src/users.py\ndef getUserName(user_id):\n    return USERS[user_id].name\n'),
+    (11, 'src/errors.py\nraise ValueError("Connection refused by HTTPServer")\n'),
+    (12, 'README.md\nUsers can be listed with the CLI. Users are stored in a database.\n'),
+]
+
+
+def test_tokenize_splits_identifiers():
+    """Test that identifiers are kept whole and split into their parts."""
+    assert tokenize('getUserName(user_id) HTTPServer 404') == [
+        'getusername',
+        'get',
+        'user',
+        'name',
+        'user_id',
+        'user',
+        'id',
+        'httpserver',
+        'http',
+        'server',
+        '404',
+    ]
+
+
+def test_search_ranks_by_bm25():
+    """Test that documents are ranked by BM25 and addressed by their ids."""
+    index = KeywordIndex.build(DOCUMENTS)
+
+    assert [doc_id for doc_id, _ in index.search('getUserName', k=10)] == [10]
+    assert [doc_id for doc_id, _ in index.search('connection refused', k=10)] == [11]
+    assert [doc_id for doc_id, _ in index.search('users', k=10)] == [12, 10]
+    assert len(index.search('user', k=1)) == 1
+    assert index.search('nonexistent', k=10) == []
+
+
+def test_save_and_load(tmp_path):
+    """Test that a saved keyword index loads without pickle and ranks the same."""
+    index = KeywordIndex.build(DOCUMENTS)
+    index.save(str(tmp_path))
+
+    loaded = KeywordIndex.load(str(tmp_path))
+
+    assert os.path.exists(tmp_path / KEYWORD_INDEX_FILE)
+    assert loaded.terms == index.terms
+    assert loaded.search('users database', k=10) == index.search('users database', k=10)
+
+
+def test_update_matches_rebuild():
+    """Test that an updated index ranks like an index built from the same documents."""
+    added = (13, 'src/users.py\ndef get_user(user_id):\n    return USERS[user_id]\n')
+
+    updated = KeywordIndex.build(DOCUMENTS).update([10], [added])
+    rebuilt = KeywordIndex.build([*DOCUMENTS[1:], added])
+
+    assert updated.terms == rebuilt.terms
+    assert 'getusername' not in updated.terms
+    assert updated.doc_ids.tolist() == [11, 12, 13]
+    for query in ('users', 'get_user', 'connection refused', 'getUserName'):
+        assert updated.search(query, k=10) == rebuilt.search(query, k=10)
+
+
+def test_empty_index(tmp_path):
+    """Test that an index without documents can be saved, loaded and searched."""
+    KeywordIndex.build([]).save(str(tmp_path))
+
+    assert KeywordIndex.load(str(tmp_path)).search('anything', k=10) == []
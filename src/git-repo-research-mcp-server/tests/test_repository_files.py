@@ -0,0 +1,136 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for file discovery and chunking in Git Repository Research MCP Server."""
+
+import fnmatch
+import os
+import pytest
+from awslabs.git_repo_research_mcp_server.defaults import Constants
+from awslabs.git_repo_research_mcp_server.repository import (
+    PathMatcher,
+    chunk_start_lines,
+    chunk_text,
+    iter_file_chunks,
+    iter_matching_files,
+    process_repository,
+)
+from unittest.mock import patch
+
+
+def _write(root, rel_path, content):
+    path = os.path.join(root, rel_path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    mode = 'wb' if isinstance(content, bytes) else 'w'
+    with open(path, mode) as f:
+        f.write(content)
+    return path
+
+
+@pytest.mark.parametrize(
+    'rel_path',
+    [
+        'README.md',
+        'src/app.py',
+        'src/app.min.js',
+        'node_modules/lib/index.js',
+        'docs/node_modules/x.md',
+        '.git/config',
+        'a/.git/HEAD',
+        'pkg.egg-info/PKG-INFO',
+        'Dockerfile',
+        'images/logo.png',
+        'data/table.csv',
+    ],
+)
+def test_path_matcher_matches_like_fnmatch(rel_path):
+    """Test that precompiled patterns match exactly like fnmatch."""
+    include = Constants.TEXT_FILE_INCLUDE_PATTERNS + Constants.DEFAULT_INCLUDE_PATTERNS
+    exclude = Constants.TEXT_FILE_EXCLUDE_PATTERNS + Constants.DEFAULT_EXCLUDE_PATTERNS
+    expected = any(fnmatch.fnmatch(rel_path, p) for p in include) and not any(
+        fnmatch.fnmatch(rel_path, p) for p in exclude
+    )
+
+    assert PathMatcher(include, exclude).matches(rel_path) == expected
+
+
+def test_excluded_directories_are_not_walked(tmp_path):
+    """Test that directories whose files are all excluded are pruned."""
+    repo = str(tmp_path)
+    _write(repo, 'src/app.py', 'print(1)\n')
+    _write(repo, 'node_modules/lib/index.py', 'print(2)\n')
+    _write(repo, 'pkg/build/out.py', 'print(3)\n')
+
+    visited = []
+    walk = os.walk
+
+    def recording_walk(top):
+        for root, dirs, files in walk(top):
+            visited.append(os.path.relpath(root, repo))
+            yield root, dirs, files
+
+    with patch('os.walk', side_effect=recording_walk):
+        files = list(iter_matching_files(repo, ['**/*.py'], ['node_modules/**', '**/build/**']))
+
+    assert files == [os.path.join(repo, 'src', 'app.py')]
+    assert 'node_modules' not in visited
+    assert os.path.join('pkg', 'build') not in visited
+
+
+def test_process_repository_skips_binary_and_empty_files(tmp_path):
+    """Test that only non-empty UTF-8 files are chunked and counted."""
+    repo = str(tmp_path)
+    _write(repo, 'README.md', '# Project\n')
+    _write(repo, 'src/app.py', 'def handler():\n    pass\n')
+    _write(repo, 'src/empty.py', '')
+    _write(repo, 'src/blob.py', b'\xff\xfe\x00binary')
+
+    chunks, chunk_sources, extension_stats, start_lines = process_repository(
+        repo, include_patterns=['*.md', '**/*.py']
+    )
+
+    assert chunks == ['# Project\n', 'def handler():\n    pass\n']
+    assert chunk_sources == ['README.md', os.path.join('src', 'app.py')]
+    assert extension_stats == {'md': 1, 'py': 1}
+    assert start_lines == [1, 1]
+
+
+def test_parallel_chunking_matches_serial_chunking(tmp_path):
+    """Test that chunking on worker processes yields the same chunks in the same order."""
+    repo = str(tmp_path)
+    paths = [
+        _write(repo, f'src/module_{i:02d}.py', f'def f{i}():\n    return {i}\n' * (i + 1))
+        for i in range(12)
+    ]
+    _write(repo, 'src/blob.py', b'\xff\xfe\x00binary')
+    paths.append(os.path.join(repo, 'src', 'blob.py'))
+
+    serial = list(iter_file_chunks(repo, paths, chunk_size=40, chunk_overlap=10, max_workers=1))
+    with patch('awslabs.git_repo_research_mcp_server.repository.FILE_BATCH_FILES', 3):
+        parallel = list(
+            iter_file_chunks(repo, iter(paths), chunk_size=40, chunk_overlap=10, max_workers=2)
+        )
+
+    assert parallel == serial
+    assert [rel_path for rel_path, _, _ in serial] == [
+        os.path.join('src', f'module_{i:02d}.py') for i in range(12)
+    ]
+
+
+def test_chunk_start_lines():
+    """Test that each chunk is mapped to the line it starts on."""
+    text = 'line one\nline two\nline three\nline four\n'
+    chunks = chunk_text(text, chunk_size=20, chunk_overlap=10)
+
+    assert chunks == ['line one\nline two', 'line three', 'line four\n']
+    assert chunk_start_lines(text, chunks) == [1, 3, 4]
@@ -13,7 +13,9 @@
 # limitations under the License.
 """Tests for the search functionality in Git Repository Research MCP Server."""
 
+import faiss
 import pytest
+from awslabs.git_repo_research_mcp_server.indexer import build_keyword_index, build_vector_store
 from awslabs.git_repo_research_mcp_server.models import (
     SearchResponse,
 )
@@ -21,6 +23,9 @@ from awslabs.git_repo_research_mcp_server.search import (
     RepositorySearcher,
     get_repository_searcher,
 )
+from langchain_community.vectorstores import FAISS
+from langchain_core.documents import Document
+from langchain_core.embeddings import Embeddings
 from unittest.mock import MagicMock, patch
 
 
@@ -257,84 +262,98 @@ def test_generate_directory_tree():
         searcher._generate_tree.assert_called_once_with('/tmp/index/test_repo', '', 'test_repo')
 
 
+class FixedEmbeddings(Embeddings):
+    """Embeddings returning fixed vectors for known texts."""
+
+    def __init__(self, vectors):
+        """Initialize with a mapping from texts to vectors."""
+        self.vectors = vectors
+
+    def embed_documents(self, texts):
+        """Embed documents."""
+        return [self.vectors[text] for text in texts]
+
+    def embed_query(self, text):
+        """Embed a query."""
+        return self.vectors[text]
+
+
+DOCS = [
+    Document(
+        page_content='def parse_config_file(path):\n    return load(path)\n',
+        metadata={'source': 'src/config.py', 'chunk_id': 0, 'start_line': 10},
+    ),
+    Document(
+        page_content='Settings are read from a YAML file.',
+        metadata={'source': 'README.md', 'chunk_id': 1, 'start_line': 1},
+    ),
+]
+
+
+def _search_indexer(with_keyword_index=True):
+    embeddings = FixedEmbeddings(
+        {
+            DOCS[0].page_content: [0.8, 0.6, 0.0],
+            DOCS[1].page_content: [1.0, 0.0, 0.0],
+            'how is configuration stored': [1.0, 0.0, 0.0],
+            'parse_config_file': [1.0, 0.0, 0.0],
+        }
+    )
+    vector_store = build_vector_store(
+        DOCS, embeddings.embed_documents([doc.page_content for doc in DOCS]), embeddings
+    )
+    mock_indexer = MagicMock()
+    mock_indexer._get_index_path.return_value = '/tmp/index/test_repo'
+    mock_indexer.load_index_without_pickle.return_value = vector_store
+    mock_indexer.load_keyword_index.return_value = (
+        build_keyword_index(vector_store) if with_keyword_index else None
+    )
+    return mock_indexer
+
+
 def test_search_with_repository_name():
     """Test the search method with a repository name."""
     with (
         patch('awslabs.git_repo_research_mcp_server.search.get_embedding_model'),
         patch('awslabs.git_repo_research_mcp_server.search.get_repository_indexer'),
         patch('os.path.exists') as mock_exists,
-        patch('os.path.isdir') as mock_isdir,
         patch('time.time') as mock_time,
     ):
-        # Configure the mocks
         mock_time.side_effect = [1000.0, 1001.0]  # Start and end times
         mock_exists.return_value = False  # Not a directory path
-        mock_isdir.return_value = True
-
-        mock_indexer = MagicMock()
-        mock_indexer._get_index_path.return_value = '/tmp/index/test_repo'
-
-        # Create mock vector store
-        mock_vector_store = MagicMock()
-
-        # Configure the mock vector store to return search results
-        mock_doc1 = MagicMock()
-        mock_doc1.page_content = 'Test content 1'
-        mock_doc1.metadata = {'source': '/path/to/file1.txt', 'chunk_id': '1'}
-
-        mock_doc2 = MagicMock()
-        mock_doc2.page_content = 'Test content 2'
-        mock_doc2.metadata = {'source': '/path/to/file2.txt', 'chunk_id': '2'}
 
-        mock_vector_store.similarity_search.return_value = [mock_doc1, mock_doc2]
-        mock_vector_store.docstore._dict = {1: mock_doc1, 2: mock_doc2}
-
-        mock_indexer.load_index_without_pickle.return_value = mock_vector_store
-
-        # Create a RepositorySearcher instance with the mock indexer
         searcher = RepositorySearcher()
-        searcher.repository_indexer = mock_indexer
-
-        # Call the method
-        result = searcher.search('test_repo', 'test query', limit=10, threshold=0.0)
+        searcher.repository_indexer = _search_indexer()
 
-        print(result)
+        result = searcher.search('test_repo', 'how is configuration stored', limit=10)
 
-        # Verify the result
         assert isinstance(result, SearchResponse)
-        assert result.query == 'test query'
+        assert result.query == 'how is configuration stored'
         assert result.index_path == '/tmp/index/test_repo'
         assert result.repository_name == 'test_repo'
         assert result.repository_directory == '/tmp/index/test_repo/repository'
         assert result.total_results == 2
         assert result.execution_time_ms == 1000
 
-        assert result is not None
-        assert result.results is not None
-        assert len(result.results) > 0
-
-        # Verify first result
-        first_result = result.results[0]
-        assert first_result is not None
-        assert first_result.file_path == '/path/to/file1.txt'
-        assert first_result.content == 'Test content 1'
-        assert first_result.score == 1.0
+        # No keyword matches, so scores are the cosine similarities
+        first_result, second_result = result.results
+        assert first_result.file_path == 'README.md'
+        assert first_result.content == 'Settings are read from a YAML file.'
+        assert first_result.score == pytest.approx(1.0)
+        assert first_result.line_numbers == [1, 1]
         assert first_result.metadata is not None
         assert first_result.metadata['chunk_id'] == '1'
+        assert second_result.file_path == 'src/config.py'
+        assert second_result.score == pytest.approx(0.8)
+        assert second_result.line_numbers == [10, 11]
 
-        # Verify second result
-        second_result = result.results[1]
-        assert second_result is not None
-        assert second_result.file_path == '/path/to/file2.txt'
-        assert second_result.content == 'Test content 2'
-        assert second_result.score == 1.0
-        assert second_result.metadata is not None
-        assert second_result.metadata['chunk_id'] == '2'
-
-        # Verify the mock calls
-        mock_indexer._get_index_path.assert_called_once_with('test_repo')
-        mock_indexer.load_index_without_pickle.assert_called_once_with('/tmp/index/test_repo')
-        mock_vector_store.similarity_search.assert_called_once_with('test query', k=10)
+        searcher.repository_indexer._get_index_path.assert_called_once_with('test_repo')
+        searcher.repository_indexer.load_index_without_pickle.assert_called_once_with(
+            '/tmp/index/test_repo'
+        )
+        searcher.repository_indexer.load_keyword_index.assert_called_once_with(
+            '/tmp/index/test_repo'
+        )
 
 
 def test_search_with_directory_path():
@@ -345,159 +364,132 @@ def test_search_with_directory_path():
         patch('os.path.exists') as mock_exists,
         patch('os.path.isdir') as mock_isdir,
         patch('os.path.basename') as mock_basename,
-        patch('time.time') as mock_time,
     ):
-        # Configure the mocks
-        mock_time.side_effect = [1000.0, 1001.0]  # Start and end times
         mock_exists.return_value = True  # It's a directory path
         mock_isdir.return_value = True
         mock_basename.return_value = 'test_repo'
 
-        mock_indexer = MagicMock()
-
-        # Create mock vector store
-        mock_vector_store = MagicMock()
-
-        # Configure the mock vector store to return search results
-        mock_doc1 = MagicMock()
-        mock_doc1.page_content = 'Test content 1'
-        mock_doc1.metadata = {'source': '/path/to/file1.txt', 'chunk_id': '1'}
-
-        mock_vector_store.similarity_search.return_value = [mock_doc1]
-        mock_vector_store.docstore._dict = {1: mock_doc1}
-
-        mock_indexer.load_index_without_pickle.return_value = mock_vector_store
-
-        # Create a RepositorySearcher instance with the mock indexer
         searcher = RepositorySearcher()
-        searcher.repository_indexer = mock_indexer
+        searcher.repository_indexer = _search_indexer()
 
-        # Call the method
-        result = searcher.search('/tmp/index/test_repo', 'test query', limit=10, threshold=0.0)
+        result = searcher.search('/tmp/index/test_repo', 'how is configuration stored', limit=1)
 
-        # Verify the result
-        assert isinstance(result, SearchResponse)
-        assert result.query == 'test query'
         assert result.index_path == '/tmp/index/test_repo'
         assert result.repository_name == 'test_repo'
-        assert result.repository_directory == '/tmp/index/test_repo/repository'
         assert result.total_results == 1
-        assert result.execution_time_ms == 1000
+        assert result.results[0].file_path == 'README.md'
+        searcher.repository_indexer.load_index_without_pickle.assert_called_once_with(
+            '/tmp/index/test_repo'
+        )
 
-        assert len(result.results) == 1
-        assert result.results[0].file_path == '/path/to/file1.txt'
-        assert result.results[0].content == 'Test content 1'
-        assert result.results[0].score == 1.0
 
-        # Verify the mock calls
-        mock_indexer.load_index_without_pickle.assert_called_once_with('/tmp/index/test_repo')
+def test_search_ranks_exact_identifier_matches_first():
+    """Test that keyword matches outrank semantically closer chunks."""
+    with (
+        patch('awslabs.git_repo_research_mcp_server.search.get_embedding_model'),
+        patch('awslabs.git_repo_research_mcp_server.search.get_repository_indexer'),
+    ):
+        searcher = RepositorySearcher()
+        searcher.repository_indexer = _search_indexer()
+
+        result = searcher.search('test_repo', 'parse_config_file')
+
+        first_result, second_result = result.results
+        assert first_result.file_path == 'src/config.py'
+        assert first_result.score == pytest.approx(0.7 * 0.8 + 0.3)
+        assert first_result.metadata is not None
+        assert float(first_result.metadata['keyword_score']) > 0
+        # README.md only shares the common term "file" with the query
+        assert second_result.file_path == 'README.md'
+        assert 0.7 < second_result.score < first_result.score
 
 
-def test_search_with_similarity_search_with_score_fallback():
-    """Test the search method with similarity_search_with_score fallback."""
+def test_search_applies_threshold():
+    """Test that results scoring below the threshold are left out."""
     with (
         patch('awslabs.git_repo_research_mcp_server.search.get_embedding_model'),
         patch('awslabs.git_repo_research_mcp_server.search.get_repository_indexer'),
-        patch('os.path.exists') as mock_exists,
-        patch('os.path.isdir') as mock_isdir,
-        patch('time.time') as mock_time,
-        patch('loguru.logger.error') as mock_logger_error,
     ):
-        # Configure the mocks
-        mock_time.side_effect = [1000.0, 1001.0]  # Start and end times
-        mock_exists.return_value = False  # Not a directory path
-        mock_isdir.return_value = True
+        searcher = RepositorySearcher()
+        searcher.repository_indexer = _search_indexer()
 
-        mock_indexer = MagicMock()
-        mock_indexer._get_index_path.return_value = '/tmp/index/test_repo'
+        result = searcher.search('test_repo', 'how is configuration stored', threshold=0.9)
 
-        # Create mock vector store
-        mock_vector_store = MagicMock()
+        assert [r.file_path for r in result.results] == ['README.md']
+        assert result.total_results == 1
 
-        # Configure the mock vector store to fail with similarity_search but succeed with similarity_search_with_score
-        mock_vector_store.similarity_search.side_effect = Exception('Test exception')
 
-        mock_doc1 = MagicMock()
-        mock_doc1.page_content = 'Test content 1'
-        mock_doc1.metadata = {'source': '/path/to/file1.txt', 'chunk_id': '1'}
+def test_search_without_keyword_index():
+    """Test that indices created without a keyword index are searched by vectors only."""
+    with (
+        patch('awslabs.git_repo_research_mcp_server.search.get_embedding_model'),
+        patch('awslabs.git_repo_research_mcp_server.search.get_repository_indexer'),
+    ):
+        searcher = RepositorySearcher()
+        searcher.repository_indexer = _search_indexer(with_keyword_index=False)
 
-        mock_vector_store.similarity_search_with_score.return_value = [(mock_doc1, 0.5)]
-        mock_vector_store.docstore._dict = {1: mock_doc1}
+        result = searcher.search('test_repo', 'parse_config_file')
 
-        mock_indexer.load_index_without_pickle.return_value = mock_vector_store
+        assert [r.file_path for r in result.results] == ['README.md', 'src/config.py']
+        assert [r.score for r in result.results] == pytest.approx([1.0, 0.8])
 
-        # Create a RepositorySearcher instance with the mock indexer
-        searcher = RepositorySearcher()
-        searcher.repository_indexer = mock_indexer
 
-        # Call the method
-        result = searcher.search('test_repo', 'test query', limit=10, threshold=0.0)
+def test_search_legacy_index_with_unnormalized_vectors():
+    """Test that legacy indices of vectors that are not unit-length get cosine scores."""
+    embeddings = FixedEmbeddings(
+        {
+            DOCS[0].page_content: [4.0, 3.0, 0.0],
+            DOCS[1].page_content: [2.0, 0.0, 0.0],
+            'how is configuration stored': [1.0, 0.0, 0.0],
+        }
+    )
+    vector_store = FAISS.from_documents(DOCS, embeddings)
+    assert not isinstance(vector_store.index, faiss.IndexIDMap)
 
-        # Verify the result
-        assert isinstance(result, SearchResponse)
-        assert result.query == 'test query'
-        assert result.index_path == '/tmp/index/test_repo'
-        assert result.repository_name == 'test_repo'
-        assert result.repository_directory == '/tmp/index/test_repo/repository'
-        assert result.total_results == 1
-        assert result.execution_time_ms == 1000
+    with (
+        patch('awslabs.git_repo_research_mcp_server.search.get_embedding_model'),
+        patch('awslabs.git_repo_research_mcp_server.search.get_repository_indexer'),
+    ):
+        searcher = RepositorySearcher()
+        searcher.repository_indexer = MagicMock()
+        searcher.repository_indexer._get_index_path.return_value = '/tmp/index/test_repo'
+        searcher.repository_indexer.load_index_without_pickle.return_value = vector_store
+        searcher.repository_indexer.load_keyword_index.return_value = None
 
-        assert len(result.results) == 1
-        assert result.results[0].file_path == '/path/to/file1.txt'
-        assert result.results[0].content == 'Test content 1'
-        assert result.results[0].score == 0.75  # 1.0 - min(1.0, 0.5/2.0)
+        result = searcher.search('test_repo', 'how is configuration stored')
 
-        # Verify the mock calls
-        mock_indexer._get_index_path.assert_called_once_with('test_repo')
-        mock_indexer.load_index_without_pickle.assert_called_once_with('/tmp/index/test_repo')
-        mock_vector_store.similarity_search.assert_called_once_with('test query', k=10)
-        mock_vector_store.similarity_search_with_score.assert_called_once_with('test query', k=10)
-        mock_logger_error.assert_called_once()
+    assert [r.file_path for r in result.results] == ['README.md', 'src/config.py']
+    assert [r.score for r in result.results] == pytest.approx([1.0, 0.8])
 
 
-def test_search_with_both_search_methods_failing():
-    """Test the search method when both similarity search methods fail."""
+def test_search_failure_returns_no_results():
+    """Test the search method when the vector search fails."""
     with (
         patch('awslabs.git_repo_research_mcp_server.search.get_embedding_model'),
         patch('awslabs.git_repo_research_mcp_server.search.get_repository_indexer'),
         patch('os.path.exists') as mock_exists,
-        patch('os.path.isdir') as mock_isdir,
         patch('time.time') as mock_time,
+        patch('loguru.logger.error') as mock_logger_error,
     ):
-        # Configure the mocks
         mock_time.side_effect = [1000.0, 1001.0]  # Start and end times
         mock_exists.return_value = False  # Not a directory path
-        mock_isdir.return_value = True
 
         mock_indexer = MagicMock()
         mock_indexer._get_index_path.return_value = '/tmp/index/test_repo'
-
-        # Create mock vector store
         mock_vector_store = MagicMock()
-
-        # Configure the mock vector store to fail with both search methods
-        mock_vector_store.similarity_search.side_effect = Exception('Test exception 1')
-        mock_vector_store.similarity_search_with_score.side_effect = Exception('Test exception 2')
+        mock_vector_store.index.ntotal = 1
+        mock_vector_store.index.search.side_effect = Exception('Test exception')
         mock_vector_store.docstore._dict = {1: MagicMock()}
-
         mock_indexer.load_index_without_pickle.return_value = mock_vector_store
 
-        # Create a RepositorySearcher instance with the mock indexer
         searcher = RepositorySearcher()
         searcher.repository_indexer = mock_indexer
 
-        # Call the method
         result = searcher.search('test_repo', 'test query', limit=10, threshold=0.0)
 
-        # Verify the result
         assert isinstance(result, SearchResponse)
-        assert result.query == 'test query'
-        assert result.index_path == '/tmp/index/test_repo'
-        assert result.repository_name == 'test_repo'
         assert result.repository_directory == '/tmp/index/test_repo/repository'
         assert result.total_results == 0
         assert result.execution_time_ms == 1000
         assert len(result.results) == 0
-
-        # Verify the mock calls
-        mock_indexer._get_index_path.assert_called_once_with('test_repo')
+        mock_logger_error.assert_called_once()
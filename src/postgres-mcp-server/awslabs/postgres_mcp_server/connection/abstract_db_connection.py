@@ -15,7 +15,8 @@
 """Abstract database connection interface for postgres MCP Server."""
 
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional
+from awslabs.postgres_mcp_server.connection.query_result import QueryResult
+from typing import Any, Dict, List, Optional, Union
 
 
 class AbstractDBConnection(ABC):
@@ -41,7 +42,7 @@ class AbstractDBConnection(ABC):
     @abstractmethod
     async def execute_query(
         self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
-    ) -> Dict[str, Any]:
+    ) -> Union[Dict[str, Any], QueryResult]:
         """Execute a SQL query.
 
         Args:
@@ -49,7 +50,8 @@ class AbstractDBConnection(ABC):
             parameters: Optional parameters for the query
 
         Returns:
-            Dict containing query results with column metadata and records
+            QueryResult with the result rows, or a dict with column metadata and
+            records in the RDS Data API format
         """
         pass
 
@@ -17,14 +17,64 @@
 This connector provides direct connection to PostgreSQL databases using psycopg.
 It supports both Aurora PostgreSQL and RDS PostgreSQL instances via direct connection
 parameters (host, port, database, user, password) or via AWS Secrets Manager.
+
+When the secret is rotated, a new pool is opened with the new credentials and the
+previous pool is closed once no client is waiting for one of its connections.
 """
 
-import boto3
-import json
+import asyncio
+import time
 from awslabs.postgres_mcp_server.connection.abstract_db_connection import AbstractDBConnection
+from awslabs.postgres_mcp_server.connection.query_result import QueryResult
+from awslabs.postgres_mcp_server.connection.secret_credentials import (
+    CREDENTIALS_TTL,
+    SecretCredentialsProvider,
+)
 from loguru import logger
-from psycopg_pool import AsyncConnectionPool
-from typing import Any, Dict, List, Optional, Tuple
+from psycopg import OperationalError
+from psycopg_pool import AsyncConnectionPool, PoolClosed, PoolTimeout
+from typing import Any, Callable, Dict, List, Optional, Sequence, Set, Tuple
+
+
+# Number of rows fetched from the cursor at a time
+FETCH_BATCH_SIZE = 1000
+
+# Maximum seconds a replaced pool is kept open while clients still wait for one of its
+# connections. Closing a pool fails its waiting clients, while connections in use are
+# only closed once they are returned.
+POOL_DRAIN_TIMEOUT = 60.0
+POOL_DRAIN_POLL_INTERVAL = 0.5
+
+# Minimum seconds between reading the secret again after failing to connect
+CREDENTIALS_MIN_REFRESH_INTERVAL = 30
+
+# Minimum seconds between logging the pool statistics while the pool is in use
+POOL_STATS_LOG_INTERVAL = 300
+
+# Types returned as they are; other values are converted to strings
+_NATIVE_TYPES = (str, int, float, bool, bytes)
+
+
+def native_row(cursor: Any) -> Callable[[Sequence[Any]], Tuple[Any, ...]]:
+    """Psycopg row factory building tuples of JSON-friendly values.
+
+    Strings, numbers, booleans, bytes and NULL are kept as they are; other values,
+    such as numerics, dates and UUIDs, are converted to strings.
+
+    Args:
+        cursor: Cursor the rows are read from
+
+    Returns:
+        Function converting the values of a row into a tuple
+    """
+
+    def make_row(values: Sequence[Any]) -> Tuple[Any, ...]:
+        return tuple(
+            value if value is None or isinstance(value, _NATIVE_TYPES) else str(value)
+            for value in values
+        )
+
+    return make_row
 
 
 class PsycopgPoolConnection(AbstractDBConnection):
@@ -35,7 +85,11 @@ class PsycopgPoolConnection(AbstractDBConnection):
     - RDS PostgreSQL (using the instance endpoint)
     - Self-hosted PostgreSQL
 
-    It uses AWS Secrets Manager (secret_arn and region) for authentication.
+    It uses AWS Secrets Manager (secret_arn and region) for authentication. The
+    credentials are read again in the background once they are older than
+    `credentials_ttl`, or right away when no connection can be made, and the pool is
+    re-keyed if they changed. The pool statistics are logged at most every
+    `POOL_STATS_LOG_INTERVAL` seconds while the pool is in use.
     """
 
     def __init__(
@@ -48,6 +102,8 @@ class PsycopgPoolConnection(AbstractDBConnection):
         region: str,
         min_size: int = 1,
         max_size: int = 10,
+        max_rows: Optional[int] = None,
+        credentials_ttl: int = CREDENTIALS_TTL,
         is_test: bool = False,
     ):
         """Initialize a new DB connection pool.
@@ -61,6 +117,8 @@ class PsycopgPoolConnection(AbstractDBConnection):
             region: AWS region for Secrets Manager
             min_size: Minimum number of connections in the pool
             max_size: Maximum number of connections in the pool
+            max_rows: Maximum number of rows returned by a query, or None for no limit
+            credentials_ttl: Seconds the credentials are used before the secret is read again
             is_test: Whether this is a test connection
         """
         super().__init__(readonly)
@@ -69,27 +127,41 @@ class PsycopgPoolConnection(AbstractDBConnection):
         self.database = database
         self.min_size = min_size
         self.max_size = max_size
+        self.max_rows = max_rows
         self.pool: Optional['AsyncConnectionPool[Any]'] = None
+        self.rekey_count = 0
+        self._refresh_task: Optional['asyncio.Task[bool]'] = None
+        self._drain_tasks: Set['asyncio.Task[None]'] = set()
+        self._draining_pools: Set['AsyncConnectionPool[Any]'] = set()
+        self._stats_logged_at = time.monotonic()
 
         # Get credentials from Secrets Manager
         logger.info(f'Retrieving credentials from Secrets Manager: {secret_arn}')
-        self.user, self.password = self._get_credentials_from_secret(secret_arn, region, is_test)
+        self.credentials = SecretCredentialsProvider(
+            secret_arn, region, ttl=credentials_ttl, is_test=is_test
+        )
+        self.user, self.password = self.credentials.get_credentials()
         logger.info(f'Successfully retrieved credentials for user: {self.user}')
 
         # Store connection info
-        if not is_test:
-            self.conninfo = f'host={host} port={port} dbname={database} user={self.user} password={self.password}'
-            logger.info('Connection parameters stored')
+        self.conninfo = self._build_conninfo()
+        logger.info('Connection parameters stored')
+
+    def _build_conninfo(self) -> str:
+        return f'host={self.host} port={self.port} dbname={self.database} user={self.user} password={self.password}'
+
+    def _open_pool(self) -> 'AsyncConnectionPool[Any]':
+        logger.info(
+            f'Initializing connection pool with min_size={self.min_size}, max_size={self.max_size}'
+        )
+        return AsyncConnectionPool(
+            self.conninfo, min_size=self.min_size, max_size=self.max_size, open=True
+        )
 
     async def initialize_pool(self):
         """Initialize the connection pool."""
         if self.pool is None:
-            logger.info(
-                f'Initializing connection pool with min_size={self.min_size}, max_size={self.max_size}'
-            )
-            self.pool = AsyncConnectionPool(
-                self.conninfo, min_size=self.min_size, max_size=self.max_size, open=True
-            )
+            self.pool = self._open_pool()
             logger.info('Connection pool initialized successfully')
 
             # Set read-only mode if needed
@@ -104,8 +176,89 @@ class PsycopgPoolConnection(AbstractDBConnection):
         if self.pool is None:
             raise ValueError('Failed to initialize connection pool')
 
+        # Read the secret again in the background once the credentials expired
+        if self.credentials.expired and (self._refresh_task is None or self._refresh_task.done()):
+            self._refresh_task = asyncio.create_task(self.refresh_credentials())
+
+        if time.monotonic() - self._stats_logged_at >= POOL_STATS_LOG_INTERVAL:
+            self._stats_logged_at = time.monotonic()
+            logger.info(f'Connection pool stats: {self.get_pool_stats()}')
+
         return self.pool.connection(timeout=15.0)
 
+    async def refresh_credentials(self) -> bool:
+        """Read the secret again and re-key the pool if the credentials changed.
+
+        Returns:
+            True if the pool was re-keyed with new credentials
+        """
+        try:
+            changed = await asyncio.to_thread(self.credentials.refresh)
+        except Exception as e:
+            logger.warning(f'Keeping the current credentials: {str(e)}')
+            return False
+        if changed:
+            await self._rekey_pool()
+            logger.info(f'Connection pool stats: {self.get_pool_stats()}')
+        return changed
+
+    async def _refresh_after_connection_failure(self):
+        """Read the secret again after failing to connect, joining a refresh under way.
+
+        The secret is not read again within `CREDENTIALS_MIN_REFRESH_INTERVAL` seconds of
+        the last read.
+        """
+        if (
+            self._refresh_task is None or self._refresh_task.done()
+        ) and self.credentials.age >= CREDENTIALS_MIN_REFRESH_INTERVAL:
+            self._refresh_task = asyncio.create_task(self.refresh_credentials())
+        if self._refresh_task is not None and not self._refresh_task.done():
+            # Shielded so that a cancelled query does not cancel the shared refresh
+            await asyncio.shield(self._refresh_task)
+
+    async def _rekey_pool(self):
+        """Replace the pool by one using the current credentials.
+
+        New clients get connections from the new pool. The previous pool is closed in
+        the background once no client is waiting for one of its connections, and the
+        connections in use are closed when they are returned.
+        """
+        if self.credentials.current is None:
+            return
+        self.user, self.password = self.credentials.current
+        self.conninfo = self._build_conninfo()
+        if self.pool is None:
+            return
+
+        logger.info(f'Re-keying connection pool for user: {self.user}')
+        old_pool, self.pool = self.pool, self._open_pool()
+        self.rekey_count += 1
+        if self.readonly_query:
+            await self._set_all_connections_readonly()
+
+        self._draining_pools.add(old_pool)
+        task = asyncio.create_task(self._drain_pool(old_pool))
+        self._drain_tasks.add(task)
+        task.add_done_callback(self._drain_tasks.discard)
+
+    async def _drain_pool(self, pool: 'AsyncConnectionPool[Any]'):
+        deadline = time.monotonic() + POOL_DRAIN_TIMEOUT
+        try:
+            while pool.get_stats().get('requests_waiting', 0) > 0 and time.monotonic() < deadline:
+                await asyncio.sleep(POOL_DRAIN_POLL_INTERVAL)
+        finally:
+            await self._close_replaced_pool(pool)
+
+    async def _close_replaced_pool(self, pool: 'AsyncConnectionPool[Any]'):
+        if pool not in self._draining_pools:
+            return
+        self._draining_pools.discard(pool)
+        try:
+            await pool.close()
+            logger.info('Replaced connection pool closed')
+        except Exception as e:
+            logger.warning(f'Failed to close replaced connection pool: {str(e)}')
+
     async def _set_all_connections_readonly(self):
         """Set all connections in the pool to read-only mode."""
         if self.pool is None:
@@ -124,16 +277,44 @@ class PsycopgPoolConnection(AbstractDBConnection):
 
     async def execute_query(
         self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
-    ) -> Dict[str, Any]:
-        """Execute a SQL query using async connection."""
+    ) -> QueryResult:
+        """Execute a SQL query using async connection.
+
+        Rows are built as tuples by the cursor and fetched in batches of
+        `FETCH_BATCH_SIZE`, stopping at `max_rows` if a row limit is set. If no
+        connection can be made because the secret was rotated, the query is retried
+        once on a pool using the new credentials, whichever query or background
+        refresh re-keyed it.
+        """
+        rekey_count = self.rekey_count
+        try:
+            return await self._execute_query(sql, parameters)
+        except PoolClosed:
+            # The pool was replaced by a re-keyed one while the query waited for it
+            if self.pool is None or self.pool.closed:
+                raise
+            logger.info('Retrying query on the re-keyed connection pool')
+            return await self._execute_query(sql, parameters)
+        except (OperationalError, PoolTimeout):
+            # The pool may already have been re-keyed since this query started
+            if self.rekey_count == rekey_count:
+                await self._refresh_after_connection_failure()
+            if self.rekey_count == rekey_count:
+                raise
+            logger.info('Retrying query with rotated credentials')
+            return await self._execute_query(sql, parameters)
+
+    async def _execute_query(
+        self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
+    ) -> QueryResult:
         try:
             async with await self._get_connection() as conn:
                 async with conn.transaction():
                     if self.readonly_query:
                         await conn.execute('SET TRANSACTION READ ONLY')  # type: ignore
 
-                    # Create a cursor for better control
-                    async with conn.cursor() as cursor:
+                    # Create a cursor that builds rows of native values
+                    async with conn.cursor(row_factory=native_row) as cursor:
                         # Execute the query
                         if parameters:
                             params = self._convert_parameters(parameters)
@@ -141,43 +322,24 @@ class PsycopgPoolConnection(AbstractDBConnection):
                         else:
                             await cursor.execute(sql)
 
-                        # Check if there are results to fetch by examining the cursor's description
-                        if cursor.description:
-                            # Get column names
-                            columns = [desc[0] for desc in cursor.description]
-
-                            # Fetch all rows
-                            rows = await cursor.fetchall()
-
-                            # Structure the response to match the interface contract required by server.py
-                            column_metadata = [{'name': col} for col in columns]
-                            records = []
-
-                            # Convert each row to the expected format
-                            for row in rows:
-                                record = []
-                                for value in row:
-                                    if value is None:
-                                        record.append({'isNull': True})
-                                    elif isinstance(value, str):
-                                        record.append({'stringValue': value})
-                                    elif isinstance(value, int):
-                                        record.append({'longValue': value})
-                                    elif isinstance(value, float):
-                                        record.append({'doubleValue': value})
-                                    elif isinstance(value, bool):
-                                        record.append({'booleanValue': value})
-                                    elif isinstance(value, bytes):
-                                        record.append({'blobValue': value})
-                                    else:
-                                        # Convert other types to string
-                                        record.append({'stringValue': str(value)})
-                                records.append(record)
-
-                            return {'columnMetadata': column_metadata, 'records': records}
-                        else:
-                            # No results (e.g., for INSERT, UPDATE, etc.)
-                            return {'columnMetadata': [], 'records': []}
+                        # No results (e.g., for INSERT, UPDATE, etc.)
+                        if not cursor.description:
+                            return QueryResult()
+
+                        columns = [desc[0] for desc in cursor.description]
+                        rows = []
+                        while True:
+                            batch_size = FETCH_BATCH_SIZE
+                            if self.max_rows is not None:
+                                # Fetch one row past the limit to detect truncation
+                                batch_size = min(batch_size, self.max_rows + 1 - len(rows))
+                            batch = await cursor.fetchmany(batch_size)
+                            rows.extend(batch)
+                            if len(batch) < batch_size:
+                                return QueryResult(columns, rows)
+                            if self.max_rows is not None and len(rows) > self.max_rows:
+                                del rows[self.max_rows :]
+                                return QueryResult(columns, rows, truncated=True)
 
         except Exception as e:
             logger.error(f'Database connection error: {str(e)}')
@@ -206,58 +368,14 @@ class PsycopgPoolConnection(AbstractDBConnection):
 
         return result
 
-    def _get_credentials_from_secret(
-        self, secret_arn: str, region: str, is_test: bool = False
-    ) -> Tuple[str, str]:
-        """Get database credentials from AWS Secrets Manager."""
-        if is_test:
-            return 'test_user', 'test_password'
-
-        try:
-            # Create a Secrets Manager client
-            logger.info(f'Creating Secrets Manager client in region {region}')
-            session = boto3.Session()
-            client = session.client(service_name='secretsmanager', region_name=region)
-
-            # Get the secret value
-            logger.info(f'Retrieving secret value for {secret_arn}')
-            get_secret_value_response = client.get_secret_value(SecretId=secret_arn)
-            logger.info('Successfully retrieved secret value')
-
-            # Parse the secret string
-            if 'SecretString' in get_secret_value_response:
-                secret = json.loads(get_secret_value_response['SecretString'])
-                logger.info(f'Secret keys: {", ".join(secret.keys())}')
-
-                # Extract username and password
-                username = secret.get('username') or secret.get('user') or secret.get('Username')
-                password = secret.get('password') or secret.get('Password')
-
-                if not username:
-                    logger.error(
-                        f'Username not found in secret. Available keys: {", ".join(secret.keys())}'
-                    )
-                    raise ValueError(
-                        f'Secret does not contain username. Available keys: {", ".join(secret.keys())}'
-                    )
-
-                if not password:
-                    logger.error('Password not found in secret')
-                    raise ValueError(
-                        f'Secret does not contain password. Available keys: {", ".join(secret.keys())}'
-                    )
-
-                logger.info(f'Successfully extracted credentials for user: {username}')
-                return username, password
-            else:
-                logger.error('Secret does not contain a SecretString')
-                raise ValueError('Secret does not contain a SecretString')
-        except Exception as e:
-            logger.error(f'Error retrieving secret: {str(e)}')
-            raise ValueError(f'Failed to retrieve credentials from Secrets Manager: {str(e)}')
-
     async def close(self) -> None:
         """Close all connections in the pool."""
+        if self._refresh_task is not None and not self._refresh_task.done():
+            self._refresh_task.cancel()
+        for task in list(self._drain_tasks):
+            task.cancel()
+        for pool in list(self._draining_pools):
+            await self._close_replaced_pool(pool)
         if self.pool is not None:
             logger.info('Closing connection pool')
             await self.pool.close()
@@ -268,20 +386,43 @@ class PsycopgPoolConnection(AbstractDBConnection):
         """Check if the connection is healthy."""
         try:
             result = await self.execute_query('SELECT 1')
-            return len(result.get('records', [])) > 0
+            return len(result.rows) > 0
         except Exception as e:
             logger.error(f'Connection health check failed: {str(e)}')
             return False
 
     def get_pool_stats(self) -> Dict[str, int]:
-        """Get current connection pool statistics."""
-        if not hasattr(self, 'pool') or self.pool is None:
-            return {'size': 0, 'min_size': self.min_size, 'max_size': self.max_size, 'idle': 0}
+        """Get current connection pool statistics.
 
-        # Access pool attributes safely
-        size = getattr(self.pool, 'size', 0)
-        min_size = getattr(self.pool, 'min_size', self.min_size)
-        max_size = getattr(self.pool, 'max_size', self.max_size)
-        idle = getattr(self.pool, 'idle', 0)
-
-        return {'size': size, 'min_size': min_size, 'max_size': max_size, 'idle': idle}
+        Besides the pool size, the statistics include the number of waiting requests
+        and their total wait time, for tuning the pool size, as well as how often the
+        credentials were read and the pool was re-keyed.
+        """
+        stats = {
+            'size': 0,
+            'min_size': self.min_size,
+            'max_size': self.max_size,
+            'idle': 0,
+            'requests_waiting': 0,
+            'requests_wait_ms': 0,
+            'requests_num': 0,
+            'connections_errors': 0,
+            'credential_refreshes': self.credentials.refresh_count,
+            'pool_rekeys': self.rekey_count,
+            'draining_pools': len(self._draining_pools),
+        }
+        if self.pool is None:
+            return stats
+
+        pool_stats = self.pool.get_stats()
+        stats.update(
+            size=pool_stats.get('pool_size', 0),
+            min_size=pool_stats.get('pool_min', self.min_size),
+            max_size=pool_stats.get('pool_max', self.max_size),
+            idle=pool_stats.get('pool_available', 0),
+            requests_waiting=pool_stats.get('requests_waiting', 0),
+            requests_wait_ms=pool_stats.get('requests_wait_ms', 0),
+            requests_num=pool_stats.get('requests_num', 0),
+            connections_errors=pool_stats.get('connections_errors', 0),
+        )
+        return stats
@@ -0,0 +1,48 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Query result for postgres MCP Server.
+
+Connections that read rows natively return a QueryResult holding column names and
+plain row tuples, instead of wrapping every cell into an RDS Data API field dict.
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Sequence
+
+
+@dataclass
+class QueryResult:
+    """Rows of a query result with their column names.
+
+    Attributes:
+        columns: Names of the result columns
+        rows: Result rows, one value per column
+        truncated: Whether rows beyond the row limit of the connection were dropped
+    """
+
+    columns: List[str] = field(default_factory=list)
+    rows: List[Sequence[Any]] = field(default_factory=list)
+    truncated: bool = False
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Return the rows as dictionaries keyed by column name."""
+        columns = self.columns
+        return [dict(zip(columns, row)) for row in self.rows]
+
+    def to_columns(self) -> Dict[str, List[Any]]:
+        """Return the values of each column as a list, keyed by column name."""
+        if not self.rows:
+            return {column: [] for column in self.columns}
+        return {column: list(values) for column, values in zip(self.columns, zip(*self.rows))}
@@ -12,17 +12,62 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""RDS Data API connector for postgres MCP Server."""
+"""RDS Data API connector for postgres MCP Server.
+
+Read-only queries run inside read-only transactions that are kept open and reused
+for a few seconds, so back-to-back queries take a single Data API call instead of four.
+"""
 
 import asyncio
 import boto3
+import json
+import re
+import threading
+import time
 from awslabs.postgres_mcp_server.connection.abstract_db_connection import AbstractDBConnection
+from awslabs.postgres_mcp_server.connection.query_result import QueryResult
+from concurrent.futures import ThreadPoolExecutor
 from loguru import logger
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Seconds a read-only transaction is reused for after its last and its first statement.
+# An open transaction keeps the locks of every table it read and pins a backend, so
+# DDL on those tables waits for it: idle transactions are rolled back when they expire.
+READONLY_TRANSACTION_IDLE_TIMEOUT = 2
+READONLY_TRANSACTION_MAX_AGE = 5
+
+# Read-only transactions kept open while idle; further ones are rolled back right away
+READONLY_MAX_IDLE_TRANSACTIONS = 2
+
+# Statement that makes a new transaction read-only; read committed gives every
+# statement of a reused transaction a fresh snapshot
+READONLY_TRANSACTION_SQL = 'SET TRANSACTION READ ONLY ISOLATION LEVEL READ COMMITTED'
+
+# Statements that can end a transaction or change its session state, after which
+# the transaction is not reused
+TRANSACTION_CONTROL_PATTERN = re.compile(
+    r'^\s*(?:(?:--[^\n]*(?:\n|$)|/\*.*?\*/)\s*)*'
+    r'(ABORT|BEGIN|CALL|COMMIT|DISCARD|END|PREPARE|RELEASE|RESET|ROLLBACK|SAVEPOINT|SET|START)\b',
+    re.IGNORECASE | re.DOTALL,
+)
+
+# Function calls that change settings such as search_path or statement_timeout from
+# within any statement, after which the transaction is not reused either. Functions
+# that change settings internally cannot be detected; the short reuse window bounds
+# how long such a change can affect later queries.
+SESSION_STATE_FUNCTION_PATTERN = re.compile(r'(?:\bset_config|"set_config")\s*\(', re.IGNORECASE)
 
 
 class RDSDataAPIConnection(AbstractDBConnection):
-    """Class that wraps DB connection client by RDS API."""
+    """Class that wraps DB connection client by RDS API.
+
+    Queries run on a bounded thread pool. In read-only mode, each worker reuses an
+    open read-only transaction, which is rolled back once it has been idle or open
+    for too long, or after a statement failed or controlled the transaction. Only a
+    few transactions are kept idle, and a background thread rolls them back as soon
+    as they expire.
+    """
 
     def __init__(
         self,
@@ -31,6 +76,7 @@ class RDSDataAPIConnection(AbstractDBConnection):
         database: str,
         region: str,
         readonly: bool,
+        max_concurrency: int = 4,
         is_test: bool = False,
     ):
         """Initialize a new DB connection.
@@ -41,18 +87,27 @@ class RDSDataAPIConnection(AbstractDBConnection):
             database: The name of the database to connect to
             region: The AWS region where the RDS instance is located
             readonly: Whether the connection should be read-only
+            max_concurrency: Maximum number of queries running at the same time
             is_test: Whether this is a test connection
         """
         super().__init__(readonly)
         self.cluster_arn = cluster_arn
         self.secret_arn = secret_arn
         self.database = database
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrency, thread_name_prefix='rds-data-api'
+        )
+        # Open read-only transactions as (transaction id, start time, last use time)
+        self._idle_transactions: List[Tuple[str, float, float]] = []
+        self._idle_changed = threading.Condition()
+        self._reaper: Optional[threading.Thread] = None
+        self._closed = False
         if not is_test:
             self.data_client = boto3.client('rds-data', region_name=region)
 
     async def execute_query(
         self, sql: str, parameters: Optional[List[Dict[str, Any]]] = None
-    ) -> Dict[str, Any]:
+    ) -> QueryResult:
         """Execute a SQL query using RDS Data API.
 
         Args:
@@ -60,88 +115,193 @@ class RDSDataAPIConnection(AbstractDBConnection):
             parameters: Optional parameters for the query
 
         Returns:
-            Dict containing query results with column metadata and records
+            QueryResult with the result rows
         """
+        loop = asyncio.get_running_loop()
         if self.readonly_query:
-            return await asyncio.to_thread(self._execute_readonly_query, sql, parameters)
+            response = await loop.run_in_executor(
+                self._executor, self._execute_readonly_query, sql, parameters
+            )
         else:
-            execute_params = {
-                'resourceArn': self.cluster_arn,
-                'secretArn': self.secret_arn,
-                'database': self.database,
-                'sql': sql,
-                'includeResultMetadata': True,
-            }
-
-            if parameters:
-                execute_params['parameters'] = parameters
+            response = await loop.run_in_executor(
+                self._executor, self._execute_statement, sql, parameters, None
+            )
+        return _to_query_result(response)
 
-            return await asyncio.to_thread(self.data_client.execute_statement, **execute_params)
+    def _execute_statement(
+        self,
+        sql: str,
+        parameters: Optional[List[Dict[str, Any]]],
+        transaction_id: Optional[str],
+    ) -> Dict[str, Any]:
+        execute_params = {
+            'resourceArn': self.cluster_arn,
+            'secretArn': self.secret_arn,
+            'database': self.database,
+            'sql': sql,
+            'includeResultMetadata': True,
+            'formatRecordsAs': 'JSON',
+        }
+        if transaction_id:
+            execute_params['transactionId'] = transaction_id
+        if parameters:
+            execute_params['parameters'] = parameters
+        return self.data_client.execute_statement(**execute_params)
 
     def _execute_readonly_query(
         self, query: str, parameters: Optional[List[Dict[str, Any]]] = None
     ) -> Dict[str, Any]:
         """Execute a query under readonly transaction.
 
+        A failure on a reused transaction, which may have timed out, is retried once
+        on a new transaction.
+
         Args:
             query: query to run
             parameters: parameters
 
         Returns:
-            Dict containing query results with column metadata and records
+            Data API response with the column metadata and JSON records
         """
-        tx_id = ''
+        tx_id, started, reused = self._acquire_readonly_transaction()
         try:
-            # Begin read-only transaction
-            tx = self.data_client.begin_transaction(
-                resourceArn=self.cluster_arn,
-                secretArn=self.secret_arn,
-                database=self.database,
-            )
+            result = self._execute_statement(query, parameters, tx_id)
+        except Exception as e:
+            self._rollback_transaction(tx_id)
+            if not reused:
+                raise e
+            # The reused transaction may have timed out, so retry on a new transaction
+            logger.debug(f'Retrying query on a new read-only transaction: {str(e)}')
+            tx_id, started, _ = self._acquire_readonly_transaction(fresh=True)
+            try:
+                result = self._execute_statement(query, parameters, tx_id)
+            except Exception:
+                self._rollback_transaction(tx_id)
+                raise
+
+        if (
+            TRANSACTION_CONTROL_PATTERN.match(query) is None
+            and SESSION_STATE_FUNCTION_PATTERN.search(query) is None
+        ):
+            self._release_readonly_transaction(tx_id, started)
+        else:
+            self._rollback_transaction(tx_id)
+        return result
+
+    def _acquire_readonly_transaction(self, fresh: bool = False) -> Tuple[str, float, bool]:
+        """Return an open read-only transaction, beginning one if none can be reused.
+
+        Args:
+            fresh: Whether to begin a new transaction even if one can be reused
 
-            tx_id = tx['transactionId']
+        Returns:
+            Transaction id, its start time, and whether it was reused
+        """
+        now = time.monotonic()
+        expired = []
+        reusable = None
+        with self._idle_changed:
+            while self._idle_transactions and not fresh:
+                tx_id, started, last_used = self._idle_transactions.pop()
+                if _expires_at(started, last_used) > now:
+                    reusable = (tx_id, started, True)
+                    break
+                expired.append(tx_id)
+        for tx_id in expired:
+            self._rollback_transaction(tx_id)
+        if reusable is not None:
+            return reusable
 
+        tx_id = self.data_client.begin_transaction(
+            resourceArn=self.cluster_arn,
+            secretArn=self.secret_arn,
+            database=self.database,
+        )['transactionId']
+        try:
             self.data_client.execute_statement(
                 resourceArn=self.cluster_arn,
                 secretArn=self.secret_arn,
                 database=self.database,
-                sql='SET TRANSACTION READ ONLY',
+                sql=READONLY_TRANSACTION_SQL,
                 transactionId=tx_id,
             )
+        except Exception as e:
+            self._rollback_transaction(tx_id)
+            raise e
+        return tx_id, time.monotonic(), False
 
-            execute_params = {
-                'resourceArn': self.cluster_arn,
-                'secretArn': self.secret_arn,
-                'database': self.database,
-                'sql': query,
-                'includeResultMetadata': True,
-                'transactionId': tx_id,
-            }
+    def _release_readonly_transaction(self, tx_id: str, started: float):
+        """Keep a read-only transaction open for reuse, or roll it back if enough are idle.
 
-            if parameters is not None:
-                execute_params['parameters'] = parameters
+        Args:
+            tx_id: Transaction id
+            started: Start time of the transaction
+        """
+        with self._idle_changed:
+            if not self._closed and len(self._idle_transactions) < READONLY_MAX_IDLE_TRANSACTIONS:
+                self._idle_transactions.append((tx_id, started, time.monotonic()))
+                if self._reaper is None:
+                    self._reaper = threading.Thread(
+                        target=self._reap_idle_transactions,
+                        name='rds-data-api-reaper',
+                        daemon=True,
+                    )
+                    self._reaper.start()
+                self._idle_changed.notify()
+                return
+        self._rollback_transaction(tx_id)
 
-            result = self.data_client.execute_statement(**execute_params)
+    def _reap_idle_transactions(self):
+        """Roll back idle read-only transactions as soon as they can no longer be reused."""
+        while True:
+            with self._idle_changed:
+                now = time.monotonic()
+                expired = [
+                    tx_id
+                    for tx_id, started, last_used in self._idle_transactions
+                    if _expires_at(started, last_used) <= now
+                ]
+                self._idle_transactions = [
+                    transaction
+                    for transaction in self._idle_transactions
+                    if transaction[0] not in expired
+                ]
+                if not expired:
+                    if self._closed:
+                        return
+                    next_expiry = min(
+                        (
+                            _expires_at(started, last_used)
+                            for _, started, last_used in self._idle_transactions
+                        ),
+                        default=None,
+                    )
+                    self._idle_changed.wait(None if next_expiry is None else next_expiry - now)
+                    continue
+            for tx_id in expired:
+                self._rollback_transaction(tx_id)
 
-            self.data_client.commit_transaction(
+    def _rollback_transaction(self, tx_id: str):
+        try:
+            self.data_client.rollback_transaction(
                 resourceArn=self.cluster_arn,
                 secretArn=self.secret_arn,
                 transactionId=tx_id,
             )
-            return result
         except Exception as e:
-            if tx_id:
-                self.data_client.rollback_transaction(
-                    resourceArn=self.cluster_arn,
-                    secretArn=self.secret_arn,
-                    transactionId=tx_id,
-                )
-            raise e
+            # The transaction may already have ended or timed out
+            logger.debug(f'Failed to roll back transaction {tx_id}: {str(e)}')
 
     async def close(self) -> None:
         """Close the database connection asynchronously."""
-        # RDS Data API doesn't maintain persistent connections
-        pass
+        # RDS Data API doesn't maintain persistent connections, only the open transactions
+        with self._idle_changed:
+            self._closed = True
+            idle, self._idle_transactions = self._idle_transactions, []
+            self._idle_changed.notify()
+        for tx_id, _, _ in idle:
+            await asyncio.to_thread(self._rollback_transaction, tx_id)
+        self._executor.shutdown(wait=False)
 
     async def check_connection_health(self) -> bool:
         """Check if the RDS Data API connection is healthy.
@@ -151,7 +311,21 @@ class RDSDataAPIConnection(AbstractDBConnection):
         """
         try:
             result = await self.execute_query('SELECT 1')
-            return len(result.get('records', [])) > 0
+            return len(result.rows) > 0
         except Exception as e:
             logger.error(f'RDS Data API connection health check failed: {str(e)}')
             return False
+
+
+def _expires_at(started: float, last_used: float) -> float:
+    """Return the time after which an idle read-only transaction is no longer reused."""
+    return min(
+        last_used + READONLY_TRANSACTION_IDLE_TIMEOUT, started + READONLY_TRANSACTION_MAX_AGE
+    )
+
+
+def _to_query_result(response: Dict[str, Any]) -> QueryResult:
+    """Convert an execute_statement response with JSON records into a QueryResult."""
+    columns = [column['name'] for column in response.get('columnMetadata', [])]
+    records = json.loads(response.get('formattedRecords') or '[]')
+    return QueryResult(columns, [tuple(record.get(c) for c in columns) for record in records])
@@ -0,0 +1,147 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Secrets Manager credentials for postgres MCP Server.
+
+Database credentials are cached for a time to live and read again afterwards, so a
+rotated secret is picked up without restarting the server.
+"""
+
+import boto3
+import json
+import threading
+import time
+from loguru import logger
+from typing import Any, Optional, Tuple
+
+
+# Seconds the credentials read from a secret are used before the secret is read again
+CREDENTIALS_TTL = 300
+
+
+class SecretCredentialsProvider:
+    """Provides the username and password stored in a Secrets Manager secret."""
+
+    def __init__(
+        self,
+        secret_arn: str,
+        region: str,
+        ttl: int = CREDENTIALS_TTL,
+        is_test: bool = False,
+    ):
+        """Initialize the credentials provider.
+
+        Args:
+            secret_arn: ARN of the secret containing credentials
+            region: AWS region for Secrets Manager
+            ttl: Seconds the credentials are cached for
+            is_test: Whether this is a test provider
+        """
+        self.secret_arn = secret_arn
+        self.region = region
+        self.ttl = ttl
+        self.is_test = is_test
+        self.refresh_count = 0
+        self._client: Any = None
+        self._credentials: Optional[Tuple[str, str]] = None
+        self._fetched_at = 0.0
+        self._lock = threading.Lock()
+
+    @property
+    def age(self) -> float:
+        """Seconds since the secret was last read."""
+        return time.monotonic() - self._fetched_at
+
+    @property
+    def expired(self) -> bool:
+        """Whether the cached credentials are missing or older than the time to live."""
+        return self._credentials is None or self.age >= self.ttl
+
+    @property
+    def current(self) -> Optional[Tuple[str, str]]:
+        """The cached username and password, without reading the secret."""
+        return self._credentials
+
+    def get_credentials(self) -> Tuple[str, str]:
+        """Return the username and password, reading the secret if the cache expired."""
+        with self._lock:
+            if not self.expired and self._credentials is not None:
+                return self._credentials
+        self.refresh()
+        assert self._credentials is not None
+        return self._credentials
+
+    def refresh(self) -> bool:
+        """Read the secret again.
+
+        Returns:
+            True if the credentials differ from the previously cached ones
+        """
+        try:
+            credentials = self._fetch_credentials()
+        except Exception as e:
+            logger.error(f'Error retrieving secret: {str(e)}')
+            raise ValueError(f'Failed to retrieve credentials from Secrets Manager: {str(e)}')
+
+        with self._lock:
+            changed = self._credentials is not None and credentials != self._credentials
+            self._credentials = credentials
+            self._fetched_at = time.monotonic()
+            self.refresh_count += 1
+        if changed:
+            logger.info(f'Credentials of secret {self.secret_arn} have changed')
+        return changed
+
+    def _fetch_credentials(self) -> Tuple[str, str]:
+        """Get database credentials from AWS Secrets Manager."""
+        if self.is_test:
+            return 'test_user', 'test_password'
+
+        if self._client is None:
+            logger.info(f'Creating Secrets Manager client in region {self.region}')
+            self._client = boto3.Session().client(
+                service_name='secretsmanager', region_name=self.region
+            )
+
+        # Get the secret value
+        logger.info(f'Retrieving secret value for {self.secret_arn}')
+        get_secret_value_response = self._client.get_secret_value(SecretId=self.secret_arn)
+
+        # Parse the secret string
+        if 'SecretString' not in get_secret_value_response:
+            logger.error('Secret does not contain a SecretString')
+            raise ValueError('Secret does not contain a SecretString')
+
+        secret = json.loads(get_secret_value_response['SecretString'])
+
+        # Extract username and password
+        username = secret.get('username') or secret.get('user') or secret.get('Username')
+        password = secret.get('password') or secret.get('Password')
+
+        if not username:
+            logger.error(
+                f'Username not found in secret. Available keys: {", ".join(secret.keys())}'
+            )
+            raise ValueError(
+                f'Secret does not contain username. Available keys: {", ".join(secret.keys())}'
+            )
+
+        if not password:
+            logger.error('Password not found in secret')
+            raise ValueError(
+                f'Secret does not contain password. Available keys: {", ".join(secret.keys())}'
+            )
+
+        logger.info(f'Successfully extracted credentials for user: {username}')
+        return username, password
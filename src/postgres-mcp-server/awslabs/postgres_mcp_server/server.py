@@ -19,6 +19,8 @@ import asyncio
 import sys
 from awslabs.postgres_mcp_server.connection import DBConnectionSingleton
 from awslabs.postgres_mcp_server.connection.psycopg_pool_connection import PsycopgPoolConnection
+from awslabs.postgres_mcp_server.connection.query_result import QueryResult
+from awslabs.postgres_mcp_server.connection.secret_credentials import CREDENTIALS_TTL
 from awslabs.postgres_mcp_server.mutable_sql_detector import (
     check_sql_injection_risk,
     detect_mutating_keywords,
@@ -27,7 +29,7 @@ from botocore.exceptions import BotoCoreError, ClientError
 from loguru import logger
 from mcp.server.fastmcp import Context, FastMCP
 from pydantic import Field
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, List, Optional, Union
 
 
 client_error_code_key = 'run_query ClientError code'
@@ -35,6 +37,7 @@ unexpected_error_key = 'run_query unexpected error'
 write_query_prohibited_key = 'Your MCP tool only allows readonly query. If you want to write, change the MCP configuration per README.md'
 query_comment_prohibited_key = 'The comment in query is prohibited because of injection risk'
 query_injection_risk_key = 'Your query contains risky injection patterns'
+result_truncated_key = 'The result was truncated to the first {} rows by the --max_rows setting of the MCP server. Narrow the query, for example with WHERE or LIMIT, to see the remaining rows'
 
 
 class DummyCtx:
@@ -49,6 +52,15 @@ class DummyCtx:
         # Do nothing
         pass
 
+    async def warning(self, message):
+        """Ignore a warning message.
+
+        Args:
+            message: The warning message
+        """
+        # Do nothing
+        pass
+
 
 def extract_cell(cell: dict):
     """Extracts the scalar or array value from a single cell."""
@@ -67,8 +79,15 @@ def extract_cell(cell: dict):
     return None
 
 
-def parse_execute_response(response: dict) -> list[dict]:
-    """Convert RDS Data API execute_statement response to list of rows."""
+def parse_execute_response(response: Union[dict, QueryResult]) -> list[dict]:
+    """Convert a query response to list of rows.
+
+    Results read natively are converted row by row; RDS Data API execute_statement
+    responses are unwrapped cell by cell.
+    """
+    if isinstance(response, QueryResult):
+        return response.to_records()
+
     columns = [col['name'] for col in response.get('columnMetadata', [])]
     records = []
 
@@ -150,6 +169,9 @@ async def run_query(
         response = await db_connection.execute_query(sql, query_parameters)
 
         logger.success(f'run_query successfully executed query:{sql}')
+        if isinstance(response, QueryResult) and response.truncated:
+            logger.warning(f'Query result was truncated to {len(response.rows)} rows')
+            await ctx.warning(result_truncated_key.format(len(response.rows)))
         return parse_execute_response(response)
     except ClientError as e:
         logger.exception(client_error_code_key)
@@ -226,6 +248,19 @@ def main():
     parser.add_argument('--database', required=True, help='Database name')
     parser.add_argument('--region', required=True, help='AWS region')
     parser.add_argument('--readonly', required=True, help='Enforce readonly SQL statements')
+    parser.add_argument(
+        '--max_rows',
+        type=int,
+        default=None,
+        help='Maximum number of rows returned by a query (for direct PostgreSQL connection)',
+    )
+    parser.add_argument(
+        '--credentials_ttl',
+        type=int,
+        default=CREDENTIALS_TTL,
+        help='Seconds before the secret is read again to pick up rotated credentials '
+        '(for direct PostgreSQL connection)',
+    )
 
     args = parser.parse_args()
 
@@ -292,6 +327,8 @@ def main():
                     readonly=connection_params['readonly'],
                     secret_arn=args.secret_arn,
                     region=args.region,
+                    max_rows=args.max_rows,
+                    credentials_ttl=args.credentials_ttl,
                 )
             except Exception as e:
                 logger.exception(f'Failed to create PostgreSQL connection: {str(e)}')
@@ -13,11 +13,19 @@
 # limitations under the License.
 """Tests for the psycopg connector functionality."""
 
+import asyncio
 import concurrent.futures
+import datetime
+import decimal
 import pytest
 import threading
 import time
-from awslabs.postgres_mcp_server.connection.psycopg_pool_connection import PsycopgPoolConnection
+from awslabs.postgres_mcp_server.connection.psycopg_pool_connection import (
+    PsycopgPoolConnection,
+)
+from awslabs.postgres_mcp_server.connection.query_result import QueryResult
+from psycopg import OperationalError
+from psycopg_pool import PoolClosed, PoolTimeout
 from unittest.mock import AsyncMock, MagicMock, patch
 
 
@@ -400,3 +408,325 @@ class TestPsycopgConnector:
         # Verify that some connection attempts timed out
         assert stats['timeouts'] > 0
         assert stats['attempts'] == num_threads
+
+
+class _FakeCursor:
+    """Async cursor returning rows built by its row factory."""
+
+    def __init__(self, rows, row_factory):
+        self.description = [('id',), ('amount',), ('created',)]
+        self.fetch_sizes = []
+        self._rows = [row_factory(self)(row) for row in rows]
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    async def execute(self, sql, params=None):
+        pass
+
+    async def fetchmany(self, size):
+        self.fetch_sizes.append(size)
+        batch, self._rows = self._rows[:size], self._rows[size:]
+        return batch
+
+
+class _FakeConnection:
+    """Async connection creating a fake cursor over fixed rows."""
+
+    def __init__(self, rows):
+        self.rows = rows
+        self.cursors = []
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *args):
+        return False
+
+    def transaction(self):
+        return self
+
+    async def execute(self, sql):
+        pass
+
+    def cursor(self, row_factory):
+        cursor = _FakeCursor(self.rows, row_factory)
+        self.cursors.append(cursor)
+        return cursor
+
+
+class TestPsycopgQueryResult:
+    """Tests for the native result rows of PsycopgPoolConnection."""
+
+    @staticmethod
+    def _connection(rows, max_rows=None):
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=True,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            max_rows=max_rows,
+            is_test=True,
+        )
+        fake = _FakeConnection(rows)
+        conn._get_connection = AsyncMock(return_value=fake)
+        return conn, fake
+
+    @pytest.mark.asyncio
+    async def test_rows_are_returned_as_native_tuples(self):
+        """Test that rows are tuples with non-JSON values converted to strings."""
+        rows = [
+            (1, decimal.Decimal('9.50'), datetime.date(2024, 1, 2)),
+            (2, None, datetime.date(2024, 1, 3)),
+        ]
+        conn, _ = self._connection(rows)
+
+        result = await conn.execute_query('SELECT * FROM orders')
+
+        assert result.columns == ['id', 'amount', 'created']
+        assert result.rows == [(1, '9.50', '2024-01-02'), (2, None, '2024-01-03')]
+        assert not result.truncated
+        assert result.to_columns() == {
+            'id': [1, 2],
+            'amount': ['9.50', None],
+            'created': ['2024-01-02', '2024-01-03'],
+        }
+
+    @pytest.mark.asyncio
+    async def test_rows_are_fetched_in_batches_up_to_the_limit(self):
+        """Test that rows are fetched in batches and cut at the row limit."""
+        rows = [(i, 'a', 'b') for i in range(2500)]
+
+        with patch(
+            'awslabs.postgres_mcp_server.connection.psycopg_pool_connection.FETCH_BATCH_SIZE',
+            1000,
+        ):
+            conn, fake = self._connection(rows)
+            result = await conn.execute_query('SELECT * FROM orders')
+            assert len(result.rows) == 2500
+            assert fake.cursors[0].fetch_sizes == [1000, 1000, 1000]
+
+            conn, fake = self._connection(rows, max_rows=1500)
+            result = await conn.execute_query('SELECT * FROM orders')
+            assert len(result.rows) == 1500
+            assert result.truncated
+            assert fake.cursors[0].fetch_sizes == [1000, 501]
+
+
+class TestPsycopgCredentialRotation:
+    """Tests for re-keying the pool of PsycopgPoolConnection when the secret rotates."""
+
+    @staticmethod
+    def _connection(credentials_ttl=300):
+        conn = PsycopgPoolConnection(
+            host='localhost',
+            port=5432,
+            database='test_db',
+            readonly=False,
+            secret_arn='test_secret_arn',  # pragma: allowlist secret
+            region='us-east-1',
+            credentials_ttl=credentials_ttl,
+            is_test=True,
+        )
+        conn.credentials._fetch_credentials = MagicMock(
+            return_value=('test_user', 'rotated_password')  # pragma: allowlist secret
+        )
+        return conn
+
+    @pytest.mark.asyncio
+    @patch('awslabs.postgres_mcp_server.connection.psycopg_pool_connection.AsyncConnectionPool')
+    async def test_pool_is_rekeyed_and_previous_pool_drained(self, mock_connection_pool):
+        """Test that rotated credentials open a new pool and close the previous one."""
+        old_pool, new_pool = MagicMock(close=AsyncMock()), MagicMock(close=AsyncMock())
+        old_pool.get_stats.side_effect = [{'requests_waiting': 1}, {'requests_waiting': 0}]
+        mock_connection_pool.side_effect = [old_pool, new_pool]
+        conn = self._connection()
+        await conn.initialize_pool()
+
+        with patch(
+            'awslabs.postgres_mcp_server.connection.psycopg_pool_connection.POOL_DRAIN_POLL_INTERVAL',
+            0,
+        ):
+            assert await conn.refresh_credentials()
+
+            assert conn.pool is new_pool
+            assert 'password=rotated_password' in mock_connection_pool.call_args.args[0]
+            assert conn.get_pool_stats()['draining_pools'] == 1
+            # The previous pool is only closed once no client waits for it anymore
+            await asyncio.gather(*conn._drain_tasks)
+
+        assert old_pool.get_stats.call_count == 2
+        old_pool.close.assert_awaited_once()
+        assert conn.get_pool_stats()['draining_pools'] == 0
+        await conn.close()
+        old_pool.close.assert_awaited_once()
+        new_pool.close.assert_awaited_once()
+        assert conn.rekey_count == 1
+
+    @pytest.mark.asyncio
+    @patch('awslabs.postgres_mcp_server.connection.psycopg_pool_connection.AsyncConnectionPool')
+    async def test_closing_connection_closes_draining_pools(self, mock_connection_pool):
+        """Test that closing the connection does not wait for replaced pools to drain."""
+        old_pool, new_pool = MagicMock(close=AsyncMock()), MagicMock(close=AsyncMock())
+        old_pool.get_stats.return_value = {'requests_waiting': 1}
+        mock_connection_pool.side_effect = [old_pool, new_pool]
+        conn = self._connection()
+        await conn.initialize_pool()
+        assert await conn.refresh_credentials()
+
+        await conn.close()
+
+        old_pool.close.assert_awaited_once()
+        new_pool.close.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_query_waiting_on_replaced_pool_is_retried(self):
+        """Test that a query failed by closing a replaced pool runs on the new pool."""
+        conn = self._connection()
+        conn.pool = MagicMock(closed=False)
+        conn.refresh_credentials = AsyncMock()
+        conn._execute_query = AsyncMock(side_effect=[PoolClosed('closed'), QueryResult(['a'])])
+
+        assert (await conn.execute_query('SELECT 1')).columns == ['a']
+        assert conn._execute_query.await_count == 2
+        conn.refresh_credentials.assert_not_called()
+
+        conn.pool.closed = True
+        conn._execute_query = AsyncMock(side_effect=PoolClosed('closed'))
+        with pytest.raises(PoolClosed):
+            await conn.execute_query('SELECT 1')
+
+    @pytest.mark.asyncio
+    @patch('awslabs.postgres_mcp_server.connection.psycopg_pool_connection.AsyncConnectionPool')
+    async def test_expired_credentials_are_refreshed_in_background(self, mock_connection_pool):
+        """Test that getting a connection schedules a refresh once the credentials expired."""
+        mock_connection_pool.side_effect = lambda *args, **kwargs: MagicMock(close=AsyncMock())
+        conn = self._connection(credentials_ttl=0)
+
+        await conn._get_connection()
+        refresh_task = conn._refresh_task
+        assert refresh_task is not None
+        assert await refresh_task
+        assert conn.credentials.refresh_count == 2
+        assert mock_connection_pool.call_count == 2
+        await conn.close()
+
+    @pytest.mark.asyncio
+    async def test_query_is_retried_after_rotation(self):
+        """Test that a query failing to connect is retried only if the credentials changed."""
+        conn = self._connection()
+
+        async def rotate():
+            conn.rekey_count += 1
+            return True
+
+        conn.refresh_credentials = AsyncMock(side_effect=rotate)
+        conn._execute_query = AsyncMock(side_effect=[PoolTimeout('timeout'), QueryResult(['a'])])
+
+        with patch(
+            'awslabs.postgres_mcp_server.connection.psycopg_pool_connection.CREDENTIALS_MIN_REFRESH_INTERVAL',
+            0,
+        ):
+            assert (await conn.execute_query('SELECT 1')).columns == ['a']
+
+            conn.refresh_credentials = AsyncMock(return_value=False)
+            conn._execute_query = AsyncMock(side_effect=OperationalError('refused'))
+            with pytest.raises(OperationalError):
+                await conn.execute_query('SELECT 1')
+
+        # The secret is not read again right after it was read
+        conn.refresh_credentials.reset_mock()
+        with pytest.raises(OperationalError):
+            await conn.execute_query('SELECT 1')
+        conn.refresh_credentials.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_queries_failing_together_share_one_rotation(self):
+        """Test that every query failing to connect is retried on the pool re-keyed once."""
+        conn = self._connection()
+
+        async def rotate():
+            await asyncio.sleep(0.01)
+            conn.rekey_count += 1
+            return True
+
+        async def execute_query(sql, parameters):
+            await asyncio.sleep(0)
+            if conn.rekey_count == 0:
+                raise PoolTimeout('timeout')
+            return QueryResult(['a'])
+
+        conn.refresh_credentials = AsyncMock(side_effect=rotate)
+        conn._execute_query = AsyncMock(side_effect=execute_query)
+        with patch(
+            'awslabs.postgres_mcp_server.connection.psycopg_pool_connection.CREDENTIALS_MIN_REFRESH_INTERVAL',
+            0,
+        ):
+            results = await asyncio.gather(*(conn.execute_query('SELECT 1') for _ in range(3)))
+
+        assert [result.columns for result in results] == [['a']] * 3
+        conn.refresh_credentials.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_query_is_retried_after_rekey_by_another_caller(self):
+        """Test that a query is retried without reading the secret when the pool was re-keyed."""
+        conn = self._connection()
+        conn.refresh_credentials = AsyncMock()
+
+        async def execute_query(sql, parameters):
+            if conn.rekey_count == 0:
+                conn.rekey_count += 1
+                raise OperationalError('password authentication failed')
+            return QueryResult(['a'])
+
+        conn._execute_query = AsyncMock(side_effect=execute_query)
+
+        assert (await conn.execute_query('SELECT 1')).columns == ['a']
+        conn.refresh_credentials.assert_not_called()
+
+    @pytest.mark.asyncio
+    @patch('awslabs.postgres_mcp_server.connection.psycopg_pool_connection.AsyncConnectionPool')
+    async def test_pool_stats_are_logged_periodically(self, mock_connection_pool):
+        """Test that the pool statistics are logged while the pool is in use."""
+        conn = self._connection()
+        with (
+            patch(
+                'awslabs.postgres_mcp_server.connection.psycopg_pool_connection.POOL_STATS_LOG_INTERVAL',
+                0,
+            ),
+            patch('awslabs.postgres_mcp_server.connection.psycopg_pool_connection.logger') as log,
+        ):
+            await conn._get_connection()
+
+        assert any(
+            call.args[0].startswith('Connection pool stats: ') for call in log.info.call_args_list
+        )
+
+    def test_pool_stats_include_wait_metrics(self):
+        """Test that the pool statistics report waiting requests and re-keys."""
+        conn = self._connection()
+        conn.pool = MagicMock()
+        conn.pool.get_stats.return_value = {
+            'pool_min': 1,
+            'pool_max': 10,
+            'pool_size': 4,
+            'pool_available': 1,
+            'requests_waiting': 2,
+            'requests_wait_ms': 350,
+            'requests_num': 40,
+        }
+
+        stats = conn.get_pool_stats()
+
+        assert stats['size'] == 4
+        assert stats['idle'] == 1
+        assert stats['requests_waiting'] == 2
+        assert stats['requests_wait_ms'] == 350
+        assert stats['connections_errors'] == 0
+        assert stats['credential_refreshes'] == 1
+        assert stats['pool_rekeys'] == 0
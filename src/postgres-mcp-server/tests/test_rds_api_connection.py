@@ -0,0 +1,188 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the RDS Data API connector functionality."""
+
+import asyncio
+import itertools
+import json
+import pytest
+import threading
+from awslabs.postgres_mcp_server.connection.rds_api_connection import (
+    READONLY_TRANSACTION_SQL,
+    RDSDataAPIConnection,
+)
+from unittest.mock import MagicMock, patch
+
+
+def _connection(readonly=True):
+    conn = RDSDataAPIConnection(
+        cluster_arn='test_cluster_arn',
+        secret_arn='test_secret_arn',  # pragma: allowlist secret
+        database='test_db',
+        region='us-east-1',
+        readonly=readonly,
+        is_test=True,
+    )
+    transaction_ids = itertools.count(1)
+    conn.data_client = MagicMock()
+    conn.data_client.begin_transaction.side_effect = lambda **kwargs: {
+        'transactionId': f'tx-{next(transaction_ids)}'
+    }
+    conn.data_client.execute_statement.return_value = {
+        'columnMetadata': [{'name': 'id'}, {'name': 'tags'}],
+        'formattedRecords': json.dumps([{'id': 1, 'tags': ['a', 'b']}, {'id': 2, 'tags': None}]),
+    }
+    return conn
+
+
+def _statements(conn):
+    return [
+        (call.kwargs['sql'], call.kwargs.get('transactionId'))
+        for call in conn.data_client.execute_statement.call_args_list
+    ]
+
+
+@pytest.mark.asyncio
+async def test_readonly_queries_reuse_one_transaction():
+    """Test that warm read-only queries take a single Data API call each."""
+    conn = _connection()
+
+    results = [await conn.execute_query('SELECT id, tags FROM items') for _ in range(3)]
+
+    result = results[-1]
+    assert result.columns == ['id', 'tags']
+    assert result.rows == [(1, ['a', 'b']), (2, None)]
+    assert conn.data_client.begin_transaction.call_count == 1
+    assert (
+        _statements(conn)
+        == [(READONLY_TRANSACTION_SQL, 'tx-1')] + [('SELECT id, tags FROM items', 'tx-1')] * 3
+    )
+    assert conn.data_client.execute_statement.call_args.kwargs['formatRecordsAs'] == 'JSON'
+    conn.data_client.commit_transaction.assert_not_called()
+
+    await conn.close()
+    conn.data_client.rollback_transaction.assert_called_once_with(
+        resourceArn='test_cluster_arn',
+        secretArn='test_secret_arn',  # pragma: allowlist secret
+        transactionId='tx-1',
+    )
+
+
+@pytest.mark.asyncio
+async def test_transaction_control_statements_end_the_transaction():
+    """Test that a transaction is not reused after statements that could change it."""
+    conn = _connection()
+
+    await conn.execute_query('/* switch */ SET ROLE reader')
+    await conn.execute_query('SELECT 1')
+
+    assert conn.data_client.begin_transaction.call_count == 2
+    assert conn.data_client.rollback_transaction.call_args.kwargs['transactionId'] == 'tx-1'
+
+
+@pytest.mark.asyncio
+async def test_set_config_calls_end_the_transaction():
+    """Test that a transaction is not reused after a query changed its settings."""
+    conn = _connection()
+
+    await conn.execute_query("SELECT SET_CONFIG ('search_path', 'private', true)")
+    await conn.execute_query('SELECT 1')
+    await conn.execute_query("""SELECT pg_catalog."set_config"('work_mem', '1GB', true)""")
+    await conn.execute_query('SELECT 1')
+
+    assert conn.data_client.begin_transaction.call_count == 3
+    assert [
+        call.kwargs['transactionId']
+        for call in conn.data_client.rollback_transaction.call_args_list
+    ] == ['tx-1', 'tx-2']
+
+
+@pytest.mark.asyncio
+async def test_failed_reused_transaction_is_retried():
+    """Test that a query failing on a reused transaction is retried on a new one."""
+    conn = _connection()
+    await conn.execute_query('SELECT 1')
+    response = conn.data_client.execute_statement.return_value
+
+    def execute_statement(**kwargs):
+        if kwargs.get('transactionId') == 'tx-1':
+            raise Exception('Transaction tx-1 is not found')
+        return response
+
+    conn.data_client.execute_statement.side_effect = execute_statement
+    result = await conn.execute_query('SELECT 1')
+
+    assert len(result.rows) == 2
+    assert conn.data_client.begin_transaction.call_count == 2
+
+    conn.data_client.execute_statement.side_effect = Exception('syntax error')
+    with pytest.raises(Exception, match='syntax error'):
+        await conn.execute_query('SELEC 1')
+
+
+@pytest.mark.asyncio
+async def test_idle_transactions_are_rolled_back_when_they_expire():
+    """Test that an idle transaction is rolled back without waiting for another query."""
+    conn = _connection()
+
+    with patch(
+        'awslabs.postgres_mcp_server.connection.rds_api_connection.READONLY_TRANSACTION_IDLE_TIMEOUT',
+        0.05,
+    ):
+        await conn.execute_query('SELECT 1')
+        for _ in range(100):
+            if conn.data_client.rollback_transaction.called:
+                break
+            await asyncio.sleep(0.01)
+
+    assert conn.data_client.rollback_transaction.call_args.kwargs['transactionId'] == 'tx-1'
+    await conn.execute_query('SELECT 1')
+    assert conn.data_client.begin_transaction.call_count == 2
+    await conn.close()
+
+
+@pytest.mark.asyncio
+async def test_idle_transactions_are_bounded():
+    """Test that transactions beyond the idle limit are rolled back right away."""
+    conn = _connection()
+    response = conn.data_client.execute_statement.return_value
+    both_running = threading.Barrier(2)
+
+    def execute_statement(**kwargs):
+        if kwargs['sql'] == 'SELECT 1':
+            both_running.wait(timeout=5)
+        return response
+
+    conn.data_client.execute_statement.side_effect = execute_statement
+    with patch(
+        'awslabs.postgres_mcp_server.connection.rds_api_connection.READONLY_MAX_IDLE_TRANSACTIONS',
+        1,
+    ):
+        await asyncio.gather(conn.execute_query('SELECT 1'), conn.execute_query('SELECT 1'))
+
+    assert conn.data_client.begin_transaction.call_count == 2
+    assert conn.data_client.rollback_transaction.call_count == 1
+    await conn.close()
+    assert conn.data_client.rollback_transaction.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_write_queries_run_without_transaction():
+    """Test that queries of a writable connection take a single call."""
+    conn = _connection(readonly=False)
+
+    await conn.execute_query('UPDATE items SET id = 1')
+
+    conn.data_client.begin_transaction.assert_not_called()
+    assert _statements(conn) == [('UPDATE items SET id = 1', None)]
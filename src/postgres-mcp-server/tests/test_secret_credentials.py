@@ -0,0 +1,71 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Tests for the Secrets Manager credentials provider."""
+
+import json
+import pytest
+from awslabs.postgres_mcp_server.connection.secret_credentials import SecretCredentialsProvider
+from unittest.mock import patch
+
+
+def _secret(**values):
+    return {'SecretString': json.dumps(values)}
+
+
+@patch('awslabs.postgres_mcp_server.connection.secret_credentials.boto3')
+def test_credentials_are_cached_until_expired(mock_boto3):
+    """Test that the secret is read once per time to live with a shared client."""
+    client = mock_boto3.Session.return_value.client.return_value
+    client.get_secret_value.return_value = _secret(username='admin', password='first')
+    provider = SecretCredentialsProvider('test_secret_arn', 'us-east-1', ttl=300)
+
+    assert provider.get_credentials() == ('admin', 'first')
+    assert provider.get_credentials() == ('admin', 'first')
+    assert client.get_secret_value.call_count == 1
+    assert not provider.expired
+
+    provider.ttl = 0
+    client.get_secret_value.return_value = _secret(username='admin', password='second')
+    assert provider.expired
+    assert provider.get_credentials() == ('admin', 'second')
+    assert mock_boto3.Session.call_count == 1
+    assert provider.refresh_count == 2
+
+
+@patch('awslabs.postgres_mcp_server.connection.secret_credentials.boto3')
+def test_refresh_reports_changed_credentials(mock_boto3):
+    """Test that refresh returns whether the credentials changed."""
+    client = mock_boto3.Session.return_value.client.return_value
+    client.get_secret_value.return_value = _secret(user='admin', Password='first')
+    provider = SecretCredentialsProvider('test_secret_arn', 'us-east-1')
+
+    assert not provider.refresh()
+    assert not provider.refresh()
+    client.get_secret_value.return_value = _secret(user='admin', Password='second')
+    assert provider.refresh()
+
+
+@patch('awslabs.postgres_mcp_server.connection.secret_credentials.boto3')
+def test_invalid_secret_raises(mock_boto3):
+    """Test that a secret without a password or a failing read raises ValueError."""
+    client = mock_boto3.Session.return_value.client.return_value
+    client.get_secret_value.return_value = _secret(username='admin')
+    provider = SecretCredentialsProvider('test_secret_arn', 'us-east-1')
+
+    with pytest.raises(ValueError, match='does not contain password'):
+        provider.get_credentials()
+
+    client.get_secret_value.side_effect = Exception('AccessDenied')
+    with pytest.raises(ValueError, match='AccessDenied'):
+        provider.refresh()
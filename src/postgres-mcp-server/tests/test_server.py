@@ -21,17 +21,20 @@ import pytest
 import sys
 import uuid
 from awslabs.postgres_mcp_server.connection.psycopg_pool_connection import PsycopgPoolConnection
+from awslabs.postgres_mcp_server.connection.query_result import QueryResult
 from awslabs.postgres_mcp_server.server import (
     DBConnectionSingleton,
     client_error_code_key,
     get_table_schema,
     main,
+    parse_execute_response,
+    result_truncated_key,
     run_query,
     unexpected_error_key,
     write_query_prohibited_key,
 )
 from conftest import DummyCtx, Mock_DBConnection, Mock_PsycopgPoolConnection, MockException
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 
 SAFE_READONLY_QUERIES = [
@@ -763,6 +766,29 @@ async def test_run_query_with_psycopg_connection():
     assert 'column2' in column_records
 
 
+def test_parse_execute_response_with_query_result():
+    """Test that native query results are converted to rows without cell dicts."""
+    result = QueryResult(['id', 'name'], [(1, 'a'), (2, None)])
+
+    assert parse_execute_response(result) == [{'id': 1, 'name': 'a'}, {'id': 2, 'name': None}]
+    assert parse_execute_response(QueryResult()) == []
+
+
+@pytest.mark.asyncio
+async def test_run_query_reports_truncated_result():
+    """Test that a result cut off by --max_rows is reported as a warning, not as a row."""
+    mock_db_connection = MagicMock(readonly_query=True)
+    mock_db_connection.execute_query = AsyncMock(
+        return_value=QueryResult(['id'], [(1,), (2,)], truncated=True)
+    )
+    ctx = MagicMock(warning=AsyncMock())
+
+    tool_response = await run_query('SELECT id FROM items', ctx, mock_db_connection)
+
+    assert tool_response == [{'id': 1}, {'id': 2}]
+    ctx.warning.assert_awaited_once_with(result_truncated_key.format(2))
+
+
 def test_main_with_psycopg_parameters(monkeypatch, capsys):
     """Test main function with valid psycopg command line parameters."""
     monkeypatch.setattr(
@@ -799,6 +825,8 @@ def test_main_with_psycopg_parameters(monkeypatch, capsys):
         region,
         min_size=1,
         max_size=10,
+        max_rows=None,
+        credentials_ttl=300,
         is_test=False,
     ):
         # Call the original __init__ but force is_test=True
@@ -812,6 +840,8 @@ def test_main_with_psycopg_parameters(monkeypatch, capsys):
             region,
             min_size,
             max_size,
+            max_rows,
+            credentials_ttl,
             is_test=True,
         )
 
@@ -21,8 +21,11 @@ CLIENT_RETRIES = {'max_attempts': 5, 'mode': 'adaptive'}
 CLIENT_USER_AGENT_NAME = 'awslabs/mcp/redshift-mcp-server'
 DEFAULT_LOG_LEVEL = 'WARNING'
 QUERY_TIMEOUT = 3600
+QUERY_POLL_INITIAL_INTERVAL = 0.05
 QUERY_POLL_INTERVAL = 1
 SESSION_KEEPALIVE = 600
+CLUSTER_CACHE_TTL = 300
+CLUSTER_CACHE_MISS_TTL = 10
 
 # Best practices
 
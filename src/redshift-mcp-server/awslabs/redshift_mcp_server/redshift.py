@@ -25,6 +25,9 @@ from awslabs.redshift_mcp_server.consts import (
     CLIENT_READ_TIMEOUT,
     CLIENT_RETRIES,
     CLIENT_USER_AGENT_NAME,
+    CLUSTER_CACHE_MISS_TTL,
+    CLUSTER_CACHE_TTL,
+    QUERY_POLL_INITIAL_INTERVAL,
     QUERY_POLL_INTERVAL,
     QUERY_TIMEOUT,
     SESSION_KEEPALIVE,
@@ -38,6 +41,9 @@ from botocore.config import Config
 from loguru import logger
 
 
+SUSPICIOUS_QUERY_PATTERN = regex.compile(SUSPICIOUS_QUERY_REGEXP)
+
+
 class RedshiftClientManager:
     """Manages AWS clients for Redshift operations."""
 
@@ -197,6 +203,55 @@ class RedshiftSessionManager:
         return (time.time() - session_info['created_at']) > self._session_keepalive
 
 
+class ClusterTopologyCache:
+    """Caches discovered clusters and workgroups to avoid rediscovering them for every query."""
+
+    def __init__(self, ttl: float, miss_ttl: float):
+        """Initialize the topology cache.
+
+        Args:
+            ttl: Seconds the discovered clusters are reused for.
+            miss_ttl: Seconds an identifier missing from the last discovery is reported
+                as not found without discovering clusters again.
+        """
+        self._ttl = ttl
+        self._miss_ttl = miss_ttl
+        self._clusters: dict[str, dict] = {}
+        self._discovered_at: float | None = None
+
+    async def cluster_info(self, cluster_identifier: str) -> dict | None:
+        """Get the information of a cluster or workgroup, discovering clusters if needed.
+
+        Clusters are rediscovered once the cache expired, or when the cluster is not
+        cached, since it may have been created after the last discovery. Unknown
+        identifiers are only rediscovered once the last discovery is older than the
+        miss time to live, so repeated lookups of a wrong identifier stay cheap.
+
+        Args:
+            cluster_identifier: The cluster identifier or workgroup name.
+
+        Returns:
+            Cluster information dictionary from discover_clusters, or None if not found.
+        """
+        if self._discovered_at is not None:
+            age = time.monotonic() - self._discovered_at
+            if cluster_identifier in self._clusters:
+                if age < self._ttl:
+                    return self._clusters[cluster_identifier]
+            elif age < self._miss_ttl:
+                return None
+
+        clusters = await discover_clusters()
+        self._clusters = {cluster['identifier']: cluster for cluster in clusters}
+        self._discovered_at = time.monotonic()
+        return self._clusters.get(cluster_identifier)
+
+    def clear(self):
+        """Forget the discovered clusters."""
+        self._clusters = {}
+        self._discovered_at = None
+
+
 async def _execute_protected_statement(
     cluster_identifier: str,
     database_name: str,
@@ -216,6 +271,11 @@ async def _execute_protected_statement(
     3. <user sql>
     4. END;
 
+    In read-write mode, steps 2 to 4 are sent as a single BatchExecuteStatement call. A batch
+    already runs as one transaction in which a nested BEGIN is ignored, so read-only SQL runs
+    as three statements to keep the READ ONLY transaction enforced. The Data API does not
+    support parameters in batches, so parameterized SQL runs as three statements as well.
+
     Args:
         cluster_identifier: The cluster identifier to query.
         database_name: The database to execute the query against.
@@ -232,12 +292,7 @@ async def _execute_protected_statement(
         Exception: If cluster not found, query fails, or times out.
     """
     # Get cluster info
-    clusters = await discover_clusters()
-    cluster_info = None
-    for cluster in clusters:
-        if cluster['identifier'] == cluster_identifier:
-            cluster_info = cluster
-            break
+    cluster_info = await cluster_cache.cluster_info(cluster_identifier)
 
     if not cluster_info:
         raise Exception(
@@ -249,12 +304,45 @@ async def _execute_protected_statement(
 
     # Check for suspicious patterns in read-only mode
     if not allow_read_write:
-        if regex.compile(SUSPICIOUS_QUERY_REGEXP).search(sql):
+        if SUSPICIOUS_QUERY_PATTERN.search(sql):
             logger.error(f'SQL contains suspicious pattern, execution rejected: {sql}')
             raise Exception(f'SQL contains suspicious pattern, execution rejected: {sql}')
 
-    # Execute BEGIN statement
     begin_sql = 'BEGIN READ WRITE;' if allow_read_write else 'BEGIN READ ONLY;'
+
+    if allow_read_write and not parameters:
+        # Execute BEGIN, user SQL and END in one batch
+        try:
+            batch_id = await _execute_batch_statement(
+                cluster_info=cluster_info,
+                cluster_identifier=cluster_identifier,
+                database_name=database_name,
+                sqls=[begin_sql, sql, 'END;'],
+                session_id=session_id,
+            )
+        except Exception as e:
+            logger.error(f'User SQL execution failed: {e}')
+            # The batch stops at the failing statement, so make sure the transaction is closed
+            try:
+                await _execute_statement(
+                    cluster_info=cluster_info,
+                    cluster_identifier=cluster_identifier,
+                    database_name=database_name,
+                    sql='END;',
+                    session_id=session_id,
+                )
+            except Exception as end_error:
+                logger.error(f'END statement execution failed: {end_error}')
+                raise Exception(f'User SQL failed: {e}; END statement failed: {end_error}')
+            raise
+
+        # Results of a batch statement are addressed by its position in the batch
+        user_query_id = f'{batch_id}:2'
+        data_client = client_manager.redshift_data_client()
+        results_response = data_client.get_statement_result(Id=user_query_id)
+        return results_response, user_query_id
+
+    # Execute BEGIN statement
     await _execute_statement(
         cluster_info=cluster_info,
         cluster_identifier=cluster_identifier,
@@ -370,28 +458,97 @@ async def _execute_statement(
         f'Executed statement: {statement_id}' + (f' in session {session_id}' if session_id else '')
     )
 
-    # Wait for statement completion
+    await _wait_for_statement(statement_id, query_poll_interval, query_timeout)
+    return statement_id
+
+
+async def _execute_batch_statement(
+    cluster_info: dict,
+    cluster_identifier: str,
+    database_name: str,
+    sqls: list[str],
+    session_id: str | None = None,
+    query_poll_interval: float = QUERY_POLL_INTERVAL,
+    query_timeout: float = QUERY_TIMEOUT,
+) -> str:
+    """Execute statements in a single BatchExecuteStatement call.
+
+    Args:
+        cluster_info: Cluster information dictionary.
+        cluster_identifier: The cluster identifier.
+        database_name: The database name.
+        sqls: The SQL statements to execute in order.
+        session_id: Optional session ID to use.
+        query_poll_interval: Maximum polling interval in seconds for checking batch status.
+        query_timeout: Maximum time in seconds to wait for batch completion.
+
+    Returns:
+        Batch statement ID; results of the n-th statement are fetched with ID `<id>:<n>`.
+    """
+    data_client = client_manager.redshift_data_client()
+
+    request_params: dict[str, str | list[str]] = {'Sqls': sqls}
+
+    # Add database and cluster/workgroup identifier only if not using session
+    if session_id:
+        request_params['SessionId'] = session_id
+    else:
+        request_params['Database'] = database_name
+        if cluster_info['type'] == 'provisioned':
+            request_params['ClusterIdentifier'] = cluster_identifier
+        elif cluster_info['type'] == 'serverless':
+            request_params['WorkgroupName'] = cluster_identifier
+        else:
+            raise Exception(f'Unknown cluster type: {cluster_info["type"]}')
+
+    response = data_client.batch_execute_statement(**request_params)
+    batch_id = response['Id']
+
+    logger.debug(
+        f'Executed batch statement: {batch_id}'
+        + (f' in session {session_id}' if session_id else '')
+    )
+
+    await _wait_for_statement(batch_id, query_poll_interval, query_timeout)
+    return batch_id
+
+
+async def _wait_for_statement(
+    statement_id: str, query_poll_interval: float, query_timeout: float
+) -> None:
+    """Wait for a statement to complete.
+
+    The status is polled after a short interval first, which doubles after every poll
+    up to query_poll_interval, so that short queries return quickly while long queries
+    are not polled more often than needed.
+
+    Args:
+        statement_id: ID of the statement or batch statement.
+        query_poll_interval: Maximum polling interval in seconds.
+        query_timeout: Maximum time in seconds to wait for completion.
+    """
+    data_client = client_manager.redshift_data_client()
+
     wait_time = 0
+    poll_interval = min(QUERY_POLL_INITIAL_INTERVAL, query_poll_interval)
     while wait_time < query_timeout:
         status_response = data_client.describe_statement(Id=statement_id)
         status = status_response['Status']
 
         if status == 'FINISHED':
             logger.debug(f'Statement completed: {statement_id}')
-            break
+            return
         elif status in ['FAILED', 'ABORTED']:
             error_msg = status_response.get('Error', 'Unknown error')
             logger.error(f'Statement failed: {error_msg}')
             raise Exception(f'Statement failed: {error_msg}')
 
-        await asyncio.sleep(query_poll_interval)
-        wait_time += query_poll_interval
-
-    if wait_time >= query_timeout:
-        logger.error(f'Statement timed out: {statement_id}')
-        raise Exception(f'Statement timed out after {wait_time} seconds')
+        await asyncio.sleep(poll_interval)
+        wait_time += poll_interval
+        poll_interval = min(poll_interval * 2, query_poll_interval)
 
-    return statement_id
+    logger.error(f'Statement timed out: {statement_id}')
+    raise Exception(f'Statement timed out after {wait_time} seconds')
 
 
 async def discover_clusters() -> list[dict]:
@@ -789,3 +946,6 @@ client_manager = RedshiftClientManager(
 session_manager = RedshiftSessionManager(
     session_keepalive=SESSION_KEEPALIVE, app_name=f'{CLIENT_USER_AGENT_NAME}/{__version__}'
 )
+
+# Global cluster topology cache instance
+cluster_cache = ClusterTopologyCache(ttl=CLUSTER_CACHE_TTL, miss_ttl=CLUSTER_CACHE_MISS_TTL)
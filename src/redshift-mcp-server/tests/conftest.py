@@ -0,0 +1,25 @@
+# Copyright Amazon.com, Inc. or its affiliates. All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+"""Test fixtures for the redshift-mcp-server."""
+
+import pytest
+from awslabs.redshift_mcp_server.redshift import cluster_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_cluster_cache():
+    """Forget clusters discovered by previous tests."""
+    cluster_cache.clear()
+    yield
+    cluster_cache.clear()
@@ -17,8 +17,10 @@
 import pytest
 import time
 from awslabs.redshift_mcp_server.redshift import (
+    ClusterTopologyCache,
     RedshiftClientManager,
     RedshiftSessionManager,
+    _execute_batch_statement,
     _execute_protected_statement,
     _execute_statement,
     discover_clusters,
@@ -239,6 +241,9 @@ class TestRedshiftClientManagerDataClient:
         mock_boto3_session.assert_called_once()
 
 
+PARAMETERS = [{'name': 'id', 'value': '1'}]
+
+
 class TestExecuteProtectedStatement:
     """Tests for _execute_protected_statement function."""
 
@@ -257,11 +262,14 @@ class TestExecuteProtectedStatement:
         mock_session_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.session_manager')
         mock_session_manager.session = mocker.AsyncMock(return_value='test-session-123')
 
-        # Mock _execute_statement
+        # Mock _execute_statement and _execute_batch_statement
         mock_execute_statement = mocker.patch(
             'awslabs.redshift_mcp_server.redshift._execute_statement'
         )
         mock_execute_statement.side_effect = ['begin-stmt-id', 'user-stmt-id', 'end-stmt-id']
+        mock_execute_batch_statement = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_batch_statement'
+        )
 
         # Mock data client
         mock_data_client = mocker.Mock()
@@ -276,13 +284,15 @@ class TestExecuteProtectedStatement:
         # Verify session was created
         mock_session_manager.session.assert_called_once()
 
-        # Verify three statements were executed: BEGIN READ ONLY, user SQL, END
-        assert mock_execute_statement.call_count == 3
+        # Verify BEGIN READ ONLY, user SQL and END were executed as separate statements, since
+        # a batch runs as one transaction that would ignore the nested BEGIN READ ONLY
+        mock_execute_batch_statement.assert_not_called()
         calls = mock_execute_statement.call_args_list
-        assert calls[0][1]['sql'] == 'BEGIN READ ONLY;'
-        assert calls[1][1]['sql'] == 'SELECT 1'
-        assert calls[2][1]['sql'] == 'END;'
+        assert [c[1]['sql'] for c in calls] == ['BEGIN READ ONLY;', 'SELECT 1', 'END;']
+        assert all(c[1]['session_id'] == 'test-session-123' for c in calls)
 
+        # Verify the results of the user SQL were fetched
+        mock_data_client.get_statement_result.assert_called_once_with(Id='user-stmt-id')
         assert result[1] == 'user-stmt-id'
 
     @pytest.mark.asyncio
@@ -300,6 +310,45 @@ class TestExecuteProtectedStatement:
         mock_session_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.session_manager')
         mock_session_manager.session = mocker.AsyncMock(return_value='test-session-123')
 
+        # Mock _execute_batch_statement
+        mock_execute_batch_statement = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_batch_statement'
+        )
+        mock_execute_batch_statement.return_value = 'batch-id'
+
+        # Mock data client
+        mock_data_client = mocker.Mock()
+        mock_data_client.get_statement_result.return_value = {'Records': [], 'ColumnMetadata': []}
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        mock_client_manager.redshift_data_client.return_value = mock_data_client
+
+        await _execute_protected_statement(
+            'test-cluster', 'test-db', 'DROP TABLE test', allow_read_write=True
+        )
+
+        # Verify BEGIN READ WRITE, user SQL and END were executed in a single batch
+        call_kwargs = mock_execute_batch_statement.call_args[1]
+        assert call_kwargs['sqls'] == ['BEGIN READ WRITE;', 'DROP TABLE test', 'END;']
+        assert call_kwargs['session_id'] == 'test-session-123'
+
+        # Verify the results of the user SQL were fetched
+        mock_data_client.get_statement_result.assert_called_once_with(Id='batch-id:2')
+
+    @pytest.mark.asyncio
+    async def test_execute_protected_statement_with_parameters(self, mocker):
+        """Test that parameterized SQL is executed as separate statements."""
+        # Mock discover_clusters
+        mock_discover_clusters = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.discover_clusters'
+        )
+        mock_discover_clusters.return_value = [
+            {'identifier': 'test-cluster', 'type': 'provisioned', 'status': 'available'}
+        ]
+
+        # Mock session manager
+        mock_session_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.session_manager')
+        mock_session_manager.session = mocker.AsyncMock(return_value='test-session-123')
+
         # Mock _execute_statement
         mock_execute_statement = mocker.patch(
             'awslabs.redshift_mcp_server.redshift._execute_statement'
@@ -312,16 +361,67 @@ class TestExecuteProtectedStatement:
         mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
         mock_client_manager.redshift_data_client.return_value = mock_data_client
 
-        await _execute_protected_statement(
-            'test-cluster', 'test-db', 'DROP TABLE test', allow_read_write=True
+        parameters = [{'name': 'id', 'value': '1'}]
+        result = await _execute_protected_statement(
+            'test-cluster',
+            'test-db',
+            'SELECT * FROM t WHERE id = :id',
+            parameters=parameters,
+            allow_read_write=False,
         )
 
-        # Verify BEGIN READ WRITE was used
+        # Verify three statements were executed: BEGIN READ ONLY, user SQL, END
+        assert mock_execute_statement.call_count == 3
         calls = mock_execute_statement.call_args_list
-        assert calls[0][1]['sql'] == 'BEGIN READ WRITE;'
-        assert calls[1][1]['sql'] == 'DROP TABLE test'
+        assert calls[0][1]['sql'] == 'BEGIN READ ONLY;'
+        assert calls[1][1]['sql'] == 'SELECT * FROM t WHERE id = :id'
+        assert calls[1][1]['parameters'] == parameters
         assert calls[2][1]['sql'] == 'END;'
 
+        assert result[1] == 'user-stmt-id'
+
+    @pytest.mark.asyncio
+    async def test_execute_protected_statement_batch_fails(self, mocker):
+        """Test that the transaction is closed after a failed batch."""
+        # Mock discover_clusters
+        mock_discover_clusters = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.discover_clusters'
+        )
+        mock_discover_clusters.return_value = [
+            {'identifier': 'test-cluster', 'type': 'provisioned'}
+        ]
+
+        # Mock session manager
+        mock_session_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.session_manager')
+        mock_session_manager.session = mocker.AsyncMock(return_value='session-123')
+
+        mock_execute_batch_statement = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_batch_statement'
+        )
+        mock_execute_batch_statement.side_effect = Exception('SQL syntax error')
+        mock_execute_statement = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift._execute_statement'
+        )
+
+        with pytest.raises(Exception, match='^SQL syntax error$'):
+            await _execute_protected_statement(
+                'test-cluster', 'test-db', 'SELECT invalid_syntax', allow_read_write=True
+            )
+
+        # Verify END was still called
+        mock_execute_statement.assert_called_once()
+        assert mock_execute_statement.call_args[1]['sql'] == 'END;'
+        assert mock_execute_statement.call_args[1]['session_id'] == 'session-123'
+
+        mock_execute_statement.side_effect = Exception('END statement failed')
+        with pytest.raises(
+            Exception,
+            match='User SQL failed: SQL syntax error; END statement failed: END statement failed',
+        ):
+            await _execute_protected_statement(
+                'test-cluster', 'test-db', 'SELECT invalid_syntax', allow_read_write=True
+            )
+
     @pytest.mark.asyncio
     async def test_execute_protected_statement_transaction_breaker_error(self, mocker):
         """Test transaction breaker protection in read-only mode."""
@@ -393,7 +493,7 @@ class TestExecuteProtectedStatement:
 
     @pytest.mark.asyncio
     async def test_execute_protected_statement_user_sql_fails_end_succeeds(self, mocker):
-        """Test user SQL fails but END succeeds - should raise user SQL error."""
+        """Test user SQL fails but END succeeds with parameters - should raise user SQL error."""
         # Mock discover_clusters
         mock_discover_clusters = mocker.patch(
             'awslabs.redshift_mcp_server.redshift.discover_clusters'
@@ -424,7 +524,11 @@ class TestExecuteProtectedStatement:
 
         with pytest.raises(Exception, match='SQL syntax error'):
             await _execute_protected_statement(
-                'test-cluster', 'test-db', 'SELECT invalid_syntax', allow_read_write=False
+                'test-cluster',
+                'test-db',
+                'SELECT invalid_syntax',
+                parameters=PARAMETERS,
+                allow_read_write=False,
             )
 
         # Verify END was still called
@@ -436,7 +540,7 @@ class TestExecuteProtectedStatement:
 
     @pytest.mark.asyncio
     async def test_execute_protected_statement_user_sql_succeeds_end_fails(self, mocker):
-        """Test user SQL succeeds but END fails - should raise END error."""
+        """Test user SQL succeeds but END fails with parameters - should raise END error."""
         # Mock discover_clusters
         mock_discover_clusters = mocker.patch(
             'awslabs.redshift_mcp_server.redshift.discover_clusters'
@@ -467,12 +571,16 @@ class TestExecuteProtectedStatement:
 
         with pytest.raises(Exception, match='END statement failed'):
             await _execute_protected_statement(
-                'test-cluster', 'test-db', 'SELECT 1', allow_read_write=False
+                'test-cluster',
+                'test-db',
+                'SELECT 1',
+                parameters=PARAMETERS,
+                allow_read_write=False,
             )
 
     @pytest.mark.asyncio
     async def test_execute_protected_statement_both_user_sql_and_end_fail(self, mocker):
-        """Test both user SQL and END fail - should raise combined error."""
+        """Test both user SQL and END fail with parameters - should raise combined error."""
         # Mock discover_clusters
         mock_discover_clusters = mocker.patch(
             'awslabs.redshift_mcp_server.redshift.discover_clusters'
@@ -506,7 +614,11 @@ class TestExecuteProtectedStatement:
             match='User SQL failed: SQL syntax error; END statement failed: END statement failed',
         ):
             await _execute_protected_statement(
-                'test-cluster', 'test-db', 'SELECT invalid_syntax', allow_read_write=False
+                'test-cluster',
+                'test-db',
+                'SELECT invalid_syntax',
+                parameters=PARAMETERS,
+                allow_read_write=False,
             )
 
 
@@ -639,6 +751,155 @@ class TestExecuteStatement:
         assert 'Database' not in call_args
         assert 'ClusterIdentifier' not in call_args
 
+    @pytest.mark.asyncio
+    async def test_execute_statement_adaptive_polling(self, mocker):
+        """Test that the polling interval doubles up to query_poll_interval."""
+        mock_client = mocker.Mock()
+        mock_client.execute_statement.return_value = {'Id': 'stmt-123'}
+        mock_client.describe_statement.side_effect = [{'Status': 'RUNNING'}] * 6 + [
+            {'Status': 'FINISHED'}
+        ]
+
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        mock_client_manager.redshift_data_client.return_value = mock_client
+        mock_sleep = mocker.patch('asyncio.sleep')
+
+        await _execute_statement({'type': 'provisioned'}, 'test-cluster', 'dev', 'SELECT 1')
+
+        assert [call[0][0] for call in mock_sleep.call_args_list] == [
+            0.05,
+            0.1,
+            0.2,
+            0.4,
+            0.8,
+            1,
+        ]
+
+
+class TestExecuteBatchStatement:
+    """Tests for _execute_batch_statement function."""
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_statement_with_session_id(self, mocker):
+        """Test that statements are sent in one batch within the session."""
+        mock_client = mocker.Mock()
+        mock_client.batch_execute_statement.return_value = {'Id': 'batch-123'}
+        mock_client.describe_statement.return_value = {'Status': 'FINISHED'}
+
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        mock_client_manager.redshift_data_client.return_value = mock_client
+
+        batch_id = await _execute_batch_statement(
+            {'type': 'provisioned'},
+            'test-cluster',
+            'dev',
+            ['BEGIN READ ONLY;', 'SELECT 1', 'END;'],
+            session_id='session-123',
+        )
+
+        assert batch_id == 'batch-123'
+        mock_client.batch_execute_statement.assert_called_once_with(
+            Sqls=['BEGIN READ ONLY;', 'SELECT 1', 'END;'], SessionId='session-123'
+        )
+        mock_client.describe_statement.assert_called_once_with(Id='batch-123')
+
+    @pytest.mark.asyncio
+    async def test_execute_batch_statement_without_session(self, mocker):
+        """Test that batches outside a session target the workgroup and database."""
+        mock_client = mocker.Mock()
+        mock_client.batch_execute_statement.return_value = {'Id': 'batch-123'}
+        mock_client.describe_statement.return_value = {
+            'Status': 'FAILED',
+            'Error': 'SQL syntax error',
+        }
+
+        mock_client_manager = mocker.patch('awslabs.redshift_mcp_server.redshift.client_manager')
+        mock_client_manager.redshift_data_client.return_value = mock_client
+
+        with pytest.raises(Exception, match='Statement failed: SQL syntax error'):
+            await _execute_batch_statement(
+                {'type': 'serverless'}, 'test-workgroup', 'dev', ['SELECT 1']
+            )
+
+        mock_client.batch_execute_statement.assert_called_once_with(
+            Sqls=['SELECT 1'], Database='dev', WorkgroupName='test-workgroup'
+        )
+
+
+class TestClusterTopologyCache:
+    """Tests for ClusterTopologyCache class."""
+
+    @pytest.mark.asyncio
+    async def test_cluster_info_is_cached(self, mocker):
+        """Test that clusters are discovered once within the time to live."""
+        mock_discover_clusters = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.discover_clusters'
+        )
+        mock_discover_clusters.return_value = [
+            {'identifier': 'test-cluster', 'type': 'provisioned'}
+        ]
+        cache = ClusterTopologyCache(ttl=300, miss_ttl=10)
+
+        for _ in range(2):
+            cluster_info = await cache.cluster_info('test-cluster')
+            assert cluster_info is not None
+            assert cluster_info['type'] == 'provisioned'
+        assert mock_discover_clusters.call_count == 1
+
+        cache.clear()
+        await cache.cluster_info('test-cluster')
+        assert mock_discover_clusters.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cluster_info_is_rediscovered(self, mocker):
+        """Test that clusters are rediscovered when expired or not found."""
+        mock_discover_clusters = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.discover_clusters'
+        )
+        mock_discover_clusters.side_effect = [
+            [{'identifier': 'test-cluster', 'type': 'provisioned'}],
+            [
+                {'identifier': 'test-cluster', 'type': 'provisioned'},
+                {'identifier': 'new-workgroup', 'type': 'serverless'},
+            ],
+            [],
+        ]
+        mock_time = mocker.patch('awslabs.redshift_mcp_server.redshift.time.monotonic')
+        mock_time.return_value = 1000.0
+        cache = ClusterTopologyCache(ttl=300, miss_ttl=10)
+
+        await cache.cluster_info('test-cluster')
+        mock_time.return_value = 1010.0
+        cluster_info = await cache.cluster_info('new-workgroup')
+        assert cluster_info is not None
+        assert cluster_info['type'] == 'serverless'
+        assert mock_discover_clusters.call_count == 2
+
+        mock_time.return_value = 1310.0
+        assert await cache.cluster_info('test-cluster') is None
+        assert mock_discover_clusters.call_count == 3
+
+    @pytest.mark.asyncio
+    async def test_unknown_cluster_is_cached_briefly(self, mocker):
+        """Test that lookups of an unknown identifier reuse a recent discovery."""
+        mock_discover_clusters = mocker.patch(
+            'awslabs.redshift_mcp_server.redshift.discover_clusters'
+        )
+        mock_discover_clusters.return_value = [
+            {'identifier': 'test-cluster', 'type': 'provisioned'}
+        ]
+        mock_time = mocker.patch('awslabs.redshift_mcp_server.redshift.time.monotonic')
+        mock_time.return_value = 1000.0
+        cache = ClusterTopologyCache(ttl=300, miss_ttl=10)
+
+        assert await cache.cluster_info('missing-cluster') is None
+        assert await cache.cluster_info('other-missing-cluster') is None
+        assert mock_discover_clusters.call_count == 1
+
+        mock_time.return_value = 1010.0
+        assert await cache.cluster_info('missing-cluster') is None
+        assert mock_discover_clusters.call_count == 2
+
 
 class TestRedshiftSessionManager:
     """Tests for RedshiftSessionManager."""